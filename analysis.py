@@ -0,0 +1,702 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from nodes.ast_node import AstNode, StmtListNode, FunctionNode, ArrayDeclarationNode, AssignNode, CallNode, \
+    IdentNode, ArrayIndexingNode, ReturnNode, VarsDeclNode, ForNode, ExprNode, LiteralNode, FactorNode, BinOpNode, \
+    TypeConvertNode, arrayOnStack, staticValue
+from passes import Pass, run_passes
+from semantic import ScopeType, ARRAY_BUILT_IN_WRITES
+from utils import BaseType, BinOp, INT_MIN, INT_MAX, isArrayBuiltinFunc
+
+# уровни доступа функции к памяти, видимой снаружи (упорядочены по возрастанию)
+MEMORY_NONE, MEMORY_READ, MEMORY_WRITE = 0, 1, 2
+
+
+def walk(node: AstNode) -> Iterator[AstNode]:
+    """Обход AST-дерева в глубину (сам узел идет первым)
+    """
+    yield node
+    for child in node.children:
+        if child is not None:
+            yield from walk(child)
+
+
+def functions(tree: StmtListNode) -> Dict[str, FunctionNode]:
+    return {func.name.name: func for func in tree.children if isinstance(func, FunctionNode)}
+
+
+def array_params(func: FunctionNode) -> List[str]:
+    return [arg.name.name if isinstance(arg, ArrayDeclarationNode) else None
+            for arg in func.argument_list.children]
+
+
+def is_global(ident) -> bool:
+    return ident is not None and not ident.type.func and ident.scope in (ScopeType.GLOBAL, ScopeType.GLOBAL_LOCAL)
+
+
+def is_array_built_in(call: CallNode) -> bool:
+    ident = call.func.node_ident
+    return ident is not None and ident.built_in and isArrayBuiltinFunc(call.func.name)
+
+
+class FunctionSummary:
+    """Сведения о теле функции, собираемые за один обход
+    """
+    def __init__(self, func: FunctionNode):
+        self.func = func
+        # массивы, изменяемые непосредственно (запись по индексу, возврат из функции)
+        self.direct: Set[str] = set()
+        # передачи массивов в вызовы: (функция, позиция параметра, имя массива)
+        self.passed: List[Tuple[str, int, str]] = []
+        self.callees: Set[str] = set()
+        self.externals: Set[str] = set()
+        # запись элементов глобальных массивов (и вызовы функций других модулей, о которых ничего не известно)
+        self.global_array_writes = False
+        # доступ к внешней памяти без учета вызываемых пользовательских функций
+        self.access = MEMORY_READ if any(name is not None for name in array_params(func)) else MEMORY_NONE
+
+    @property
+    def uses(self) -> Tuple[Set[str], List[Tuple[str, int, str]]]:
+        return self.direct, self.passed
+
+
+class FunctionSummaryPass(Pass):
+    """Сводки всех функций программы; до семантического анализа достоверен только граф вызовов
+    """
+    name = 'function_summary'
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        self.summaries: Dict[str, FunctionSummary] = {}
+        self.stack: List[FunctionSummary] = []
+
+    def finish(self, tree: AstNode) -> Dict[str, FunctionSummary]:
+        return self.summaries
+
+    def enter_FunctionNode(self, node: FunctionNode):
+        self.stack.append(FunctionSummary(node))
+        self.summaries[node.name.name] = self.stack[-1]
+
+    def exit_FunctionNode(self, node: FunctionNode):
+        self.stack.pop()
+
+    def enter_AssignNode(self, node: AssignNode):
+        if self.stack:
+            target = node.var.name if isinstance(node.var, ArrayIndexingNode) else node.var
+            # запись элемента или присваивание всего массива (копируется в память глобального массива)
+            if isinstance(node.var, ArrayIndexingNode) or is_global(target.node_ident) and target.node_type.is_arr:
+                self.stack[-1].direct.add(target.name)
+                if is_global(target.node_ident):
+                    self.stack[-1].global_array_writes = True
+            if is_global(target.node_ident):
+                self.stack[-1].access = MEMORY_WRITE
+
+    def enter_ReturnNode(self, node: ReturnNode):
+        if self.stack and isinstance(node.expr, IdentNode):
+            self.stack[-1].direct.add(node.expr.name)
+
+    def enter_IdentNode(self, node: IdentNode):
+        if self.stack and is_global(node.node_ident):
+            self.stack[-1].access = max(self.stack[-1].access, MEMORY_READ)
+
+    def enter_CallNode(self, node: CallNode):
+        if not self.stack:
+            return
+        summary = self.stack[-1]
+        summary.callees.add(node.func.name)
+        for i, param in enumerate(node.params):
+            if isinstance(param, IdentNode):
+                summary.passed.append((node.func.name, i, param.name))
+        ident = node.func.node_ident
+        if ident is not None and ident.built_in and isArrayBuiltinFunc(node.func.name):
+            # встроенные функции над массивами изменяют только элементы своих аргументов (и print_array выводит)
+            for i in ARRAY_BUILT_IN_WRITES.get(node.func.name, ()):
+                summary.direct.add(node.params[i].name)
+                if is_global(node.params[i].node_ident):
+                    summary.access = MEMORY_WRITE
+                    summary.global_array_writes = True
+            if node.func.name == 'print_array':
+                summary.access = MEMORY_WRITE
+        elif ident is not None and (ident.built_in or ident.external):
+            # встроенные функции выполняют ввод-вывод, о функциях других модулей ничего не известно
+            summary.access = MEMORY_WRITE
+            if ident.external:
+                summary.externals.add(node.func.name)
+                summary.global_array_writes = True
+
+
+def function_summaries(tree: StmtListNode) -> Dict[str, FunctionSummary]:
+    return run_passes(tree, FunctionSummaryPass())['function_summary']
+
+
+def mutated_arrays(mutating_params: Dict[str, Set[int]],
+                   uses: Tuple[Set[str], List[Tuple[str, int, str]]]) -> Set[str]:
+    """Имена массивов, содержимое которых может измениться (или утечь наружу) внутри функции:
+    запись по индексу, передача в изменяющий параметр другой функции, возврат из функции
+    """
+    direct, passed = uses
+    return direct | {name for func, i, name in passed if i in mutating_params.get(func, ())}
+
+
+def global_array_writers(summaries: Dict[str, FunctionSummary]) -> Set[str]:
+    """Функции, которые сами или через вызываемые функции изменяют элементы глобальных массивов
+    """
+    graph = {name: summary.callees for name, summary in summaries.items()}
+    return {name for name in summaries
+            if any(summaries[callee].global_array_writes for callee in reachable(graph, [name]) if callee in summaries)}
+
+
+def mutating_params(summaries: Dict[str, FunctionSummary]) -> Dict[str, Set[int]]:
+    """Для каждой функции - позиции параметров-массивов, которые функция может изменить.
+    Считается до неподвижной точки, т.к. параметр может изменяться в вызываемой функции.
+    Если функция изменяет глобальный массив, изменяемыми считаются все ее параметры-массивы:
+    в параметр мог быть передан этот же массив (f(ga)), а по ссылке он изменился бы вместе с ним
+    """
+    writers = global_array_writers(summaries)
+    mutating: Dict[str, Set[int]] = {name: {i for i, param in enumerate(array_params(summary.func))
+                                            if param is not None and name in writers}
+                                     for name, summary in summaries.items()}
+    changed = True
+    while changed:
+        changed = False
+        for name, summary in summaries.items():
+            mutated = mutated_arrays(mutating, summary.uses)
+            for i, param in enumerate(array_params(summary.func)):
+                if param is not None and param in mutated and i not in mutating[name]:
+                    mutating[name].add(i)
+                    changed = True
+    return mutating
+
+
+def find_mutating_params(tree: StmtListNode) -> Dict[str, Set[int]]:
+    return mutating_params(function_summaries(tree))
+
+
+class ReadonlyArrayParamsPass(Pass):
+    """Помечает параметры-массивы, которые можно передавать по ссылке без копирования,
+    и присваивания массивов, которые можно заменить на копирование указателя
+    """
+    name = 'readonly_array_params'
+    requires = ('function_summary',)
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        self.summaries = results['function_summary']
+        self.mutating = mutating_params(self.summaries)
+        self.writers = global_array_writers(self.summaries)
+        self.mutated: Optional[Set[str]] = None
+
+    def enter_FunctionNode(self, node: FunctionNode):
+        name = node.name.name
+        for i, arg in enumerate(node.argument_list.children):
+            if isinstance(arg, ArrayDeclarationNode):
+                arg.by_ref = i not in self.mutating[name]
+        self.mutated = mutated_arrays(self.mutating, self.summaries[name].uses)
+        # если функция изменяет глобальный массив, правая часть присваивания может быть им самим или ссылаться на него
+        self.aliasing = name not in self.writers
+
+    def exit_FunctionNode(self, node: FunctionNode):
+        self.mutated = None
+
+    def enter_AssignNode(self, node: AssignNode):
+        if self.mutated is not None and self.aliasing and isinstance(node.var, IdentNode) \
+                and isinstance(node.val, IdentNode):
+            node.alias_array = node.var.name not in self.mutated and node.val.name not in self.mutated
+
+
+def mark_readonly_array_params(tree: StmtListNode) -> None:
+    run_passes(tree, FunctionSummaryPass(), ReadonlyArrayParamsPass())
+
+
+def call_graph(tree: StmtListNode) -> Dict[str, Set[str]]:
+    return {name: summary.callees for name, summary in function_summaries(tree).items()}
+
+
+def external_functions(tree: StmtListNode) -> Set[str]:
+    return {name for summary in function_summaries(tree).values() for name in summary.externals}
+
+
+def reachable(graph: Dict[str, Set[str]], roots: Iterable[str]) -> Set[str]:
+    result = set()
+    stack = list(roots)
+    while stack:
+        name = stack.pop()
+        if name not in result:
+            result.add(name)
+            stack.extend(graph.get(name, ()))
+    return result
+
+
+def function_memory_access(summaries: Dict[str, FunctionSummary], writers: Iterable[str] = ()) -> Dict[str, int]:
+    """Доступ функций к внешней памяти с учетом вызываемых функций (до неподвижной точки);
+    writers - функции, изменяющие внешнюю память помимо видимого в сводке (например, выделяющие память в арене)
+    """
+    writers = set(writers)
+    access = {name: MEMORY_WRITE if name in writers else summary.access for name, summary in summaries.items()}
+    changed = True
+    while changed:
+        changed = False
+        for name, summary in summaries.items():
+            callee_access = max((access[callee] for callee in summary.callees if callee in access),
+                                default=MEMORY_NONE)
+            if callee_access > access[name]:
+                access[name] = callee_access
+                changed = True
+    return access
+
+
+def pure_functions(tree: StmtListNode) -> Set[str]:
+    """Функции без ввода-вывода и обращений к внешней памяти, принимающие и возвращающие скаляры:
+    их результат зависит только от аргументов (завершаемость проверяется при вычислении)
+    """
+    summaries = function_summaries(tree)
+    access = function_memory_access(summaries)
+    return {name for name, summary in summaries.items()
+            if access[name] == MEMORY_NONE and not summary.func.type.isArr and str(summary.func.type.type) != 'void'}
+
+
+def infer_function_attributes(summaries: Dict[str, FunctionSummary],
+                              writers: Iterable[str] = ()) -> Dict[str, List[str]]:
+    """Атрибуты функций, выводимые по графу вызовов: nounwind, readnone/readonly, norecurse
+    """
+    graph = {name: summary.callees for name, summary in summaries.items()}
+    access = function_memory_access(summaries, writers)
+    externals = {name for summary in summaries.values() for name in summary.externals}
+
+    result = {}
+    for name in summaries:
+        # исключений в языке нет, а printf/scanf объявлены как nounwind
+        attributes = ['nounwind']
+        if access[name] == MEMORY_NONE:
+            attributes.append('readnone')
+        elif access[name] == MEMORY_READ:
+            attributes.append('readonly')
+        callees = reachable(graph, graph[name])
+        # функция другого модуля может снова вызвать функции этого модуля
+        if name not in callees and not callees & externals:
+            attributes.append('norecurse')
+        result[name] = attributes
+    return result
+
+
+class FunctionAttributesPass(Pass):
+    """:param arena: учитывать функции, выделяющие память в арене (результат EscapePass)
+    :param bounds_checks: учитывать функции с проверками границ массивов (результат BoundsCheckPass):
+    при выходе за границы они завершают программу, поэтому не могут быть readnone/readonly
+    """
+    name = 'function_attributes'
+    requires = ('function_summary',)
+
+    def __init__(self, arena: bool = False, bounds_checks: bool = False):
+        self.requires = ('function_summary',) + (('escape',) if arena else ()) \
+            + (('bounds_checks',) if bounds_checks else ())
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        summaries = results['function_summary']
+        writers = set(results.get('escape', ())) | set(results.get('bounds_checks', ()))
+        for name, attributes in infer_function_attributes(summaries, writers).items():
+            summaries[name].func.attributes = attributes
+
+
+def mark_function_attributes(tree: StmtListNode) -> None:
+    run_passes(tree, FunctionSummaryPass(), FunctionAttributesPass())
+
+
+class ConstantDataPass(Pass):
+    """Помечает массивы и глобальные переменные, которые не изменяются после объявления:
+    их значения размещаются в секции констант.
+    Изменением считается присваивание (кроме начального значения), а для constant - еще и запись
+    элемента массива и возврат массива из функции (вызывающий может изменить его элементы)
+    """
+    name = 'constant_data'
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        self.initializers: Set[int] = set()
+        # written - изменяется значение или элементы, reassigned - только само значение
+        self.written: Set[object] = set()
+        self.reassigned: Set[object] = set()
+        self.arrays: List[ArrayDeclarationNode] = []
+        self.decls: List[VarsDeclNode] = []
+
+    def enter_VarsDeclNode(self, node: VarsDeclNode):
+        self.decls.append(node)
+        self.initializers.update(id(var) for var in node.vars_list if isinstance(var, AssignNode))
+
+    def enter_ArrayDeclarationNode(self, node: ArrayDeclarationNode):
+        self.arrays.append(node)
+
+    def enter_AssignNode(self, node: AssignNode):
+        if id(node) in self.initializers:
+            return
+        if isinstance(node.var, ArrayIndexingNode):
+            self.written.add(node.var.name.node_ident)
+        else:
+            ident = (node.var.name if isinstance(node.var, ArrayDeclarationNode) else node.var).node_ident
+            self.written.add(ident)
+            self.reassigned.add(ident)
+
+    def enter_ReturnNode(self, node: ReturnNode):
+        if isinstance(node.expr, IdentNode):
+            self.written.add(node.expr.node_ident)
+
+    def enter_CallNode(self, node: CallNode):
+        if node.func.node_ident.built_in:
+            for i in ARRAY_BUILT_IN_WRITES.get(node.func.name, ()):
+                self.written.add(node.params[i].node_ident)
+
+    def finish(self, tree: AstNode) -> None:
+        for node in self.arrays:
+            node.constant = node.name.node_ident not in self.written
+            node.fixed = node.name.node_ident not in self.reassigned
+        for node in self.decls:
+            for var in node.vars_list:
+                ident = (var.var if isinstance(var, AssignNode) else var).node_ident
+                if is_global(ident) and ident not in self.written:
+                    node.constants.add(ident.name)
+
+
+def mark_constant_data(tree: StmtListNode) -> None:
+    run_passes(tree, ConstantDataPass())
+
+
+class EscapePass(Pass):
+    """Анализ убегания массивов: массив функции переживает ее, если возвращается из нее
+    непосредственно или через переменную, которой присвоен (присваивание может копировать только указатель).
+    Помечает такие объявления массивов и параметры (escapes), копии при присваивании и результаты read_str.
+    Результат - функции, которые выделяют память в арене (см. nodes.ast_node.allocateArray)
+    """
+    name = 'escape'
+
+    def __init__(self, stack_array_limit: int, arrays_by_ref: bool = False):
+        self.limit = stack_array_limit
+        # параметры, передаваемые по ссылке, не копируются
+        self.arrays_by_ref = arrays_by_ref
+        self.requires = ('constant_data', 'readonly_array_params') if arrays_by_ref else ('constant_data',)
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        self.func: Optional[FunctionNode] = None
+        self.arena_functions: Set[str] = set()
+
+    def finish(self, tree: AstNode) -> Set[str]:
+        return self.arena_functions
+
+    def enter_FunctionNode(self, node: FunctionNode):
+        self.func = node
+        self.returned: Set[object] = set()
+        # переменная -> массивы, на память которых она может указывать после присваивания
+        self.sources: Dict[object, Set[object]] = {}
+        # память, которую выделяет присваивание (копия массива или read_str), -> переменная
+        self.allocations: List[Tuple[AstNode, object]] = []
+        self.arrays: List[ArrayDeclarationNode] = []
+        self.reads: List[CallNode] = []
+
+    def enter_CallNode(self, node: CallNode):
+        if self.func is not None and node.func.name == 'read_str':
+            self.reads.append(node)
+
+    def enter_ArrayDeclarationNode(self, node: ArrayDeclarationNode):
+        if self.func is not None:
+            self.arrays.append(node)
+
+    def enter_ReturnNode(self, node: ReturnNode):
+        if self.func is not None and isinstance(node.expr, IdentNode) and node.expr.node_type.is_arr:
+            self.returned.add(node.expr.node_ident)
+
+    def enter_AssignNode(self, node: AssignNode):
+        if self.func is None or not node.var.node_type.is_arr:
+            return
+        target = (node.var.name if isinstance(node.var, ArrayDeclarationNode) else node.var).node_ident
+        if is_global(target):
+            # глобальный массив переживает функцию: копируется его память, а read_str выделяет новую
+            if isinstance(node.val, CallNode):
+                node.val.escapes = True
+        elif isinstance(node.val, IdentNode):
+            self.sources.setdefault(target, set()).add(node.val.node_ident)
+            self.allocations.append((node, target))
+        elif isinstance(node.val, CallNode):
+            self.allocations.append((node.val, target))
+
+    def exit_FunctionNode(self, node: FunctionNode):
+        escaping, stack = set(), list(self.returned)
+        while stack:
+            ident = stack.pop()
+            if ident not in escaping:
+                escaping.add(ident)
+                stack.extend(self.sources.get(ident, ()))
+        params = set(node.argument_list.children)
+        arena = False
+        for array in self.arrays:
+            array.escapes = array.name.node_ident in escaping
+            if array in params:
+                copied = not (self.arrays_by_ref and array.by_ref)
+            else:
+                copied = not (array.constant and array.values is not None and array.static_contents() is not None)
+            arena |= copied and not arrayOnStack(self.limit, str(array.type_var), staticValue(array.value),
+                                                 array.escapes)
+        for allocation, target in self.allocations:
+            allocation.escapes = target in escaping
+            if isinstance(allocation, AssignNode):
+                arena |= not arrayOnStack(self.limit, str(allocation.var.node_type.base_type),
+                                          staticValue(allocation.val.node_ident.size), allocation.escapes)
+        for call in self.reads:
+            arena |= not arrayOnStack(self.limit, 'char', 100, call.escapes)
+        if arena:
+            self.arena_functions.add(node.name.name)
+        self.func = None
+
+
+def mark_escaping_arrays(tree: StmtListNode, stack_array_limit: int = 65536) -> Set[str]:
+    return run_passes(tree, ConstantDataPass(), EscapePass(stack_array_limit))['escape']
+
+
+class TailCallPass(Pass):
+    """Помечает return f(...) с вызовом пользовательской функции того же типа результата
+    и функции, которые так вызывают сами себя (такие вызовы генерируются переходом в начало функции)
+    """
+    name = 'tail_calls'
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        self.func: Optional[FunctionNode] = None
+
+    def enter_FunctionNode(self, node: FunctionNode):
+        self.func = node
+
+    def exit_FunctionNode(self, node: FunctionNode):
+        self.func = None
+
+    def enter_ReturnNode(self, node: ReturnNode):
+        call = node.expr
+        if self.func is None or not isinstance(call, CallNode) or call.func.node_ident.built_in:
+            return
+        node.tail_call = True
+        if call.func.name == self.func.name.name:
+            self.func.tail_recursive = True
+
+
+# проверяемые сравнения счетчика цикла с границей: шаг счетчика должен вести к границе
+INDUCTION_CONDITIONS = {BinOp.LT: 1, BinOp.LE: 1, BinOp.GT: -1, BinOp.GE: -1}
+
+
+def int_range(low: int, high: int) -> Optional[Tuple[int, int]]:
+    return (low, high) if INT_MIN <= low and high <= INT_MAX else None
+
+
+def value_range(expr: ExprNode, ranges: Dict[object, Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    """Интервал значений целочисленного выражения в сгенерированном коде; ranges - интервалы переменных
+    (счетчиков объемлющих циклов). None - интервал неизвестен или при вычислении возможно переполнение
+    """
+    base_type = expr.node_type.base_type if expr.node_type is not None else None
+    if isinstance(expr, LiteralNode):
+        # true как индекс getelementptr расширяется со знаком (-1), поэтому bool не рассматривается
+        return (expr.number, expr.number) if base_type in (BaseType.INT, BaseType.CHAR) else None
+    if isinstance(expr, IdentNode):
+        if expr.node_ident in ranges:
+            return ranges[expr.node_ident]
+        return (-128, 127) if base_type == BaseType.CHAR else None
+    if isinstance(expr, TypeConvertNode) and base_type == BaseType.INT:
+        # char и bool расширяются до int без знака
+        return {BaseType.CHAR: (0, 255), BaseType.BOOL: (0, 1)}.get(expr.expr.node_type.base_type)
+    if base_type != BaseType.INT:
+        return None
+    if isinstance(expr, FactorNode):
+        value = value_range(expr.literal, ranges)
+        if value is None or expr.operation == '+':
+            return value
+        return int_range(-value[1], -value[0])
+    if isinstance(expr, BinOpNode) and expr.op in (BinOp.ADD, BinOp.SUB, BinOp.MUL):
+        left, right = value_range(expr.arg1, ranges), value_range(expr.arg2, ranges)
+        if left is None or right is None:
+            return None
+        if expr.op == BinOp.ADD:
+            return int_range(left[0] + right[0], left[1] + right[1])
+        if expr.op == BinOp.SUB:
+            return int_range(left[0] - right[1], left[1] - right[0])
+        products = [a * b for a in left for b in right]
+        return int_range(min(products), max(products))
+    return None
+
+
+def induction_variable(loop: ForNode, calls: bool) -> Optional[Tuple[IdentNode, ExprNode, BinOp, int]]:
+    """Счетчик цикла for (i = ...; i < n; i = i + c) - переменная, которая изменяется только шагом цикла
+    на константу в сторону границы (<, <=, >, >=).
+    :return: (переменная из условия, граница, сравнение, шаг) или None
+    """
+    cond, steps = loop.cond, getattr(loop.step, 'exprs', ())
+    if not isinstance(cond, BinOpNode) or cond.op not in INDUCTION_CONDITIONS \
+            or not isinstance(cond.arg1, IdentNode) or cond.arg1.node_type.base_type != BaseType.INT \
+            or len(steps) != 1 or not isinstance(steps[0], AssignNode):
+        return None
+    var, step = cond.arg1.node_ident, steps[0]
+    if var is None or var.type.func or (calls and is_global(var)) \
+            or not isinstance(step.var, IdentNode) or step.var.node_ident is not var:
+        return None
+    value = step.val
+    if not isinstance(value, BinOpNode) or value.op not in (BinOp.ADD, BinOp.SUB):
+        return None
+    operands = (value.arg1, value.arg2) if value.op == BinOp.SUB else \
+        sorted((value.arg1, value.arg2), key=lambda arg: not isinstance(arg, IdentNode))
+    if not isinstance(operands[0], IdentNode) or operands[0].node_ident is not var \
+            or not isinstance(operands[1], LiteralNode) or operands[1].node_type.base_type != BaseType.INT:
+        return None
+    delta = operands[1].number if value.op == BinOp.ADD else -operands[1].number
+    if delta * INDUCTION_CONDITIONS[cond.op] <= 0:
+        return None
+    if any(isinstance(node, AssignNode) and isinstance(node.var, IdentNode) and node.var.node_ident is var
+           for node in walk(loop.body)):
+        return None
+    return cond.arg1, cond.arg2, cond.op, delta
+
+
+def induction_range(loop: ForNode, ranges: Dict[object, Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    """Интервал счетчика цикла (loop.induction) в теле цикла по интервалам начального значения и границы.
+    Переход счетчика за границу не должен переполнять int, иначе условие снова станет истинным
+    """
+    var, bound, op, delta = loop.induction
+    starts = [node.val for node in walk(loop.init)
+              if isinstance(node, AssignNode) and isinstance(node.var, IdentNode) and node.var.node_ident is var.node_ident]
+    start = value_range(starts[-1], ranges) if starts else None
+    limit = value_range(bound, ranges)
+    if start is None or limit is None:
+        return None
+    if delta > 0:
+        high = limit[1] - (op == BinOp.LT)
+        return (start[0], high) if high + delta <= INT_MAX else None
+    low = limit[0] + (op == BinOp.GT)
+    return (low, start[1]) if low + delta >= INT_MIN else None
+
+
+class LoopContext:
+    """Цикл for, в теле которого находится обращение к массиву: переменные, изменяемые в цикле,
+    и есть ли в нем вызовы (для инвариантов, см. optimizer.is_invariant)
+    """
+    def __init__(self, loop: ForNode):
+        from optimizer import loop_assigned, is_invariant
+
+        self.loop = loop
+        self.assigned, self.calls = loop_assigned(loop)
+        self.is_invariant = lambda expr: is_invariant(expr, self.assigned, self.calls)
+        loop.induction = induction_variable(loop, self.calls)
+        # для проверки в предзаголовке граница счетчика вычисляется до входа в цикл
+        self.counter = loop.induction[0].node_ident \
+            if loop.induction is not None and self.is_invariant(loop.induction[1]) else None
+
+
+class BoundsCheckPass(Pass):
+    """Проверки границ массивов (CodeGenerator.bounds_checks). Длина массива известна при компиляции,
+    если его размер - константа и переменной массива ничего не присваивается, иначе она хранится
+    в переменной длины (nodes.ast_node.storeLength). Параметр-массив имеет объявленный размер.
+    Обращение не проверяется, если интервальный анализ индекса по счетчикам объемлющих циклов for
+    доказывает, что индекс в границах. Проверка обращения в теле цикла for выносится в предзаголовок
+    самого внешнего цикла, в котором длина массива не изменяется, а индекс - инвариант цикла или счетчик
+    цикла плюс инвариант (проверяются первое и последнее значения счетчика).
+    Результат - функции, в которых остались проверки (они могут завершить программу)
+    """
+    name = 'bounds_checks'
+    requires = ('constant_data',)
+
+    def start(self, tree: AstNode, results: Dict[str, object]) -> None:
+        # массив -> длина, известная при компиляции, или None
+        self.lengths: Dict[object, Optional[int]] = {}
+        self.func: Optional[FunctionNode] = None
+        self.checking: Set[str] = set()
+        self.visit(tree, {}, [])
+
+    def finish(self, tree: AstNode) -> Set[str]:
+        return self.checking
+
+    def visit(self, node: AstNode, ranges: Dict[object, Tuple[int, int]], loops: List[LoopContext]) -> None:
+        if isinstance(node, FunctionNode):
+            self.func = node
+        elif isinstance(node, ArrayDeclarationNode):
+            size = node.size if node.values is not None else staticValue(node.value)
+            static = node.fixed and isinstance(size, int) and not isinstance(size, bool) and size > 0
+            node.length = size if static else None
+            self.lengths[node.name.node_ident] = node.length
+        elif isinstance(node, ArrayIndexingNode):
+            self.check(node, ranges, loops)
+        elif isinstance(node, CallNode) and is_array_built_in(node):
+            self.check_call(node)
+        elif isinstance(node, ForNode):
+            for part in (node.init, node.cond, node.step):
+                self.visit(part, ranges, loops)
+            context = LoopContext(node)
+            node.hoisted_checks = ()
+            if node.induction is not None:
+                counter = induction_range(node, ranges)
+                if counter is not None:
+                    ranges = dict(ranges)
+                    ranges[node.induction[0].node_ident] = counter
+            self.visit(node.body, ranges, loops + [context])
+            return
+
+        for child in node.children:
+            if child is not None:
+                self.visit(child, ranges, loops)
+        if isinstance(node, FunctionNode):
+            self.func = None
+
+    def check(self, node: ArrayIndexingNode, ranges: Dict[object, Tuple[int, int]], loops: List[LoopContext]):
+        ident = node.name.node_ident
+        if ident not in self.lengths:
+            # не переменная-массив
+            node.checked = False
+            return
+        node.length = self.lengths[ident]
+        index = value_range(node.value, ranges)
+        if node.length is not None and index is not None and 0 <= index[0] and index[1] < node.length:
+            node.checked = False
+            return
+
+        node.checked = True
+        for context in loops:
+            hoisted = self.hoist(node, context)
+            if hoisted is not None:
+                node.hoisted = True
+                context.loop.hoisted_checks += (hoisted,)
+                break
+        if self.func is not None:
+            self.checking.add(self.func.name.name)
+
+    def check_call(self, node: CallNode):
+        """Кол-во элементов n встроенной функции над массивами не больше длины каждого массива-аргумента
+        """
+        count = staticValue(node.params[-1])
+        checked = []
+        for param in node.params[:-1]:
+            if not param.node_type.is_arr or param.node_ident not in self.lengths:
+                continue
+            length = self.lengths[param.node_ident]
+            if length is None or not isinstance(count, int) or count > length:
+                checked.append((param, length))
+        node.checked_arrays = tuple(checked)
+        if checked and self.func is not None:
+            self.checking.add(self.func.name.name)
+
+    @staticmethod
+    def hoist(node: ArrayIndexingNode, context: LoopContext) -> Optional[Tuple[ArrayIndexingNode, bool, ExprNode, int]]:
+        """:return: проверка для предзаголовка цикла (обращение, индекс зависит от счетчика,
+        инвариант - индекс или слагаемое к счетчику, знак слагаемого) или None
+        """
+        if node.length is None and (node.name.name in context.assigned or context.calls and is_global(node.name.node_ident)):
+            return None
+        index = node.value
+        if context.is_invariant(index):
+            return node, False, index, 1
+        if context.counter is None:
+            return None
+        if isinstance(index, IdentNode) and index.node_ident is context.counter:
+            return node, True, None, 1
+        if not isinstance(index, BinOpNode) or index.op not in (BinOp.ADD, BinOp.SUB) \
+                or index.node_type.base_type != BaseType.INT:
+            return None
+        operands = [index.arg1, index.arg2]
+        for i, operand in enumerate(operands if index.op == BinOp.ADD else operands[:1]):
+            other = operands[1 - i]
+            if isinstance(operand, IdentNode) and operand.node_ident is context.counter \
+                    and context.is_invariant(other):
+                return node, True, other, 1 if index.op == BinOp.ADD else -1
+        return None
+
+
+def bounds_check_counts(tree: StmtListNode) -> Tuple[int, int, int]:
+    """Для отчета: (обращений к массивам, без проверки, с проверкой в предзаголовке цикла)
+    """
+    accesses = [node for node in walk(tree) if isinstance(node, ArrayIndexingNode)]
+    return len(accesses), sum(not node.checked for node in accesses), sum(node.hoisted for node in accesses)
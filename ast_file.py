@@ -0,0 +1,288 @@
+"""Двоичный формат AST после семантического анализа (.ast) для быстрой повторной загрузки.
+
+Сохраняются все узлы со всеми атрибутами (в т.ч. выставленными анализами и оптимизациями),
+ссылки на TypeDesc, IdentDesc и IdentScope и позиции в исходном тексте; общие объекты остаются общими.
+
+Файл:
+    заголовок       MAGIC, версия, смещения секций, кол-во объектов
+    strings         marshal: кортеж всех строк (имена, литералы, имена атрибутов и классов)
+    schemas         marshal: кортеж (класс, имена атрибутов) - одинаковые наборы атрибутов хранятся один раз
+    index           смещения записей объектов, little-endian u32 (кол-во объектов + 1)
+    data            записи объектов: marshal (номер схемы, значение атрибута, ...)
+    meta            marshal: номер корня и номера функций верхнего уровня
+
+Значения атрибутов: None, bool, int и float хранятся как есть, остальное - кортежами с тегом.
+Файл отображается в память (mmap), объект декодируется при первом обращении к нему:
+AstFile.function(name) материализует только поддерево одной функции.
+
+    python ast_file.py tests/bbbb.c -o bbbb.ast
+"""
+import argparse
+import marshal
+import mmap
+import struct
+import sys
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import parser_base
+import semantic
+from nodes import ast_node
+from nodes.ast_node import AstNode, StmtListNode, FunctionNode
+from semantic import TypeDesc, IdentDesc, ArrayDesc, IdentScope
+from utils import BinOp, BaseType, ArrayType
+
+MAGIC = b'OPAST\x00'
+VERSION = 4
+HEADER = struct.Struct('<6sH6I')
+OFFSET = struct.Struct('<II')
+
+OBJECT, STR, TUPLE, LIST, SET, DICT, ENUM, TOKEN, KNOWN = range(9)
+
+ENUMS = {cls.__name__: cls for cls in (BinOp, BaseType, ArrayType, semantic.ScopeType)}
+
+
+def _subclasses(cls) -> List[type]:
+    result = [cls]
+    for sub in cls.__subclasses__():
+        result.extend(_subclasses(sub))
+    return result
+
+
+CLASSES = {cls.__name__: cls for cls in _subclasses(AstNode) + [TypeDesc, IdentDesc, ArrayDesc, IdentScope]}
+
+_known: Optional[Dict[str, Any]] = None
+
+
+def known_objects() -> Dict[str, Any]:
+    """Объекты, существующие в каждом процессе в одном экземпляре: типы, встроенные функции, EMPTY_IDENT.
+    В файле хранятся только их имена
+    """
+    global _known
+    if _known is None:
+        _known = semantic.type_singletons()
+        _known.update({f'built_in.{name}': ident for name, ident in semantic.get_default_scope().idents.items()})
+        _known['EMPTY_IDENT'] = ast_node.EMPTY_IDENT
+    return _known
+
+
+class _Writer:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.schemas: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self.objects: Dict[int, int] = {}
+        self.records: List[Optional[bytes]] = []
+        self.known = {id(obj): name for name, obj in known_objects().items()}
+        # объекты удерживаются до конца записи, чтобы их id не переиспользовались
+        self.alive = []
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def object(self, obj) -> int:
+        index = self.objects.get(id(obj))
+        if index is not None:
+            return index
+        index = self.objects[id(obj)] = len(self.records)
+        self.records.append(None)
+        self.alive.append(obj)
+
+        attrs = tuple(vars(obj))
+        schema_key = (type(obj).__name__, attrs)
+        schema = self.schemas.get(schema_key)
+        if schema is None:
+            schema = self.schemas[schema_key] = len(self.schemas)
+        values = tuple(self.value(value) for value in vars(obj).values())
+        self.records[index] = marshal.dumps((schema,) + values)
+        return index
+
+    def value(self, value):
+        if value is None or isinstance(value, (bool, int, float)) and not isinstance(value, Enum):
+            return value
+        if id(value) in self.known:
+            return KNOWN, self.string(self.known[id(value)])
+        # lark.Token может встретиться, только если lark уже загружен разбором
+        lark = sys.modules.get('lark')
+        if lark is not None and isinstance(value, lark.Token):
+            return (TOKEN, self.string(value.type), self.string(value.value), value.start_pos,
+                    value.line, value.column, value.end_line, value.end_column, value.end_pos)
+        if isinstance(value, Enum):
+            return ENUM, self.string(type(value).__name__), self.value(value.value)
+        if isinstance(value, str):
+            return STR, self.string(value)
+        if isinstance(value, tuple):
+            return (TUPLE,) + tuple(self.value(item) for item in value)
+        if isinstance(value, list):
+            return (LIST,) + tuple(self.value(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return (SET,) + tuple(self.value(item) for item in value)
+        if isinstance(value, dict):
+            return (DICT,) + tuple(self.value(item) for pair in value.items() for item in pair)
+        if type(value).__name__ in CLASSES:
+            return OBJECT, self.object(value)
+        raise TypeError(f'Не удается сохранить значение типа {type(value).__name__}')
+
+    def dumps(self, tree: StmtListNode) -> bytes:
+        root = self.object(tree)
+        meta = {'root': root,
+                'functions': {func.name.name: self.objects[id(func)]
+                              for func in tree.children if isinstance(func, FunctionNode)}}
+
+        strings = marshal.dumps(tuple(self.strings))
+        schemas = marshal.dumps(tuple((name, attrs) for name, attrs in self.schemas))
+        offsets, position = [], 0
+        for record in self.records:
+            offsets.append(position)
+            position += len(record)
+        offsets.append(position)
+        index = struct.pack(f'<{len(offsets)}I', *offsets)
+        meta = marshal.dumps(meta)
+
+        sections = [strings, schemas, index, b''.join(self.records), meta]
+        starts, position = [], HEADER.size
+        for section in sections:
+            starts.append(position)
+            position += len(section)
+        header = HEADER.pack(MAGIC, VERSION, *starts, len(self.records))
+        return header + b''.join(sections)
+
+
+def dumps(tree: StmtListNode) -> bytes:
+    return _Writer().dumps(tree)
+
+
+def dump(tree: StmtListNode, path: str):
+    with open(path, 'wb') as f:
+        f.write(dumps(tree))
+
+
+class AstFile:
+    """Чтение .ast: строки и схемы загружаются сразу, объекты - при первом обращении
+    """
+    def __init__(self, data):
+        self.data = memoryview(data)
+        magic, version, strings, schemas, index, records, meta, self.count = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Неподдерживаемый формат AST')
+        self.strings = marshal.loads(self.data[strings:schemas])
+        self.schemas = [(CLASSES[name], attrs) for name, attrs in marshal.loads(self.data[schemas:index])]
+        self.index = index
+        self.records = records
+        self.meta = marshal.loads(self.data[meta:])
+        self.objects: Dict[int, Any] = {}
+        self.known = known_objects()
+
+    @staticmethod
+    def open(path: str) -> 'AstFile':
+        with open(path, 'rb') as f:
+            return AstFile(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def object(self, index: int):
+        obj = self.objects.get(index)
+        if obj is not None:
+            return obj
+        start, end = OFFSET.unpack_from(self.data, self.index + 4 * index)
+        record = marshal.loads(self.data[self.records + start:self.records + end])
+        cls, attrs = self.schemas[record[0]]
+        obj = self.objects[index] = cls.__new__(cls)
+        fields = obj.__dict__
+        value = self.value
+        for name, item in zip(attrs, record[1:]):
+            fields[name] = value(item)
+        return obj
+
+    def value(self, item):
+        if type(item) is not tuple:
+            return item
+        tag = item[0]
+        if tag == OBJECT:
+            return self.object(item[1])
+        if tag == STR:
+            return self.strings[item[1]]
+        if tag == TUPLE:
+            return tuple(self.value(x) for x in item[1:])
+        if tag == LIST:
+            return [self.value(x) for x in item[1:]]
+        if tag == SET:
+            return {self.value(x) for x in item[1:]}
+        if tag == DICT:
+            return {self.value(item[i]): self.value(item[i + 1]) for i in range(1, len(item), 2)}
+        if tag == ENUM:
+            return ENUMS[self.strings[item[1]]](self.value(item[2]))
+        if tag == TOKEN:
+            from lark import Token
+            return Token(self.strings[item[1]], self.strings[item[2]], *item[3:])
+        if tag == KNOWN:
+            return self.known[self.strings[item[1]]]
+        raise ValueError(f'Неизвестный тег {tag}')
+
+    @property
+    def root(self) -> StmtListNode:
+        return self.object(self.meta['root'])
+
+    @property
+    def function_names(self) -> List[str]:
+        return list(self.meta['functions'])
+
+    def function(self, name: str) -> FunctionNode:
+        return self.object(self.meta['functions'][name])
+
+
+def loads(data: bytes) -> StmtListNode:
+    return AstFile(data).root
+
+
+def load(path: str) -> StmtListNode:
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def same_tree(a, b, seen: Optional[Dict[int, int]] = None) -> bool:
+    """Структурное равенство двух графов объектов AST с учетом общих объектов
+    """
+    if seen is None:
+        seen = {}
+    if type(a) is not type(b):
+        return False
+    if type(a).__name__ in CLASSES and a is not b:
+        if id(a) in seen:
+            return seen[id(a)] == id(b)
+        seen[id(a)] = id(b)
+        return vars(a).keys() == vars(b).keys() and all(same_tree(vars(a)[k], vars(b)[k], seen) for k in vars(a))
+    if isinstance(a, (tuple, list)):
+        return len(a) == len(b) and all(same_tree(x, y, seen) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same_tree(a[k], b[k], seen) for k in a)
+    if type(a).__name__ == 'Token':
+        return (a.type, a.value, a.line, a.column) == (b.type, b.value, b.line, b.column)
+    return a == b
+
+
+def main():
+    import compiler
+
+    args = argparse.ArgumentParser(description='Save the checked AST of a program')
+    args.add_argument('source')
+    args.add_argument('-o', '--output')
+    args.add_argument('--licm', action='store_true')
+    args.add_argument('--const-calls', action='store_true')
+    args.add_argument('--switches', action='store_true')
+    args = args.parse_args()
+
+    try:
+        tree = compiler.check(open(args.source).read(), const_calls=args.const_calls, licm=args.licm,
+                              switches=args.switches)
+    except semantic.SemanticException as e:
+        print('Ошибка: {}'.format(e.message))
+        raise SystemExit(1)
+    data = dumps(tree)
+    with open(args.output or args.source.rsplit('.', 1)[0] + '.ast', 'wb') as f:
+        f.write(data)
+    print(f'{len(data)} bytes, {len(AstFile(data).function_names)} functions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,951 @@
+import atexit
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import compiler
+import ast_file
+import interpreter
+import modules
+import optimizer
+import analysis
+from passes import PassManager
+import parser_base
+
+BENCH_DIR = tempfile.mkdtemp(prefix='ourparser-bench-')
+atexit.register(shutil.rmtree, BENCH_DIR, True)
+
+
+def compile_to_file(prog: str, name: str, **options) -> str:
+    path = os.path.join(BENCH_DIR, f'{name}.ll')
+    with open(path, 'w') as f:
+        f.write(compiler.compile_program(prog, **options))
+    return path
+
+
+def optimize(path: str, level: str = '-O2') -> str:
+    result = path.replace('.ll', f'{level}.ll')
+    subprocess.run(['opt', level, '-S', path, '-o', result], check=True)
+    return result
+
+
+def run_ll(path: str, repeat: int = 3, stdin: str = '') -> float:
+    """Лучшее время (в секундах) из repeat запусков программы через lli
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(['lli', path], input=stdin.encode(), stdout=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(title: str, results: dict):
+    print(title)
+    base = None
+    for name, elapsed in results.items():
+        base = elapsed if base is None else base
+        print(f'    {name:<24} {elapsed * 1000:10.2f} ms  x{base / elapsed:.2f}')
+
+
+ARRAY_PRINT_PROG = '''
+void print_arr(int arr[{n}], int n){{
+    for(int i = 0; i < n; i = i + 1){{
+        print_int(arr[i]);
+    }}
+}}
+
+int main(){{
+    int a[{n}];
+    for(int i = 0; i < {n}; i = i + 1){{
+        a[i] = i;
+    }}
+    for(int k = 0; k < {calls}; k = k + 1){{
+        print_arr(a, 4);
+    }}
+    return 0;
+}}
+'''
+
+ARRAY_SORT_PROG = '''
+bool greater(int arr[{n}], int j){{
+    return arr[j] > arr[j + 1];
+}}
+
+void sort(int arr[{n}], int n){{
+    int temp = 0;
+    for (int i = 0; i < n - 1; i = i + 1)
+        for (int j = 0; j < n - i - 1; j = j + 1)
+            if (greater(arr, j)){{
+                temp = arr[j + 1];
+                arr[j + 1] = arr[j];
+                arr[j] = temp;
+            }}
+    print_int(arr[0]);
+}}
+
+int main(){{
+    int a[{n}];
+    for(int i = 0; i < {n}; i = i + 1){{
+        a[i] = {n} - i;
+    }}
+    sort(a, {n});
+    return 0;
+}}
+'''
+
+
+def bench_array_params():
+    for title, prog in (('print_arr: 100000 elements, 5000 calls', ARRAY_PRINT_PROG.format(n=100000, calls=5000)),
+                        ('sort: 1500 elements', ARRAY_SORT_PROG.format(n=1500))):
+        copy = compile_to_file(prog, 'arrays_copy')
+        by_ref = compile_to_file(prog, 'arrays_by_ref', arrays_by_ref=True)
+        report(title, {'copy': run_ll(copy), 'by reference': run_ll(by_ref)})
+
+
+def bench_function_attributes():
+    programs = (('tests/bbbb.c', open('tests/bbbb.c').read(), 'hello\n'),
+                ('print_arr', ARRAY_PRINT_PROG.format(n=100000, calls=5000), ''),
+                ('sort', ARRAY_SORT_PROG.format(n=1500), ''))
+    for title, prog, stdin in programs:
+        plain = optimize(compile_to_file(prog, 'attributes_off', function_attributes=False))
+        attributed = optimize(compile_to_file(prog, 'attributes_on'))
+        report(f'{title} at -O2', {'external, no attributes': run_ll(plain, stdin=stdin),
+                                   'internal + attributes': run_ll(attributed, stdin=stdin)})
+
+
+ARRAY_SUM_PROG = '''
+int main(){{
+    int a[{n}];
+    for (int i = 0; i < {n}; i = i + 1) {{
+        a[i] = i;
+    }}
+    int sum = 0;
+    for (int k = 0; k < {repeat}; k = k + 1) {{
+        {pragma}
+        for (int j = 0; j < {n}; j = j + 1) {{
+            sum = sum + a[j];
+        }}
+    }}
+    print_int(sum);
+    return 0;
+}}
+'''
+
+
+def bench_loop_hints():
+    hints = {
+        'no hints': '',
+        'vectorize_width(8)': '#pragma loop vectorize_width(8) interleave_count(4)',
+        'unroll_count(8)': '#pragma loop unroll_count(8)',
+    }
+    results = {}
+    for name, pragma in hints.items():
+        prog = ARRAY_SUM_PROG.format(n=500000, repeat=5000, pragma=pragma)
+        results[name] = run_ll(optimize(compile_to_file(prog, 'loop_hints')))
+    report('array summation at -O2', results)
+
+
+def bench_cse():
+    programs = (('tests/bbbb.c', open('tests/bbbb.c').read()),
+                ('sort', ARRAY_SORT_PROG.format(n=1500)))
+    for title, prog in programs:
+        tree = compiler.check(prog)
+        print(title)
+        for cse in (False, True):
+            start = time.perf_counter()
+            for _ in range(20):
+                code = compiler.generate(tree, cse=cse)
+            codegen = (time.perf_counter() - start) / 20
+            path = compile_to_file(prog, f'cse_{cse}', cse=cse)
+            opt = None
+            for _ in range(3):
+                start = time.perf_counter()
+                optimize(path)
+                opt = min(opt or 1e9, time.perf_counter() - start)
+            print(f'    cse={cse!s:<6} {len(code.splitlines()):6} lines {len(code):8} bytes  '
+                  f'codegen {codegen * 1000:7.2f} ms  opt -O2 {opt * 1000:7.2f} ms')
+
+
+def generated_helpers_prog(count: int, used: int) -> str:
+    helpers = []
+    for i in range(count):
+        helpers.append(f'''
+int helper{i}(int a, int b){{
+    int c = a * {i} + b;
+    if (c > 100) {{
+        return c - 100;
+    }}
+    return c;
+    print_int(c);
+}}''')
+    calls = ''.join(f'    print_int(helper{i}(1, 2));\n' for i in range(used))
+    return ''.join(helpers) + f'''
+int main(){{
+{calls}    return 0;
+}}
+'''
+
+
+def bench_dce():
+    prog = generated_helpers_prog(300, 10)
+    results = {}
+    for dce in (False, True):
+        start = time.perf_counter()
+        tree = parser_base.parse(prog)
+        parsed = time.perf_counter()
+        tree.program = True
+        if dce:
+            funcs, stmts = optimizer.eliminate_dead_code(tree)
+            print(f'eliminated {funcs} functions and {stmts} statements')
+        tree.semantic_check(compiler.semantic.get_default_scope())
+        compiler.generate(tree)
+        results[f'dce={dce}'] = time.perf_counter() - parsed
+        print(f'    parse {(parsed - start) * 1000:.2f} ms')
+    report('semantic check + codegen after parse, 300 helpers, 10 used', results)
+
+
+class FirstOutput(io.BytesIO):
+    """stdout интерпретатора, запоминающий момент первого вывода
+    """
+    def __init__(self):
+        super().__init__()
+        self.first = None
+
+    def write(self, data):
+        if self.first is None:
+            self.first = time.perf_counter()
+        return super().write(data)
+
+
+def run_interpreter(tree, stdin: str = '') -> (float, float):
+    """(время до первого вывода, общее время) от проверенного дерева до конца программы
+    """
+    out = FirstOutput()
+    start = time.perf_counter()
+    interpreter.run(tree, io.BytesIO(stdin.encode()), out)
+    end = time.perf_counter()
+    return (out.first or end) - start, end - start
+
+
+def run_jit(tree, stdin: str = '') -> (float, float):
+    """То же для генерации LLVM и запуска через lli
+    """
+    path = os.path.join(BENCH_DIR, 'jit.ll')
+    start = time.perf_counter()
+    with open(path, 'w') as f:
+        f.write(compiler.generate(tree))
+    process = subprocess.Popen(['lli', path], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    process.stdin.write(stdin.encode())
+    process.stdin.close()
+    process.stdout.read(1)
+    first = time.perf_counter()
+    process.stdout.read()
+    process.wait()
+    return first - start, time.perf_counter() - start
+
+
+def bench_interpreter():
+    programs = (('tests/bbbb.c', open('tests/bbbb.c').read(), 'hello\n'),
+                ('print_arr', ARRAY_PRINT_PROG.format(n=1000, calls=50), ''),
+                ('sort 300', ARRAY_SORT_PROG.format(n=300), ''),
+                ('sort 1500', ARRAY_SORT_PROG.format(n=1500), ''))
+    for title, prog, stdin in programs:
+        print(title)
+        for name, runner in (('interpreter', run_interpreter), ('lli', run_jit)):
+            best = None
+            for _ in range(5):
+                # генерация LLVM меняет дерево (CSE, атрибуты), поэтому каждый раз новое
+                result = runner(compiler.check(prog), stdin)
+                best = result if best is None else (min(best[0], result[0]), min(best[1], result[1]))
+            print(f'    {name:<12} first output {best[0] * 1000:9.3f} ms  total {best[1] * 1000:9.2f} ms')
+
+
+CONST_CALLS_PROG = '''
+int fib(int n){
+    if (n < 2) return n;
+    return fib(n - 1) + fib(n - 2);
+}
+
+int power(int base, int exp){
+    int result = 1;
+    for (int i = 0; i < exp; i = i + 1) result = result * base;
+    return result;
+}
+
+int main(){
+    int sum = 0;
+    for (int i = 0; i < 2000; i = i + 1) {
+        sum = sum + fib(22) + power(3, 15);
+    }
+    print_int(sum);
+    return 0;
+}
+'''
+
+
+def bench_const_calls():
+    results = {}
+    for const_calls in (False, True):
+        start = time.perf_counter()
+        code = compiler.generate(compiler.check(CONST_CALLS_PROG, const_calls=const_calls))
+        compile_time = time.perf_counter() - start
+        path = os.path.join(BENCH_DIR, f'const_calls_{const_calls}.ll')
+        with open(path, 'w') as f:
+            f.write(code)
+        results[f'const_calls={const_calls}'] = run_ll(path)
+        print(f'    const_calls={const_calls!s:<6} compile {compile_time * 1000:8.2f} ms  '
+              f'{code.count(" call ")} calls in IR')
+    report('fib(22) + power(3, 15) in a loop of 2000, lli', results)
+
+
+MATMUL_PROG = '''
+int main(){{
+    int n = {n};
+    int a[{size}];
+    int b[{size}];
+    int c[{size}];
+    for (int t = 0; t < n * n; t = t + 1) {{
+        a[t] = t;
+        b[t] = n * n - t;
+    }}
+    for (int r = 0; r < {repeat}; r = r + 1) {{
+        for (int i = 0; i < n; i = i + 1) {{
+            for (int j = 0; j < n; j = j + 1) {{
+                int s = 0;
+                for (int k = 0; k < n; k = k + 1) {{
+                    s = s + a[i * n + k] * b[k * n + j];
+                }}
+                c[i * n + j] = s + r;
+            }}
+        }}
+    }}
+    print_int(c[n * n - 1]);
+    return 0;
+}}
+'''
+
+
+def bench_licm():
+    programs = (('matmul 120x120, 3 times', MATMUL_PROG.format(n=120, size=120 * 120, repeat=3)),
+                ('sort 1500', ARRAY_SORT_PROG.format(n=1500)))
+    for title, prog in programs:
+        results = {}
+        for licm in (False, True):
+            hoisted = optimizer.hoist_loop_invariants(compiler.check(prog)) if licm else 0
+            path = compile_to_file(prog, f'licm_{licm}', licm=licm)
+            with open(path) as f:
+                lines = len(f.readlines())
+            results[f'licm={licm}'] = run_ll(path)
+            results[f'licm={licm} -O2'] = run_ll(optimize(path))
+            print(f'    licm={licm!s:<6} {hoisted:3} hoisted  {lines:6} lines')
+        report(f'{title}, lli', results)
+
+
+TABLE_PROG = '''
+{table}
+int main(){{
+{init}    int s = 0;
+    for (int r = 0; r < {repeat}; r = r + 1) {{
+        for (int i = 0; i < 16; i = i + 1) {{
+            s = s + squares[i] * r;
+        }}
+    }}
+    print_int(s);
+    return 0;
+}}
+'''
+
+
+def bench_constant_tables():
+    variants = {
+        'filled in main': ('int squares[16];',
+                           '    for (int j = 0; j < 16; j = j + 1) {\n        squares[j] = j * j;\n    }\n'),
+        'initializer': (f'int squares[16] = {{{", ".join(str(i * i) for i in range(16))}}};', ''),
+    }
+    results = {}
+    for name, (table, init) in variants.items():
+        path = compile_to_file(TABLE_PROG.format(table=table, init=init, repeat=2000000), 'tables')
+        results[name] = run_ll(optimize(path))
+    report('sum over a 16-entry table, -O2, lli', results)
+
+
+def project_module(index: int, functions: int, version: int = 0) -> str:
+    """Модуль проекта: функции вызывают функции предыдущего модуля
+    """
+    prev = f'helper{index - 1}_0(a, b) + ' if index else ''
+    return ''.join(f'''
+int helper{index}_{i}(int a, int b){{
+    int c = {prev}a * {i + version} + b;
+    for (int k = 0; k < 3; k = k + 1) {{
+        if (c > 100) {{
+            c = c - 100;
+        }}
+    }}
+    return c;
+}}''' for i in range(functions))
+
+
+def bench_modules(count: int = 50, functions: int = 6):
+    project = os.path.join(BENCH_DIR, 'project')
+    os.makedirs(project)
+    sources = []
+    for i in range(count):
+        sources.append(os.path.join(project, f'module{i}.c'))
+        with open(sources[-1], 'w') as f:
+            f.write(project_module(i, functions))
+    sources.append(os.path.join(project, 'main.c'))
+    with open(sources[-1], 'w') as f:
+        f.write(f'int main(){{\n    print_int(helper{count - 1}_0(1, 2));\n    return 0;\n}}\n')
+    whole = ''.join(project_module(i, functions) for i in range(count)) + open(sources[-1]).read()
+
+    def edit(index: int, version: int):
+        with open(sources[index], 'w') as f:
+            f.write(project_module(index, functions, version))
+
+    out_dir = os.path.join(BENCH_DIR, 'project-build')
+    results = {}
+    start = time.perf_counter()
+    compiler.compile_program(whole)
+    results['single file'] = time.perf_counter() - start
+    steps = {
+        'full build': lambda: None,
+        'nothing changed': lambda: None,
+        'one module changed': lambda: edit(count // 2, 1),
+    }
+    for name, step in steps.items():
+        step()
+        rebuilt = []
+        start = time.perf_counter()
+        program = modules.build(sources, out_dir, log=rebuilt)
+        results[f'{name} ({len(rebuilt)})'] = time.perf_counter() - start
+    subprocess.run(['lli', program], stdout=subprocess.DEVNULL, check=True)
+    report(f'build of {count} modules x {functions} functions, incl. linking (rebuilt modules)', results)
+
+
+def bench_ast_file(count: int = 100):
+    prog = generated_helpers_prog(count, count)
+    results = {}
+    start = time.perf_counter()
+    tree = compiler.check(prog)
+    results['parse + semantic check'] = time.perf_counter() - start
+
+    path = os.path.join(BENCH_DIR, 'helpers.ast')
+    start = time.perf_counter()
+    ast_file.dump(tree, path)
+    print(f'    dump {(time.perf_counter() - start) * 1000:.2f} ms, {os.path.getsize(path)} bytes '
+          f'(source {len(prog)} bytes)')
+
+    start = time.perf_counter()
+    loaded = ast_file.load(path)
+    results['load'] = time.perf_counter() - start
+    start = time.perf_counter()
+    ast_file.AstFile.open(path).function('main')
+    results['lazy load of main'] = time.perf_counter() - start
+
+    assert ast_file.same_tree(tree, loaded)
+    assert compiler.generate(tree) == compiler.generate(loaded)
+    report(f'checked AST of {count} helpers', results)
+
+
+def bench_passes(count: int = 100, repeat: int = 20):
+    timings = {}
+    tree = compiler.check(generated_helpers_prog(count, count), timings=timings)
+    codegen_passes = (analysis.ConstantDataPass, analysis.FunctionSummaryPass,
+                      analysis.ReadonlyArrayParamsPass, analysis.FunctionAttributesPass)
+
+    def separate():
+        analysis.mark_constant_data(tree)
+        analysis.mark_readonly_array_params(tree)
+        analysis.mark_function_attributes(tree)
+
+    def fused():
+        PassManager(*(cls() for cls in codegen_passes)).run(tree)
+
+    results = {}
+    for name, run in (('separate traversals', separate), ('fused', fused)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+    report(f'codegen analyses over {count} helpers', results)
+
+    manager = PassManager(*(cls() for cls in codegen_passes), profile=True)
+    manager.run(tree)
+    print('per pass (profiled):')
+    for name, elapsed in timings.items():
+        print(f'    {name:<60} {elapsed * 1000:10.2f} ms')
+    manager.report()
+
+
+BRANCHY_PROG = '''
+int classify(int x) {{
+    if (x > 998) {{
+        return x / 7 + x / 11;
+    }}
+    return 1;
+}}
+
+int main() {{
+    int total = 0;
+    int v = 0;
+    for (int i = 0; i < {n}; i = i + 1) {{
+        v = i - i / 1000 * 1000;
+        if (v > 996) {{
+            total = total * 3 + v;
+        }} else {{
+            total = total + classify(v);
+        }}
+    }}
+    print_int(total);
+    return 0;
+}}
+'''
+
+
+def bench_pgo(n: int = 100000000):
+    prog = BRANCHY_PROG.format(n=n)
+    profile = os.path.join(BENCH_DIR, 'branchy.prof')
+    subprocess.run(['lli', compile_to_file(prog, 'branchy-instrumented', profile=profile)],
+                   stdout=subprocess.DEVNULL, check=True)
+    counts = compiler.read_profile(profile)
+    print(f'    profile: {len(counts)} counters')
+
+    results = {
+        'no profile': run_ll(optimize(compile_to_file(prog, 'branchy'))),
+        'profile-guided': run_ll(optimize(compile_to_file(prog, 'branchy-pgo', profile_counts=counts))),
+    }
+    report('branchy loop, -O2, lli', results)
+
+
+def dispatch_prog(cases: int, n: int) -> str:
+    rungs = ' else '.join(f'if (op == {k}) {{\n        acc = acc * {k % 7 + 2} + {k * 37 % 101};\n    }}'
+                          for k in range(cases))
+    return f'''
+int dispatch(int op, int acc) {{
+    {rungs}
+    return acc & 65535;
+}}
+
+int main() {{
+    int acc = 1;
+    for (int i = 0; i < {n}; i = i + 1) {{
+        acc = dispatch(i * 97 & {cases - 1}, acc);
+    }}
+    print_int(acc);
+    return 0;
+}}
+'''
+
+
+def bench_switch(cases: int = 256, n: int = 3000000):
+    prog = dispatch_prog(cases, n)
+    print(f'    lowered chains: {optimizer.lower_switches(compiler.check(prog))}')
+    results = {}
+    for switches in (False, True):
+        path = compile_to_file(prog, f'dispatch_{switches}', switches=switches)
+        results[f'switches={switches}'] = run_ll(path)
+        results[f'switches={switches} -O2'] = run_ll(optimize(path))
+    report(f'{cases}-way dispatch, {n} calls, lli', results)
+
+
+def bench_conversions():
+    import corpus
+
+    print('conversions removed, IR bytes without / with the pass:')
+    removed, sizes = 0, [0, 0]
+    for name in corpus.sources():
+        with open(os.path.join(corpus.TESTS_DIR, name)) as f:
+            prog = f.read()
+        try:
+            tree = compiler.check(prog)
+        except Exception:
+            continue
+        before = len(compiler.generate(tree))
+        count = optimizer.simplify_conversions(tree)
+        after = len(compiler.generate(tree))
+        removed += count
+        sizes[0] += before
+        sizes[1] += after
+        print(f'    {name:<30} {count:5} {before:8} {after:8}')
+    print(f'    {"total":<30} {removed:5} {sizes[0]:8} {sizes[1]:8}')
+    conversions = '\n'.join(f'    float f{i} = {i};\n    bool b{i} = f{i} + {i};\n    print_float(f{i} + b{i});'
+                             for i in range(200))
+    prog = f'int main() {{\n{conversions}\n    return 0;\n}}\n'
+    print('200 statements with literal and mixed-type conversions:')
+    for conversions in (False, True):
+        print(f'    conversions={conversions}: {len(compiler.compile_program(prog, conversions=conversions))} bytes')
+
+
+FLOAT_REDUCTION_PROG = '''
+int main() {{
+    float a[{n}];
+    for (int i = 0; i < {n}; i = i + 1) {{
+        a[i] = i * 0.5;
+    }}
+    float s = 0.0;
+    for (int r = 0; r < {repeat}; r = r + 1) {{
+        for (int i = 0; i < {n}; i = i + 1) {{
+            s = s + a[i] * a[i];
+        }}
+    }}
+    print_float(s);
+    return 0;
+}}
+'''
+
+# сдвиг k неизвестен при компиляции: без nsw индекс i + k может переполниться, и его sext остается в цикле
+INT_SCAN_PROG = '''
+int scan(int a[{n}], int n, int k) {{
+    int count = 0;
+    for (int i = 0; i < n; i = i + 1) {{
+        if (a[i + k] > a[i]) {{
+            count = count + 1;
+        }}
+    }}
+    return count;
+}}
+
+int main() {{
+    int a[{n}];
+    for (int i = 0; i < {n}; i = i + 1) {{
+        a[i] = i * 7 - i / 3;
+    }}
+    int count = 0;
+    for (int r = 0; r < {repeat}; r = r + 1) {{
+        count = count + scan(a, {n} - 8, r & 7);
+    }}
+    print_int(count);
+    return 0;
+}}
+'''
+
+
+def bench_arithmetic_flags(n: int = 100000, repeat: int = 10000):
+    flags = {
+        'no flags': {},
+        'nsw': {'nsw': True},
+        'nsw, fast-math': {'nsw': True, 'fast_math': 'fast'},
+        'reassoc nnan ninf': {'nsw': True, 'fast_math': 'reassoc nnan ninf'},
+    }
+    for title, prog in (('float reduction', FLOAT_REDUCTION_PROG), ('int array scan', INT_SCAN_PROG)):
+        prog = prog.format(n=n, repeat=repeat)
+        results = {}
+        for name, options in flags.items():
+            if title == 'int array scan' and 'fast_math' in options:
+                continue
+            path = compile_to_file(prog, 'arithmetic_flags', arrays_by_ref=True, **options)
+            results[name] = run_ll(optimize(path))
+        report(f'{title}, {n} elements x {repeat}, -O2', results)
+
+
+# индекс h зависит от данных: проверка остается в цикле
+HISTOGRAM_PROG = '''
+int main() {{
+    int a[{n}];
+    int h[256];
+    for (int i = 0; i < {n}; i = i + 1) {{
+        a[i] = i * 7919 & 255;
+    }}
+    for (int r = 0; r < {repeat}; r = r + 1) {{
+        for (int i = 0; i < {n}; i = i + 1) {{
+            h[a[i]] = h[a[i]] + r;
+        }}
+    }}
+    print_int(h[7]);
+    return 0;
+}}
+'''
+
+
+def bench_bounds_checks():
+    programs = (('array sum, 10000 elements x 20000', ARRAY_SUM_PROG.format(n=10000, repeat=20000, pragma='')),
+                ('matmul 200x200, 3 times', MATMUL_PROG.format(n=200, size=200 * 200, repeat=3)),
+                ('int array scan, 100000 elements x 10000', INT_SCAN_PROG.format(n=100000, repeat=10000)),
+                ('float reduction, 100000 elements x 2000', FLOAT_REDUCTION_PROG.format(n=100000, repeat=2000)),
+                ('histogram, 100000 elements x 1000', HISTOGRAM_PROG.format(n=100000, repeat=1000)))
+    for title, prog in programs:
+        tree = compiler.check(prog)
+        PassManager(analysis.ConstantDataPass(), analysis.BoundsCheckPass()).run(tree)
+        accesses, removed, hoisted = analysis.bounds_check_counts(tree)
+        print(f'    {accesses} accesses: {removed} checks removed, {hoisted} hoisted to loop preheaders, '
+              f'{accesses - removed - hoisted} in place')
+        results = {}
+        for checks in (False, True):
+            path = compile_to_file(prog, f'bounds_checks_{checks}', bounds_checks=checks, arrays_by_ref=True, nsw=True)
+            results[f'bounds_checks={checks}'] = run_ll(optimize(path))
+        report(f'{title}, -O2', results)
+
+
+TAIL_CALL_PROGS = {
+    'accumulating sum, depth {n}': '''
+int sum(int n, int acc) {{
+    if (n == 0) {{
+        return acc;
+    }}
+    return sum(n - 1, acc + n);
+}}
+
+int main() {{
+    print_int(sum({n}, 0));
+    return 0;
+}}
+''',
+    'gcd, {n} calls': '''
+int gcd(int a, int b) {{
+    if (b == 0) {{
+        return a;
+    }}
+    return gcd(b, a - a / b * b);
+}}
+
+int main() {{
+    int s = 0;
+    for (int i = 1; i < {n}; i = i + 1) {{
+        s = s + gcd(i * 7919, i + 104729);
+    }}
+    print_int(s);
+    return 0;
+}}
+''',
+    'binary search, {n} lookups': '''
+int search(int arr[4096], int x, int lo, int hi) {{
+    if (hi - lo < 2) {{
+        return lo;
+    }}
+    int mid = (lo + hi) / 2;
+    if (arr[mid] > x) {{
+        return search(arr, x, lo, mid);
+    }}
+    return search(arr, x, mid, hi);
+}}
+
+int main() {{
+    int data[4096];
+    for (int i = 0; i < 4096; i = i + 1) {{
+        data[i] = i * 3;
+    }}
+    int s = 0;
+    for (int j = 0; j < {n}; j = j + 1) {{
+        s = s + search(data, j & 16383, 0, 4096);
+    }}
+    print_int(s);
+    return 0;
+}}
+''',
+}
+
+
+def bench_tail_calls():
+    sizes = {'accumulating sum, depth {n}': 10000000, 'gcd, {n} calls': 1000000, 'binary search, {n} lookups': 1000000}
+    for title, prog in TAIL_CALL_PROGS.items():
+        prog = prog.format(n=sizes[title])
+        results = {}
+        for tail_calls in (False, True):
+            path = compile_to_file(prog, f'tail_calls_{tail_calls}', tail_calls=tail_calls, arrays_by_ref=True)
+            for name, program in ((f'tail_calls={tail_calls}', path),
+                                  (f'tail_calls={tail_calls} -O2', optimize(path))):
+                try:
+                    results[name] = run_ll(program)
+                except subprocess.CalledProcessError:
+                    print(f'    {name:<24} crashed (stack overflow)')
+        report(f'{title.format(n=sizes[title])}, lli', results)
+
+
+ALLOCATION_PROGS = {
+    'scratch arrays of size {n}, {calls} calls': '''
+int work(int n, int seed) {{
+    int tmp[n];
+    for (int i = 0; i < n; i = i + 1) {{
+        tmp[i] = seed + i;
+    }}
+    return tmp[seed & 15] + tmp[n - 1];
+}}
+
+int main() {{
+    int s = 0;
+    for (int k = 0; k < {calls}; k = k + 1) {{
+        s = s + work({n}, k);
+    }}
+    print_int(s);
+    return 0;
+}}
+''',
+    'returned arrays of size {n}, {calls} calls': '''
+int[] make(int n, int seed) {{
+    int a[n];
+    for (int i = 0; i < n; i = i + 1) {{
+        a[i] = seed * i;
+    }}
+    return a;
+}}
+
+int main() {{
+    int s = 0;
+    int b[{n}];
+    for (int k = 0; k < {calls}; k = k + 1) {{
+        b = make({n}, k);
+        s = s + b[k & 15];
+    }}
+    print_int(s);
+    return 0;
+}}
+''',
+}
+
+
+def bench_allocation(n: int = 16, calls: int = 2000000):
+    variants = {'arena': {}, 'malloc per array': {'arena_chunk': 0}}
+    for title, prog in ALLOCATION_PROGS.items():
+        prog = prog.format(n=n, calls=calls)
+        results = {}
+        for name, options in variants.items():
+            path = compile_to_file(prog, 'allocation', **options)
+            results[name] = run_ll(path)
+            results[f'{name} -O2'] = run_ll(optimize(path))
+        report(f'{title.format(n=n, calls=calls)}, lli', results)
+
+
+ARRAY_BUILT_IN_PROG = '''
+int a[{n}];
+int b[{n}];
+
+int main() {{
+    for (int i = 0; i < {n}; i = i + 1) {{
+        a[i] = (i * 7919) & 1023;
+    }}
+    int s = 0;
+    for (int k = 0; k < {repeat}; k = k + 1) {{
+        {body}
+    }}
+    print_int(s + a[{n} - 1] + b[{n} - 1]);
+    return 0;
+}}
+'''
+
+# операция -> (цикл, встроенная функция); print выполняется один раз
+ARRAY_BUILT_IN_BODIES = {
+    'fill': ('for (int j = 0; j < {n}; j = j + 1) {{ b[j] = k; }}', 'fill(b, k, {n});'),
+    'copy': ('for (int j = 0; j < {n}; j = j + 1) {{ b[j] = a[j]; }}', 'copy(b, a, {n});'),
+    'sum': ('for (int j = 0; j < {n}; j = j + 1) {{ s = s + a[j]; }}', 's = s + sum(a, {n});'),
+    'max': ('int m = a[0]; for (int j = 1; j < {n}; j = j + 1) {{ if (a[j] > m) {{ m = a[j]; }} }} s = s + m;',
+            's = s + max(a, {n});'),
+    'print': ('for (int j = 0; j < {n}; j = j + 1) {{ print_int(a[j]); }}', 'print_array(a, {n});'),
+}
+
+
+def bench_array_built_ins(n: int = 10000000, repeat: int = 10):
+    for name, bodies in ARRAY_BUILT_IN_BODIES.items():
+        times = 1 if name == 'print' else repeat
+        results = {}
+        for variant, body in zip(('loop', 'built-in'), bodies):
+            prog = ARRAY_BUILT_IN_PROG.format(n=n, repeat=times, body=body.format(n=n))
+            path = compile_to_file(prog, f'array_built_in_{variant}')
+            results[variant] = run_ll(path)
+            results[f'{variant} -O2'] = run_ll(optimize(path))
+        report(f'{name}: {n} elements x {times}, lli', results)
+
+
+def bench_parallel(count: int = 5000, jobs: int = os.cpu_count() or 1):
+    """Проверка и генерация кода функций в jobs процессах; разбор (одинаковый для всех вариантов)
+    выполняется один раз, каждый вариант получает копию дерева через ast_file
+    """
+    parsed = ast_file.dumps(parser_base.parse(generated_helpers_prog(count, 50)))
+    results, codes = {}, {}
+    for variant in sorted({1, 2, jobs}):
+        tree = ast_file.loads(parsed)
+        start = time.perf_counter()
+        compiler.check_tree(tree, jobs=variant)
+        codes[variant] = compiler.generate(tree, jobs=variant)
+        results[f'{variant} jobs'] = time.perf_counter() - start
+    assert len(set(codes.values())) == 1
+    report(f'semantic check + codegen of {count} functions ({os.cpu_count()} CPUs)', results)
+
+
+# бюджет запуска компилятора (мс); bench.py startup завершается с ошибкой при превышении
+IMPORT_BUDGET_MS = 60
+STARTUP_BUDGET_MS = 250
+# модули, которые не должны загружаться при import compiler (нужны только разбору, -j или командной строке)
+LAZY_MODULES = ('lark', 'multiprocessing', 'argparse')
+
+
+def import_times(module: str) -> dict:
+    """python -X importtime: модуль -> (собственное время, время с зависимостями) в мкс
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line and 'self [us]' not in line:
+            own, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def bench_startup(repeat: int = 5):
+    times = import_times('compiler')
+    print('slowest imports (self, cumulative):')
+    for name, (own, cumulative) in sorted(times.items(), key=lambda item: -item[1][0])[:8]:
+        print(f'    {name:<40} {own / 1000:8.2f} ms {cumulative / 1000:8.2f} ms')
+
+    source = os.path.join(BENCH_DIR, 'startup.c')
+    with open(source, 'w') as f:
+        f.write('int main(){ print_int(1); return 0; }')
+    cli = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compiler.py'),
+           source, '-o', os.path.join(BENCH_DIR, 'startup.ll')]
+    # первый запуск сохраняет снимок грамматики и встроенных функций
+    subprocess.run(cli, check=True)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cli, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    results = {'import compiler': times['compiler'][1] / 1e6, 'compile a one-line program': best}
+    report('compiler startup', results)
+    failures = [f'{name} imported by compiler' for name in LAZY_MODULES if name in times]
+    if results['import compiler'] * 1000 > IMPORT_BUDGET_MS:
+        failures.append(f'import compiler takes more than {IMPORT_BUDGET_MS} ms')
+    if best * 1000 > STARTUP_BUDGET_MS:
+        failures.append(f'compiling a one-line program takes more than {STARTUP_BUDGET_MS} ms')
+    if failures:
+        raise SystemExit('startup budget exceeded: ' + '; '.join(failures))
+
+
+BENCHMARKS = {
+    'array_params': bench_array_params,
+    'function_attributes': bench_function_attributes,
+    'loop_hints': bench_loop_hints,
+    'cse': bench_cse,
+    'dce': bench_dce,
+    'interpreter': bench_interpreter,
+    'const_calls': bench_const_calls,
+    'licm': bench_licm,
+    'constant_tables': bench_constant_tables,
+    'modules': bench_modules,
+    'ast_file': bench_ast_file,
+    'passes': bench_passes,
+    'pgo': bench_pgo,
+    'switch': bench_switch,
+    'conversions': bench_conversions,
+    'arithmetic_flags': bench_arithmetic_flags,
+    'bounds_checks': bench_bounds_checks,
+    'tail_calls': bench_tail_calls,
+    'allocation': bench_allocation,
+    'array_built_ins': bench_array_built_ins,
+    'parallel': bench_parallel,
+    'startup': bench_startup,
+}
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -1,10 +1,373 @@
-from typing import List, Dict
+import re
+from typing import List, Dict, Iterable, Optional, Set, Tuple, Callable
+
+from utils import getLLVMTypeSize
 
 
 INT_POINTER_CONST = "@int.0.0"
 CHAR_POINTER_CONST = "@char.0.0"
 FLOAT_POINTER_CONST = "@float.0.0"
 
+TERMINATORS = ('br', 'ret', 'switch', 'unreachable')
+
+_host_target = ()
+
+
+def host_target() -> Optional[Tuple[str, str]]:
+    """(target datalayout, target triple) хоста по установленному LLVM: тройка - llvm-config --host-target,
+    размещение данных - то, что llc выставляет пустому модулю для этой тройки; None - LLVM не найден
+    (строки target в IR не выводятся). Определяется один раз за процесс
+    """
+    global _host_target
+    if _host_target == ():
+        import subprocess
+
+        _host_target = None
+        try:
+            triple = subprocess.run(['llvm-config', '--host-target'], capture_output=True, text=True,
+                                    check=True).stdout.strip()
+            module = subprocess.run(['llc', f'-mtriple={triple}', '-stop-after=pre-isel-intrinsic-lowering',
+                                     '-o', '-'], input='', capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        layout = re.search(r'target datalayout = "([^"]*)"', module)
+        if triple and layout is not None:
+            _host_target = (layout.group(1), triple)
+    return _host_target
+
+
+def arrayLiteral(elem_type: str, contents: Tuple[str, ...]) -> str:
+    """Константа LLVM типа [N x T] из значений элементов
+    """
+    if all(value in ('0', 'false', '0x0000000000000000') for value in contents):
+        return f"[{len(contents)} x {elem_type}] zeroinitializer"
+    return f"[{len(contents)} x {elem_type}] [{', '.join(f'{elem_type} {value}' for value in contents)}]"
+
+
+def arrayStart(elem_type: str, size: int, data: str) -> str:
+    """Указатель на первый элемент глобального массива [size x T] (константное выражение)
+    """
+    return f"getelementptr inbounds ([{size} x {elem_type}], [{size} x {elem_type}]* {data}, i32 0, i32 0)"
+
+
+# арена: связный список блоков памяти, выделенных malloc (в начале блока - указатель на предыдущий блок
+# и размер блока); память выделяется сдвигом указателя top внутри текущего блока, release возвращает
+# блоки новее метки в список свободных (spare), из которого берутся следующие блоки.
+# Для функций арена @arena.frame освобождается при каждом выходе из функции до метки, сохраненной при входе,
+# @arena.heap (массивы, которые переживают функцию) - только при завершении программы
+ARENA_RUNTIME = """@arena.frame = internal global {type} zeroinitializer
+@arena.heap = internal global {type} zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({type}* %a, i64 %n) nounwind {{
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 1
+  %endp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, {chunk}
+  %want.size = select i1 %large, i64 %want, i64 {chunk}
+  %sparep = getelementptr inbounds {type}, {type}* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}}
+
+define internal void @arena.release({type}* %a, i8* %head, i8* %top, i8* %end) nounwind {{
+entry:
+  %headp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds {type}, {type}* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+{discard}
+  br label %check
+exit:
+  %topp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds {type}, {type}* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}}
+"""
+
+# release: блок становится свободным для повторного использования или (malloc на каждый массив) освобождается
+ARENA_RECYCLE = """  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep"""
+ARENA_FREE = "  call void @free(i8* %chunk)"
+ARENA_TYPE = "{ i8*, i8*, i8*, i8* }"
+ARENA_FIELDS = ('head', 'top', 'end')
+
+
+# встроенные функции над массивами (CodeGenerator.arrayRuntime): функции с циклами по n элементам,
+# выводятся в секцию данных при первом использовании для каждого типа элементов.
+# Циклы по целым числам помечаются для векторизации; для double порядок операций сохраняется
+# (сложение и сравнение с NaN не ассоциативны), поэтому такие циклы векторизуются только при записи
+VECTORIZE_ENABLE = '!{!"llvm.loop.vectorize.enable", i1 true}'
+
+ARRAY_FILL = """define internal void @array.fill.{suffix}({type}* %a, {type} %value, i32 %n) nounwind {{
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds {type}, {type}* %a, i64 %i
+  store {type} %value, {type}* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done{loop}
+done:
+  ret void
+}}
+"""
+
+# sum, min, max: свертка, начиная с первого элемента; для пустого массива - 0
+ARRAY_REDUCE = """define internal {type} @array.{name}.{suffix}({type}* %a, i32 %n) nounwind readonly {{
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load {type}, {type}* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi {type} [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds {type}, {type}* %a, i64 %i
+  %v = load {type}, {type}* %p
+{combine}
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done{loop}
+done:
+  %result = phi {type} [ {zero}, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret {type} %result
+}}
+"""
+
+ARRAY_COMBINE = {
+    'sum': "  %acc.next = {add} {type} %acc, %v",
+    'min': "  %better = {lt} {type} %v, %acc\n  %acc.next = select i1 %better, {type} %v, {type} %acc",
+    'max': "  %better = {gt} {type} %v, %acc\n  %acc.next = select i1 %better, {type} %v, {type} %acc",
+}
+
+# sort: qsort из libc со сравнением элементов как операторы < и > языка
+ARRAY_SORT = """define internal i32 @array.compare.{suffix}(i8* %x, i8* %y) nounwind readonly {{
+entry:
+  %px = bitcast i8* %x to {type}*
+  %py = bitcast i8* %y to {type}*
+  %vx = load {type}, {type}* %px
+  %vy = load {type}, {type}* %py
+  %less = {lt} {type} %vx, %vy
+  %greater = {gt} {type} %vx, %vy
+  %less.32 = zext i1 %less to i32
+  %greater.32 = zext i1 %greater to i32
+  %order = sub i32 %greater.32, %less.32
+  ret i32 %order
+}}
+
+define internal void @array.sort.{suffix}({type}* %a, i32 %n) nounwind {{
+entry:
+  %many = icmp sgt i32 %n, 1
+  br i1 %many, label %sort, label %done
+sort:
+  %data = bitcast {type}* %a to i8*
+  %count = sext i32 %n to i64
+  call void @qsort(i8* %data, i64 %count, i64 {size}, i32 (i8*, i8*)* @array.compare.{suffix})
+  br label %done
+done:
+  ret void
+}}
+"""
+
+# print_array: элементы форматируются в буфер (как print_int/print_float/print_char - по одному в строке),
+# буфер выводится одним fwrite, когда в нем остается меньше ARRAY_PRINT_RESERVE байт, и в конце
+ARRAY_PRINT_BUFFER = 16384
+ARRAY_PRINT_RESERVE = 512
+ARRAY_WRITE = """@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+"""
+
+ARRAY_PRINT = """define internal void @array.print.{suffix}({type}* %a, i32 %n) nounwind {{
+entry:
+  %buffer = alloca [{buffer} x i8]
+  %base = getelementptr inbounds [{buffer} x i8], [{buffer} x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, {limit}
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds {type}, {type}* %a, i64 %i
+  %v = load {type}, {type}* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+{format}
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}}
+"""
+
+# запись элемента %v в буфер с позиции %start, результат - %pos.next
+ARRAY_PRINT_FORMAT = {
+    'i8': """  store i8 %v, i8* %out
+  %newline.out = getelementptr inbounds i8, i8* %out, i64 1
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %start, 2
+  br label %next""",
+    # цифры записываются с конца во временный буфер, модуль считается в i64 (для -2147483648)
+    'i32': """  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next""",
+    'double': """  %room = sub i64 {buffer}, %start
+  %written = call i32 (i8*, i64, i8*, ...) @snprintf(i8* %out, i64 %room, i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %v)
+  %written.64 = sext i32 %written to i64
+  %pos.next = add i64 %start, %written.64
+  br label %next""",
+}
+
+
+# выход за границы массива (режим проверки границ): сообщение как у интерпретатора, код завершения 1;
+# exit сбрасывает буферы вывода программы
+BOUNDS_ERROR_MESSAGE = "Ошибка выполнения: Выход за границы массива: %d\n"
+BOUNDS_ERROR = """declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {{
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* {message}, i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}}
+"""
+
+
+# строки тела функции: метка, определение значения; имя локального значения или метки
+LABEL = re.compile(r"^([-a-zA-Z$._0-9]+):$")
+DEFINITION = re.compile(r"^\s*(%[-a-zA-Z$._0-9]+) = ")
+LOCAL_NAME = re.compile(r"%[-a-zA-Z$._0-9]+")
+# результат вызова не присвоен, но функция не void - значение все равно получает номер
+UNNAMED_CALL = re.compile(r"^\s*(?:(?:tail|musttail) )?call (?!void )")
+
+# имена, которые генератор функции (CodeGenerator.fork) нумерует сам: при объединении (merge) они перенумеруются
+FRAGMENT_NAMES = re.compile(r"@const\.\d+\b|@prof\.\d+\b|!\d+\b")
+
+
+class Fragment:
+    """Код одной функции, сгенерированный отдельным генератором (CodeGenerator.fork):
+    текст функции, ее метаданные, константные массивы (ключ -> имя), счетчики профиля
+    и отложенные объявления уровня программы (метод генератора, аргументы)
+    """
+    def __init__(self, code: str, metadata: List[str], constants: Dict[tuple, str], counters: List[str],
+                 deferred: List[tuple]):
+        self.code = code
+        self.metadata = metadata
+        self.constants = constants
+        self.counters = counters
+        self.deferred = deferred
+
 
 class CodeLine:
     def __init__(self, code: str):
@@ -15,35 +378,518 @@ class CodeLine:
 
 
 class CodeGenerator:
-    def __init__(self):
+    def __init__(self, arrays_by_ref: bool = False, function_attributes: bool = True,
+                 exported: Iterable[str] = (), cse: bool = False, profile: Optional[str] = None,
+                 profile_counts: Optional[Dict[str, int]] = None, tail_calls: bool = True,
+                 stack_array_limit: Optional[int] = 65536, arena_chunk: int = 1 << 20, named_values: bool = False,
+                 nsw: bool = False, fast_math: Optional[str] = None, bounds_checks: bool = False):
         self.code_lines: List[CodeLine] = []
+        # счетчики имен значений и меток (имя -> следующий номер), свои у каждой функции
         self.var_counter: Dict[str, int] = {}
+        # имена значений (%x.3, %call.f.0) остаются в IR для отладки, иначе в конце функции
+        # значения и метки перенумеровываются (%0, %1, ...)
+        self.named_values = named_values
+        # nsw - переполнение int в add/sub/mul считается невозможным (poison), индексы массивов расширяются до i64:
+        # LLVM расширяет счетчики циклов и векторизует их; fast_math - флаги fast-math (fast, "reassoc nnan ninf")
+        # операций и сравнений над float: переупорядочивание сумм, векторизация редукций
+        self.nsw = nsw
+        self.fast_math = fast_math
+        # обращения к массивам проверяются на выход за границы (analysis.BoundsCheckPass);
+        # checked_loop - сейчас генерируется копия цикла, в которой выполняются и вынесенные проверки
+        self.bounds_checks = bounds_checks
+        self.checked_loop = 0
+        self.bounds_error_declared = False
+        self.metadata: List[str] = []
+        # access group'ы циклов с подсказкой noalias, внутри которых сейчас генерируется код
+        self.access_groups: List[str] = []
+        self.access_group_lists: Dict[Tuple[str, ...], str] = {}
+        # массивы-параметры, которые функция не изменяет, передаются без копирования
+        self.arrays_by_ref = arrays_by_ref
+        # internal-линковка и атрибуты функций; снаружи видны только main и exported
+        self.function_attributes = function_attributes
+        self.exported = set(exported)
+        # нумерация значений в пределах базового блока:
+        # ('load', ptr), ('elem', ptr) - загрузки из памяти, ('binop', ...), ('gep', ...), ('conv', ...) - чистые значения
+        self.cse = cse
+        self.values: Dict[tuple, str] = {}
+        # текущий базовый блок уже завершен (br/ret), до следующей метки код недостижим
+        self.terminated = False
+        # значения, вычисленные в предзаголовках объемлющих циклов (LICM): действуют во всем цикле,
+        # поэтому не сбрасываются на метках; hoisting - сейчас генерируется предзаголовок
+        self.invariants: List[Dict[tuple, str]] = []
+        self.hoisting = False
+        # секция данных: глобальные переменные и константы, выводится после функций
+        self.data: List[str] = []
+        # код копии цикла с проверками границ (ForNode.iterate) объявляет те же переменные повторно
+        self.defined: Set[str] = set()
+        self.constant_arrays: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self.malloc_declared = False
+        # функции других модулей, для которых уже выведен declare
+        self.externals: Set[str] = set()
+        self.init_start: Optional[int] = None
+        # profile - файл, в который программа при завершении дописывает счетчики выполнения блоков;
+        # profile_counts - счетчики прошлого запуска: из них выводятся веса ветвлений (!prof)
+        self.profile = profile
+        self.profile_counts = profile_counts or {}
+        self.counters: List[str] = []
+        # return f(...) генерируется как tail/musttail call, а вызов функцией самой себя - переходом в ее начало
+        self.tail_calls = tail_calls
+        # массивы больше stack_array_limit байт (или неизвестного при компиляции размера) и массивы,
+        # которые переживают функцию, размещаются в арене (None - все массивы в стеке, как раньше);
+        # arena_chunk - размер блока арены, 0 - отдельный malloc на каждый массив
+        self.stack_array_limit = stack_array_limit
+        self.arena_chunk = arena_chunk
+        self.arena_declared = False
+        # уже выведенные функции встроенных функций над массивами (arrayRuntime) и объявления (declareOnce)
+        self.array_runtime: Set[str] = set()
+        # текущая функция выделяет память в @arena.frame; строки, перед которыми функция ее освобождает
+        self.frame_arena = False
+        self.exits: List[int] = []
+        # функция, код которой сейчас генерируется (FunctionNode), и ее alloca фиксированного размера:
+        # они выводятся в начале входного блока, поэтому не выполняются повторно в циклах
+        self.function = None
+        self.entry_start: Optional[int] = None
+        self.entry_allocas: List[CodeLine] = []
+        # генератор одной функции (fork): объявления уровня программы откладываются до merge
+        self.deferred: Optional[List[tuple]] = None
+        # заранее (параллельно) сгенерированные функции: имя -> Fragment
+        self.fragments: Dict[str, Fragment] = {}
+
+    def fork(self) -> 'CodeGenerator':
+        """Генератор для кода одной функции с теми же параметрами и собственной нумерацией имен;
+        функции генерируются независимо друг от друга, поэтому их можно генерировать параллельно
+        """
+        gen = CodeGenerator(self.arrays_by_ref, self.function_attributes, self.exported, self.cse, self.profile,
+                            self.profile_counts, self.tail_calls, self.stack_array_limit, self.arena_chunk,
+                            self.named_values, self.nsw, self.fast_math, self.bounds_checks)
+        gen.deferred = []
+        return gen
+
+    def fragment(self) -> Fragment:
+        return Fragment("".join(str(line) for line in self.code_lines), self.metadata,
+                        self.constant_arrays, self.counters, self.deferred)
+
+    def merge(self, fragment: Fragment):
+        """Добавляет код функции из fork: номера метаданных, константы и счетчики профиля
+        переводятся в нумерацию программы, отложенные объявления выводятся (один раз)
+        """
+        renames = {name: self.constantArray(*key) for key, name in fragment.constants.items()}
+        for counter, key in enumerate(fragment.counters):
+            renames[f"@prof.{counter}"] = f"@prof.{len(self.counters)}"
+            self.counters.append(key)
+        offset = len(self.metadata)
+
+        def rename(match) -> str:
+            name = match.group()
+            return f"!{int(name[1:]) + offset}" if name[0] == "!" else renames[name]
+
+        self.metadata.extend(FRAGMENT_NAMES.sub(rename, node) for node in fragment.metadata)
+        self.code_lines.append(CodeLine(FRAGMENT_NAMES.sub(rename, fragment.code)[:-1]))
+        for method, args in fragment.deferred:
+            getattr(self, method)(*args)
+
+    def defer(self, method: str, *args) -> bool:
+        """В генераторе функции объявление уровня программы запоминается и выводится при merge
+        :return: объявление отложено
+        """
+        if self.deferred is None:
+            return False
+        self.deferred.append((method, args))
+        return True
+
+    def linkage(self, func_name: str) -> str:
+        if not self.function_attributes or func_name == "main" or func_name in self.exported:
+            return ""
+        return "internal "
 
     def start(self):
+        target = host_target()
+        if target is not None:
+            self.code_lines.append(CodeLine(f"target datalayout = \"{target[0]}\""))
+            self.code_lines.append(CodeLine(f"target triple = \"{target[1]}\"\n"))
+
         self.code_lines.append(CodeLine("declare i32 @printf(i8*, ...) nounwind"))
         self.code_lines.append(CodeLine("declare i32 @scanf(i8*, ...) nounwind\n"))
 
         self.code_lines.append(CodeLine("declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)"))
         self.code_lines.append(CodeLine("declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)"))
         self.code_lines.append(CodeLine("declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)"))
-        self.code_lines.append(CodeLine("declare void @llvm.memcpy.p0double.p0double.i32(double*, double*, i32, i1)\n"))
+        self.code_lines.append(CodeLine("declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)\n"))
 
-        self.code_lines.append(CodeLine(f"{INT_POINTER_CONST} = global i32 0"))
-        self.code_lines.append(CodeLine(f"{CHAR_POINTER_CONST} = global i8 0"))
-        self.code_lines.append(CodeLine(f"{FLOAT_POINTER_CONST} = global double 0.0\n"))
+        self.code_lines.append(CodeLine(f"{INT_POINTER_CONST} = internal global i32 0"))
+        self.code_lines.append(CodeLine(f"{CHAR_POINTER_CONST} = internal global i8 0"))
+        self.code_lines.append(CodeLine(f"{FLOAT_POINTER_CONST} = internal global double 0.0\n"))
 
-        self.code_lines.append(CodeLine("@formatInt = private constant [4 x i8] c\"%d\\0A\\00\""))
-        self.code_lines.append(CodeLine("@formatFloat = private constant [4 x i8] c\"%f\\0A\\00\""))
-        self.code_lines.append(CodeLine("@formatChar = private constant [4 x i8] c\"%c\\0A\\00\"\n"))
-        self.code_lines.append(CodeLine("@formatStr = private constant [4 x i8] c\"%s\\0A\\00\"\n"))
+        self.code_lines.append(CodeLine("@formatInt = private unnamed_addr constant [4 x i8] c\"%d\\0A\\00\""))
+        self.code_lines.append(CodeLine("@formatFloat = private unnamed_addr constant [4 x i8] c\"%f\\0A\\00\""))
+        self.code_lines.append(CodeLine("@formatChar = private unnamed_addr constant [4 x i8] c\"%c\\0A\\00\"\n"))
+        self.code_lines.append(CodeLine("@formatStr = private unnamed_addr constant [4 x i8] c\"%s\\0A\\00\"\n"))
 
-        self.code_lines.append(CodeLine("@inputStr = private constant [3 x i8] c\"%s\\00\""))
-        self.code_lines.append(CodeLine("@inputFloat = private constant [4 x i8] c\"%lf\\00\""))
-        self.code_lines.append(CodeLine("@inputChar = private constant [3 x i8] c\"%c\\00\""))
-        self.code_lines.append(CodeLine("@inputInt = private constant [3 x i8] c\"%d\\00\"\n"))
+        self.code_lines.append(CodeLine("@inputStr = private unnamed_addr constant [3 x i8] c\"%s\\00\""))
+        self.code_lines.append(CodeLine("@inputFloat = private unnamed_addr constant [4 x i8] c\"%lf\\00\""))
+        self.code_lines.append(CodeLine("@inputChar = private unnamed_addr constant [3 x i8] c\"%c\\00\""))
+        self.code_lines.append(CodeLine("@inputInt = private unnamed_addr constant [3 x i8] c\"%d\\00\"\n"))
 
     def add(self, code: str):
         self.code_lines.append(CodeLine(code))
+        words = code.split(maxsplit=1)
+        if words:
+            self.terminated = words[0] in TERMINATORS
+
+    def addGlobal(self, code: str):
+        if code not in self.defined:
+            self.defined.add(code)
+            self.data.append(code)
+
+    def constantArray(self, elem_type: str, contents: Tuple[str, ...]) -> str:
+        """Неизменяемый массив в секции данных; одинаковые массивы размещаются один раз
+        """
+        key = (elem_type, contents)
+        if key not in self.constant_arrays:
+            name = f"@const.{len(self.constant_arrays)}"
+            self.constant_arrays[key] = name
+            if self.deferred is None:
+                self.addGlobal(f"{name} = private unnamed_addr constant {arrayLiteral(elem_type, contents)}")
+        return self.constant_arrays[key]
+
+    def declareMalloc(self):
+        if not self.malloc_declared:
+            self.malloc_declared = True
+            if not self.defer('declareMalloc'):
+                self.addGlobal("declare noalias i8* @malloc(i64) nounwind")
+
+    def declareExternal(self, func_name: str, declaration: str):
+        """declare для функции, определенной в другом модуле (выводится при первом вызове)
+        """
+        if func_name not in self.externals:
+            self.externals.add(func_name)
+            if not self.defer('declareExternal', func_name, declaration):
+                self.addGlobal(declaration)
+
+    def startFunction(self, function):
+        """Начало тела функции (сразу после строки define)
+        """
+        self.function = function
+        self.entry_start = len(self.code_lines)
+        self.entry_allocas = []
+        self.var_counter = {}
+
+    def endFunction(self):
+        if self.frame_arena:
+            # метка арены сохраняется при входе в функцию и восстанавливается перед каждым выходом
+            for field, index in zip(ARENA_FIELDS, range(3)):
+                self.entry_allocas.append(CodeLine(
+                    f"%arena.{field} = load i8*, i8** getelementptr inbounds "
+                    f"({ARENA_TYPE}, {ARENA_TYPE}* @arena.frame, i32 0, i32 {index})"))
+            release = CodeLine(f"call void @arena.release({ARENA_TYPE}* @arena.frame, "
+                               + ", ".join(f"i8* %arena.{field}" for field in ARENA_FIELDS) + ")")
+            for index in reversed(self.exits):
+                self.code_lines.insert(index, release)
+        self.code_lines[self.entry_start:self.entry_start] = self.entry_allocas
+        if not self.named_values:
+            self.numberValues(self.entry_start)
+        self.function = None
+        self.entry_start = None
+        self.entry_allocas = []
+        self.frame_arena = False
+        self.exits = []
+
+    def numberValues(self, start: int):
+        """Имена значений и меток тела функции (строки с start) заменяются номерами в порядке определения,
+        как у безымянных значений LLVM; неявный входной блок, блоки после ret/br без метки и неприсвоенные
+        результаты вызовов тоже получают номер
+        """
+        lines = [line for code_line in self.code_lines[start:] for line in code_line.code.split("\n")]
+        names: Dict[str, str] = {}
+        number = 0
+        terminated = True
+        # строки списка вариантов switch (до закрывающей ]) - продолжение инструкции, а не новый блок
+        continued = False
+        for line in lines:
+            if continued:
+                continued = not line.lstrip().startswith("]")
+                continue
+            label = LABEL.match(line)
+            if label:
+                names["%" + label.group(1)] = f"%{number}"
+                number += 1
+                terminated = False
+                continue
+            words = line.split(maxsplit=1)
+            if not words:
+                continue
+            continued = line.rstrip().endswith("[")
+            if terminated:
+                number += 1
+            definition = DEFINITION.match(line)
+            if definition:
+                names[definition.group(1)] = f"%{number}"
+                number += 1
+            elif UNNAMED_CALL.match(line):
+                number += 1
+            terminated = words[0] in TERMINATORS
+
+        def rename(match) -> str:
+            return names.get(match.group(), match.group())
+
+        code = []
+        for line in lines:
+            label = LABEL.match(line)
+            code.append(f"{names['%' + label.group(1)][1:]}:" if label else LOCAL_NAME.sub(rename, line))
+        self.code_lines[start:] = [CodeLine("\n".join(code))]
+
+    def functionExit(self):
+        """Следующая строка завершает вызов функции (ret или вызов в хвостовой позиции перед ret)
+        """
+        if self.function is not None:
+            self.exits.append(len(self.code_lines))
+
+    def arenaAlloc(self, size_bytes, escapes: bool) -> str:
+        """Память из арены: функции - из @arena.frame, если массив не переживает функцию, иначе из @arena.heap.
+        :return: значение i8*
+        """
+        self.declareArena()
+        arena = "@arena.heap"
+        if not escapes and self.function is not None:
+            arena = "@arena.frame"
+            self.frame_arena = True
+        if not isinstance(size_bytes, int):
+            size = f"%{self.getTempVar()}"
+            self.addTempVarIndex()
+            self.add(f"{size} = zext i32 {size_bytes} to i64")
+            size_bytes = size
+        memory = f"%{self.getTempVar()}"
+        self.addTempVarIndex()
+        self.add(f"{memory} = call i8* @arena.alloc({ARENA_TYPE}* {arena}, i64 {size_bytes})")
+        return memory
+
+    def declareArena(self):
+        if not self.arena_declared:
+            self.arena_declared = True
+            if not self.defer('declareArena'):
+                self.declareMalloc()
+                self.addGlobal(ARENA_RUNTIME.format(type=ARENA_TYPE, chunk=self.arena_chunk,
+                                                    discard=ARENA_RECYCLE if self.arena_chunk else ARENA_FREE))
+
+    def declareBoundsError(self):
+        if not self.bounds_error_declared:
+            self.bounds_error_declared = True
+            if not self.defer('declareBoundsError'):
+                self.addGlobal(BOUNDS_ERROR.format(message=self.cString("@bounds.message", BOUNDS_ERROR_MESSAGE)))
+
+    def arrayRuntime(self, name: str, elem_type: str) -> str:
+        """Функция, реализующая встроенную функцию над массивами (fill, sum, min, max, sort, print_array)
+        для элементов типа elem_type; выводится при первом использовании.
+        :return: имя функции LLVM
+        """
+        suffix = elem_type.replace("double", "f64")
+        func_name = f"@array.{'print' if name == 'print_array' else name}.{suffix}"
+        if func_name in self.array_runtime:
+            return func_name
+        self.array_runtime.add(func_name)
+        if self.defer('arrayRuntime', name, elem_type):
+            return func_name
+
+        is_float = elem_type == "double"
+        loop = ""
+        # циклы по double без fast-math не векторизуются, и подсказка привела бы к предупреждению
+        if name == "fill" or not is_float or self.fast_math:
+            loop = f", !llvm.loop {self.addLoopMetadata([VECTORIZE_ENABLE])}"
+        ops = {'add': "fadd" if is_float else "add", 'lt': "fcmp olt" if is_float else "icmp slt",
+               'gt': "fcmp ogt" if is_float else "icmp sgt"}
+        ops = {key: self.arithmetic(op, elem_type) for key, op in ops.items()}
+        if name == "fill":
+            self.addGlobal(ARRAY_FILL.format(type=elem_type, suffix=suffix, loop=loop))
+        elif name in ARRAY_COMBINE:
+            self.addGlobal(ARRAY_REDUCE.format(type=elem_type, suffix=suffix, name=name, loop=loop,
+                                               zero="0.0" if is_float else "0",
+                                               combine=ARRAY_COMBINE[name].format(type=elem_type, **ops)))
+        elif name == "sort":
+            self.declareOnce("declare void @qsort(i8*, i64, i64, i32 (i8*, i8*)*)")
+            self.addGlobal(ARRAY_SORT.format(type=elem_type, suffix=suffix, size=getLLVMTypeSize(elem_type), **ops))
+        else:
+            self.declareOnce(ARRAY_WRITE)
+            if is_float:
+                self.declareOnce("declare i32 @snprintf(i8*, i64, i8*, ...) nounwind")
+            buffer = ARRAY_PRINT_BUFFER
+            self.addGlobal(ARRAY_PRINT.format(type=elem_type, suffix=suffix, buffer=buffer,
+                                              limit=buffer - ARRAY_PRINT_RESERVE,
+                                              format=ARRAY_PRINT_FORMAT[elem_type].format(buffer=buffer)))
+        return func_name
+
+    def declareOnce(self, code: str):
+        """Объявление в секции данных, которое выводится один раз (для arrayRuntime)
+        """
+        if code not in self.array_runtime:
+            self.array_runtime.add(code)
+            if not self.defer('declareOnce', code):
+                self.addGlobal(code)
+
+    def alloca(self, code: str):
+        """alloca фиксированного размера: во входной блок текущей функции (вне функций - на месте)
+        """
+        if self.function is None:
+            self.add(code)
+        elif code not in self.defined:
+            self.defined.add(code)
+            self.entry_allocas.append(CodeLine(code))
+
+    def startGlobalInit(self):
+        """Функция для операторов верхнего уровня программы, выполняется до main (llvm.global_ctors)
+        """
+        self.init_start = len(self.code_lines)
+        self.var_counter = {}
+        self.add("define internal void @global.init() {")
+        self.forgetValues()
+
+    def endGlobalInit(self):
+        if len(self.code_lines) == self.init_start + 1:
+            # все глобальные переменные инициализированы статически
+            del self.code_lines[self.init_start:]
+            return
+        if not self.terminated:
+            self.add("ret void")
+        self.add("}\n")
+        self.addGlobal("@llvm.global_ctors = appending global [1 x { i32, void ()*, i8* }] "
+                       "[{ i32, void ()*, i8* } { i32 65535, void ()* @global.init, i8* null }]")
+
+    def arithmetic(self, op: str, llvm_type: str) -> str:
+        """Инструкция op (add, fcmp olt, ...) над llvm_type с флагами из параметров генератора:
+        nsw для add/sub/mul над i32, флаги fast-math для операций и сравнений над double
+        """
+        if llvm_type == "double" and self.fast_math and op.startswith("f"):
+            opcode, _, predicate = op.partition(" ")
+            return f"{opcode} {self.fast_math} {predicate}".rstrip()
+        if llvm_type == "i32" and self.nsw and op in ("add", "sub", "mul"):
+            return f"{op} nsw"
+        return op
+
+    def countBlock(self, key: str):
+        """Счетчик выполнений текущего места программы (в режиме профилирования)
+        """
+        if self.profile is None:
+            return
+        counter = len(self.counters)
+        self.counters.append(self.profileKey(key))
+        self.add(f"%prof.{counter} = load i64, i64* @prof.{counter}")
+        self.add(f"%prof.{counter}.inc = add i64 %prof.{counter}, 1")
+        self.add(f"store i64 %prof.{counter}.inc, i64* @prof.{counter}")
+
+    def branchWeights(self, *targets: str) -> str:
+        """Суффикс !prof для условного перехода (switch) по счетчикам переходов из профиля
+        (счетчик может быть выражением 'a-b-...': разность счетчиков)
+        """
+        counts = [self.profileCount(key) for key in targets]
+        if None in counts:
+            return ""
+        # веса в LLVM - 32-битные
+        scale = max(1, (max(counts) + 0xFFFFFFFE) // 0xFFFFFFFF)
+        weights = ", ".join(f"i32 {max(0, count) // scale}" for count in counts)
+        node = self.addMetadata('!{!"branch_weights", ' + weights + '}')
+        return f", !prof {node}"
+
+    def profileCount(self, key: str) -> Optional[int]:
+        if '-' in key:
+            parts = [self.profileCount(part) for part in key.split('-')]
+            return None if None in parts else parts[0] - sum(parts[1:])
+        return self.profile_counts.get(self.profileKey(key))
+
+    def profileKey(self, key: str) -> str:
+        """Ключ счетчика в профиле: метки нумеруются в пределах функции, поэтому к ним добавляется ее имя
+        """
+        return f"{self.function.name.name}.{key}" if self.function is not None else key
+
+    def entryCount(self, func_name: str) -> str:
+        """Метаданные function_entry_count для определения функции по профилю
+        """
+        count = self.profile_counts.get(f"{func_name}.entry")
+        if count is None:
+            return ""
+        node = self.addMetadata(f'!{{!"function_entry_count", i64 {count}}}')
+        return f"!prof {node} "
+
+    def endProfile(self):
+        """Счетчики и функция, которая при завершении программы (llvm.global_dtors)
+        дописывает их значения в файл профиля строками 'ключ количество'
+        """
+        if self.profile is None:
+            return
+        self.addGlobal("declare i8* @fopen(i8*, i8*) nounwind")
+        self.addGlobal("declare i32 @fprintf(i8*, i8*, ...) nounwind")
+        self.addGlobal("declare i32 @fclose(i8*) nounwind")
+        path = self.cString("@prof.path", self.profile)
+        mode = self.cString("@prof.mode", "a")
+        line_format = self.cString("@prof.format", "%s %lld\n")
+
+        self.add("define internal void @prof.dump() {")
+        self.add(f"%file = call i8* @fopen(i8* {path}, i8* {mode})")
+        self.add("%failed = icmp eq i8* %file, null")
+        self.add("br i1 %failed, label %done, label %write")
+        self.add("write:")
+        for counter, key in enumerate(self.counters):
+            self.addGlobal(f"@prof.{counter} = internal global i64 0")
+            name = self.cString(f"@prof.key.{counter}", key)
+            self.add(f"%count.{counter} = load i64, i64* @prof.{counter}")
+            self.add(f"call i32 (i8*, i8*, ...) @fprintf(i8* %file, i8* {line_format}, i8* {name}, "
+                     f"i64 %count.{counter})")
+        self.add("call i32 @fclose(i8* %file)")
+        self.add("br label %done")
+        self.add("done:")
+        self.add("ret void")
+        self.add("}\n")
+        self.addGlobal("@llvm.global_dtors = appending global [1 x { i32, void ()*, i8* }] "
+                       "[{ i32, void ()*, i8* } { i32 65535, void ()* @prof.dump, i8* null }]")
+
+    def cString(self, name: str, value: str) -> str:
+        """Строковая константа в секции данных, возвращает указатель на первый символ
+        """
+        data = value.encode() + b"\0"
+        text = "".join(chr(b) if 32 <= b < 127 and chr(b) not in '"\\' else f"\\{b:02X}" for b in data)
+        self.addGlobal(f"{name} = private unnamed_addr constant [{len(data)} x i8] c\"{text}\"")
+        return arrayStart("i8", len(data), name)
+
+    def branch(self, label: str, suffix: str = ""):
+        """Безусловный переход в конце блока, если блок еще не завершен (например, return)
+        """
+        if not self.terminated:
+            self.add(f"br label %{label}{suffix}")
+
+    def label(self, name: str):
+        self.forgetValues()
+        self.add(f"{name}:")
+
+    def lookupValue(self, key: tuple) -> Optional[str]:
+        for layer in reversed(self.invariants):
+            if key in layer:
+                return layer[key]
+        value = self.values.get(key) if self.cse else None
+        if value is not None and self.hoisting:
+            self.invariants[-1][key] = value
+        return value
+
+    def rememberValue(self, key: tuple, value: str):
+        if self.hoisting:
+            self.invariants[-1][key] = str(value)
+        if self.cse:
+            self.values[key] = str(value)
+
+    def pushInvariants(self):
+        self.invariants.append({})
+
+    def popInvariants(self):
+        self.invariants.pop()
+
+    def forgetValues(self, predicate: Optional[Callable[[tuple], bool]] = None):
+        if predicate is None:
+            self.values.clear()
+        else:
+            for key in [key for key in self.values if predicate(key)]:
+                del self.values[key]
+
+    def forgetMemory(self):
+        """Вызов функции с побочными эффектами: сбрасываются элементы массивов и глобальные переменные
+        """
+        self.forgetValues(lambda key: key[0] == 'elem' or (key[0] == 'load' and key[1].startswith('@')))
 
     def addVarIndex(self, var_name: str):
         if str(var_name) in self.var_counter:
@@ -63,12 +909,41 @@ class CodeGenerator:
     def addTempVarIndex(self):
         self.addVarIndex("temp")
 
-    def removeIdent(self, ident: str):
-        self.var_counter.pop(ident, None)
+    def addMetadata(self, node: str) -> str:
+        name = f"!{len(self.metadata)}"
+        self.metadata.append(f"{name} = {node}")
+        return name
+
+    def addLoopMetadata(self, properties: List[str]) -> str:
+        loop = f"!{len(self.metadata)}"
+        self.metadata.append(None)
+        props = [self.addMetadata(prop) for prop in properties]
+        self.metadata[int(loop[1:])] = f"{loop} = distinct !{{{', '.join([loop] + props)}}}"
+        return loop
+
+    def accessGroup(self) -> str:
+        """Суффикс для обращений к элементам массивов внутри циклов с подсказкой noalias
+        """
+        if not self.access_groups:
+            return ""
+        if len(self.access_groups) == 1:
+            return f", !llvm.access.group {self.access_groups[0]}"
+        key = tuple(self.access_groups)
+        if key not in self.access_group_lists:
+            self.access_group_lists[key] = self.addMetadata("!{" + ", ".join(key) + "}")
+        return f", !llvm.access.group {self.access_group_lists[key]}"
 
     def __str__(self):
         code = ""
         for line in self.code_lines:
             code += str(line)
 
+        if self.data:
+            code += "\n".join(self.data) + "\n"
+
+        if self.metadata:
+            code += "\n"
+        for node in self.metadata:
+            code += node + "\n"
+
         return code
@@ -0,0 +1,153 @@
+import time
+from typing import Dict, Optional
+
+import parser_base
+import semantic
+import analysis
+import optimizer
+import parallel
+from code_generator import CodeGenerator
+from passes import PassManager, SemanticCheckPass, TreePass
+from nodes.ast_node import StmtListNode
+
+
+def check(prog: str, dce: bool = False, exported=(), const_calls: bool = False, licm: bool = False,
+          switches: bool = False, externals: Optional[dict] = None,
+          timings: Optional[Dict[str, float]] = None, jobs: int = 1, conversions: bool = False) -> StmtListNode:
+    return check_tree(parser_base.parse(prog), dce, exported, const_calls, licm, switches, externals, timings, jobs,
+                      conversions)
+
+
+def check_tree(tree: StmtListNode, dce: bool = False, exported=(), const_calls: bool = False, licm: bool = False,
+               switches: bool = False, externals: Optional[dict] = None, timings: Optional[Dict[str, float]] = None,
+               jobs: int = 1, conversions: bool = False) -> StmtListNode:
+    """Семантический анализ и оптимизации над AST;
+    externals - функции других модулей (см. modules.py): имя -> сигнатура из интерфейса;
+    в timings добавляется время каждого прохода; jobs - число процессов для проверки тел функций
+    """
+    tree.program = True
+    manager = PassManager(profile=timings is not None)
+    if dce:
+        manager.add(TreePass('dce', lambda tree: optimizer.eliminate_dead_code(tree, exported)))
+    manager.add(SemanticCheckPass(externals, jobs))
+    if const_calls:
+        manager.add(TreePass('const_calls', optimizer.evaluate_constant_calls, requires=('semantic',)))
+    if conversions:
+        manager.add(TreePass('conversions', optimizer.simplify_conversions, requires=('semantic',)))
+    if licm:
+        manager.add(TreePass('licm', optimizer.hoist_loop_invariants, requires=('semantic',)))
+    if switches:
+        manager.add(TreePass('switches', optimizer.lower_switches, requires=('semantic',)))
+    manager.run(tree)
+    if timings is not None:
+        timings.update(manager.timings)
+    return tree
+
+
+def generate(tree: StmtListNode, timings: Optional[Dict[str, float]] = None, jobs: int = 1, **options) -> str:
+    """LLVM IR программы; jobs - число процессов для генерации кода функций (результат тот же)
+    """
+    gen = CodeGenerator(**options)
+    # анализы, нужные генерации кода, выполняются совместными обходами дерева
+    manager = PassManager(analysis.ConstantDataPass(), analysis.TailCallPass(), profile=timings is not None)
+    arena = gen.stack_array_limit is not None
+    if gen.arrays_by_ref or gen.function_attributes:
+        manager.add(analysis.FunctionSummaryPass())
+    if gen.arrays_by_ref:
+        manager.add(analysis.ReadonlyArrayParamsPass())
+    if arena:
+        manager.add(analysis.EscapePass(gen.stack_array_limit, gen.arrays_by_ref))
+    if gen.bounds_checks:
+        manager.add(analysis.BoundsCheckPass())
+    if gen.function_attributes:
+        manager.add(analysis.FunctionAttributesPass(arena, gen.bounds_checks))
+    manager.run(tree)
+
+    start = time.perf_counter()
+    parallel.generate_functions(tree, gen, jobs)
+    gen.start()
+    tree.to_llvm(gen)
+    code = str(gen)
+    if timings is not None:
+        timings.update(manager.timings)
+        timings['codegen'] = time.perf_counter() - start
+    return code
+
+
+def compile_program(prog: str, dce: bool = False, const_calls: bool = False, licm: bool = False,
+                    switches: bool = False, externals: Optional[dict] = None,
+                    timings: Optional[Dict[str, float]] = None, jobs: int = 1, conversions: bool = False,
+                    **options) -> str:
+    """LLVM IR программы; options - параметры CodeGenerator (cse, fast_math, stack_array_limit, ...)
+    """
+    return generate(check(prog, dce, options.get('exported', ()), const_calls, licm, switches, externals, timings,
+                          jobs, conversions), timings, jobs, **options)
+
+
+def read_profile(path: str) -> Dict[str, int]:
+    """Счетчики из файла профиля (строки 'ключ количество'), счетчики нескольких запусков суммируются
+    """
+    counts: Dict[str, int] = {}
+    with open(path) as f:
+        for line in f:
+            key, count = line.split()
+            counts[key] = counts.get(key, 0) + int(count)
+    return counts
+
+
+def main():
+    # argparse нужен только командной строке, compiler импортируется и сервером, и modules.py
+    import argparse
+
+    args = argparse.ArgumentParser(description='Compile a program to LLVM IR')
+    args.add_argument('source')
+    args.add_argument('-o', '--output', default='llvm.ll')
+    for flag in ('dce', 'const_calls', 'conversions', 'licm', 'switches', 'cse', 'arrays_by_ref', 'nsw', 'bounds_checks'):
+        args.add_argument('--' + flag.replace('_', '-'), dest=flag, action='store_true')
+    args.add_argument('--profile', metavar='PATH',
+                      help='count executions of blocks, the program appends the counters to PATH at exit')
+    args.add_argument('--use-profile', metavar='PATH', help='emit branch weights and entry counts from PATH')
+    args.add_argument('--named-values', action='store_true',
+                      help='keep names of values and labels (%%x.3, for.body.0) instead of numbers, for debugging')
+    args.add_argument('--fast-math', nargs='?', const='fast', metavar='FLAGS',
+                      help='fast-math flags of float operations and comparisons (default: fast)')
+    args.add_argument('--stack-array-limit', type=int, metavar='BYTES',
+                      help='arrays larger than BYTES, of unknown size or outliving the function are allocated '
+                           'in an arena (default: 65536)')
+    args.add_argument('--no-arena', action='store_true', help='allocate all arrays on the stack')
+    args.add_argument('--no-function-attributes', dest='function_attributes', action='store_false',
+                      help='external linkage and no inferred attributes for all functions')
+    args.add_argument('--export', action='append', default=[], metavar='NAME',
+                      help='keep function NAME external (and not removed by --dce), may be repeated')
+    args.add_argument('-j', '--jobs', type=int, default=1,
+                      help='check and generate functions in JOBS processes (same output as with one)')
+    args = args.parse_args()
+
+    options = {flag: True for flag in ('dce', 'const_calls', 'conversions', 'licm', 'switches', 'cse', 'arrays_by_ref', 'nsw', 'bounds_checks') if getattr(args, flag)}
+    if args.profile:
+        options['profile'] = args.profile
+    if args.named_values:
+        options['named_values'] = True
+    if args.fast_math:
+        options['fast_math'] = args.fast_math
+    if args.use_profile:
+        options['profile_counts'] = read_profile(args.use_profile)
+    if args.stack_array_limit is not None:
+        options['stack_array_limit'] = args.stack_array_limit
+    if args.no_arena:
+        options['stack_array_limit'] = None
+    if not args.function_attributes:
+        options['function_attributes'] = False
+    if args.export:
+        options['exported'] = args.export
+    try:
+        code = compile_program(open(args.source).read(), jobs=args.jobs, **options)
+    except semantic.SemanticException as e:
+        print('Ошибка: {}'.format(e.message))
+        raise SystemExit(1)
+    with open(args.output, 'w') as f:
+        f.write(code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+"""Регрессионный прогон корпуса tests/: эталонный LLVM IR, ожидаемые ошибки и время по файлам.
+
+Каждый файл tests/*.c разбирается, проверяется и компилируется в каждой конфигурации (CONFIGS)
+в пуле процессов. Результат сравнивается с эталоном в tests/golden/<конфигурация>/:
+    <файл>.ll       IR файла, который компилируется
+    <файл>.out      вывод программы: stdout, строка "--- exit <код>" и stderr
+    errors.json     файл -> сообщение об ошибке для файлов, которые не компилируются
+Файлы not_working_test_* обязаны завершаться ошибкой. Файл, начинающийся с комментария "// run"
+("// run: default optimized" - только в перечисленных конфигурациях), еще и выполняется через lli (stdin - из
+tests/<файл>.in, если он есть); его stdout и код завершения должны совпасть и с результатом
+интерпретатора байт-кода (interpreter.py). Без lli программы не выполняются.
+С --timings проверяется и время разбора, проверки и генерации (медиана --repeat запусков) в единицах
+времени разбора CALIBRATION_SOURCE, измеренного в том же процессе вперемешку с файлом: так время меньше
+зависит от машины и ее загрузки. Базовое время - локальный файл tests/.timings.json (не в git, записывается
+с --update --timings); регрессия - больше базового в --tolerance раз и не меньше чем на SLACK единиц.
+
+    python corpus.py                # проверка
+    python corpus.py --update       # записать текущие результаты как эталон
+    python corpus.py --timings      # и сравнить время с локальным базовым
+    python corpus.py -j 4
+"""
+import argparse
+import difflib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTS_DIR = os.path.join(BASE_DIR, 'tests')
+GOLDEN_DIR = os.path.join(TESTS_DIR, 'golden')
+TIMINGS = os.path.join(TESTS_DIR, '.timings.json')
+ERRORS = 'errors.json'
+SOURCE_SUFFIXES = ('.c', '.C')
+SLACK = 0.5
+RUN_TIMEOUT = 10
+EXIT_MARK = '--- exit '
+
+# конфигурация -> параметры compiler.check_tree / compiler.generate
+CONFIGS = {
+    'default': {},
+    'optimized': {'dce': True, 'const_calls': True, 'conversions': True, 'licm': True, 'switches': True,
+                  'cse': True, 'arrays_by_ref': True, 'nsw': True},
+    # внешняя линковка всех функций без выведенных атрибутов
+    'external': {'function_attributes': False},
+    # имена значений и меток без перенумерации, вызовы без хвостовой оптимизации, fast-math для float
+    'debug': {'named_values': True, 'tail_calls': False, 'fast_math': 'fast'},
+    # все массивы размещаются в арене
+    'arena': {'stack_array_limit': 0},
+    # проверки границ массивов вместе с оптимизациями, которые меняют обращения к массивам
+    'checked': {'bounds_checks': True, 'licm': True, 'cse': True, 'arrays_by_ref': True, 'nsw': True},
+}
+CHECK_OPTIONS = ('dce', 'const_calls', 'conversions', 'licm', 'switches')
+# программа, время разбора которой - единица измерения времени
+CALIBRATION_SOURCE = '''
+int f(int a[10], int n) {
+    int s = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        if (a[i] > s && i > 3)
+            s = s + a[i] * 2 - 1;
+        else
+            s = s - 1;
+    }
+    return s;
+}
+'''
+
+
+def sources() -> List[str]:
+    return sorted(name for name in os.listdir(TESTS_DIR)
+                  if name.endswith(SOURCE_SUFFIXES) and os.path.isfile(os.path.join(TESTS_DIR, name)))
+
+
+def must_fail(name: str) -> bool:
+    return name.startswith('not_working_test_')
+
+
+def read_source(name: str) -> str:
+    with open(os.path.join(TESTS_DIR, name)) as f:
+        return f.read()
+
+
+def run_configs(source: str) -> List[str]:
+    """Конфигурации, в которых программа выполняется (по комментарию "// run" в начале файла)
+    """
+    first = source.lstrip().split('\n', 1)[0].strip()
+    if first == '// run':
+        return list(CONFIGS)
+    if first.startswith('// run:'):
+        return first[len('// run:'):].split()
+    return []
+
+
+def program_input(name: str) -> bytes:
+    path = os.path.join(TESTS_DIR, name + '.in')
+    if not os.path.exists(path):
+        return b''
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def run_result(stdout: str, code: int, stderr: str = '') -> str:
+    return f'{stdout}{EXIT_MARK}{code}\n{stderr}'
+
+
+def without_stderr(output: str) -> str:
+    head, mark, tail = output.rpartition(EXIT_MARK)
+    return head + mark + tail.split('\n', 1)[0] + '\n'
+
+
+def execute(name: str, llvm: str) -> str:
+    """Вывод программы, выполненной через lli
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.ll') as f:
+        f.write(llvm)
+        f.flush()
+        try:
+            result = subprocess.run(['lli', f.name], input=program_input(name), capture_output=True,
+                                    timeout=RUN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return run_result('', -1, f'timeout {RUN_TIMEOUT} s\n')
+    return run_result(result.stdout.decode(errors='replace'), result.returncode, result.stderr.decode(errors='replace'))
+
+
+def interpret(name: str) -> Optional[str]:
+    """Вывод программы в интерпретаторе байт-кода (без stderr), None - программа не компилируется
+    """
+    import io
+    import compiler
+    import interpreter
+
+    try:
+        tree = compiler.check(read_source(name))
+    except Exception:
+        return None
+    stdout = io.BytesIO()
+    try:
+        code = interpreter.run(tree, io.BytesIO(program_input(name)), stdout) & 255
+    except interpreter.RuntimeException:
+        code = 1
+    return run_result(stdout.getvalue().decode(errors='replace'), code)
+
+
+def error_message(e: Exception) -> str:
+    message = getattr(e, 'message', None) or str(e)
+    return f'{type(e).__name__}: {message.splitlines()[0] if message else ""}'
+
+
+class Outcome:
+    """Результат компиляции файла в одной конфигурации: IR или сообщение об ошибке,
+    время этапов - медиана нескольких запусков в единицах калибровки (пусто, если время не измерялось),
+    вывод программы (None - не выполнялась)
+    """
+    def __init__(self, name: str, config: str, llvm: Optional[str], error: Optional[str], timings: Dict[str, float],
+                 output: Optional[str] = None):
+        self.name = name
+        self.config = config
+        self.llvm = llvm
+        self.error = error
+        self.timings = timings
+        self.output = output
+
+
+def compile_file(task: Tuple[str, str, int, bool]) -> Outcome:
+    import compiler
+    import parser_base
+
+    name, config, repeat, run_programs = task
+    source = read_source(name)
+    options = dict(CONFIGS[config])
+    check_options = {option: options.pop(option) for option in CHECK_OPTIONS if option in options}
+    llvm, error, samples = None, None, {}
+
+    def measure(phase: str, start: float):
+        samples.setdefault(phase, []).append(time.perf_counter() - start)
+
+    for _ in range(repeat):
+        try:
+            if repeat > 1:
+                start = time.perf_counter()
+                parser_base.parse(CALIBRATION_SOURCE)
+                measure('unit', start)
+            start = time.perf_counter()
+            tree = parser_base.parse(source)
+            measure('parse', start)
+            start = time.perf_counter()
+            compiler.check_tree(tree, **check_options)
+            measure('check', start)
+            start = time.perf_counter()
+            llvm = compiler.generate(tree, **options)
+            measure('codegen', start)
+        except Exception as e:
+            error = error_message(e)
+            break
+    timings = {}
+    if repeat > 1 and error is None:
+        unit = statistics.median(samples.pop('unit'))
+        timings = {phase: statistics.median(values) / unit for phase, values in samples.items()}
+    output = None
+    if run_programs and error is None and config in run_configs(source):
+        output = execute(name, llvm)
+    return Outcome(name, config, llvm, error, timings, output)
+
+
+def golden_path(config: str, name: str, suffix: str = '.ll') -> str:
+    return os.path.join(GOLDEN_DIR, config, name + suffix)
+
+
+def read_golden(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return f.read()
+
+
+def write_golden(path: str, text: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def read_json(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: str, value: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(value, f, indent=1, sort_keys=True, ensure_ascii=False)
+        f.write('\n')
+
+
+def compare(outcome: Outcome, errors: Dict[str, str]) -> List[str]:
+    """:return: описания расхождений с эталоном
+    """
+    problems = []
+    where = f'{outcome.config}/{outcome.name}'
+    if must_fail(outcome.name) and outcome.error is None:
+        problems.append(f'{where}: compiled, but must fail')
+    expected_error = errors.get(outcome.name)
+    if outcome.error is not None or expected_error is not None:
+        if outcome.error != expected_error:
+            problems.append(f'{where}: error {outcome.error!r}, expected {expected_error!r}')
+        return problems
+
+    for what, suffix, current in (('IR', '.ll', outcome.llvm), ('output', '.out', outcome.output)):
+        if current is None:
+            continue
+        golden = read_golden(golden_path(outcome.config, outcome.name, suffix))
+        if golden is None:
+            problems.append(f'{where}: no golden {what} (run with --update)')
+        elif golden != current:
+            problems.append(f'{where}: {what} differs from golden\n' + diff(golden, current))
+    return problems
+
+
+def diff(golden: str, current: str) -> str:
+    lines = difflib.unified_diff(golden.splitlines(), current.splitlines(), 'golden', 'current', lineterm='')
+    return '\n'.join(list(lines)[:40])
+
+
+def compare_interpreter(name: str, output: Optional[str], outcomes: List[Outcome]) -> List[str]:
+    """Вывод интерпретатора совпадает с выводом программы во всех конфигурациях (кроме stderr:
+    интерпретатор добавляет к сообщению об ошибке имя функции)
+    """
+    problems = []
+    for outcome in outcomes:
+        if outcome.name == name and outcome.output is not None and without_stderr(outcome.output) != output:
+            problems.append(f'interpreter/{name}: output differs from {outcome.config}\n'
+                            + diff(without_stderr(outcome.output), output or ''))
+    return problems
+
+
+def slower(outcome: Outcome, baseline: Dict[str, float], tolerance: float) -> List[str]:
+    problems = []
+    for phase, elapsed in outcome.timings.items():
+        base = baseline.get(phase)
+        if base is not None and elapsed > base * tolerance and elapsed - base >= SLACK:
+            problems.append(f'{outcome.config}/{outcome.name}: {phase} {elapsed:.2f} units, baseline {base:.2f} units')
+    return problems
+
+
+def run(jobs: Optional[int] = None, repeat: int = 5, timings: bool = False, tolerance: float = 2.0,
+        update: bool = False, verbose: bool = True) -> bool:
+    """Прогон корпуса; :return: результаты совпали с эталоном (при update - эталон перезаписан);
+    timings - измерять время (repeat запусков на файл) и сравнивать его с локальным базовым
+    """
+    import multiprocessing
+
+    repeat = max(repeat, 2) if timings else 1
+    run_programs = shutil.which('lli') is not None
+    tasks = [(name, config, repeat, run_programs) for config in CONFIGS for name in sources()]
+    programs = [name for name in sources() if run_configs(read_source(name))] if run_programs else []
+    with multiprocessing.Pool(jobs or os.cpu_count()) as workers:
+        outcomes = workers.map(compile_file, tasks, chunksize=1)
+        interpreted = workers.map(interpret, programs, chunksize=1)
+
+    baseline = read_json(TIMINGS)
+    if update:
+        for config in CONFIGS:
+            errors = {}
+            for outcome in outcomes:
+                if outcome.config != config:
+                    continue
+                if outcome.error is not None:
+                    errors[outcome.name] = outcome.error
+                else:
+                    write_golden(golden_path(config, outcome.name), outcome.llvm)
+                if outcome.output is not None:
+                    write_golden(golden_path(config, outcome.name, '.out'), outcome.output)
+            write_json(os.path.join(GOLDEN_DIR, config, ERRORS), errors)
+        if timings:
+            write_json(TIMINGS, {f'{outcome.config}/{outcome.name}': {phase: round(elapsed, 3) for phase, elapsed
+                                                                      in outcome.timings.items()}
+                                 for outcome in outcomes if outcome.timings})
+
+    problems, regressions = [], []
+    errors = {config: read_json(os.path.join(GOLDEN_DIR, config, ERRORS)) for config in CONFIGS}
+    for outcome in outcomes:
+        problems.extend(compare(outcome, errors[outcome.config]))
+        if timings and not update:
+            regressions.extend(slower(outcome, baseline.get(f'{outcome.config}/{outcome.name}', {}), tolerance))
+    for name, output in zip(programs, interpreted):
+        problems.extend(compare_interpreter(name, output, outcomes))
+
+    for outcome in outcomes if verbose else ():
+        status = 'error' if outcome.error is not None else 'ok'
+        total = f'{sum(outcome.timings.values()):10.2f} units' if outcome.timings else ''
+        print(f'    {outcome.config + "/" + outcome.name:<40} {status:<6} {total}')
+    for problem in problems + regressions:
+        print(problem)
+    if verbose:
+        print(f'{len(outcomes)} runs, {len(programs)} programs executed, {len(problems)} mismatches, '
+              f'{len(regressions)} timing regressions')
+    return not problems and not regressions
+
+
+def main():
+    args = argparse.ArgumentParser(description='Golden IR, expected errors and timings over tests/')
+    args.add_argument('-j', '--jobs', type=int, help='worker processes (default: number of CPUs)')
+    args.add_argument('--timings', action='store_true',
+                      help='measure compile times and compare them with the local baseline (tests/.timings.json)')
+    args.add_argument('--repeat', type=int, default=5, help='runs per file with --timings, the median is taken')
+    args.add_argument('--tolerance', type=float, default=2.0, help='allowed slowdown against the baseline')
+    args.add_argument('--update', action='store_true', help='store current results as golden')
+    args = args.parse_args()
+    ok = run(args.jobs, args.repeat, args.timings, args.tolerance, args.update)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
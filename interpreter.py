@@ -0,0 +1,877 @@
+"""Интерпретатор байт-кода: быстрый запуск программ без LLVM.
+
+Проверенное AST-дерево компилируется в регистровый байт-код. Каждая команда - 4 числа (код, a, b, c)
+в буфере array('i'). Регистры - слоты списка кадра функции: сначала параметры, затем переменные и
+временные значения, в конце - константы (они заполняются один раз в шаблоне кадра).
+Семантика операций повторяет генерацию LLVM: переполнение int/char, zext/trunc/sitofp из TypeConvertNode,
+отсутствие сокращенного вычисления && и ||.
+"""
+import functools
+import math
+import operator
+import re
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import compiler
+import analysis
+from nodes.ast_node import AstNode, StmtListNode, FunctionNode, VarsDeclNode, AssignNode, CallNode, IfNode, \
+    ForNode, WhileNode, ReturnNode, ArrayDeclarationNode, ArrayIndexingNode, IdentNode, LiteralNode, FactorNode, \
+    BinOpNode, TypeConvertNode, ExprNode
+from semantic import SemanticException
+from utils import BinOp, BaseType, isArrayBuiltinFunc
+
+MOVE, LOADG, STOREG, \
+    IADD, ISUB, IMUL, IDIV, CADD, CSUB, FADD, FSUB, FMUL, FDIV, \
+    LT, LE, GT, GE, EQ, NE, AND, OR, XOR, \
+    TOBOOL, FTOBOOL, BTOI, ZEXT8, TRUNC8, FPTOSI, FPTOSI8, SITOFP, BTOFP, \
+    JMP, JT, JF, JLT, JLE, JGT, JGE, JEQ, JNE, \
+    NEWARR, COPYARR, ELEM, SETELEM, \
+    CALL, RET, RETV, UNREACHABLE, \
+    PRINTI, PRINTF, PRINTC, PRINTS, READI, READF, READC, READS, \
+    FILL, COPY, ISUM, FSUM, MIN, MAX, SORT, PRINTA = range(64)
+
+# операнды команд: r - регистр, g - глобальная переменная, j - адрес перехода, f - функция, k - число
+OPERANDS = {
+    MOVE: 'rr', LOADG: 'rg', STOREG: 'gr',
+    **{op: 'rrr' for op in (IADD, ISUB, IMUL, IDIV, CADD, CSUB, FADD, FSUB, FMUL, FDIV,
+                            LT, LE, GT, GE, EQ, NE, AND, OR, XOR)},
+    **{op: 'rr' for op in (TOBOOL, FTOBOOL, BTOI, ZEXT8, TRUNC8, FPTOSI, FPTOSI8, SITOFP, BTOFP)},
+    JMP: 'j', JT: 'rj', JF: 'rj',
+    **{op: 'rrj' for op in (JLT, JLE, JGT, JGE, JEQ, JNE)},
+    NEWARR: 'rrk', COPYARR: 'rrr', ELEM: 'rrr', SETELEM: 'rrr',
+    CALL: 'frr', RET: 'r', RETV: '', UNREACHABLE: '',
+    **{op: 'r' for op in (PRINTI, PRINTF, PRINTC, PRINTS, READI, READF, READC, READS)},
+    **{op: 'rrr' for op in (FILL, COPY, ISUM, FSUM, MIN, MAX)}, SORT: 'rr', PRINTA: 'rrk',
+}
+OPCODE_NAMES = {op: name for name, op in list(globals().items()) if name.isupper() and isinstance(op, int)}
+
+ARITHMETIC = {
+    (BinOp.ADD, BaseType.INT): IADD, (BinOp.SUB, BaseType.INT): ISUB,
+    (BinOp.MUL, BaseType.INT): IMUL, (BinOp.DIV, BaseType.INT): IDIV,
+    (BinOp.ADD, BaseType.CHAR): CADD,
+    (BinOp.ADD, BaseType.FLOAT): FADD, (BinOp.SUB, BaseType.FLOAT): FSUB,
+    (BinOp.MUL, BaseType.FLOAT): FMUL, (BinOp.DIV, BaseType.FLOAT): FDIV,
+}
+COMPARE = {BinOp.LT: LT, BinOp.LE: LE, BinOp.GT: GT, BinOp.GE: GE, BinOp.EQUALS: EQ, BinOp.NEQUALS: NE}
+BITWISE = {BinOp.BIT_AND: AND, BinOp.BIT_OR: OR, BinOp.XOR: XOR, BinOp.LOGICAL_AND: AND, BinOp.LOGICAL_OR: OR}
+# сравнение + условный переход одной командой; отрицание допустимо только для целых (из-за NaN)
+COMPARE_JUMPS = {BinOp.LT: JLT, BinOp.LE: JLE, BinOp.GT: JGT, BinOp.GE: JGE, BinOp.EQUALS: JEQ, BinOp.NEQUALS: JNE}
+NEGATED_COMPARE_JUMPS = {BinOp.LT: JGE, BinOp.LE: JGT, BinOp.GT: JLE, BinOp.GE: JLT, BinOp.EQUALS: JNE,
+                         BinOp.NEQUALS: JEQ}
+CONVERSIONS = {
+    (BaseType.INT, BaseType.BOOL): TOBOOL, (BaseType.CHAR, BaseType.BOOL): TOBOOL,
+    (BaseType.FLOAT, BaseType.BOOL): FTOBOOL,
+    (BaseType.BOOL, BaseType.INT): BTOI, (BaseType.BOOL, BaseType.CHAR): BTOI,
+    (BaseType.CHAR, BaseType.INT): ZEXT8, (BaseType.INT, BaseType.CHAR): TRUNC8,
+    (BaseType.FLOAT, BaseType.INT): FPTOSI, (BaseType.FLOAT, BaseType.CHAR): FPTOSI8,
+    (BaseType.INT, BaseType.FLOAT): SITOFP, (BaseType.CHAR, BaseType.FLOAT): SITOFP,
+    (BaseType.BOOL, BaseType.FLOAT): BTOFP,
+}
+BUILT_IN_OPS = {'print_int': PRINTI, 'print_float': PRINTF, 'print_char': PRINTC, 'print_str': PRINTS,
+                'read_int': READI, 'read_float': READF, 'read_char': READC, 'read_str': READS}
+# встроенные функции над массивами: аргументы - регистры (a, b, c), для sum, min и max результат - в a
+ARRAY_BUILT_IN_OPS = {'fill': FILL, 'copy': COPY, 'min': MIN, 'max': MAX, 'sort': SORT, 'print_array': PRINTA}
+# формат элемента для print_array (k): как print_int, print_float, print_char
+PRINT_FORMATS = {BaseType.INT: 0, BaseType.FLOAT: 1, BaseType.CHAR: 2}
+
+# временные номера регистров-констант, после компиляции функции они переносятся в конец кадра
+CONST_BASE = 1 << 24
+MAX_CALL_DEPTH = 100000
+READ_STR_SIZE = 100
+
+
+class RuntimeException(Exception):
+
+    def __init__(self, message, func: Optional[str] = None) -> None:
+        self.message = message
+        if func:
+            self.message += f' (функция: {func})'
+
+
+class InterpreterLimit(RuntimeException):
+    """Выполнение прервано ограничением интерпретатора (число шагов, глубина вызовов), а не ошибкой программы:
+    скомпилированная программа может завершиться успешно. Такой вызов не вычисляется при компиляции
+    """
+    pass
+
+
+class FuelExhausted(InterpreterLimit):
+    pass
+
+
+class CallDepthExceeded(InterpreterLimit):
+    pass
+
+
+class Function:
+    def __init__(self, name: str, nparams: int):
+        self.name = name
+        self.nparams = nparams
+        self.code = array('i')
+        # шаблон кадра: регистры переменных (nregs) и затем константы
+        self.frame: list = []
+        self.nregs = 0
+
+
+class Program:
+    def __init__(self, functions: List[Function], init: Function, globals_count: int):
+        self.functions = functions
+        self.init = init
+        self.globals_count = globals_count
+        main = [func for func in functions if func.name == 'main' and func.nparams == 0]
+        self.main = main[0] if main else None
+
+
+def zero(type_: BaseType):
+    return 0.0 if type_ == BaseType.FLOAT else 0
+
+
+class BytecodeCompiler:
+    def __init__(self, tree: StmtListNode):
+        self.tree = tree
+        self.functions: List[Function] = []
+        self.function_index: Dict[str, int] = {}
+        self.globals: Dict[object, int] = {}
+
+    def compile(self) -> Program:
+        funcs = analysis.functions(self.tree)
+        for name, node in funcs.items():
+            self.function_index[name] = len(self.functions)
+            self.functions.append(Function(name, len(node.argument_list.children)))
+        for name, node in funcs.items():
+            self.compile_function(self.functions[self.function_index[name]], node)
+
+        init = Function('<global>', 0)
+        self.begin(init)
+        for stmt in self.tree.exprs:
+            if not isinstance(stmt, FunctionNode):
+                self.stmt(stmt)
+        self.emit(RETV)
+        self.end()
+        return Program(self.functions, init, len(self.globals))
+
+    def compile_function(self, func: Function, node: FunctionNode):
+        self.begin(func)
+        args = node.argument_list.children
+        for arg in args:
+            self.regs[arg.name.node_ident] = self.alloc()
+        # параметры-массивы копируются при входе, как memcpy в LLVM (без копирования LLVM передает только
+        # массивы, которые не могут измениться во время вызова, поэтому результат тот же)
+        for arg in args:
+            if isinstance(arg, ArrayDeclarationNode):
+                self.emit(COPYARR, self.regs[arg.name.node_ident], self.regs[arg.name.node_ident],
+                          self.array_size(arg.value))
+        self.stmt(node.list)
+        self.emit(RETV if str(node.type.type) == 'void' and not node.type.isArr else UNREACHABLE)
+        self.end()
+
+    def compile_expression(self, expr: ExprNode) -> Function:
+        """Отдельная функция без параметров, возвращающая значение выражения (после compile)
+        """
+        func = Function('<expr>', 0)
+        self.begin(func)
+        self.emit(RET, self.expr(expr))
+        self.end()
+        return func
+
+    # --- состояние компилируемой функции ---
+
+    def begin(self, func: Function):
+        self.func = func
+        self.code: List[int] = []
+        self.regs: Dict[object, int] = {}
+        self.consts: Dict[tuple, int] = {}
+        self.const_values: list = []
+        self.next_reg = 0
+        self.max_reg = 0
+        self.labels: List[Optional[int]] = []
+        self.fixups: List[Tuple[int, int]] = []
+
+    def end(self):
+        nregs = self.max_reg
+        code = self.code
+        for pc in range(0, len(code), 4):
+            for i, kind in enumerate(OPERANDS[code[pc]], 1):
+                if kind == 'r' and code[pc + i] >= CONST_BASE:
+                    code[pc + i] = nregs + code[pc + i] - CONST_BASE
+        for pos, label in self.fixups:
+            code[pos] = self.labels[label]
+        self.func.code = array('i', code)
+        self.func.frame = [0] * nregs + self.const_values
+        self.func.nregs = nregs
+
+    def emit(self, op: int, a: int = 0, b: int = 0, c: int = 0):
+        self.code.extend((op, a, b, c))
+
+    def alloc(self) -> int:
+        reg = self.next_reg
+        self.next_reg += 1
+        self.max_reg = max(self.max_reg, self.next_reg)
+        return reg
+
+    def const(self, value) -> int:
+        key = (type(value), repr(value))
+        if key not in self.consts:
+            self.consts[key] = CONST_BASE + len(self.const_values)
+            self.const_values.append(value)
+        return self.consts[key]
+
+    def label(self) -> int:
+        self.labels.append(None)
+        return len(self.labels) - 1
+
+    def place(self, label: int):
+        self.labels[label] = len(self.code)
+
+    def jump(self, op: int, label: int, *regs: int):
+        operands = list(regs) + [0]
+        self.fixups.append((len(self.code) + len(operands), label))
+        self.emit(op, *operands)
+
+    # --- переменные ---
+
+    def global_slot(self, ident) -> int:
+        # функции компилируются раньше операторов верхнего уровня, где объявлены глобальные переменные
+        return self.globals.setdefault(ident, len(self.globals))
+
+    def declare(self, ident) -> None:
+        if analysis.is_global(ident):
+            self.global_slot(ident)
+        else:
+            self.regs[ident] = self.alloc()
+
+    def store(self, ident, reg: int):
+        if analysis.is_global(ident):
+            self.emit(STOREG, self.global_slot(ident), reg)
+        elif self.regs[ident] != reg:
+            self.emit(MOVE, self.regs[ident], reg)
+
+    def target(self, ident) -> Optional[int]:
+        """Регистр, в который можно сразу вычислить новое значение переменной
+        """
+        return None if analysis.is_global(ident) else self.regs[ident]
+
+    def array_size(self, size) -> int:
+        """Регистр с размером массива из объявления; -1 - размер неизвестен до выполнения (копируется весь)
+        """
+        if isinstance(size, int):
+            return self.const(size)
+        if isinstance(size, TypeConvertNode):
+            size = size.expr
+        if isinstance(size, LiteralNode) and isinstance(size.value, int):
+            return self.const(int(size.value))
+        return -1
+
+    # --- операторы ---
+
+    def stmt(self, node: AstNode):
+        mark = self.next_reg
+        if isinstance(node, StmtListNode):
+            for stmt in node.exprs:
+                self.stmt(stmt)
+        elif isinstance(node, VarsDeclNode):
+            self.vars_decl(node)
+            return
+        elif isinstance(node, ArrayDeclarationNode):
+            self.declare(node.name.node_ident)
+            keep = self.next_reg
+            self.new_array(node)
+            self.next_reg = keep
+            return
+        elif isinstance(node, AssignNode):
+            if isinstance(node.var, ArrayDeclarationNode):
+                self.declare(node.var.name.node_ident)
+                mark = self.next_reg
+            self.assign(node)
+        elif isinstance(node, CallNode):
+            self.call(node, -1)
+        elif isinstance(node, IfNode):
+            self.if_stmt(node)
+        elif isinstance(node, ForNode):
+            self.init_loop(node.init)
+            self.loop(node.cond, node.body, node.step)
+        elif isinstance(node, WhileNode):
+            self.loop(node.cond, node.stmt_list)
+        elif isinstance(node, ReturnNode):
+            if node.expr is None:
+                self.emit(RETV)
+            else:
+                self.emit(RET, self.expr(node.expr))
+        elif isinstance(node, FunctionNode):
+            pass
+        # выражение-оператор (не вызов) в LLVM не генерирует кода
+        self.next_reg = mark
+
+    def vars_decl(self, node: VarsDeclNode):
+        type_ = BaseType(node.vars_type.name)
+        for var in node.vars_list:
+            ident = (var.var if isinstance(var, AssignNode) else var).node_ident
+            self.declare(ident)
+            keep = self.next_reg
+            if isinstance(var, AssignNode):
+                self.assign(var)
+            else:
+                self.store(ident, self.const(zero(type_)))
+            self.next_reg = keep
+
+    def new_array(self, node: ArrayDeclarationNode):
+        ident = node.name.node_ident
+        target = self.target(ident)
+        reg = target if target is not None else self.alloc()
+        self.emit(NEWARR, reg, self.expr(node.value), int(ident.type.base_type.value == 'float'))
+        if node.values is not None:
+            for i, value in enumerate(node.values.values):
+                self.emit(SETELEM, reg, self.const(i), self.expr(value))
+        self.store(ident, reg)
+
+    def assign(self, node: AssignNode):
+        var = node.var.name if isinstance(node.var, (ArrayDeclarationNode, ArrayIndexingNode)) else node.var
+        ident = var.node_ident
+        if isinstance(node.var, ArrayIndexingNode):
+            arr = self.expr(node.var.name)
+            index = self.expr(node.var.value)
+            self.emit(SETELEM, arr, index, self.expr(node.val))
+        elif node.val.node_type.is_arr and not isinstance(node.val, CallNode):
+            # присваивание массивов копирует содержимое (размер - из объявления исходного массива)
+            source = self.expr(node.val)
+            target = self.target(ident)
+            reg = target if target is not None else self.alloc()
+            self.emit(COPYARR, reg, source, self.array_size(node.val.node_ident.size))
+            self.store(ident, reg)
+        else:
+            self.store(ident, self.expr(node.val, self.target(ident)))
+
+    def if_stmt(self, node: IfNode):
+        else_label, end_label = self.label(), self.label()
+        self.branch(node.cond, else_label if node.else_stmt is not None else end_label, False)
+        self.stmt(node.then_stmt)
+        if node.else_stmt is not None:
+            self.jump(JMP, end_label)
+            self.place(else_label)
+            self.stmt(node.else_stmt)
+        self.place(end_label)
+
+    def init_loop(self, init: AstNode):
+        if isinstance(init, VarsDeclNode):
+            self.vars_decl(init)
+        else:
+            self.stmt(init)
+
+    def loop(self, cond: ExprNode, body: AstNode, step: Optional[AstNode] = None):
+        """Условие проверяется в конце цикла: одна команда перехода на итерацию
+        """
+        body_label, cond_label = self.label(), self.label()
+        self.jump(JMP, cond_label)
+        self.place(body_label)
+        self.stmt(body)
+        if step is not None:
+            self.stmt(step)
+        self.place(cond_label)
+        mark = self.next_reg
+        self.branch(cond, body_label, True)
+        self.next_reg = mark
+
+    def branch(self, cond: ExprNode, label: int, when: bool):
+        """Переход на label, если условие cond равно when
+        """
+        if isinstance(cond, BinOpNode) and cond.op in COMPARE_JUMPS \
+                and (when or cond.arg1.node_type.base_type != BaseType.FLOAT):
+            arg1, arg2 = self.expr(cond.arg1), self.expr(cond.arg2)
+            self.jump((COMPARE_JUMPS if when else NEGATED_COMPARE_JUMPS)[cond.op], label, arg1, arg2)
+            return
+        if isinstance(cond, TypeConvertNode) and cond.expr.node_type.base_type in (BaseType.INT, BaseType.CHAR):
+            # ненулевое целое и так истинно
+            cond = cond.expr
+        self.jump(JT if when else JF, label, self.expr(cond))
+
+    # --- выражения ---
+
+    def expr(self, node: ExprNode, dst: Optional[int] = None) -> int:
+        """Вычисляет выражение и возвращает регистр с результатом;
+        dst - желаемый регистр результата (в него пишет только последняя команда)
+        """
+        reg = self.value(node, dst)
+        if dst is not None and reg != dst:
+            self.emit(MOVE, dst, reg)
+            return dst
+        return reg
+
+    def value(self, node: ExprNode, dst: Optional[int]) -> int:
+        if isinstance(node, LiteralNode):
+            return self.const(self.literal(node))
+        if isinstance(node, IdentNode):
+            if analysis.is_global(node.node_ident):
+                reg = self.alloc() if dst is None else dst
+                self.emit(LOADG, reg, self.global_slot(node.node_ident))
+                return reg
+            return self.regs[node.node_ident]
+        if isinstance(node, CallNode):
+            reg = self.alloc() if dst is None else dst
+            self.call(node, reg)
+            return reg
+
+        if isinstance(node, FactorNode):
+            if node.operation == '+' or node.node_type.base_type == BaseType.BOOL:
+                return self.value(node.literal, dst)
+            if isinstance(node.literal, LiteralNode):
+                return self.const(self.wrap(-self.literal(node.literal), node.node_type.base_type))
+            arg = self.expr(node.literal)
+            type_ = node.node_type.base_type
+            op = {BaseType.INT: ISUB, BaseType.CHAR: CSUB, BaseType.FLOAT: FSUB}[type_]
+            reg = self.alloc() if dst is None else dst
+            self.emit(op, reg, self.const(zero(type_)), arg)
+            return reg
+
+        if isinstance(node, BinOpNode):
+            type_ = node.arg1.node_type.base_type
+            op = ARITHMETIC.get((node.op, type_)) or COMPARE.get(node.op)
+            if op is None and type_ != BaseType.FLOAT:
+                op = BITWISE.get(node.op)
+            if op is None:
+                node.semantic_error(f'Оператор {node.op} для типа {node.arg1.node_type} не поддерживается')
+            arg1, arg2 = self.expr(node.arg1), self.expr(node.arg2)
+            reg = self.alloc() if dst is None else dst
+            self.emit(op, reg, arg1, arg2)
+            return reg
+
+        if isinstance(node, TypeConvertNode):
+            arg = self.expr(node.expr)
+            reg = self.alloc() if dst is None else dst
+            self.emit(CONVERSIONS[node.expr.node_type.base_type, node.node_type.base_type], reg, arg)
+            return reg
+
+        if isinstance(node, ArrayIndexingNode):
+            arr, index = self.expr(node.name), self.expr(node.value)
+            reg = self.alloc() if dst is None else dst
+            self.emit(ELEM, reg, arr, index)
+            return reg
+
+        node.semantic_error(f'Выражение {node} не поддерживается интерпретатором')
+
+    @staticmethod
+    def wrap(value, type_: BaseType):
+        if type_ == BaseType.INT:
+            return (value + 0x80000000 & 0xFFFFFFFF) - 0x80000000
+        if type_ == BaseType.CHAR:
+            return (value + 0x80 & 0xFF) - 0x80
+        return value
+
+    def literal(self, node: LiteralNode):
+        return node.number
+
+    def call(self, node: CallNode, dst: int):
+        ident = node.func.node_ident
+        if ident.built_in and isArrayBuiltinFunc(node.func.name):
+            self.array_built_in(node, dst)
+            return
+        if ident.built_in:
+            op = BUILT_IN_OPS[node.func.name]
+            if node.params:
+                self.emit(op, self.expr(node.params[0]))
+            else:
+                self.emit(op, dst if dst >= 0 else self.alloc())
+            return
+
+        # аргументы вычисляются в подряд идущие регистры, вызываемая функция получает их как параметры
+        base = self.next_reg
+        args = [self.alloc() for _ in node.params]
+        for arg, param in zip(args, node.params):
+            self.expr(param, arg)
+        self.emit(CALL, self.function_index[node.func.name], base, dst)
+
+
+    def array_built_in(self, node: CallNode, dst: int):
+        name = node.func.name
+        args = [self.expr(param) for param in node.params]
+        elem_type = BaseType(node.params[0].node_type.base_type.value)
+        if name in ('sum', 'min', 'max'):
+            op = (FSUM if elem_type == BaseType.FLOAT else ISUM) if name == 'sum' else ARRAY_BUILT_IN_OPS[name]
+            self.emit(op, dst if dst >= 0 else self.alloc(), *args)
+        elif name == 'print_array':
+            self.emit(PRINTA, *args, PRINT_FORMATS[elem_type])
+        else:
+            self.emit(ARRAY_BUILT_IN_OPS[name], *args)
+
+
+class Input:
+    """Чтение stdin в духе scanf: %d, %lf и %s пропускают пробельные символы, %c - нет
+    """
+    INT = re.compile(rb'[+-]?\d+')
+    FLOAT = re.compile(rb'[+-]?(\d+\.?\d*([eE][+-]?\d+)?|\.\d+([eE][+-]?\d+)?|inf(inity)?|nan)', re.I)
+    STR = re.compile(rb'\S+')
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.line = b''
+        self.pos = 0
+
+    def fill(self) -> bool:
+        if self.pos >= len(self.line):
+            self.line = self.stream.readline()
+            self.pos = 0
+        return self.pos < len(self.line)
+
+    def char(self) -> Optional[int]:
+        if not self.fill():
+            return None
+        self.pos += 1
+        return self.line[self.pos - 1]
+
+    def token(self, pattern) -> Optional[bytes]:
+        while True:
+            if not self.fill():
+                return None
+            while self.pos < len(self.line) and self.line[self.pos] in b' \t\n\r\v\f':
+                self.pos += 1
+            if self.pos < len(self.line):
+                break
+        match = pattern.match(self.line, self.pos)
+        if match is None:
+            return None
+        self.pos = match.end()
+        return match.group()
+
+
+class Interpreter:
+    def __init__(self, program: Program, stdin=None, stdout=None):
+        self.program = program
+        self.input = Input(stdin if stdin is not None else sys.stdin.buffer)
+        self.stdout = stdout if stdout is not None else sys.stdout.buffer
+        self.globals: list = [0] * program.globals_count
+        # scanf пишет в глобальные переменные, при ошибке чтения остается прежнее значение
+        self.last_int, self.last_char, self.last_float = 0, 0, 0.0
+
+    def run(self) -> int:
+        try:
+            self.execute(self.program.init)
+            result = self.execute(self.program.main) if self.program.main is not None else 0
+        finally:
+            self.stdout.flush()
+        return result if isinstance(result, int) else 0
+
+    def execute(self, func: Function, args: tuple = (), fuel: int = sys.maxsize):
+        """Выполняет функцию; fuel - сколько переходов и вызовов разрешено сделать
+        """
+        functions = self.program.functions
+        G = self.globals
+        code = func.code
+        regs = list(func.frame)
+        regs[:len(args)] = args
+        pc = 0
+        stack = []
+        try:
+            while True:
+                op = code[pc]
+                a = code[pc + 1]
+                b = code[pc + 2]
+                c = code[pc + 3]
+                pc += 4
+                if op == MOVE:
+                    regs[a] = regs[b]
+                elif op == IADD:
+                    v = regs[b] + regs[c]
+                    regs[a] = v if -2147483648 <= v <= 2147483647 else (v + 2147483648 & 4294967295) - 2147483648
+                elif op == ELEM:
+                    i = regs[c]
+                    if i < 0:
+                        raise IndexError(i)
+                    regs[a] = regs[b][i]
+                elif op == JLT:
+                    if regs[a] < regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JGE:
+                    if regs[a] >= regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == SETELEM:
+                    i = regs[b]
+                    if i < 0:
+                        raise IndexError(i)
+                    regs[a][i] = regs[c]
+                elif op == JMP:
+                    pc = a
+                    fuel -= 1
+                    if fuel < 0:
+                        raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JF:
+                    if not regs[a]:
+                        pc = b
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JT:
+                    if regs[a]:
+                        pc = b
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == ISUB:
+                    v = regs[b] - regs[c]
+                    regs[a] = v if -2147483648 <= v <= 2147483647 else (v + 2147483648 & 4294967295) - 2147483648
+                elif op == IMUL:
+                    v = regs[b] * regs[c]
+                    regs[a] = v if -2147483648 <= v <= 2147483647 else (v + 2147483648 & 4294967295) - 2147483648
+                elif op == JLE:
+                    if regs[a] <= regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JGT:
+                    if regs[a] > regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JEQ:
+                    if regs[a] == regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == JNE:
+                    if regs[a] != regs[b]:
+                        pc = c
+                        fuel -= 1
+                        if fuel < 0:
+                            raise FuelExhausted('Превышен лимит шагов вычисления', func.name)
+                elif op == CALL:
+                    callee = functions[a]
+                    frame = list(callee.frame)
+                    frame[:callee.nparams] = regs[b:b + callee.nparams]
+                    stack.append((func, code, regs, pc, c))
+                    if len(stack) > MAX_CALL_DEPTH:
+                        raise CallDepthExceeded('Превышена глубина вызовов интерпретатора', callee.name)
+                    fuel -= 1
+                    if fuel < 0:
+                        raise FuelExhausted('Превышен лимит шагов вычисления', callee.name)
+                    func, code, regs, pc = callee, callee.code, frame, 0
+                elif op == RET or op == RETV:
+                    value = regs[a] if op == RET else None
+                    if not stack:
+                        return value
+                    func, code, regs, pc, dst = stack.pop()
+                    if dst >= 0:
+                        regs[dst] = value
+                elif op == LOADG:
+                    regs[a] = G[b]
+                elif op == STOREG:
+                    G[a] = regs[b]
+                elif op == LT:
+                    regs[a] = regs[b] < regs[c]
+                elif op == LE:
+                    regs[a] = regs[b] <= regs[c]
+                elif op == GT:
+                    regs[a] = regs[b] > regs[c]
+                elif op == GE:
+                    regs[a] = regs[b] >= regs[c]
+                elif op == EQ:
+                    regs[a] = regs[b] == regs[c]
+                elif op == NE:
+                    regs[a] = regs[b] != regs[c]
+                elif op == IDIV:
+                    v = int(regs[b] / regs[c])
+                    regs[a] = v if -2147483648 <= v <= 2147483647 else (v + 2147483648 & 4294967295) - 2147483648
+                elif op == CADD:
+                    v = regs[b] + regs[c]
+                    regs[a] = v if -128 <= v <= 127 else (v + 128 & 255) - 128
+                elif op == CSUB:
+                    v = regs[b] - regs[c]
+                    regs[a] = v if -128 <= v <= 127 else (v + 128 & 255) - 128
+                elif op == FADD:
+                    regs[a] = regs[b] + regs[c]
+                elif op == FSUB:
+                    regs[a] = regs[b] - regs[c]
+                elif op == FMUL:
+                    regs[a] = regs[b] * regs[c]
+                elif op == FDIV:
+                    y = regs[c]
+                    regs[a] = regs[b] / y if y else _float_div_by_zero(regs[b], y)
+                elif op == AND:
+                    regs[a] = regs[b] & regs[c]
+                elif op == OR:
+                    regs[a] = regs[b] | regs[c]
+                elif op == XOR:
+                    regs[a] = regs[b] ^ regs[c]
+                elif op == TOBOOL:
+                    regs[a] = regs[b] != 0
+                elif op == FTOBOOL:
+                    # fcmp one: NaN не равен нулю, но и не истинен
+                    v = regs[b]
+                    regs[a] = v != 0.0 and v == v
+                elif op == BTOI:
+                    regs[a] = 1 if regs[b] else 0
+                elif op == ZEXT8:
+                    regs[a] = regs[b] & 255
+                elif op == TRUNC8:
+                    regs[a] = (regs[b] + 128 & 255) - 128
+                elif op == FPTOSI:
+                    regs[a] = (int(regs[b]) + 2147483648 & 4294967295) - 2147483648
+                elif op == FPTOSI8:
+                    regs[a] = (int(regs[b]) + 128 & 255) - 128
+                elif op == SITOFP:
+                    regs[a] = float(regs[b])
+                elif op == BTOFP:
+                    # sitofp i1: истина - это -1
+                    regs[a] = -1.0 if regs[b] else 0.0
+                elif op == NEWARR:
+                    n = int(regs[b])
+                    if n < 0:
+                        raise IndexError(n)
+                    regs[a] = [0.0 if c else 0] * n
+                elif op == COPYARR:
+                    source = regs[b]
+                    if c < 0:
+                        regs[a] = list(source)
+                    else:
+                        n = regs[c]
+                        regs[a] = source[:n] + [0] * (n - len(source))
+                elif op == UNREACHABLE:
+                    raise RuntimeException('Функция завершилась без return', func.name)
+                else:
+                    self.built_in(op, regs, a, b, c)
+        except RuntimeException:
+            raise
+        except IndexError as e:
+            # индекс за верхней границей проверяет сам список: индекс берется из операнда ELEM/SETELEM
+            index = e.args[0] if e.args and isinstance(e.args[0], int) \
+                else regs[code[pc - 1] if code[pc - 4] == ELEM else code[pc - 2]]
+            raise RuntimeException(f'Выход за границы массива: {index}', func.name)
+        except ZeroDivisionError:
+            raise RuntimeException('Деление на ноль', func.name)
+        except (ValueError, OverflowError) as e:
+            raise RuntimeException(f'Некорректное преобразование числа: {e}', func.name)
+
+    def built_in(self, op: int, regs: list, a: int, b: int, c: int):
+        if op >= FILL:
+            self.array_built_in(op, regs, a, b, c)
+        elif op == PRINTI:
+            self.stdout.write(b'%d\n' % regs[a])
+        elif op == PRINTF:
+            self.stdout.write(b'%f\n' % regs[a])
+        elif op == PRINTC:
+            self.stdout.write(bytes((regs[a] & 255, 10)))
+        elif op == PRINTS:
+            chars = regs[a]
+            end = chars.index(0) if 0 in chars else len(chars)
+            self.stdout.write(bytes(c & 255 for c in chars[:end]) + b'\n')
+        else:
+            # перед чтением выводится все накопленное (для интерактивных программ)
+            self.stdout.flush()
+            if op == READI:
+                token = self.input.token(Input.INT)
+                if token is not None:
+                    self.last_int = BytecodeCompiler.wrap(int(token), BaseType.INT)
+                regs[a] = self.last_int
+            elif op == READF:
+                token = self.input.token(Input.FLOAT)
+                if token is not None:
+                    self.last_float = float(token)
+                regs[a] = self.last_float
+            elif op == READC:
+                char = self.input.char()
+                if char is not None:
+                    self.last_char = BytecodeCompiler.wrap(char, BaseType.CHAR)
+                regs[a] = self.last_char
+            elif op == READS:
+                chars = [0] * READ_STR_SIZE
+                token = self.input.token(Input.STR) or b''
+                chars[:len(token[:READ_STR_SIZE - 1])] = [BytecodeCompiler.wrap(c, BaseType.CHAR)
+                                                          for c in token[:READ_STR_SIZE - 1]]
+                regs[a] = chars
+
+
+    def array_built_in(self, op: int, regs: list, a: int, b: int, c: int):
+        """Встроенные функции над массивами; n < 0 - как n = 0, n больше размера массива - выход за границы
+        """
+        if op in (FILL, COPY, ISUM, FSUM, MIN, MAX):
+            array, n = regs[b if op >= ISUM else a], max(regs[c], 0)
+        else:
+            array, n = regs[a], max(regs[b], 0)
+        if n > len(array):
+            raise IndexError(n)
+        if op == FILL:
+            array[:n] = [regs[b]] * n
+        elif op == COPY:
+            source = regs[b]
+            if n > len(source):
+                raise IndexError(n)
+            array[:n] = source[:n]
+        elif op == ISUM:
+            regs[a] = BytecodeCompiler.wrap(sum(array[:n]), BaseType.INT)
+        elif op == FSUM:
+            # как в LLVM: последовательное сложение, начиная с первого элемента
+            regs[a] = functools.reduce(operator.add, array[:n]) if n else 0.0
+        elif op == MIN:
+            regs[a] = min(array[:n]) if n else self.zero_like(array)
+        elif op == MAX:
+            regs[a] = max(array[:n]) if n else self.zero_like(array)
+        elif op == SORT:
+            array[:n] = sorted(array[:n])
+        elif op == PRINTA:
+            if c == 0:
+                self.stdout.write(b''.join(b'%d\n' % value for value in array[:n]))
+            elif c == 1:
+                self.stdout.write(b''.join(b'%f\n' % value for value in array[:n]))
+            else:
+                self.stdout.write(b''.join(bytes((value & 255, 10)) for value in array[:n]))
+
+
+    @staticmethod
+    def zero_like(array: list):
+        return 0.0 if array and isinstance(array[0], float) else 0
+
+
+def _float_div_by_zero(x: float, y: float) -> float:
+    if x == 0.0 or x != x:
+        return float('nan')
+    return math.copysign(math.inf, x) * math.copysign(1.0, y)
+
+
+def compile_tree(tree: StmtListNode) -> Program:
+    return BytecodeCompiler(tree).compile()
+
+
+def run(tree: StmtListNode, stdin=None, stdout=None) -> int:
+    """Выполняет проверенное (после semantic_check) дерево, возвращает результат main
+    """
+    return Interpreter(compile_tree(tree), stdin, stdout).run()
+
+
+def disassemble(func: Function) -> str:
+    consts = ', '.join(f'r{func.nregs + i} = {value!r}' for i, value in enumerate(func.frame[func.nregs:]))
+    lines = [f'{func.name}: {func.nparams} params, {func.nregs} regs; {consts}']
+    for pc in range(0, len(func.code), 4):
+        op = func.code[pc]
+        operands = ', '.join(f'{kind}{func.code[pc + i]}' for i, kind in enumerate(OPERANDS[op], 1))
+        lines.append(f'{pc:6}  {OPCODE_NAMES[op]:<12} {operands}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(f'usage: {sys.argv[0]} program.c [--dis]')
+        sys.exit(2)
+    try:
+        tree = compiler.check(open(sys.argv[1]).read())
+        if '--dis' in sys.argv:
+            program = compile_tree(tree)
+            print(*(disassemble(func) for func in program.functions + [program.init]), sep='\n\n')
+            sys.exit(0)
+        sys.exit(run(tree))
+    except SemanticException as e:
+        print('Ошибка: {}'.format(e.message), file=sys.stderr)
+        sys.exit(1)
+    except InterpreterLimit as e:
+        print('Выполнение прервано: {}'.format(e.message), file=sys.stderr)
+        sys.exit(1)
+    except RuntimeException as e:
+        print('Ошибка выполнения: {}'.format(e.message), file=sys.stderr)
+        sys.exit(1)
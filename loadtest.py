@@ -0,0 +1,130 @@
+"""Нагрузочный тест сервера компиляции (server.py): p50/p99 задержки при разной частоте запросов.
+
+    python loadtest.py --rates 5,10,20,40 --duration 5
+    python loadtest.py --unix /tmp/ourparser.sock --rates 10
+
+Без --unix/--port сервер запускается в отдельном процессе на временном unix-сокете.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+CONNECTIONS = 16
+
+
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.ids = itertools.count()
+        self.listener = asyncio.create_task(self.listen())
+
+    async def listen(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            self.waiting.pop(response['id']).set_result(response)
+
+    async def request(self, **request) -> dict:
+        request['id'] = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request['id']] = future
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+
+async def connect(args) -> Client:
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix, limit=2 ** 26)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port, limit=2 ** 26)
+    return Client(reader, writer)
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_rate(clients, source: str, rate: float, duration: float, distinct: bool, counter):
+    latencies, failures = [], {}
+
+    async def one(client: Client, n: int):
+        start = time.perf_counter()
+        prog = source + (f'\n// request {n}\n' if distinct else '')
+        response = await client.request(op='compile', source=prog)
+        if response['ok']:
+            latencies.append((time.perf_counter() - start) * 1000)
+        else:
+            failures[response['error'][:40]] = failures.get(response['error'][:40], 0) + 1
+
+    tasks = []
+    start = time.perf_counter()
+    total = int(rate * duration)
+    # открытая модель нагрузки: запросы отправляются по расписанию, не дожидаясь ответов
+    for i in range(total):
+        delay = start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(clients[i % len(clients)], next(counter))))
+    await asyncio.gather(*tasks)
+
+    if latencies:
+        print(f'{rate:8.1f} req/s  sent {total:5}  ok {len(latencies):5}  '
+              f'p50 {percentile(latencies, 0.5):8.2f} ms  p99 {percentile(latencies, 0.99):8.2f} ms  '
+              f'failed {failures or 0}')
+    else:
+        print(f'{rate:8.1f} req/s  sent {total:5}  all failed {failures}')
+
+
+async def run(args):
+    clients = [await connect(args) for _ in range(CONNECTIONS)]
+    source = open(args.source).read()
+    counter = itertools.count()
+    for rate in args.rates:
+        await run_rate(clients, source, rate, args.duration, not args.same_source, counter)
+    print('server stats:', (await clients[0].request(op='stats'))['stats'])
+    for client in clients:
+        client.writer.close()
+        await client.writer.wait_closed()
+
+
+def main():
+    args = argparse.ArgumentParser(description='Load test for the compile server')
+    args.add_argument('--unix')
+    args.add_argument('--host', default='127.0.0.1')
+    args.add_argument('--port', type=int)
+    args.add_argument('--rates', default='5,10,20,40', type=lambda s: [float(r) for r in s.split(',')])
+    args.add_argument('--duration', type=float, default=5.0)
+    args.add_argument('--source', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'bbbb.c'))
+    args.add_argument('--same-source', action='store_true', help='send identical sources (tests coalescing)')
+    args.add_argument('--workers', type=int, default=4, help='workers of the spawned server')
+    args = args.parse_args()
+
+    server = None
+    if not args.unix and not args.port:
+        args.unix = os.path.join(tempfile.mkdtemp(prefix='ourparser-'), 'server.sock')
+        server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py'),
+                                   '--unix', args.unix, '--workers', str(args.workers)],
+                                  stdout=subprocess.PIPE, text=True)
+        server.stdout.readline()  # 'listening on ...'
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,15 @@
-import parser_base
-import semantic
 import os
-from code_generator import CodeGenerator
+import sys
 
-from tests import working_test
 
-if __name__ == '__main__':
+def demo():
+    """Самопроверка разбора и компиляция tests/bbbb.c с выводом AST (запуск без аргументов)
+    """
+    import parser_base
+    import semantic
+    import compiler
+    from tests import working_test
+
     prog = open('tests/bbbb.c', 'r').read()
 
     # prog = parser_base.parse("void d(int a[1]){}", True)
@@ -28,11 +32,16 @@ if __name__ == '__main__':
         print(*tree.tree, sep=os.linesep)
 
         with open("llvm.ll", 'w') as f:
-            gen = CodeGenerator()
-            gen.start()
-            tree.to_llvm(gen)
-            f.write(str(gen))
+            f.write(compiler.generate(tree))
 
     except semantic.SemanticException as e:
         print('Ошибка: {}'.format(e.message))
 
+
+if __name__ == '__main__':
+    # с аргументами - компилятор (python main.py prog.c -o prog.ll), без самопроверки при запуске
+    if len(sys.argv) > 1:
+        import compiler
+        compiler.main()
+    else:
+        demo()
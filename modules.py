@@ -0,0 +1,198 @@
+"""Раздельная компиляция: интерфейсы модулей, инкрементальная сборка проекта и компоновка.
+
+Интерфейс модуля (.ifc) - JSON с сигнатурами его функций: имя -> [возвращаемый тип, [типы параметров]],
+массивы записываются как 'int[]':
+    {"functions": {"sum": ["int", ["int[]", "int"]]}}
+Модуль компилируется вместе с интерфейсами остальных модулей: их функции известны семантическому
+анализу как внешние и объявляются в LLVM через declare. Модуль пересобирается, только если изменился
+его исходный текст или сигнатура одной из вызываемых им внешних функций.
+
+    python modules.py -o build lib.c main.c
+    python modules.py -o build main.c --lib prebuilt/lib.ifc
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import parser_base
+import analysis
+import compiler
+from nodes.ast_node import StmtListNode, ArrayDeclarationNode
+from semantic import SemanticException
+
+MANIFEST = 'build.json'
+
+Signature = List  # [возвращаемый тип, [типы параметров]]
+
+
+def signature(func) -> Signature:
+    return [str(func.type.type) + ('[]' if func.type.isArr else ''),
+            [str(arg.type_var) + ('[]' if isinstance(arg, ArrayDeclarationNode) else '')
+             for arg in func.argument_list.children]]
+
+
+def interface(tree: StmtListNode) -> Dict[str, Signature]:
+    """Сигнатуры функций модуля, доступных другим модулям (все, кроме main);
+    строится по дереву разбора, семантический анализ не нужен
+    """
+    return {name: signature(func) for name, func in analysis.functions(tree).items() if name != 'main'}
+
+
+def write_interface(path: str, functions: Dict[str, Signature]):
+    with open(path, 'w') as f:
+        json.dump({'functions': functions}, f, indent=1, sort_keys=True)
+
+
+def read_interface(path: str) -> Dict[str, Signature]:
+    with open(path) as f:
+        return json.load(f)['functions']
+
+
+def module_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def compile_module(tree: StmtListNode, externals: Dict[str, Signature], dce: bool = False,
+                   const_calls: bool = False, licm: bool = False, switches: bool = False, conversions: bool = False,
+                   **options) -> Tuple[str, Dict[str, Signature]]:
+    """Компиляция одного модуля; функции модуля остаются видимыми снаружи (не internal).
+    :return: (LLVM IR, сигнатуры использованных внешних функций)
+    """
+    exported = set(interface(tree)) | set(options.pop('exported', ()))
+    compiler.check_tree(tree, dce, exported, const_calls, licm, switches, externals, conversions=conversions)
+    imports = {name: externals[name] for name in analysis.external_functions(tree)}
+    return compiler.generate(tree, exported=exported, **options), imports
+
+
+def link(paths: Iterable[str], output: str) -> str:
+    """Компоновка модулей (.ll или .bc) в один: в процессе через llvmlite, если он установлен,
+    иначе через llvm-link. Формат результата определяется расширением output
+    """
+    paths = list(paths)
+    try:
+        import llvmlite.binding as llvm
+    except ImportError:
+        subprocess.run(['llvm-link', *(['-S'] if output.endswith('.ll') else []), *paths, '-o', output], check=True)
+        return output
+
+    module = None
+    for path in paths:
+        if path.endswith('.bc'):
+            with open(path, 'rb') as f:
+                other = llvm.parse_bitcode(f.read())
+        else:
+            with open(path) as f:
+                other = llvm.parse_assembly(f.read())
+        if module is None:
+            module = other
+        else:
+            module.link_in(other)
+    module.verify()
+    if output.endswith('.bc'):
+        with open(output, 'wb') as f:
+            f.write(module.as_bitcode())
+    else:
+        with open(output, 'w') as f:
+            f.write(str(module))
+    return output
+
+
+def library_module(interface_path: str) -> str:
+    base = os.path.splitext(interface_path)[0]
+    return base + '.ll' if os.path.exists(base + '.ll') else base + '.bc'
+
+
+def build(sources: Iterable[str], out_dir: str, libraries: Iterable[str] = (), output: Optional[str] = None,
+          log: Optional[List[str]] = None, **options) -> str:
+    """Инкрементальная сборка: для каждого модуля в out_dir сохраняются name.ll и name.ifc,
+    состояние сборки - в build.json. libraries - интерфейсы заранее собранных модулей
+    (рядом с name.ifc должен лежать name.ll или name.bc).
+    :param log: сюда добавляются имена перекомпилированных модулей
+    :return: путь к скомпонованному модулю
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {'options': options, 'modules': {}}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            old = json.load(f)
+        if old['options'] == json.loads(json.dumps(options)):
+            manifest = old
+
+    paths, entries, trees = {}, {}, {}
+    for path in sources:
+        name = module_name(path)
+        if name in paths:
+            raise SemanticException(f'Модуль {name} указан несколько раз: {paths[name]}, {path}')
+        paths[name] = path
+        with open(path) as f:
+            source = f.read()
+        digest = hashlib.sha256(source.encode()).hexdigest()
+        entry = manifest['modules'].get(name)
+        if entry is None or entry['hash'] != digest:
+            trees[name] = parser_base.parse(source)
+            entry = {'hash': digest, 'functions': interface(trees[name]), 'imports': None}
+            write_interface(os.path.join(out_dir, name + '.ifc'), entry['functions'])
+        entries[name] = entry
+
+    # функция -> (модуль, сигнатура) по всем модулям проекта и библиотекам
+    table: Dict[str, Tuple[str, Signature]] = {}
+    owners = [(library, read_interface(library)) for library in libraries] + \
+             [(name, entry['functions']) for name, entry in entries.items()]
+    for owner, functions in owners:
+        for func, sig in functions.items():
+            if func in table:
+                raise SemanticException(f'Функция {func} объявлена в модулях {table[func][0]} и {owner}')
+            table[func] = (owner, sig)
+
+    for name, entry in entries.items():
+        module_path = os.path.join(out_dir, name + '.ll')
+        if entry['imports'] is not None and os.path.exists(module_path) \
+                and all(func in table and table[func][1] == sig for func, sig in entry['imports'].items()):
+            continue
+        tree = trees.get(name)
+        if tree is None:
+            with open(paths[name]) as f:
+                tree = parser_base.parse(f.read())
+        externals = {func: sig for func, (owner, sig) in table.items() if owner != name}
+        llvm, entry['imports'] = compile_module(tree, externals, **options)
+        with open(module_path, 'w') as f:
+            f.write(llvm)
+        if log is not None:
+            log.append(name)
+
+    manifest['modules'] = entries
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+    modules = [os.path.join(out_dir, name + '.ll') for name in entries] + \
+              [library_module(library) for library in libraries]
+    return link(modules, output or os.path.join(out_dir, 'program.ll'))
+
+
+def main():
+    args = argparse.ArgumentParser(description='Separate compilation and linking of modules')
+    args.add_argument('sources', nargs='+')
+    args.add_argument('-o', '--out-dir', default='build')
+    args.add_argument('--lib', action='append', default=[], help='interface of a prebuilt module')
+    args.add_argument('--output', help='linked module (default: OUT_DIR/program.ll)')
+    for flag in ('dce', 'const_calls', 'conversions', 'licm', 'switches', 'cse', 'arrays_by_ref', 'nsw', 'bounds_checks'):
+        args.add_argument('--' + flag.replace('_', '-'), dest=flag, action='store_true')
+    args = args.parse_args()
+
+    options = {flag: True for flag in ('dce', 'const_calls', 'conversions', 'licm', 'switches', 'cse', 'arrays_by_ref', 'nsw', 'bounds_checks') if getattr(args, flag)}
+    rebuilt = []
+    try:
+        output = build(args.sources, args.out_dir, args.lib, args.output, rebuilt, **options)
+    except SemanticException as e:
+        print('Ошибка: {}'.format(e.message))
+        raise SystemExit(1)
+    print(f'rebuilt: {", ".join(rebuilt) or "nothing"}')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
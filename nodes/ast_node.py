@@ -1,11 +1,15 @@
+import math
+import struct
 from abc import ABC, abstractmethod
 from typing import Callable, Tuple, Optional, Union
 from enum import Enum
-from utils import BinOp, BaseType, getLLVMtype, getBinOp, getConvOp, isBuiltinFunc
+from utils import BinOp, BaseType, getLLVMtype, getBinOp, getConvOp, isBuiltinFunc, isArrayBuiltinFunc, getLLVMTypeSize, \
+    getMemcpy, convertValue, INT_MIN, INT_MAX
 from semantic import IdentScope, TypeDesc, SemanticException, IdentDesc, BIN_OP_TYPE_COMPATIBILITY, TYPE_CONVERTIBILITY, \
-    ArrayDesc
+    TYPE_PROMOTIONS, ArrayDesc, ScopeType, ARRAY_BUILT_IN_WRITES, array_built_in_type
 
-from code_generator import CodeGenerator, INT_POINTER_CONST, CHAR_POINTER_CONST, FLOAT_POINTER_CONST
+from code_generator import CodeGenerator, Fragment, INT_POINTER_CONST, CHAR_POINTER_CONST, FLOAT_POINTER_CONST, \
+    arrayLiteral, arrayStart
 
 
 class KeyWords(Enum):
@@ -23,6 +27,301 @@ def checkNameIsKeywordAndRaiseException(name: str, text: str):
         raise Exception("Using keyword in name of " + text)
 
 
+def globalName(ident: Optional[IdentDesc]) -> Optional[str]:
+    """Имя глобальной переменной в LLVM (None для локальных переменных и функций).
+    Переменные из блоков верхнего уровня могут называться одинаково, поэтому к их имени добавляется номер
+    """
+    if ident is None or ident.type.func:
+        return None
+    if ident.scope == ScopeType.GLOBAL:
+        return f"@{ident.name}"
+    if ident.scope == ScopeType.GLOBAL_LOCAL:
+        return f"@{ident.name}.{ident.index}"
+    return None
+
+
+def varPointer(name: 'IdentNode') -> str:
+    """Указатель на переменную: глобальная переменная LLVM или alloca локальной переменной.
+    Локальные переменные (и параметры) из разных блоков функции могут называться одинаково,
+    поэтому к имени добавляется номер
+    """
+    ident = name.node_ident
+    if ident is not None and ident.scope == ScopeType.LOCAL and not ident.type.func:
+        return f"%{name.name}.addr.{ident.index}"
+    return globalName(ident) or f"%{name.name}"
+
+
+def loadArrayBase(gen: CodeGenerator, name: 'IdentNode') -> str:
+    """Загрузка указателя на начало массива из его переменной
+    """
+    ptr = varPointer(name)
+    cached = gen.lookupValue(('load', ptr))
+    if cached is not None:
+        return cached
+
+    var_name = f"%{name.name}.{gen.getVarIndex(name.name)}"
+    var_type = getLLVMtype(name.node_type)
+    gen.add(f'{var_name} = load {var_type}*, {var_type}** {ptr}')
+    gen.addVarIndex(name.name)
+    gen.rememberValue(('load', ptr), var_name)
+    return var_name
+
+
+def wrapValue(value, type_: BaseType):
+    """Значение после переполнения: int - 32 бита со знаком, char - 8 бит без знака (как ord)
+    """
+    if type_ == BaseType.INT:
+        return (value + 2 ** 31) % 2 ** 32 - 2 ** 31
+    if type_ == BaseType.CHAR:
+        return value & 0xFF
+    if type_ == BaseType.BOOL:
+        return bool(value & 1)
+    return value
+
+
+STATIC_OPS = {
+    BinOp.ADD: lambda a, b: a + b,
+    BinOp.SUB: lambda a, b: a - b,
+    BinOp.MUL: lambda a, b: a * b,
+}
+
+
+def staticValue(expr: 'ExprNode'):
+    """Значение константного выражения, вычисленное во время компиляции так же, как его вычислит программа;
+    None - выражение не константа (или его значение не определено, например, fptosi вне диапазона)
+    """
+    type_ = expr.node_type.base_type if expr.node_type is not None else None
+    if isinstance(expr, LiteralNode):
+        return ord(expr.value) if type_ == BaseType.CHAR else expr.value
+    if isinstance(expr, FactorNode):
+        value = staticValue(expr.literal)
+        if value is None or expr.operation == '+':
+            return value
+        return -value if type_ == BaseType.FLOAT else wrapValue(-int(value), type_)
+    if isinstance(expr, BinOpNode):
+        if expr.op not in STATIC_OPS or type_ not in (BaseType.INT, BaseType.FLOAT) \
+                or expr.arg1.node_type.base_type != type_:
+            return None
+        arg1, arg2 = staticValue(expr.arg1), staticValue(expr.arg2)
+        if arg1 is None or arg2 is None:
+            return None
+        value = STATIC_OPS[expr.op](arg1, arg2)
+        return value if type_ == BaseType.FLOAT else wrapValue(value, type_)
+    if isinstance(expr, TypeConvertNode):
+        value = staticValue(expr.expr)
+        type_from = expr.expr.node_type.base_type
+        if value is None:
+            return None
+        if type_ == BaseType.BOOL:
+            return value != 0
+        if type_ == BaseType.FLOAT:
+            # sitofp: char и bool считаются знаковыми
+            if type_from == BaseType.CHAR and value > 127:
+                value -= 256
+            return -1.0 if type_from == BaseType.BOOL and value else float(value)
+        if type_from == BaseType.FLOAT:
+            low, high = (-128, 127) if type_ == BaseType.CHAR else (-2 ** 31, 2 ** 31 - 1)
+            if not math.isfinite(value) or not low <= int(value) <= high:
+                return None
+            value = int(value)
+        return wrapValue(int(value), type_)
+    return None
+
+
+def llvmConstant(value, type_: BaseType) -> str:
+    if type_ == BaseType.FLOAT:
+        # шестнадцатеричная запись double точна для любого значения
+        return f"0x{struct.unpack('>Q', struct.pack('>d', value))[0]:016X}"
+    if type_ == BaseType.BOOL:
+        return 'true' if value else 'false'
+    if type_ == BaseType.CHAR:
+        return str(value - 256 if value > 127 else value)
+    return str(int(value))
+
+
+def zeroValue(type_: BaseType):
+    return 0.0 if type_ == BaseType.FLOAT else False if type_ == BaseType.BOOL else 0
+
+
+TAIL_RECURSE_LABEL = "tail.recurse"
+
+
+def llvmSignature(type_: TypeDesc) -> Tuple[str, ...]:
+    """Типы LLVM результата и параметров функции
+    """
+    return tuple(getLLVMtype(t.base_type) + ("*" if t.is_arr else "") for t in (type_.return_type,) + type_.params)
+
+
+def tailCallMarker(gen: CodeGenerator, call: 'CallNode') -> str:
+    """Маркер вызова в хвостовой позиции: tail - вызываемая функция не обращается к alloca вызывающей
+    (массивы передаются, только если это параметры, переданные по ссылке и не переприсваиваемые),
+    musttail - к тому же совпадают сигнатуры, и вызов гарантированно не занимает стек
+    """
+    params = {arg.name.node_ident: arg for arg in gen.function.argument_list.children
+              if isinstance(arg, ArrayDeclarationNode)}
+    for param in call.params:
+        if not param.node_type.is_arr:
+            continue
+        arg = params.get(param.node_ident) if isinstance(param, IdentNode) else None
+        if arg is None or not (gen.arrays_by_ref and arg.by_ref and arg.fixed):
+            return ""
+    if llvmSignature(call.func.node_type) == llvmSignature(gen.function.name.node_type):
+        return "musttail "
+    return "tail "
+
+
+def hoistInvariants(gen: CodeGenerator, invariants: Tuple['ExprNode', ...]) -> None:
+    """Предзаголовок цикла: инвариантные выражения вычисляются один раз до входа в цикл,
+    их значения действуют до выхода из цикла (см. CodeGenerator.popInvariants)
+    """
+    gen.pushInvariants()
+    gen.hoisting = True
+    for expr in invariants:
+        if expr.node_type.is_arr:
+            loadArrayBase(gen, expr)
+        else:
+            expr.load(gen)
+    gen.hoisting = False
+
+
+def arrayOnStack(limit: Optional[int], elem_type, count, escapes: bool) -> bool:
+    """Массив размещается в стеке, если он не переживает функцию и его размер известен и не больше limit байт
+    (limit None - все массивы в стеке)
+    """
+    if limit is None:
+        return True
+    return not escapes and isinstance(count, int) and not isinstance(count, bool) \
+        and count * getLLVMTypeSize(elem_type) <= limit
+
+
+def allocateArray(gen: CodeGenerator, result: str, elem_type: str, count, escapes: bool) -> None:
+    """Память под массив из count элементов: в стеке (alloca) или в арене (см. CodeGenerator.arenaAlloc)
+    """
+    if arrayOnStack(gen.stack_array_limit, elem_type, count, escapes):
+        gen.add(f"{result} = alloca {elem_type}, i32 {count}")
+        return
+    memory = gen.arenaAlloc(arraySizeInBytes(gen, count, elem_type), escapes)
+    gen.add(f"{result} = bitcast i8* {memory} to {elem_type}*")
+
+
+def arraySizeInBytes(gen: CodeGenerator, count, type_) -> str:
+    if isinstance(count, int):
+        return str(count * getLLVMTypeSize(type_))
+
+    result = f"%{gen.getTempVar()}"
+    gen.addTempVarIndex()
+    gen.add(f"{result} = mul i32 {count}, {getLLVMTypeSize(type_)}")
+    return result
+
+
+def widenIndex(gen: CodeGenerator, index, index_type: str) -> str:
+    """Индекс массива, расширенный до i64 (sext: индексы getelementptr - числа со знаком)
+    """
+    if index_type == "i32" and not str(index).startswith("%"):
+        return str(index)
+    key = ('conv', index_type, 'i64', index)
+    cached = gen.lookupValue(key)
+    if cached is not None:
+        return cached
+
+    result = f"%idx.{gen.getVarIndex('idx')}"
+    gen.addVarIndex('idx')
+    gen.add(f"{result} = sext {index_type} {index} to i64")
+    gen.rememberValue(key, result)
+    return result
+
+
+def lengthPointer(name: 'IdentNode') -> str:
+    """Переменная с длиной массива для проверок границ (если длина неизвестна при компиляции)
+    """
+    return f"{varPointer(name)}.len"
+
+
+def declareLength(gen: CodeGenerator, name: 'IdentNode', initial: int = 0) -> None:
+    if name.node_ident.scope in (ScopeType.GLOBAL, ScopeType.GLOBAL_LOCAL):
+        gen.addGlobal(f"{lengthPointer(name)} = internal global i32 {initial}")
+    else:
+        gen.alloca(f"{lengthPointer(name)} = alloca i32")
+
+
+def storeLength(gen: CodeGenerator, name: 'IdentNode', length) -> None:
+    gen.add(f"store i32 {length}, i32* {lengthPointer(name)}")
+    gen.rememberValue(('load', lengthPointer(name)), length)
+
+
+def arrayLength(gen: CodeGenerator, name: 'IdentNode', length: Optional[int]):
+    """Длина массива name: константа length (если известна при компиляции) или значение из переменной длины
+    """
+    if length is not None:
+        return length
+    ptr = lengthPointer(name)
+    cached = gen.lookupValue(('load', ptr))
+    if cached is not None:
+        return cached
+
+    result = f"%{name.name}.len.{gen.getVarIndex(name.name)}"
+    gen.addVarIndex(name.name)
+    gen.add(f"{result} = load i32, i32* {ptr}")
+    gen.rememberValue(('load', ptr), result)
+    return result
+
+
+def boundsCheck(gen: CodeGenerator, index, index_type: str, length, predicate: str = "ult") -> None:
+    """Проверка индекса массива (сравнение без знака отсекает и отрицательные индексы) или, с predicate sle,
+    кол-ва элементов для встроенной функции над массивом (отрицательное - как 0);
+    при выходе за границы программа завершается с ошибкой, как интерпретатор
+    """
+    gen.declareBoundsError()
+    number = gen.getVarIndex('bounds')
+    gen.addVarIndex('bounds')
+    if index_type != "i32":
+        gen.add(f"%bounds.index.{number} = sext {index_type} {index} to i32")
+        index = f"%bounds.index.{number}"
+    gen.add(f"%bounds.{number} = icmp {predicate} i32 {index}, {length}")
+    gen.add(f"br i1 %bounds.{number}, label %bounds.ok.{number}, label %bounds.fail.{number}")
+    gen.add(f"bounds.fail.{number}:")
+    gen.add(f"call void @array.bounds_error(i32 {index})")
+    gen.add("unreachable")
+    # блок продолжения доминируется проверкой, поэтому значения (CSE) в нем сохраняются
+    gen.add(f"bounds.ok.{number}:")
+
+
+def hoistBoundsChecks(gen: CodeGenerator, loop: 'ForNode') -> str:
+    """Предзаголовок цикла: проверки границ, вынесенные из его тела (analysis.BoundsCheckPass), в i64.
+    Для индекса - счетчика плюс инвариант проверяются первое и последнее значения счетчика
+    и то, что шаг после последнего значения не переполняет int.
+    :return: значение i1 - все вынесенные обращения в границах (тогда тело выполняется без этих проверок)
+    """
+    def compute(op: str, left, right) -> str:
+        result = f"%bounds.{gen.getVarIndex('bounds')}"
+        gen.addVarIndex('bounds')
+        gen.add(f"{result} = {op} {left}, {right}")
+        return result
+
+    conditions = []
+    if any(counter for _, counter, _, _ in loop.hoisted_checks):
+        var, bound, op, delta = loop.induction
+        start, limit = widenIndex(gen, var.load(gen), "i32"), widenIndex(gen, bound.load(gen), "i32")
+        if delta > 0:
+            first, last = start, compute("sub i64", limit, 1) if op == BinOp.LT else limit
+            conditions.append(compute("icmp sle i64", compute("add i64", last, delta), INT_MAX))
+        else:
+            first, last = compute("add i64", limit, 1) if op == BinOp.GT else limit, start
+            conditions.append(compute("icmp sge i64", compute("add i64", first, delta), INT_MIN))
+    for access, counter, offset, sign in loop.hoisted_checks:
+        index = widenIndex(gen, offset.load(gen), getLLVMtype(offset.node_type)) if offset is not None else 0
+        low = high = index
+        if counter:
+            op = "add i64" if sign > 0 else "sub i64"
+            low, high = compute(op, first, index), compute(op, last, index)
+        conditions.append(compute("icmp sge i64", low, 0))
+        conditions.append(compute("icmp slt i64", high, widenIndex(gen, arrayLength(gen, access.name, access.length), "i32")))
+    safe = conditions[0]
+    for condition in conditions[1:]:
+        safe = compute("and i1", safe, condition)
+    return safe
+
+
 class AstNode(ABC):
     init_action: Callable[['AstNode'], None] = None
 
@@ -110,7 +409,21 @@ class LiteralNode(ExprNode):
     def load(self, gen: CodeGenerator) -> str:
         if self.node_type.base_type == BaseType.CHAR:
             return ord(self.value)
+        if self.node_type.base_type == BaseType.BOOL:
+            return int(self.value)
+
+        return self.value
 
+    @property
+    def number(self):
+        """Значение в представлении интерпретатора: int и char с переполнением, char и bool - числа
+        """
+        if self.node_type.base_type == BaseType.CHAR:
+            return (ord(self.value) + 0x80 & 0xFF) - 0x80
+        if self.node_type.base_type == BaseType.BOOL:
+            return int(self.value)
+        if self.node_type.base_type == BaseType.INT:
+            return (self.value + 0x80000000 & 0xFFFFFFFF) - 0x80000000
         return self.value
 
     def __str__(self) -> str:
@@ -136,12 +449,20 @@ class FactorNode(ExprNode):
         if isinstance(self.literal, LiteralNode):
             return f"{self.operation}{self.literal.load(gen)}"
 
-        res = f"%{gen.getTempVar()}"
-        gen.addTempVarIndex()
+        arg = self.literal.load(gen)
         if self.literal.node_type.base_type == BaseType.FLOAT:
-            gen.add(f"{res} = fsub double 0.0, {self.literal.load(gen)}")
+            key = ('binop', gen.arithmetic('fsub', 'double'), 'double', '0.0', arg)
         else:
-            gen.add(f"{res} = sub {getLLVMtype(self.literal.node_type)} 0, {self.literal.load(gen)}")
+            llvm_type = getLLVMtype(self.literal.node_type)
+            key = ('binop', gen.arithmetic('sub', llvm_type), llvm_type, '0', arg)
+        cached = gen.lookupValue(key)
+        if cached is not None:
+            return cached
+
+        res = f"%{gen.getTempVar()}"
+        gen.addTempVarIndex()
+        gen.add(f"{res} = {key[1]} {key[2]} {key[3]}, {arg}")
+        gen.rememberValue(key, res)
         return f"{res}"
 
     def __str__(self) -> str:
@@ -162,9 +483,15 @@ class IdentNode(ExprNode):
         self.node_ident = ident
 
     def load(self, gen: CodeGenerator) -> str:
+        ptr = varPointer(self)
+        cached = gen.lookupValue(('load', ptr))
+        if cached is not None:
+            return cached
+
         gen.add(
-            f"%{self.name}.{gen.getVarIndex(self.name)} = load {getLLVMtype(self.node_type.base_type)}, {getLLVMtype(self.node_type.base_type)}* %{self.name}")
+            f"%{self.name}.{gen.getVarIndex(self.name)} = load {getLLVMtype(self.node_type.base_type)}, {getLLVMtype(self.node_type.base_type)}* {ptr}")
         gen.addVarIndex(self.name)
+        gen.rememberValue(('load', ptr), f"%{self.name}.{gen.getVarIndex(self.name) - 1}")
         return f"%{self.name}.{gen.getVarIndex(self.name) - 1}"
 
     def __str__(self) -> str:
@@ -200,22 +527,24 @@ class BinOpNode(ExprNode):
                 self.node_type = TypeDesc.from_base_type(compatibility[args_types])
                 return
 
-            if self.arg2.node_type.base_type in TYPE_CONVERTIBILITY:
-                for arg2_type in TYPE_CONVERTIBILITY[self.arg2.node_type.base_type]:
-                    args_types = (self.arg1.node_type.base_type, arg2_type)
-                    if args_types in compatibility:
-                        self.arg2 = type_convert(self.arg2, TypeDesc.from_base_type(arg2_type))
-                        self.node_type = TypeDesc.from_base_type(compatibility[args_types])
-                        return
-
-            if self.arg1.node_type.base_type in TYPE_CONVERTIBILITY:
-                for arg1_type in TYPE_CONVERTIBILITY[self.arg1.node_type.base_type]:
-                    args_types = (arg1_type, self.arg2.node_type.base_type)
-                    if args_types in compatibility:
-                        self.arg1 = type_convert(self.arg1, TypeDesc.from_base_type(arg1_type))
-                        self.node_type = TypeDesc.from_base_type(compatibility[args_types])
-                        return
-
+            # (номер операнда, тип, к которому он преобразуется, тип результата)
+            candidates = []
+            for arg2_type in TYPE_CONVERTIBILITY.get(self.arg2.node_type.base_type, ()):
+                if (self.arg1.node_type.base_type, arg2_type) in compatibility:
+                    candidates.append((2, arg2_type, compatibility[self.arg1.node_type.base_type, arg2_type]))
+            for arg1_type in TYPE_CONVERTIBILITY.get(self.arg1.node_type.base_type, ()):
+                if (arg1_type, self.arg2.node_type.base_type) in compatibility:
+                    candidates.append((1, arg1_type, compatibility[arg1_type, self.arg2.node_type.base_type]))
+            if candidates:
+                # преобразование без потерь предпочтительнее (int + float - в float, а не в int),
+                # при равенстве - первое в порядке TYPE_CONVERTIBILITY
+                index, arg_type, result = min(candidates, key=lambda c: self.conversionLoss(c[0], c[1]))
+                if index == 1:
+                    self.arg1 = type_convert(self.arg1, TypeDesc.from_base_type(arg_type))
+                else:
+                    self.arg2 = type_convert(self.arg2, TypeDesc.from_base_type(arg_type))
+                self.node_type = TypeDesc.from_base_type(result)
+                return
 
         if not self.arg1.node_type.is_simple and not self.arg2.node_type.is_simple:
             if self.arg1.node_type.base_type == self.arg2.node_type.base_type:
@@ -225,22 +554,43 @@ class BinOpNode(ExprNode):
             self.op, self.arg1.node_type, self.arg2.node_type
         ))
 
+    def conversionLoss(self, index: int, type_: BaseType) -> bool:
+        """Преобразование операнда теряет значения: не расширение типа (TYPE_PROMOTIONS)
+        и не литерал с тем же значением в новом типе (200 в char - это -56)
+        """
+        arg = self.arg1 if index == 1 else self.arg2
+        type_from = arg.node_type.base_type
+        if (type_from, type_) in TYPE_PROMOTIONS:
+            return False
+        if isinstance(arg, LiteralNode):
+            return convertValue(arg.number, type_from, type_) != arg.number
+        return True
+
     def load(self, gen: CodeGenerator) -> str:
 
-        if self.is_simple:
+        # деление целых в Python дает float (и округляет не к нулю), поэтому оно выполняется sdiv
+        if self.is_simple and not (self.op == BinOp.DIV and self.node_type.base_type != BaseType.FLOAT):
             try:
-                return eval(f"{self.arg1.load(gen)}{self.op.value}{self.arg2.load(gen)}")
+                value = eval(f"{self.arg1.load(gen)}{self.op.value}{self.arg2.load(gen)}")
+                # сравнение дает True/False, в IR - i1 1/0
+                return int(value) if isinstance(value, bool) else value
             except SyntaxError:
                 pass
 
         arg1 = self.arg1.load(gen)
         arg2 = self.arg2.load(gen)
 
+        llvm_type = getLLVMtype(self.arg1.node_type.base_type)
+        key = ('binop', gen.arithmetic(getBinOp(self.op, self.arg1.node_type.base_type), llvm_type), llvm_type,
+               arg1, arg2)
+        cached = gen.lookupValue(key)
+        if cached is not None:
+            return cached
+
         ret = f"%{gen.getTempVar()}"
-        gen.add(
-            f"{ret} = {getBinOp(self.op, self.arg1.node_type.base_type)} {getLLVMtype(self.arg1.node_type.base_type)} "
-            f"{arg1}, {arg2}")
+        gen.add(f"{ret} = {key[1]} {key[2]} {arg1}, {arg2}")
         gen.addTempVarIndex()
+        gen.rememberValue(key, ret)
         return ret
 
     def to_llvm(self, gen: CodeGenerator):
@@ -261,6 +611,8 @@ class VarsDeclNode(StmtNode):
         super().__init__(row=row, line=line, **props)
         self.vars_type = vars_type
         self.vars_list = vars_list
+        # глобальные переменные, которые не изменяются после объявления (analysis.mark_constant_data)
+        self.constants = set()
 
     @property
     def children(self) -> Tuple[ExprNode, ...]:
@@ -280,15 +632,30 @@ class VarsDeclNode(StmtNode):
         self.node_type = TypeDesc.VOID
 
     def to_llvm(self, gen: CodeGenerator):
-        val = "0" if BaseType(self.vars_type.name) != BaseType.FLOAT else "0.0"
+        base_type = BaseType(self.vars_type.name)
+        var_type = getLLVMtype(self.vars_type.name)
+        val = llvmConstant(zeroValue(base_type), base_type)
         for node in self.vars_list:
+            var = node.var if isinstance(node, AssignNode) else node
+            ptr = varPointer(var)
+            if var.node_ident.scope == ScopeType.GLOBAL:
+                # объявление верхнего уровня выполняется один раз: значение задается статически
+                value = staticValue(node.val) if isinstance(node, AssignNode) else zeroValue(base_type)
+                if value is not None:
+                    kind = "unnamed_addr constant" if var.name in self.constants else "global"
+                    gen.addGlobal(f"{ptr} = {gen.linkage(var.name)}{kind} {var_type} {llvmConstant(value, base_type)}")
+                    continue
+                gen.addGlobal(f"{ptr} = {gen.linkage(var.name)}global {var_type} {val}")
+            elif var.node_ident.scope == ScopeType.GLOBAL_LOCAL:
+                gen.addGlobal(f"{ptr} = internal global {var_type} {val}")
+            else:
+                gen.alloca(f"{ptr} = alloca {var_type}")
+
             if isinstance(node, AssignNode):
-                gen.add(f"%{node.var.name} = alloca {getLLVMtype(self.vars_type.name)}")
                 node.to_llvm(gen)
-            if isinstance(node, IdentNode):
-                gen.add(f"%{node.name} = alloca {getLLVMtype(self.vars_type.name)}")
-                gen.add(
-                    f"store {getLLVMtype(self.vars_type.name)} {val}, {getLLVMtype(self.vars_type.name)}* %{node.name}")
+            else:
+                gen.add(f"store {var_type} {val}, {var_type}* {ptr}")
+                gen.rememberValue(('load', ptr), val)
 
     def __str__(self) -> str:
         return 'var'
@@ -301,6 +668,11 @@ class CallNode(StmtNode):
         checkNameIsKeywordAndRaiseException(str(func), "function")
         self.func = func
         self.params = params
+        # результат read_str переживает функцию (analysis.EscapePass)
+        self.escapes = False
+        # массивы-аргументы встроенной функции, для которых проверяется кол-во элементов (analysis.BoundsCheckPass):
+        # (массив, длина при компиляции или None)
+        self.checked_arrays: Tuple[Tuple[IdentNode, Optional[int]], ...] = ()
 
     @property
     def children(self) -> Tuple[IdentNode, ...]:
@@ -317,20 +689,28 @@ class CallNode(StmtNode):
             self.semantic_error('Кол-во аргументов {} не совпадает (ожидалось {}, передано {})'.format(
                 func.name, len(func.type.params), len(self.params)
             ))
+        for param in self.params:
+            param.semantic_check(scope)
+        func_type = func.type
+        if func.built_in and isArrayBuiltinFunc(func.name):
+            func_type = array_built_in_type(func.name, self.params[0].node_type)
+            if func_type is None or not all(isinstance(param, IdentNode) for param in self.params
+                                            if param.node_type.is_arr):
+                self.semantic_error('Функция {} не применима к аргументу типа {}'.format(
+                    func.name, self.params[0].node_type))
         params = []
         error = False
         decl_params_str = fact_params_str = ''
         for i in range(len(self.params)):
             param: ExprNode = self.params[i]
-            param.semantic_check(scope)
             if (len(decl_params_str) > 0):
                 decl_params_str += ', '
-            decl_params_str += str(func.type.params[i])
+            decl_params_str += str(func_type.params[i])
             if (len(fact_params_str) > 0):
                 fact_params_str += ', '
             fact_params_str += str(param.node_type)
             try:
-                params.append(type_convert(param, func.type.params[i]))
+                params.append(type_convert(param, func_type.params[i]))
             except:
                 error = True
         if error:
@@ -340,17 +720,22 @@ class CallNode(StmtNode):
             ))
         else:
             self.params = tuple(params)
-            self.func.node_type = func.type
+            self.func.node_type = func_type
             self.func.node_ident = func
-            self.node_type = func.type.return_type
+            self.node_type = func_type.return_type
 
     def to_llvm(self, gen: CodeGenerator):
         self.load(gen)
 
-    def load(self, gen: CodeGenerator) -> str:
+    def load(self, gen: CodeGenerator, marker: str = "") -> str:
+        """:param marker: 'tail ' или 'musttail ' для вызова в хвостовой позиции (см. tailCallMarker)
+        """
         result = f"%call.{self.func.name}.{gen.getVarIndex(f'call.{self.func.name}')}"
         gen.addVarIndex(f'call.{self.func.name}')
 
+        if self.func.node_ident.built_in and isArrayBuiltinFunc(self.func.name):
+            return self.arrayBuiltin(gen, result)
+
         if len(self.params) == 0 and isBuiltinFunc(self.func.name):
             if self.func.name == "read_int":
                 gen.add(f"call i32 (i8*, ...) @scanf(i8* getelementptr inbounds "
@@ -368,7 +753,7 @@ class CallNode(StmtNode):
                 gen.add(f"{result} = load double, double* {FLOAT_POINTER_CONST}")
 
             elif self.func.name == "read_str":
-                gen.add(f"{result} = alloca i8, i32 100")
+                allocateArray(gen, result, "i8", 100, self.escapes)
                 gen.add(f"call i32 (i8*, ...) @scanf(i8* getelementptr inbounds "
                         f"([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* {result})")
 
@@ -377,7 +762,7 @@ class CallNode(StmtNode):
         if len(self.params) == 1 and self.func.name == "print_str" and isinstance(self.params[0], IdentNode):
             temp_var = gen.getTempVar()
             gen.addTempVarIndex()
-            gen.add(f"%{temp_var} = load i8*, i8** %{self.params[0].name}")
+            gen.add(f"%{temp_var} = load i8*, i8** {varPointer(self.params[0])}")
             gen.add(f"{result} = call i32 (i8*, ...) @printf(i8* getelementptr inbounds "
                         f"([4 x i8], [4 x i8]* @formatStr, i32 0, i32 0), i8* %{temp_var})")
 
@@ -404,27 +789,93 @@ class CallNode(StmtNode):
         call_type = getLLVMtype(self.node_type.base_type)
         if self.node_type.is_arr:
             call_type+= "*"
+        if self.func.node_ident.external:
+            params = ', '.join(f"{getLLVMtype(param)}{'*' if param.is_arr else ''}"
+                               for param in self.func.node_type.params)
+            gen.declareExternal(self.func.name, f"declare {call_type} @{self.func.name}({params})")
         if self.node_type.base_type == BaseType.VOID:
-            res_str = f"call void @{self.func.name}("
+            res_str = f"{marker}call void @{self.func.name}("
         else:
-            res_str = f"{result} = call {call_type} @{self.func.name}("
+            res_str = f"{result} = {marker}call {call_type} @{self.func.name}("
         args = []
         for param in self.params:
             if param.node_type.is_arr:
-                var_name = f"%{param.name}.{gen.getVarIndex(param.name)}"
-                var_type = f"{getLLVMtype(param.node_type)}"
-
-                gen.add(f'{var_name} = load {var_type}*, {var_type}** %{param.name}')
-                gen.getVarIndex(param.name)
-
-                args.append(f'{getLLVMtype(param.node_type)}* {var_name}')
+                args.append(f'{getLLVMtype(param.node_type)}* {loadArrayBase(gen, param)}')
             else:
                 args.append(f'{getLLVMtype(param.node_type)} {param.load(gen)}')
 
         res_str += f"{', '.join(args)})"
+        if marker:
+            gen.functionExit()
         gen.add(res_str)
+        gen.forgetMemory()
         return result
 
+    def arrayBuiltin(self, gen: CodeGenerator, result: str) -> str:
+        """Встроенные функции над массивами: copy и fill байтов или нулей - llvm.memcpy/llvm.memset,
+        остальные - вызов функции с циклом (CodeGenerator.arrayRuntime)
+        """
+        name = self.func.name
+        elem_type = getLLVMtype(self.params[0].node_type)
+        args = [loadArrayBase(gen, param) if param.node_type.is_arr else param.load(gen) for param in self.params]
+        base, count = args[0], args[-1]
+        if gen.bounds_checks:
+            for array, length in self.checked_arrays:
+                boundsCheck(gen, count, "i32", arrayLength(gen, array, length), "sle")
+
+        fill_value = staticValue(self.params[1]) if name == "fill" else None
+        if name == "copy" or name == "fill" and (elem_type in ("i8", "i1") or fill_value is not None
+                                                 and fill_value == 0 and math.copysign(1, fill_value) > 0):
+            positive = f"%{gen.getTempVar()}"
+            gen.addTempVarIndex()
+            gen.add(f"{positive} = icmp sgt i32 {count}, 0")
+            elements = f"%{gen.getTempVar()}"
+            gen.addTempVarIndex()
+            gen.add(f"{elements} = select i1 {positive}, i32 {count}, i32 0")
+            size = arraySizeInBytes(gen, elements, elem_type)
+            if name == "copy":
+                gen.add(f"call void @{getMemcpy(elem_type)}({elem_type}* {base}, {elem_type}* {args[1]}, "
+                        f"i32 {size}, i1 false)")
+            else:
+                gen.declareOnce("declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)")
+                value = args[1]
+                if elem_type == "i1":
+                    value = f"%{gen.getTempVar()}"
+                    gen.addTempVarIndex()
+                    gen.add(f"{value} = zext i1 {args[1]} to i8")
+                elif elem_type != "i8":
+                    value = "0"
+                memory = base
+                if elem_type != "i8":
+                    memory = f"%{gen.getTempVar()}"
+                    gen.addTempVarIndex()
+                    gen.add(f"{memory} = bitcast {elem_type}* {base} to i8*")
+                gen.add(f"call void @llvm.memset.p0i8.i32(i8* {memory}, i8 {value}, i32 {size}, i1 false)")
+        else:
+            params = ', '.join(f"{getLLVMtype(param.node_type)}{'*' if param.node_type.is_arr else ''} {arg}"
+                               for param, arg in zip(self.params, args))
+            func_name = gen.arrayRuntime(name, elem_type)
+            if self.node_type.base_type == BaseType.VOID:
+                gen.add(f"call void {func_name}({params})")
+            else:
+                gen.add(f"{result} = call {elem_type} {func_name}({params})")
+
+        if name in ARRAY_BUILT_IN_WRITES:
+            gen.forgetMemory()
+        return result
+
+    def jumpToEntry(self, gen: CodeGenerator, func: 'FunctionNode') -> None:
+        """Хвостовой вызов функцией самой себя: новые значения параметров и переход в начало функции
+        """
+        values = [loadArrayBase(gen, param) if param.node_type.is_arr else param.load(gen) for param in self.params]
+        for arg, value in zip(func.argument_list.children, values):
+            arg_type = getLLVMtype(arg.type_var.name)
+            if isinstance(arg, ArrayDeclarationNode):
+                gen.add(f"store {arg_type}* {value}, {arg_type}** {varPointer(arg.name)}")
+            else:
+                gen.add(f"store {arg_type} {value}, {arg_type}* {varPointer(arg.name)}")
+        gen.add(f"br label %{TAIL_RECURSE_LABEL}")
+
     def __str__(self) -> str:
         return 'call'
 
@@ -435,6 +886,10 @@ class AssignNode(StmtNode):
         super().__init__(row=row, line=line, **props)
         self.var = var
         self.val = val
+        # ни один из массивов не изменяется, поэтому копирование можно заменить присваиванием указателя
+        self.alias_array = False
+        # копия массива переживает функцию (analysis.EscapePass)
+        self.escapes = False
 
     @property
     def children(self) -> Tuple[IdentNode, ExprNode]:
@@ -457,50 +912,88 @@ class AssignNode(StmtNode):
         if self.val.node_type == self.var.node_type \
                 and self.val.node_type.array:
             self_type = getLLVMtype(self.node_type.base_type)
+            var = self.var.name if isinstance(self.var, ArrayDeclarationNode) else self.var
+            var_ptr = varPointer(var)
+            if isinstance(self.var, ArrayDeclarationNode):
+                self.var.declare(gen)
 
             if self.val.node_type.is_arr and isinstance(self.val, CallNode):
                 result = self.val.load(gen)
                 var_type = getLLVMtype(self.var.node_type)
-                gen.add(f"store {var_type}* {result}, {var_type}** %{self.var.name} ")
+                gen.add(f"store {var_type}* {result}, {var_type}** {var_ptr} ")
+                gen.rememberValue(('load', var_ptr), result)
+                if gen.bounds_checks:
+                    # длина массива-результата неизвестна: проверяются только отрицательные индексы
+                    storeLength(gen, var, INT_MAX)
+                return;
+
+            if gen.bounds_checks:
+                # массив получает размер исходного, как при копировании
+                storeLength(gen, var, self.val.node_ident.size.load(gen))
+            temp_val_loaded = loadArrayBase(gen, self.val)
+            # глобальный массив живет до конца программы, поэтому не может указывать на память функции
+            static = var.node_ident.scope == ScopeType.GLOBAL
+
+            if gen.arrays_by_ref and self.alias_array \
+                    and (not static or self.val.node_ident.scope == ScopeType.GLOBAL):
+                gen.add(f"store {self_type}* {temp_val_loaded}, {self_type}** {var_ptr}")
+                gen.rememberValue(('load', var_ptr), temp_val_loaded)
+                return;
+
+            size = self.val.node_ident.size.load(gen)
+            if static:
+                target = loadArrayBase(gen, var)
+                gen.add(f"call void @{getMemcpy(self_type)}("
+                        f"{self_type}* {target}, {self_type}* {temp_val_loaded},"
+                        f" i32 {arraySizeInBytes(gen, size, self_type)}, i1 0)")
+                gen.forgetValues(lambda key: key[0] == 'elem')
                 return;
 
-            temp_val_loaded = gen.getTempVar()
-            gen.addTempVarIndex()
             temp_var_space = gen.getTempVar()
             gen.addTempVarIndex()
-            size = self.val.node_ident.size.load(gen)
-            assigment_type = getLLVMtype(self.node_type.base_type)
 
-            gen.add(f"%{temp_val_loaded} = load {self_type}*, {self_type}** %{self.val.name}")
-            gen.add(f"%{temp_var_space} = alloca {self_type}, i32 {size}")
+            allocateArray(gen, f"%{temp_var_space}", self_type, size, self.escapes)
 
-            gen.add(f"call void @llvm.memcpy.p0{assigment_type}.p0{assigment_type}.i32("
-                    f"{assigment_type}* %{temp_var_space}, {assigment_type}* %{temp_val_loaded},"
-                    f" i32 {size}, i1 0)")
+            gen.add(f"call void @{getMemcpy(self_type)}("
+                    f"{self_type}* %{temp_var_space}, {self_type}* {temp_val_loaded},"
+                    f" i32 {arraySizeInBytes(gen, size, self_type)}, i1 0)")
 
-            gen.add(f"store {self_type}* %{temp_var_space}, {self_type}** %{self.var.name}")
+            gen.add(f"store {self_type}* %{temp_var_space}, {self_type}** {var_ptr}")
+            gen.rememberValue(('load', var_ptr), f"%{temp_var_space}")
             return;
 
         if isinstance(self.var, ArrayIndexingNode):
             target_ptr = f"{self.var.load_ptr(gen)}"
             var_name = self.var.name.name
         else:
-            target_ptr = f"%{self.var.name}"
+            target_ptr = varPointer(self.var)
             var_name = self.var.name
 
         if isinstance(self.val, LiteralNode):
             gen.add(f"%{var_name}.{gen.getVarIndex(var_name)} = {add} {getLLVMtype(self.node_type.base_type)} "
                     f"{0.0 if self.node_type.base_type == BaseType.FLOAT else 0}, "
-                    f"{self.val.value if self.node_type.base_type != BaseType.CHAR else ord(self.val.value)}")
+                    f"{self.val.load(gen)}")
 
             gen.addVarIndex(var_name)
-            gen.add(f"store {getLLVMtype(self.node_type.base_type)} %{var_name}.{gen.getVarIndex(var_name) - 1}, "
-                    f"{getLLVMtype(self.node_type.base_type)}* {target_ptr}")
+            res = f"%{var_name}.{gen.getVarIndex(var_name) - 1}"
+            gen.add(f"store {getLLVMtype(self.node_type.base_type)} {res}, "
+                    f"{getLLVMtype(self.node_type.base_type)}* {target_ptr}"
+                    f"{gen.accessGroup() if isinstance(self.var, ArrayIndexingNode) else ''}")
 
         elif isinstance(self.val, ExprNode):
             res = self.val.load(gen)
             gen.add(f"store {getLLVMtype(self.val.node_type.base_type)} {res}, "
-                    f"{getLLVMtype(self.var.node_type.base_type)}* {target_ptr}")
+                    f"{getLLVMtype(self.var.node_type.base_type)}* {target_ptr}"
+                    f"{gen.accessGroup() if isinstance(self.var, ArrayIndexingNode) else ''}")
+        else:
+            return
+
+        if isinstance(self.var, ArrayIndexingNode):
+            # по-другому названный массив может указывать на ту же память
+            gen.forgetValues(lambda key: key[0] == 'elem')
+            gen.rememberValue(('elem', target_ptr), res)
+        else:
+            gen.rememberValue(('load', target_ptr), res)
 
     def __str__(self) -> str:
         return '='
@@ -513,6 +1006,11 @@ class IfNode(StmtNode):
         self.cond = cond
         self.then_stmt = then_stmt
         self.else_stmt = else_stmt
+        # цепочка if (x == 1) ... else if (x == 2) ..., генерируемая одним switch (optimizer.lower_switches):
+        # сравниваемая переменная, (значение, оператор) по порядку и оператор для остальных значений
+        self.switch_on: Optional[IdentNode] = None
+        self.switch_cases: Tuple[Tuple[int, StmtNode], ...] = ()
+        self.switch_default: Optional[StmtNode] = None
 
     @property
     def children(self) -> Tuple[ExprNode, StmtNode, Optional[StmtNode]]:
@@ -527,24 +1025,69 @@ class IfNode(StmtNode):
         self.node_type = TypeDesc.VOID
 
     def to_llvm(self, gen: CodeGenerator) -> None:
+        if self.switch_cases:
+            self.switchToLlvm(gen)
+            return
+
         condRes = self.cond.load(gen)
         eqLabel = f"IfTrue.0.{gen.getVarIndex('if')}"
         neqLabel = f"IfFalse.0.{gen.getVarIndex('if')}"
         resLabel = f"IfEnd.0.{gen.getVarIndex('if')}"
+        siteKey = f"if.0.{gen.getVarIndex('if')}"
         gen.addVarIndex('if')
 
-        gen.add(f"br i1 {condRes}, label %{eqLabel}, label %{neqLabel if self.else_stmt is not None else resLabel}\n")
-        gen.add(f"{eqLabel}:")
+        if self.else_stmt is None:
+            gen.countBlock(siteKey)
+        weights = gen.branchWeights(eqLabel, neqLabel if self.else_stmt is not None else f"{siteKey}-{eqLabel}")
+        gen.add(f"br i1 {condRes}, label %{eqLabel}, label %{neqLabel if self.else_stmt is not None else resLabel}"
+                f"{weights}\n")
+        gen.label(eqLabel)
+        gen.countBlock(eqLabel)
 
         self.then_stmt.to_llvm(gen)
-        gen.add(f"br label %{resLabel}")
+        gen.branch(resLabel)
 
         if self.else_stmt is not None:
-            gen.add(f"\n{neqLabel}:")
+            gen.label(neqLabel)
+            gen.countBlock(neqLabel)
             self.else_stmt.to_llvm(gen)
-            gen.add(f"br label %{resLabel}")
-
-        gen.add(f"\n{resLabel}:")
+            gen.branch(resLabel)
+
+        gen.label(resLabel)
+
+    def switchToLlvm(self, gen: CodeGenerator) -> None:
+        index = gen.getVarIndex('switch')
+        gen.addVarIndex('switch')
+        caseLabels = [f"switch.case.{index}.{i}" for i in range(len(self.switch_cases))]
+        defaultLabel = f"switch.default.{index}"
+        endLabel = f"switch.end.{index}"
+        siteKey = f"switch.{index}"
+
+        value = self.switch_on.load(gen)
+        type_ = getLLVMtype(self.switch_on.node_type.base_type)
+        if self.switch_default is None:
+            gen.countBlock(siteKey)
+            weights = gen.branchWeights('-'.join([siteKey] + caseLabels), *caseLabels)
+        else:
+            weights = gen.branchWeights(defaultLabel, *caseLabels)
+        cases = "\n".join(f"    {type_} {caseValue}, label %{label}"
+                           for (caseValue, _), label in zip(self.switch_cases, caseLabels))
+        gen.add(f"switch {type_} {value}, label %{defaultLabel if self.switch_default else endLabel} [\n"
+                f"{cases}\n  ]{weights}\n")
+
+        for (_, stmt), label in zip(self.switch_cases, caseLabels):
+            gen.label(label)
+            gen.countBlock(label)
+            stmt.to_llvm(gen)
+            gen.branch(endLabel)
+
+        if self.switch_default is not None:
+            gen.label(defaultLabel)
+            gen.countBlock(defaultLabel)
+            self.switch_default.to_llvm(gen)
+            gen.branch(endLabel)
+
+        gen.label(endLabel)
 
     def __str__(self) -> str:
         return 'if'
@@ -559,10 +1102,17 @@ class ForNode(AstNode):
         self.cond = cond if cond else _empty
         self.step = step if step else _empty
         self.body = body if body else _empty
+        self.pragma: Optional[PragmaNode] = None
+        # инварианты цикла, вычисляемые в предзаголовке (optimizer.hoist_loop_invariants)
+        self.invariants: Tuple[ExprNode, ...] = ()
+        # счетчик цикла (переменная, граница, сравнение, шаг) и проверки границ массивов,
+        # вынесенные в предзаголовок (analysis.BoundsCheckPass)
+        self.induction: Optional[Tuple['IdentNode', ExprNode, BinOp, int]] = None
+        self.hoisted_checks: Tuple[tuple, ...] = ()
 
     @property
     def children(self) -> Tuple[AstNode, ...]:
-        return self.init, self.cond, self.step, self.body
+        return (self.init, self.cond, self.step, self.body) + ((self.pragma,) if self.pragma else tuple())
 
     def semantic_check(self, scope: IdentScope) -> None:
         scope = IdentScope(scope)
@@ -573,6 +1123,8 @@ class ForNode(AstNode):
         self.cond = type_convert(self.cond, TypeDesc.BOOL, None, 'условие')
         self.step.semantic_check(scope)
         self.body.semantic_check(IdentScope(scope))
+        if self.pragma:
+            self.pragma.semantic_check(scope)
         self.node_type = TypeDesc.VOID
         self.scope = scope
 
@@ -581,29 +1133,58 @@ class ForNode(AstNode):
         gen.addVarIndex('for')
         forHeader = f"for.head.{varIndex}"
         forCond = f"for.cond.{varIndex}"
-        forBody = f"for.body.{varIndex}"
-        forHatch = f"for.hatch.{varIndex}"
         forExit = f"for.exit.{varIndex}"
 
         gen.add(f"br label %{forHeader}\n")
-        gen.add(f"{forHeader}:")
+        gen.label(forHeader)
+        gen.countBlock(forHeader)
         self.init.to_llvm(gen)
-        gen.add(f"br label %{forCond}")
+        if self.invariants:
+            hoistInvariants(gen, self.invariants)
+        # цикл с вынесенными проверками границ генерируется дважды: без этих проверок и, если проверка
+        # в предзаголовке не прошла, с ними (в этой копии вложенные циклы проверяют все обращения)
+        versioned = gen.bounds_checks and self.hoisted_checks and not gen.checked_loop
+        if versioned:
+            gen.add(f"br i1 {hoistBoundsChecks(gen, self)}, label %{forCond}, label %{forCond}.checked")
+        else:
+            gen.add(f"br label %{forCond}")
+        self.iterate(gen, varIndex)
+        if versioned:
+            gen.checked_loop += 1
+            self.iterate(gen, varIndex, ".checked")
+            gen.checked_loop -= 1
+
+        gen.label(forExit)
+        if self.invariants:
+            gen.popInvariants()
+
+    def iterate(self, gen: CodeGenerator, varIndex: int, suffix: str = "") -> None:
+        """Условие, тело и шаг цикла; suffix - копия цикла с проверками границ (без подсказок #pragma)
+        """
+        forHeader = f"for.head.{varIndex}"
+        forCond = f"for.cond.{varIndex}{suffix}"
+        forBody = f"for.body.{varIndex}{suffix}"
+        forHatch = f"for.hatch.{varIndex}{suffix}"
+        forExit = f"for.exit.{varIndex}"
+        pragma = self.pragma if not suffix else None
 
-        gen.add(f"{forCond}:")  # for condition
+        loop_metadata = pragma.loopMetadata(gen) if pragma else ""
+        gen.label(forCond)  # for condition
         condRes = self.cond.load(gen)
 
-        gen.add(f"br i1 {condRes}, label %{forBody}, label %{forExit}\n")
+        weights = gen.branchWeights(forBody, forHeader) if not suffix else ""
+        gen.add(f"br i1 {condRes}, label %{forBody}, label %{forExit}{weights}\n")
 
-        gen.add(f"{forBody}:")  # for body
+        gen.label(forBody)  # for body
+        gen.countBlock(forBody)
         self.body.to_llvm(gen)
-        gen.add(f"br label %{forHatch}\n")
+        gen.branch(forHatch)
 
-        gen.add(f"{forHatch}:")
+        gen.label(forHatch)
         self.step.to_llvm(gen)
-        gen.add(f"br label %{forCond}\n")
-
-        gen.add(f"{forExit}:")
+        if pragma:
+            pragma.leaveLoop(gen)
+        gen.add(f"br label %{forCond}{loop_metadata}\n")
 
     def __str__(self) -> str:
         return 'for'
@@ -628,8 +1209,22 @@ class StmtListNode(StmtNode):
         self.node_type = TypeDesc.VOID
 
     def to_llvm(self, gen: CodeGenerator):
+        if not self.program:
+            for child in self.children:
+                child.to_llvm(gen)
+            return
+
+        # функции генерируются независимо (возможно, заранее и параллельно, см. parallel.py) и объединяются
+        # в порядке исходного текста; остальные операторы верхнего уровня выполняются до main в отдельной функции
         for child in self.children:
-            child.to_llvm(gen)
+            if isinstance(child, FunctionNode):
+                gen.merge(gen.fragments.pop(child.name.name, None) or child.fragment(gen))
+        gen.startGlobalInit()
+        for child in self.children:
+            if not isinstance(child, FunctionNode):
+                child.to_llvm(gen)
+        gen.endGlobalInit()
+        gen.endProfile()
 
     def __str__(self) -> str:
         return '...'
@@ -644,10 +1239,12 @@ class WhileNode(StmtNode):
         super().__init__(row=row, line=line, **props)
         self.cond = cond
         self.stmt_list = stmt_list if stmt_list else _empty
+        self.pragma: Optional[PragmaNode] = None
+        self.invariants: Tuple[ExprNode, ...] = ()
 
     @property
     def children(self) -> Tuple['AstNode', ...]:
-        return self.cond, self.stmt_list
+        return (self.cond, self.stmt_list) + ((self.pragma,) if self.pragma else tuple())
 
     def semantic_check(self, scope: IdentScope) -> None:
         scope = IdentScope(scope)
@@ -656,42 +1253,83 @@ class WhileNode(StmtNode):
         self.cond.semantic_check(scope)
         self.cond = type_convert(self.cond, TypeDesc.BOOL, None, 'условие')
         self.stmt_list.semantic_check(IdentScope(scope))
+        if self.pragma:
+            self.pragma.semantic_check(scope)
         self.node_type = TypeDesc.VOID
 
     def to_llvm(self, gen: CodeGenerator):
         condLabel = f"whihe.cond.{gen.getVarIndex('while')}"
         bodyLabel = f"whihe.body.{gen.getVarIndex('while')}"
         exitLabel = f"while.exit.{gen.getVarIndex('while')}"
+        entryKey = f"while.entry.{gen.getVarIndex('while')}"
 
         gen.addVarIndex('while')
+        if self.invariants:
+            hoistInvariants(gen, self.invariants)
+        gen.countBlock(entryKey)
         gen.add(f"br label %{condLabel}\n")
-        gen.add(f"{condLabel}:")
+        loop_metadata = self.pragma.loopMetadata(gen) if self.pragma else ""
+        gen.label(condLabel)
 
         condVar = self.cond.load(gen)
-        gen.add(f"br i1 {condVar}, label %{bodyLabel}, label %{exitLabel}\n")
+        gen.add(f"br i1 {condVar}, label %{bodyLabel}, label %{exitLabel}{gen.branchWeights(bodyLabel, entryKey)}\n")
 
-        gen.add(f"{bodyLabel}:")
+        gen.label(bodyLabel)
+        gen.countBlock(bodyLabel)
         self.stmt_list.to_llvm(gen)
-        gen.add(f"br label %{condLabel}\n")
+        if self.pragma:
+            self.pragma.leaveLoop(gen)
+        gen.branch(condLabel, loop_metadata)
 
-        gen.add(f"{exitLabel}:")
+        gen.label(exitLabel)
+        if self.invariants:
+            gen.popInvariants()
 
     def __str__(self) -> str:
         return 'while'
 
 
+class ArrayValuesNode(AstNode):
+    """Значения элементов в объявлении массива: int a[3] = {1, 2, 3};
+    """
+
+    def __init__(self, *values: ExprNode,
+                 row: Optional[int] = None, line: Optional[int] = None, **props):
+        super().__init__(row=row, line=line, **props)
+        self.values = values
+
+    @property
+    def children(self) -> Tuple[ExprNode, ...]:
+        return self.values
+
+    def __str__(self) -> str:
+        return 'array_values'
+
+
 class ArrayDeclarationNode(StmtNode):
-    def __init__(self, type_var: IdentNode, name: IdentNode, value: ExprNode,
+    def __init__(self, type_var: IdentNode, name: IdentNode, value: ExprNode, values: Optional[ArrayValuesNode] = None,
                  row: Optional[int] = None, line: Optional[int] = None, **props):
         super().__init__(row=row, line=line, **props)
         self.type_var = type_var
         self.name = name
         self.value = value
+        self.values = values
+        # параметр функции, который передается по ссылке без копирования
+        self.by_ref = False
+        # содержимое массива не изменяется после объявления (analysis.mark_constant_data)
+        self.constant = False
+        # переменная массива всегда указывает на одну и ту же память
+        self.fixed = False
+        # массив переживает функцию: возвращается из нее (analysis.EscapePass)
+        self.escapes = False
+        # длина, известная при компиляции (analysis.BoundsCheckPass); None - в режиме проверки границ
+        # длина хранится в переменной (lengthPointer)
+        self.length: Optional[int] = None
 
     @property
     def children(self) -> Tuple[ExprNode, ...]:
         # return self.vars_type, (*self.vars_list)
-        return (self.type_var, self.name, self.value)
+        return (self.type_var, self.name, self.value) + ((self.values,) if self.values is not None else ())
 
     def semantic_check(self, scope: IdentScope) -> None:
         if str(self.name).upper() in BaseType.__dict__:
@@ -702,26 +1340,162 @@ class ArrayDeclarationNode(StmtNode):
 
         try:
             self.value.semantic_check(scope)
-            scope.add_ident(ArrayDesc(str(self.name), TypeDesc.arr_from_str(str(self.type_var)),
-                                      type_convert(self.value, TypeDesc.INT, self)))
+            size = type_convert(self.value, TypeDesc.INT, self)
+            if self.values is not None:
+                self.check_values(scope, staticValue(size))
+            self.name.node_ident = scope.add_ident(ArrayDesc(str(self.name), TypeDesc.arr_from_str(str(self.type_var)),
+                                                             size))
         except SemanticException as e:
             self.semantic_error(e.message)
         self.node_type = TypeDesc.arr_from_str(str(self.type_var))
 
+    def check_values(self, scope: IdentScope, size) -> None:
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            self.semantic_error(f"Размер массива {self.name} с начальными значениями должен быть константой")
+        if len(self.values.values) > size:
+            self.semantic_error(f"Слишком много значений для массива {self.name} из {size} элементов")
+        values = []
+        for value in self.values.values:
+            value.semantic_check(scope)
+            values.append(type_convert(value, TypeDesc.from_str(str(self.type_var)), self, 'элемент массива'))
+        self.values.values = tuple(values)
+        self.size = size
+
+    @property
+    def elem_type(self) -> BaseType:
+        return BaseType(str(self.type_var))
+
+    def static_contents(self) -> Optional[Tuple[str, ...]]:
+        """Начальные значения всех элементов в виде констант LLVM (None, если не все значения константы)
+        """
+        base_type = self.elem_type
+        values = [staticValue(value) for value in self.values.values]
+        if any(value is None for value in values):
+            return None
+        values += [zeroValue(base_type)] * (self.size - len(values))
+        return tuple(llvmConstant(value, base_type) for value in values)
+
     def to_llvm(self, gen: CodeGenerator) -> None:
-        count_arg = self.value.load(gen)
         node_type = getLLVMtype(self.node_type.base_type)
+        ident = self.name.node_ident
+        ptr = varPointer(self.name)
+        contents = self.static_contents() if self.values is not None else None
+
+        if ident.scope == ScopeType.GLOBAL:
+            self.global_to_llvm(gen, contents)
+            return
+
+        if ident.scope == ScopeType.GLOBAL_LOCAL:
+            gen.addGlobal(f"{ptr} = internal global {node_type}* null")
+        if contents is not None and self.constant:
+            # массив только читается: указатель на общую константу вместо копии в стеке
+            start = arrayStart(node_type, self.size, gen.constantArray(node_type, contents))
+            if ident.scope != ScopeType.GLOBAL_LOCAL:
+                gen.alloca(f"{ptr} = alloca {node_type}*")
+            gen.add(f"store {node_type}* {start}, {node_type}** {ptr}")
+            gen.rememberValue(('load', ptr), start)
+            self.initLength(gen, self.size)
+            return
 
-        gen.add(
-            f"%{self.name.name}.{gen.getVarIndex(self.name.name)} = alloca {node_type}, {getLLVMtype(self.value.node_type)} {count_arg}")
-        gen.add(f"%{self.name.name} = alloca {node_type}*")
-        gen.add(
-            f"store {node_type}* %{self.name.name}.{gen.getVarIndex(self.name.name)}, {node_type}** %{self.name.name}")
-
+        count_arg = self.value.load(gen)
+        data = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
+        allocateArray(gen, data, node_type, count_arg, self.escapes)
+        if ident.scope != ScopeType.GLOBAL_LOCAL:
+            gen.alloca(f"{ptr} = alloca {node_type}*")
+        gen.add(f"store {node_type}* {data}, {node_type}** {ptr}")
+        gen.rememberValue(('load', ptr), data)
         gen.addVarIndex(self.name.name)
+        self.initLength(gen, count_arg)
+
+        if contents is not None:
+            gen.add(f"call void @{getMemcpy(node_type)}({node_type}* {data}, "
+                    f"{node_type}* {arrayStart(node_type, self.size, gen.constantArray(node_type, contents))}, "
+                    f"i32 {arraySizeInBytes(gen, self.size, node_type)}, i1 0)")
+        elif self.values is not None:
+            self.store_values(gen, data)
+
+    def global_to_llvm(self, gen: CodeGenerator, contents: Optional[Tuple[str, ...]]) -> None:
+        """Массив верхнего уровня: данные в секции данных, переменная - глобальный указатель на них
+        """
+        node_type = getLLVMtype(self.node_type.base_type)
+        ptr = varPointer(self.name)
+        linkage = gen.linkage(self.name.name)
+        size = staticValue(self.value) if self.values is None else self.size
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            # размер известен только во время выполнения: память выделяется при инициализации программы
+            gen.addGlobal(f"{ptr} = {linkage}global {node_type}* null")
+            gen.declareMalloc()
+            count = self.value.load(gen)
+            count_bytes = arraySizeInBytes(gen, count, node_type)
+            size_bytes = f"%{gen.getTempVar()}"
+            gen.addTempVarIndex()
+            gen.add(f"{size_bytes} = zext i32 {count_bytes} to i64")
+            memory = f"%{gen.getTempVar()}"
+            gen.addTempVarIndex()
+            gen.add(f"{memory} = call i8* @malloc(i64 {size_bytes})")
+            data = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
+            gen.addVarIndex(self.name.name)
+            gen.add(f"{data} = bitcast i8* {memory} to {node_type}*")
+            gen.add(f"store {node_type}* {data}, {node_type}** {ptr}")
+            gen.rememberValue(('load', ptr), data)
+            self.initLength(gen, count)
+            return
+
+        if gen.bounds_checks and self.length is None:
+            declareLength(gen, self.name, size)
+        zeros = (llvmConstant(zeroValue(self.elem_type), self.elem_type),) * size
+        if self.constant and (self.values is None or contents is not None):
+            data = gen.constantArray(node_type, contents or zeros)
+            gen.addGlobal(f"{ptr} = {linkage}unnamed_addr constant {node_type}* {arrayStart(node_type, size, data)}")
+            return
+
+        data = f"{ptr}.data"
+        kind = "unnamed_addr constant" if self.fixed else "global"
+        gen.addGlobal(f"{data} = internal global {arrayLiteral(node_type, contents or zeros)}")
+        gen.addGlobal(f"{ptr} = {linkage}{kind} {node_type}* {arrayStart(node_type, size, data)}")
+        if self.values is not None and contents is None:
+            self.store_values(gen, arrayStart(node_type, size, data))
+
+    def initLength(self, gen: CodeGenerator, count) -> None:
+        """Переменная длины массива с начальным значением count (в режиме проверки границ,
+        если длина неизвестна при компиляции)
+        """
+        if gen.bounds_checks and self.length is None:
+            declareLength(gen, self.name)
+            storeLength(gen, self.name, count)
+
+    def store_values(self, gen: CodeGenerator, data: str) -> None:
+        """Начальные значения, которые не удалось вычислить при компиляции, записываются по одному
+        """
+        node_type = getLLVMtype(self.node_type.base_type)
+        base_type = self.elem_type
+        values = list(self.values.values) + [None] * (self.size - len(self.values.values))
+        for i, value in enumerate(values):
+            static = staticValue(value) if value is not None else zeroValue(base_type)
+            res = llvmConstant(static, base_type) if static is not None else value.load(gen)
+            elem = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
+            gen.addVarIndex(self.name.name)
+            gen.add(f"{elem} = getelementptr inbounds {node_type}, {node_type}* {data}, i32 {i}")
+            gen.add(f"store {node_type} {res}, {node_type}* {elem}")
+
+    def declare(self, gen: CodeGenerator) -> None:
+        """Переменная массива, значение которой задает присваивание: int a[n] = b;
+        """
+        node_type = getLLVMtype(self.node_type.base_type)
+        if self.name.node_ident.scope == ScopeType.GLOBAL:
+            self.global_to_llvm(gen, None)
+            return
+        if self.name.node_ident.scope == ScopeType.GLOBAL_LOCAL:
+            gen.addGlobal(f"{varPointer(self.name)} = internal global {node_type}* null")
+        else:
+            gen.alloca(f"{varPointer(self.name)} = alloca {node_type}*")
+        if gen.bounds_checks and self.length is None:
+            declareLength(gen, self.name)
 
     # used only in argument list node
     def load(self, gen: CodeGenerator) -> str:
+        if gen.arrays_by_ref and self.by_ref:
+            return f"{getLLVMtype(self.node_type.base_type)}* noalias readonly %c{self.name}"
         return f"{getLLVMtype(self.node_type.base_type)}* %c{self.name}"
 
     def __str__(self) -> str:
@@ -734,6 +1508,11 @@ class ArrayIndexingNode(ExprNode):
         super().__init__(row=row, line=line, **props)
         self.name = name
         self.value = value
+        # режим проверки границ (analysis.BoundsCheckPass): длина массива, известная при компиляции;
+        # нужна ли проверка (индекс не доказан в границах) и вынесена ли она в предзаголовок цикла
+        self.length: Optional[int] = None
+        self.checked = True
+        self.hoisted = False
 
     @property
     def children(self) -> Tuple[ExprNode, ...]:
@@ -752,37 +1531,40 @@ class ArrayIndexingNode(ExprNode):
         self.node_type = scope.get_ident(str(self.name)).toIdentDesc().type
 
     def load(self, gen: CodeGenerator) -> str:
-        result = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
         self_type = getLLVMtype(self.node_type.base_type)
+        ptr = self.load_ptr(gen)
+        cached = gen.lookupValue(('elem', ptr))
+        if cached is not None:
+            return cached
 
-        temp_var = gen.getTempVar()
-        gen.add(f"%{temp_var} = load {self_type}*, {self_type}** %{self.name.name}")
-
-        gen.addTempVarIndex()
-        ptr = gen.getTempVar()
-        gen.addTempVarIndex()
-        gen.add(f"%{ptr} = getelementptr inbounds {self_type}, "
-                f"{self_type}* %{temp_var}, "
-                f"{getLLVMtype(self.value.node_type)} {self.value.load(gen)}")
-
-        gen.add(f"{result} = load {self_type}, {self_type}* %{ptr}")
+        result = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
+        gen.add(f"{result} = load {self_type}, {self_type}* {ptr}{gen.accessGroup()}")
         gen.addVarIndex(self.name.name)
-        gen.addTempVarIndex()
+        gen.rememberValue(('elem', ptr), result)
         return result
 
     def load_ptr(self, gen: CodeGenerator) -> str:
-        result = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
         self_type = getLLVMtype(self.node_type.base_type)
-
-        temp_var = gen.getTempVar()
-        gen.add(f"%{temp_var} = load {self_type}*, {self_type}** %{self.name.name}")
-
-        gen.addTempVarIndex()
-
+        base = loadArrayBase(gen, self.name)
+        index = self.value.load(gen)
+        key = ('gep', self_type, base, index)
+        cached = gen.lookupValue(key)
+        if cached is not None:
+            return cached
+
+        index_type = getLLVMtype(self.value.node_type)
+        if gen.bounds_checks and self.checked and (not self.hoisted or gen.checked_loop):
+            boundsCheck(gen, index, index_type, arrayLength(gen, self.name, self.length))
+        if gen.nsw:
+            # индекс i64 не требует расширения в адресной арифметике, а расширение счетчика
+            # цикла с nsw LLVM выносит из цикла (indvars)
+            index, index_type = widenIndex(gen, index, index_type), "i64"
+        result = f"%{self.name.name}.{gen.getVarIndex(self.name.name)}"
         gen.add(f"{result} = getelementptr inbounds {self_type}, "
-                f"{self_type}* %{temp_var}, "
-                f"{getLLVMtype(self.value.node_type)} {self.value.load(gen)}")
+                f"{self_type}* {base}, "
+                f"{index_type} {index}")
         gen.addVarIndex(self.name.name)
+        gen.rememberValue(key, result)
         return result
 
     def __str__(self) -> str:
@@ -864,12 +1646,22 @@ class FunctionNode(StmtNode):
         self.name = name
         self.argument_list = argument_list
         self.list = stmt_list
+        # атрибуты LLVM, выведенные анализом графа вызовов (nounwind, readonly, ...)
+        self.attributes = []
+        # в функции есть return f(...) с вызовом самой себя (analysis.TailCallPass)
+        self.tail_recursive = False
 
     @property
     def children(self) -> Tuple[ExprNode, ...]:
         return self.type, self.name, self.argument_list, self.list
 
     def semantic_check(self, scope: IdentScope) -> None:
+        self.checkBody(self.declare(scope))
+
+    def declare(self, scope: IdentScope) -> IdentScope:
+        """Проверка сигнатуры и объявление функции в глобальной области видимости
+        :return: область видимости тела функции (с параметрами)
+        """
         if scope.curr_func:
             self.semantic_error(
                 "Объявление функции ({}) внутри другой функции не поддерживается".format(self.name.name))
@@ -905,9 +1697,19 @@ class FunctionNode(StmtNode):
             self.name.node_ident = parent_scope.curr_global.add_ident(func_ident)
         except SemanticException as e:
             self.name.semantic_error("Повторное объявление функции {}".format(self.name.name))
+        return scope
+
+    def checkBody(self, scope: IdentScope) -> None:
         self.list.semantic_check(scope)
         self.node_type = TypeDesc.VOID
 
+    def fragment(self, gen: CodeGenerator) -> Fragment:
+        """Код функции, сгенерированный отдельным генератором (см. CodeGenerator.fork)
+        """
+        func_gen = gen.fork()
+        self.to_llvm(func_gen)
+        return func_gen.fragment()
+
     def to_llvm(self, gen: CodeGenerator) -> None:
 
         func_type = f"{getLLVMtype(self.type.type.name)}"\
@@ -915,36 +1717,65 @@ class FunctionNode(StmtNode):
         if self.type.isArr:
             func_type += "*"
 
-        code = f"define {func_type} @{self.name.name}" \
-               f"({self.argument_list.load(gen)}) "'{'
+        attributes = ''.join(f"{attr} " for attr in self.attributes) if gen.function_attributes else ""
+        code = f"define {gen.linkage(self.name.name)}{func_type} @{self.name.name}" \
+               f"({self.argument_list.load(gen)}) {attributes}{gen.entryCount(self.name.name)}"'{'
         gen.add(code)
+        gen.startFunction(self)
+        gen.forgetValues()
+        gen.countBlock("entry")
 
         if len(self.argument_list.children) > 0:
             for arg in self.argument_list.children:
+                ptr = varPointer(arg.name)
                 if isinstance(arg, ArgumentNode):
-                    gen.add(f"%{arg.name} = alloca {getLLVMtype(arg.type_var.name)}")
+                    gen.add(f"{ptr} = alloca {getLLVMtype(arg.type_var.name)}")
                     gen.add(
-                        f"store {getLLVMtype(arg.type_var.name)} %c{arg.name}, {getLLVMtype(arg.type_var.name)}* %{arg.name}")
+                        f"store {getLLVMtype(arg.type_var.name)} %c{arg.name}, {getLLVMtype(arg.type_var.name)}* {ptr}")
+                    gen.rememberValue(('load', ptr), f"%c{arg.name}")
                 elif isinstance(arg, ArrayDeclarationNode):
                     arg_type = getLLVMtype(arg.type_var.name)
-                    gen.add(f"%{arg.name.name} = alloca {arg_type}*")
-                    gen.add(
-                        f"%{arg.name.name}.{gen.getVarIndex(arg.name.name)} = alloca {arg_type}, i32 {arg.value.load(gen)}")
-                    gen.add(f"call void @llvm.memcpy.p0{arg_type}.p0{arg_type}.i32("
+                    gen.add(f"{ptr} = alloca {arg_type}*")
+                    if gen.bounds_checks:
+                        arg.initLength(gen, arg.value.load(gen))
+                    if gen.arrays_by_ref and arg.by_ref:
+                        gen.add(f"store {arg_type}* %c{arg.name.name}, {arg_type}** {ptr}")
+                        gen.rememberValue(('load', ptr), f"%c{arg.name.name}")
+                        continue
+
+                    allocateArray(gen, f"%{arg.name.name}.{gen.getVarIndex(arg.name.name)}", arg_type,
+                                  arg.value.load(gen), arg.escapes)
+                    gen.add(f"call void @{getMemcpy(arg_type)}("
                             f"{arg_type}* %{arg.name.name}.{gen.getVarIndex(arg.name.name)}, {arg_type}* %c{arg.name.name}, "
-                            f"i32 {arg.value.load(gen)}, i1 0)")
+                            f"i32 {arraySizeInBytes(gen, arg.value.load(gen), arg_type)}, i1 0)")
 
                     gen.add(f"store {arg_type}* %{arg.name.name}.{gen.getVarIndex(arg.name.name)},"
-                            f"{arg_type}** %{arg.name.name}")
+                            f"{arg_type}** {ptr}")
+                    gen.rememberValue(('load', ptr), f"%{arg.name.name}.{gen.getVarIndex(arg.name.name)}")
 
                     gen.addVarIndex(arg.name.name)
 
+        if self.loopsTailCalls(gen):
+            gen.add(f"br label %{TAIL_RECURSE_LABEL}")
+            gen.label(TAIL_RECURSE_LABEL)
         self.list.to_llvm(gen)
 
-        if next((x for x in self.list.children if isinstance(x, ReturnNode)), None) is None:
-            gen.add("ret void")
+        if not gen.terminated:
+            # до конца функции без return может дойти только void-функция
+            if func_type == "void":
+                gen.functionExit()
+            gen.add("ret void" if func_type == "void" else "unreachable")
+        gen.endFunction()
         gen.add("}\n")
 
+    def loopsTailCalls(self, gen: CodeGenerator) -> bool:
+        """Хвостовые вызовы самой себя заменяются циклом, если параметры-массивы передаются по ссылке
+        (иначе на каждой итерации нужна новая копия массива)
+        """
+        return gen.tail_calls and self.tail_recursive \
+            and all(not isinstance(arg, ArrayDeclarationNode) or gen.arrays_by_ref and arg.by_ref
+                    for arg in self.argument_list.children)
+
     def __str__(self) -> str:
         return 'function'
 
@@ -955,6 +1786,8 @@ class ReturnNode(ExprNode):
         super().__init__(row=row, line=line, **props)
         # checkNameAndException(str(func), "function")
         self.expr = expr
+        # return f(...): вызов пользовательской функции в хвостовой позиции (analysis.TailCallPass)
+        self.tail_call = False
 
     @property
     def children(self) -> Tuple[ExprNode, ...]:
@@ -970,31 +1803,109 @@ class ReturnNode(ExprNode):
             self.expr = type_convert(self.expr, func.func.type.return_type, self, 'возвращаемое значение')
 
         self.node_type = TypeDesc.VOID
-        self.scope = scope
 
     def to_llvm(self, gen: CodeGenerator):
         if isinstance(self.expr, IdentNode) and self.expr.node_type.is_arr:
             temp_var = gen.getTempVar()
             var_type = getLLVMtype(self.expr.node_type)
             gen.addTempVarIndex()
-            gen.add(f"%{temp_var} = load {var_type}*, {var_type}** %{self.expr.name}")
+            gen.add(f"%{temp_var} = load {var_type}*, {var_type}** {varPointer(self.expr)}")
+            gen.functionExit()
             gen.add(f"ret {var_type}* %{temp_var}")
+        elif self.tail_call and self.expr.func.name == gen.function.name.name and gen.function.loopsTailCalls(gen):
+            self.expr.jumpToEntry(gen, gen.function)
         else:
-            res = self.expr.load(gen) if self.expr is not None else "void"
-
+            marker = tailCallMarker(gen, self.expr) if self.tail_call and gen.tail_calls else ""
+            if marker:
+                res = self.expr.load(gen, marker)
+            else:
+                res = self.expr.load(gen) if self.expr is not None else "void"
+                gen.functionExit()
             if self.expr is None:
                 gen.add(f"ret void")
             else:
                 gen.add(f"ret {getLLVMtype(self.expr.node_type)} {res}")
 
-            if self.scope is not None:
-                for ident in self.scope.idents:
-                    gen.removeIdent(ident)
-
     def __str__(self) -> str:
         return 'return'
 
 
+# подсказка -> (свойство llvm.loop, нужен ли аргумент)
+LOOP_HINTS = {
+    'vectorize_width': ('llvm.loop.vectorize.width', True),
+    'interleave_count': ('llvm.loop.interleave.count', True),
+    'unroll_count': ('llvm.loop.unroll.count', True),
+    'noalias': ('llvm.loop.parallel_accesses', False),
+}
+
+
+class PragmaHintNode(AstNode):
+    def __init__(self, name: IdentNode, value: Optional[LiteralNode] = None,
+                 row: Optional[int] = None, line: Optional[int] = None, **props):
+        super().__init__(row=row, line=line, **props)
+        self.name = name
+        self.value = value
+
+    @property
+    def children(self) -> Tuple[AstNode, ...]:
+        return (self.value,) if self.value else tuple()
+
+    def semantic_check(self, scope: IdentScope) -> None:
+        if self.name.name not in LOOP_HINTS:
+            self.name.semantic_error(f"Неизвестная подсказка цикла {self.name.name}")
+        if LOOP_HINTS[self.name.name][1] != (self.value is not None):
+            self.name.semantic_error(f"Неверное количество аргументов подсказки {self.name.name}")
+        if self.value is not None:
+            self.value.semantic_check(scope)
+            if self.value.node_type != TypeDesc.INT or self.value.value <= 0:
+                self.value.semantic_error(f"Аргумент подсказки {self.name.name} должен быть положительным целым")
+
+    def __str__(self) -> str:
+        return str(self.name)
+
+
+class PragmaNode(AstNode):
+    def __init__(self, kind: IdentNode, *hints: PragmaHintNode,
+                 row: Optional[int] = None, line: Optional[int] = None, **props):
+        super().__init__(row=row, line=line, **props)
+        self.kind = kind
+        self.hints = hints
+
+    @property
+    def children(self) -> Tuple[PragmaHintNode, ...]:
+        return self.hints
+
+    def semantic_check(self, scope: IdentScope) -> None:
+        if self.kind.name != 'loop':
+            self.kind.semantic_error(f"Неизвестная директива #pragma {self.kind.name}")
+        for hint in self.hints:
+            hint.semantic_check(scope)
+
+    def loopMetadata(self, gen: CodeGenerator) -> str:
+        """Создает метаданные цикла; вызывается до генерации тела цикла,
+        т.к. для noalias обращения к массивам в теле помечаются access group'ой
+        """
+        properties = []
+        for hint in self.hints:
+            name = LOOP_HINTS[hint.name.name][0]
+            if hint.name.name == 'noalias':
+                group = gen.addMetadata("distinct !{}")
+                gen.access_groups.append(group)
+                properties.append(f'!{{!"{name}", {group}}}')
+            else:
+                properties.append(f'!{{!"{name}", i32 {hint.value.value}}}')
+                if hint.name.name == 'vectorize_width':
+                    properties.append('!{!"llvm.loop.vectorize.enable", i1 true}')
+        return f", !llvm.loop {gen.addLoopMetadata(properties)}"
+
+    def leaveLoop(self, gen: CodeGenerator):
+        if any(hint.name.name == 'noalias' for hint in self.hints):
+            gen.access_groups.pop()
+
+    def __str__(self) -> str:
+        return f'#pragma {self.kind}'
+
+
 class _GroupNode(AstNode):
     """Класс для группировки других узлов (вспомогательный, в синтаксисе нет соотвествия)
     """
@@ -1030,6 +1941,10 @@ class TypeConvertNode(ExprNode):
         type_from = self.expr.node_type.base_type
         type_to = self.node_type.base_type
         conv_op = getConvOp(type_from, type_to)
+        key = ('conv', type_from, type_to, var)
+        cached = gen.lookupValue(key)
+        if cached is not None:
+            return cached
 
         if type_to == BaseType.BOOL and \
                 (type_from == BaseType.CHAR or type_from == BaseType.INT):
@@ -1040,7 +1955,7 @@ class TypeConvertNode(ExprNode):
         elif type_to == BaseType.BOOL and \
                 (type_from == BaseType.FLOAT):
 
-            gen.add(f"%{gen.getTempVar()} = fcmp one "
+            gen.add(f"%{gen.getTempVar()} = {gen.arithmetic('fcmp one', 'double')} "
                     f"{getLLVMtype(type_from)} 0.0, {var}")
 
         else:
@@ -1050,11 +1965,16 @@ class TypeConvertNode(ExprNode):
 
         var = f"%{gen.getTempVar()}"
         gen.addTempVarIndex()
+        gen.rememberValue(key, var)
         return var
 
     def __str__(self) -> str:
         return 'convert'
 
+    @property
+    def children(self) -> Tuple[ExprNode]:
+        return self.expr,
+
     @property
     def childs(self) -> Tuple[AstNode, ...]:
         return _GroupNode(str(self.type), self.expr),
@@ -0,0 +1,418 @@
+import io
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from analysis import walk, functions, call_graph, reachable, pure_functions, is_global
+from interpreter import BytecodeCompiler, Interpreter, RuntimeException
+from nodes.ast_node import AstNode, StmtListNode, FunctionNode, CallNode, ReturnNode, IfNode, ForNode, WhileNode, \
+    LiteralNode, FactorNode, BinOpNode, TypeConvertNode, ExprNode, IdentNode, AssignNode, VarsDeclNode, \
+    ArrayDeclarationNode, PragmaNode, _empty
+from semantic import TYPE_PROMOTIONS
+from utils import BaseType, BinOp, convertValue
+
+# сколько переходов и вызовов можно выполнить при вычислении одного вызова во время компиляции
+CONST_CALL_FUEL = 100000
+
+
+def is_terminator(stmt: AstNode) -> bool:
+    """После такого оператора управление никогда не переходит к следующему оператору
+    """
+    if isinstance(stmt, ReturnNode):
+        return True
+    if isinstance(stmt, StmtListNode):
+        return len(stmt.exprs) > 0 and is_terminator(stmt.exprs[-1])
+    if isinstance(stmt, IfNode):
+        return stmt.else_stmt is not None and is_terminator(stmt.then_stmt) and is_terminator(stmt.else_stmt)
+    # в языке нет break, поэтому из бесконечного цикла можно выйти только через return
+    if isinstance(stmt, ForNode):
+        return stmt.cond is _empty or (isinstance(stmt.cond, LiteralNode) and bool(stmt.cond.value))
+    if isinstance(stmt, WhileNode):
+        return isinstance(stmt.cond, LiteralNode) and bool(stmt.cond.value)
+    return False
+
+
+def prune_unreachable_stmts(tree: AstNode) -> int:
+    removed = 0
+    for node in walk(tree):
+        if isinstance(node, StmtListNode):
+            for i, stmt in enumerate(node.exprs):
+                if is_terminator(stmt) and i + 1 < len(node.exprs):
+                    removed += len(node.exprs) - i - 1
+                    node.exprs = node.exprs[:i + 1]
+                    break
+    return removed
+
+
+def eliminate_dead_code(tree: StmtListNode, exported: Iterable[str] = ()) -> Tuple[int, int]:
+    """Удаляет функции, недостижимые из main (и exported), и операторы после return.
+    Выполняется до семантического анализа, поэтому граф вызовов строится по именам.
+    :return: (кол-во удаленных функций, кол-во удаленных операторов)
+    """
+    removed_funcs = 0
+    funcs = functions(tree)
+    if 'main' in funcs:
+        roots = {'main', *exported}
+        for stmt in tree.exprs:
+            if not isinstance(stmt, FunctionNode):
+                roots.update(node.func.name for node in walk(stmt) if isinstance(node, CallNode))
+        alive = reachable(call_graph(tree), roots)
+        exprs = tuple(stmt for stmt in tree.exprs if not isinstance(stmt, FunctionNode) or stmt.name.name in alive)
+        removed_funcs = len(tree.exprs) - len(exprs)
+        tree.exprs = exprs
+
+    return removed_funcs, prune_unreachable_stmts(tree)
+
+
+def replace_nodes(node: AstNode, replace: Callable[[AstNode], AstNode]) -> AstNode:
+    """Обход в глубину с заменой узлов (сначала дети): replace возвращает новый узел или тот же
+    """
+    for name, value in list(vars(node).items()):
+        if isinstance(value, AstNode):
+            setattr(node, name, replace_nodes(value, replace))
+        elif isinstance(value, tuple) and any(isinstance(item, AstNode) for item in value):
+            setattr(node, name, tuple(replace_nodes(item, replace) if isinstance(item, AstNode) else item
+                                      for item in value))
+    return replace(node)
+
+
+def make_literal(value, type_: BaseType, origin: AstNode) -> Optional[LiteralNode]:
+    """Литерал со значением из интерпретатора (None, если значение не записать литералом)
+    """
+    if type_ == BaseType.CHAR:
+        literal = repr(chr(value & 0xFF))
+    elif type_ == BaseType.BOOL:
+        literal = repr(bool(value))
+    elif type_ == BaseType.FLOAT:
+        if not math.isfinite(value):
+            return None
+        literal = repr(float(value))
+    else:
+        literal = str(value)
+    node = LiteralNode(literal, line=origin.line, column=origin.column)
+    node.semantic_check(None)
+    return node
+
+
+class ConstantCalls:
+    """Вычисление во время компиляции вызовов чистых функций с константными аргументами;
+    результаты запоминаются по (функция, аргументы) на всю компиляцию
+    """
+
+    def __init__(self, tree: StmtListNode, fuel: int = CONST_CALL_FUEL):
+        self.pure = pure_functions(tree)
+        self.fuel = fuel
+        # None - вызов не удалось вычислить
+        self.memo: Dict[tuple, object] = {}
+        self.evaluated = 0
+        if self.pure:
+            self.compiler = BytecodeCompiler(tree)
+            self.program = self.compiler.compile()
+            # чистые функции не выполняют ввод-вывод
+            self.interpreter = Interpreter(self.program, io.BytesIO(), io.BytesIO())
+
+    def is_constant(self, expr: ExprNode) -> bool:
+        return all(isinstance(node, (LiteralNode, FactorNode, BinOpNode, TypeConvertNode)) for node in walk(expr))
+
+    def evaluate(self, call: CallNode) -> AstNode:
+        if call.func.name not in self.pure or not all(self.is_constant(param) for param in call.params):
+            return call
+        try:
+            args = tuple(self.interpreter.execute(self.compiler.compile_expression(param), fuel=self.fuel)
+                         for param in call.params)
+        except RuntimeException:
+            return call
+        # 1, 1.0 и True равны как ключи словаря, поэтому в ключ входят и типы
+        key = (call.func.name, args, tuple(type(arg) for arg in args))
+        if key not in self.memo:
+            self.evaluated += 1
+            func = self.program.functions[self.compiler.function_index[call.func.name]]
+            try:
+                self.memo[key] = self.interpreter.execute(func, args, self.fuel)
+            except RuntimeException:
+                # не завершилась за отведенное число шагов или глубину вызовов (InterpreterLimit) или ошибка
+                # выполнения - вызов остается
+                self.memo[key] = None
+        if self.memo[key] is None:
+            return call
+        return make_literal(self.memo[key], call.node_type.base_type, call) or call
+
+    def replace(self, node: AstNode) -> AstNode:
+        return self.evaluate(node) if isinstance(node, CallNode) else node
+
+
+def evaluate_constant_calls(tree: StmtListNode, fuel: int = CONST_CALL_FUEL) -> Tuple[int, int]:
+    """Заменяет вызовы чистых функций с константными аргументами литералами.
+    Выполняется после семантического анализа (нужны типы и IdentDesc).
+    :return: (кол-во замененных вызовов, кол-во вычисленных различных вызовов)
+    """
+    constant_calls = ConstantCalls(tree, fuel)
+    if not constant_calls.pure:
+        return 0, 0
+    replaced = 0
+
+    def replace(node: AstNode) -> AstNode:
+        nonlocal replaced
+        result = constant_calls.replace(node)
+        replaced += result is not node
+        return result
+
+    replace_nodes(tree, replace)
+    return replaced, constant_calls.evaluated
+
+
+# цепочки преобразований a -> b -> c, равные одному a -> c при любом значении a (кроме цепочек с неопределенным
+# результатом fptosi); проверено перебором значений по convertValue. Цепочки a -> b -> a
+# с преобразованием без потерь (TYPE_PROMOTIONS) удаляются целиком
+CONVERSION_CHAINS = {
+    (BaseType.BOOL, BaseType.CHAR, BaseType.INT), (BaseType.BOOL, BaseType.INT, BaseType.CHAR),
+    (BaseType.CHAR, BaseType.INT, BaseType.BOOL), (BaseType.CHAR, BaseType.FLOAT, BaseType.BOOL),
+    (BaseType.INT, BaseType.FLOAT, BaseType.BOOL), (BaseType.INT, BaseType.FLOAT, BaseType.CHAR),
+}
+
+
+def constant_number(expr: ExprNode):
+    """Значение литерала (в т.ч. с унарным минусом) в представлении интерпретатора, None - не литерал
+    """
+    if isinstance(expr, FactorNode) and isinstance(expr.literal, LiteralNode) \
+            and expr.node_type.base_type in (BaseType.INT, BaseType.FLOAT):
+        value = expr.literal.number
+        return value if expr.operation == '+' else BytecodeCompiler.wrap(-value, expr.node_type.base_type)
+    return expr.number if isinstance(expr, LiteralNode) else None
+
+
+def simplify_conversion(node: TypeConvertNode) -> Tuple[ExprNode, int]:
+    """:return: (узел, заменяющий преобразование, кол-во удаленных преобразований)
+    """
+    removed = 0
+    while True:
+        expr = node.expr
+        type_from, type_to = expr.node_type.base_type, node.node_type.base_type
+        if type_from == type_to:
+            return expr, removed + 1
+        value = constant_number(expr)
+        if value is not None:
+            value = convertValue(value, type_from, type_to)
+            literal = make_literal(value, type_to, node) if value is not None else None
+            if literal is not None:
+                return literal, removed + 1
+        if not isinstance(expr, TypeConvertNode):
+            return node, removed
+        type_from = expr.expr.node_type.base_type
+        if type_from == type_to:
+            # a -> b -> a с потерями (float -> int -> float) остается
+            if (type_from, expr.node_type.base_type) in TYPE_PROMOTIONS:
+                return expr.expr, removed + 2
+            return node, removed
+        if (type_from, expr.node_type.base_type, type_to) not in CONVERSION_CHAINS:
+            return node, removed
+        node.expr = expr.expr
+        removed += 1
+
+
+def simplify_conversions(tree: StmtListNode) -> int:
+    """Упрощение преобразований типов, добавленных семантическим анализом: преобразование литерала
+    заменяется литералом нового типа, цепочка преобразований - одним (CONVERSION_CHAINS),
+    преобразование туда и обратно без потерь удаляется. Результат программы не меняется.
+    Выполняется после семантического анализа.
+    :return: кол-во удаленных преобразований
+    """
+    removed = 0
+
+    def replace(node: AstNode) -> AstNode:
+        nonlocal removed
+        if not isinstance(node, TypeConvertNode):
+            return node
+        result, count = simplify_conversion(node)
+        removed += count
+        return result
+
+    replace_nodes(tree, replace)
+    return removed
+
+
+LOOP_EXPRESSIONS = (LiteralNode, IdentNode, BinOpNode, FactorNode, TypeConvertNode)
+
+
+def loop_parts(loop: AstNode) -> Tuple[AstNode, ...]:
+    """Части цикла, которые выполняются на каждой итерации (init цикла for выполняется один раз до него)
+    """
+    if isinstance(loop, ForNode):
+        return loop.cond, loop.step, loop.body
+    return loop.cond, loop.stmt_list
+
+
+def loop_assigned(loop: AstNode) -> Tuple[Set[str], bool]:
+    """Переменные, которые присваиваются или объявляются внутри цикла,
+    и есть ли в цикле вызовы пользовательских функций (они могут изменить глобальные переменные)
+    """
+    assigned, calls = set(), False
+    for part in loop_parts(loop):
+        for node in walk(part):
+            if isinstance(node, AssignNode) and isinstance(node.var, IdentNode):
+                assigned.add(node.var.name)
+            elif isinstance(node, VarsDeclNode):
+                assigned.update(var.name for var in node.vars_list if isinstance(var, IdentNode))
+            elif isinstance(node, ArrayDeclarationNode):
+                assigned.add(node.name.name)
+            elif isinstance(node, CallNode) and not node.func.node_ident.built_in:
+                calls = True
+    return assigned, calls
+
+
+def is_invariant(expr: ExprNode, assigned: Set[str], calls: bool) -> bool:
+    if isinstance(expr, LiteralNode):
+        return True
+    if isinstance(expr, IdentNode):
+        ident = expr.node_ident
+        return ident is not None and not ident.type.func and expr.name not in assigned \
+            and not (calls and is_global(ident))
+    if isinstance(expr, BinOpNode):
+        # предзаголовок выполняется, даже если тело цикла не выполнится ни разу,
+        # поэтому деление выносится, только если делитель - ненулевая константа
+        if expr.op == BinOp.DIV and not (isinstance(expr.arg2, LiteralNode) and expr.arg2.value != 0):
+            return False
+        return expr.node_type is not None and expr.node_type.is_simple \
+            and is_invariant(expr.arg1, assigned, calls) and is_invariant(expr.arg2, assigned, calls)
+    if isinstance(expr, (FactorNode, TypeConvertNode)):
+        return is_invariant(expr.children[0], assigned, calls)
+    return False
+
+
+def expr_key(expr: ExprNode) -> tuple:
+    return (type(expr).__name__, str(expr), expr.node_type.base_type if expr.node_type else None,
+            tuple(expr_key(child) for child in expr.children))
+
+
+def loop_invariants(loop: AstNode, outer: Set[int]) -> List[ExprNode]:
+    """Наибольшие инвариантные подвыражения цикла, содержащие загрузку переменной
+    (а также переменные-массивы, указатель на начало которых не меняется в цикле).
+    Выражения из outer уже вынесены объемлющим циклом
+    """
+    assigned, calls = loop_assigned(loop)
+    found: Dict[tuple, ExprNode] = {}
+
+    def collect(node: AstNode):
+        if id(node) in outer:
+            return
+        if isinstance(node, LOOP_EXPRESSIONS):
+            if is_invariant(node, assigned, calls):
+                if any(isinstance(child, IdentNode) for child in walk(node)):
+                    found.setdefault(expr_key(node), node)
+                    outer.add(id(node))
+                return
+        elif isinstance(node, AssignNode):
+            # присваивание переменной - это запись, а не загрузка
+            if not isinstance(node.var, IdentNode):
+                collect(node.var)
+            collect(node.val)
+            return
+        elif isinstance(node, VarsDeclNode):
+            for var in node.vars_list:
+                collect(var)
+            return
+        elif isinstance(node, ArrayDeclarationNode):
+            collect(node.value)
+            return
+        elif isinstance(node, CallNode):
+            for param in node.params:
+                collect(param)
+            return
+        elif isinstance(node, PragmaNode):
+            return
+        for child in node.children:
+            if child is not None:
+                collect(child)
+
+    for part in loop_parts(loop):
+        collect(part)
+    return list(found.values())
+
+
+def hoist_loop_invariants(tree: StmtListNode) -> int:
+    """Вынос инвариантов циклов (LICM): для каждого цикла запоминает выражения,
+    которые генератор вычислит один раз в предзаголовке цикла.
+    :return: кол-во вынесенных выражений
+    """
+    hoisted = 0
+    outer: Set[int] = set()
+    # обход в глубину: объемлющий цикл обрабатывается раньше вложенных
+    for node in walk(tree):
+        if isinstance(node, (ForNode, WhileNode)):
+            node.invariants = tuple(loop_invariants(node, outer))
+            hoisted += len(node.invariants)
+    return hoisted
+
+
+# более короткие цепочки остаются условными переходами
+SWITCH_MIN_CASES = 3
+
+
+def case_value(expr: ExprNode) -> Optional[int]:
+    """Значение целочисленного или символьного литерала (в т.ч. с унарным минусом), None - не литерал
+    """
+    if isinstance(expr, FactorNode) and expr.operation == '-':
+        value = case_value(expr.literal)
+        return None if value is None or expr.literal.node_type.base_type != BaseType.INT else -value
+    if not isinstance(expr, LiteralNode) or expr.node_type.base_type not in (BaseType.INT, BaseType.CHAR):
+        return None
+    if expr.node_type.base_type == BaseType.CHAR:
+        return ord(expr.value)
+    return expr.value if -2 ** 31 <= expr.value < 2 ** 31 else None
+
+
+def switch_test(cond: ExprNode) -> Optional[Tuple[IdentNode, int]]:
+    """Условие вида x == литерал (или литерал == x) для скалярной целой или символьной переменной x
+    """
+    if not isinstance(cond, BinOpNode) or cond.op != BinOp.EQUALS:
+        return None
+    for var, literal in ((cond.arg1, cond.arg2), (cond.arg2, cond.arg1)):
+        if isinstance(var, IdentNode) and var.node_type.is_simple \
+                and var.node_type.base_type in (BaseType.INT, BaseType.CHAR) \
+                and literal.node_type.base_type == var.node_type.base_type:
+            value = case_value(literal)
+            if value is not None:
+                return var, value
+    return None
+
+
+def else_if(stmt: Optional[AstNode]) -> Optional[IfNode]:
+    if isinstance(stmt, StmtListNode) and len(stmt.exprs) == 1:
+        stmt = stmt.exprs[0]
+    return stmt if isinstance(stmt, IfNode) else None
+
+
+def lower_switches(tree: StmtListNode, min_cases: int = SWITCH_MIN_CASES) -> int:
+    """Цепочки if (x == 1) ... else if (x == 2) ... по одной переменной с различными значениями
+    помечаются для генерации одной инструкцией switch (LLVM строит по ней таблицу переходов
+    или двоичный поиск). Условия цепочки не имеют побочных эффектов, поэтому переменная загружается один раз.
+    Выполняется после семантического анализа.
+    :return: кол-во цепочек, сгенерированных через switch
+    """
+    lowered = 0
+    inner: Set[int] = set()
+    # обход в глубину: цепочка начинается с самого внешнего if
+    for node in walk(tree):
+        if not isinstance(node, IfNode) or id(node) in inner:
+            continue
+        test = switch_test(node.cond)
+        if test is None:
+            continue
+        var, cases, seen, rung, default = test[0], [], set(), node, None
+        while rung is not None:
+            test = switch_test(rung.cond)
+            if test is None or test[0].node_ident is not var.node_ident or test[1] in seen:
+                # остаток цепочки выполняется как ветка default
+                default = rung
+                break
+            seen.add(test[1])
+            cases.append((test[1], rung.then_stmt))
+            inner.add(id(rung))
+            default = rung.else_stmt
+            rung = else_if(rung.else_stmt)
+        if len(cases) < min_cases:
+            continue
+        node.switch_on = var
+        node.switch_cases = tuple(cases)
+        node.switch_default = default
+        lowered += 1
+    return lowered
@@ -0,0 +1,191 @@
+"""Параллельные семантический анализ и генерация кода функций одного файла.
+
+Семантический анализ: сначала последовательно проверяются сигнатуры функций (FunctionNode.declare)
+и остальные операторы верхнего уровня, затем тела функций проверяются в пуле процессов. Тело функции
+видит только глобальные имена, объявленные до нее (как при последовательном анализе); при ошибке
+сообщается первая в порядке исходного текста.
+Генерация кода: после анализов каждая функция генерируется в пуле своим генератором (CodeGenerator.fork),
+фрагменты объединяются в порядке исходного текста, поэтому результат совпадает с последовательным.
+
+Процессы создаются через fork и наследуют дерево и глобальную область видимости; проверенная функция
+возвращается через pickle, общие объекты (типы, встроенные и глобальные идентификаторы,
+глобальная область видимости) передаются по номерам. Без fork (Windows, macOS по умолчанию)
+все выполняется последовательно.
+"""
+import io
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+from code_generator import CodeGenerator, Fragment
+from nodes.ast_node import StmtListNode, FunctionNode
+from semantic import IdentScope, IdentDesc, TypeDesc, SemanticException
+
+
+class VisibleIdents(dict):
+    """Глобальные идентификаторы с позицией объявления: get возвращает только объявленные
+    не позже оператора верхнего уровня limit (функцию, заменившую встроенную, - после ее объявления)
+    """
+    def __init__(self, idents: Dict[str, IdentDesc]):
+        super().__init__(idents)
+        # имя -> (номер оператора, прежнее значение)
+        self.positions: Dict[str, Tuple[int, Optional[IdentDesc]]] = {}
+        self.position = 0
+        self.limit: Optional[int] = None
+
+    def __setitem__(self, name: str, ident: IdentDesc):
+        self.positions[name] = (self.position, dict.get(self, name))
+        super().__setitem__(name, ident)
+
+    def get(self, name: str, default=None):
+        ident = dict.get(self, name, default)
+        if self.limit is not None and name in self.positions:
+            position, previous = self.positions[name]
+            if position > self.limit:
+                return previous if previous is not None else default
+        return ident
+
+
+# multiprocessing и ast_file импортируются только при jobs > 1, чтобы не замедлять запуск компилятора
+def can_fork() -> bool:
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def pool(jobs: int):
+    import multiprocessing
+    return multiprocessing.get_context('fork').Pool(jobs)
+
+
+def chunk_size(count: int, jobs: int) -> int:
+    return max(1, count // (jobs * 4))
+
+
+def shared_objects(scope: IdentScope) -> List[Any]:
+    """Объекты, общие для всех функций: известные объекты (ast_file.known_objects), глобальная область
+    видимости, ее идентификаторы и их типы
+    """
+    import ast_file
+
+    objects = list(ast_file.known_objects().values()) + [scope]
+    seen = {id(obj) for obj in objects}
+
+    def add(obj):
+        if id(obj) not in seen and isinstance(obj, (IdentDesc, TypeDesc)):
+            seen.add(id(obj))
+            objects.append(obj)
+            for value in vars(obj).values():
+                for item in value if isinstance(value, (list, tuple)) else (value,):
+                    add(item)
+
+    for ident in scope.idents.values():
+        add(ident)
+    for _, previous in getattr(scope.idents, 'positions', {}).values():
+        if previous is not None:
+            add(previous)
+    return objects
+
+
+def _shared_object(index: int):
+    return _shared[index]
+
+
+def _reduce(obj):
+    index = _shared_ids.get(id(obj))
+    if index is None:
+        return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    return _shared_object, (index,)
+
+
+def dumps(obj) -> bytes:
+    """pickle, в котором общие объекты (shared_objects) заменены их номерами; номера действительны
+    в процессах, созданных fork после вычисления _shared
+    """
+    data = io.BytesIO()
+    pickler = pickle.Pickler(data, pickle.HIGHEST_PROTOCOL)
+    # обработчики по типу вызываются только для объектов этих типов (не для строк, чисел, узлов)
+    pickler.dispatch_table = {cls: _reduce for cls in {type(obj) for obj in _shared}}
+    pickler.dump(obj)
+    return data.getvalue()
+
+
+# состояние, которое процессы пула получают при fork
+_tree: Optional[StmtListNode] = None
+_scopes: Dict[int, IdentScope] = {}
+_shared: List[Any] = []
+_shared_ids: Dict[int, int] = {}
+_gen: Optional[CodeGenerator] = None
+
+
+def _check_body(index: int) -> Tuple[int, Optional[bytes], Optional[str]]:
+    """:return: (номер оператора, проверенная функция или None, сообщение об ошибке или None)
+    """
+    func = _tree.exprs[index]
+    scope = _scopes[index]
+    scope.curr_global.idents.limit = index
+    try:
+        func.checkBody(scope)
+    except SemanticException as e:
+        return index, None, e.message
+    return index, dumps(func), None
+
+
+def check_program(tree: StmtListNode, scope: IdentScope, jobs: int):
+    """Семантический анализ программы (tree.program) с проверкой тел функций в jobs процессах
+    """
+    if jobs <= 1 or not can_fork():
+        tree.semantic_check(scope)
+        return
+
+    global _tree, _scopes, _shared, _shared_ids
+    idents = scope.idents = VisibleIdents(scope.idents)
+    scopes: Dict[int, IdentScope] = {}
+    error = None
+    for index, expr in enumerate(tree.exprs):
+        idents.position = index
+        try:
+            if isinstance(expr, FunctionNode):
+                scopes[index] = expr.declare(scope)
+            else:
+                expr.semantic_check(scope)
+        except SemanticException as e:
+            error = e
+            break
+
+    _tree, _scopes, _shared = tree, scopes, shared_objects(scope)
+    _shared_ids = {id(obj): index for index, obj in enumerate(_shared)}
+    exprs = list(tree.exprs)
+    try:
+        with pool(jobs) as workers:
+            for index, data, message in workers.imap(_check_body, list(scopes), chunk_size(len(scopes), jobs)):
+                if message is not None:
+                    # ошибка в теле функции предшествует ошибкам в следующих операторах
+                    raise SemanticException(message)
+                exprs[index] = pickle.loads(data)
+    finally:
+        tree.exprs = tuple(exprs)
+        _tree, _scopes, _shared, _shared_ids = None, {}, [], {}
+        scope.idents = dict(idents)
+    if error is not None:
+        raise error
+    tree.node_type = TypeDesc.VOID
+
+
+def _fragment(index: int) -> Tuple[str, Fragment]:
+    func = _tree.exprs[index]
+    return func.name.name, func.fragment(_gen)
+
+
+def generate_functions(tree: StmtListNode, gen: CodeGenerator, jobs: int):
+    """Генерация кода функций в jobs процессах: фрагменты сохраняются в gen.fragments
+    и объединяются при tree.to_llvm(gen)
+    """
+    if jobs <= 1 or not can_fork():
+        return
+    global _tree, _gen
+    indices = [index for index, expr in enumerate(tree.exprs) if isinstance(expr, FunctionNode)]
+    _tree, _gen = tree, gen
+    try:
+        with pool(jobs) as workers:
+            gen.fragments.update(workers.imap(_fragment, indices, chunk_size(len(indices), jobs)))
+    finally:
+        _tree, _gen = None, None
@@ -1,38 +1,86 @@
-from lark import Lark, Token, InlineTransformer
-from nodes.ast_node import *
+"""Разбор исходного текста в AST.
 
+lark импортируется при первом разборе, а не при импорте модуля: запуски, которым разбор не нужен
+(например, сборка modules.py без измененных модулей), его не загружают.
+Построенная грамматика сохраняется в снимке (snapshot.py).
+"""
+import os
 
-class ASTBuilder(InlineTransformer):
-    def __getattr__(self, item):
-        if isinstance(item, str) and item.upper() == item:
-            return lambda x: x
+import snapshot
+from nodes import ast_node
+from nodes.ast_node import StmtListNode, BinOpNode, ForNode, WhileNode, BinOp, SemanticException
 
-        if item in ('bin_op',):
-            def get_bin_op_node(*args):
-                op = BinOp(args[1].value)
-                return BinOpNode(op, args[0], args[2],
-                                 **{'token': args[1], 'line': args[1].column, 'column': args[1].column})
+GRAMMAR = 'syntax.lark'
 
-            return get_bin_op_node
-        else:
-            def get_node(*args):
-                props = {}
-                if len(args) == 1 and isinstance(args[0], Token):
-                    props['token'] = args[0]
-                    props['line'] = args[0].line
-                    props['column'] = args[0].column
-                    args = [args[0].value]
-                cls = eval(''.join(x.capitalize() for x in item.split('_')) + 'Node')
-                return cls(*args, **props)
 
-            return get_node
+def _ast_builder_class() -> type:
+    from lark import Token, InlineTransformer
+
+    class ASTBuilder(InlineTransformer):
+        def __getattr__(self, item):
+            if isinstance(item, str) and item.upper() == item:
+                return lambda x: x
+
+            if item in ('bin_op',):
+                def get_bin_op_node(*args):
+                    op = BinOp(args[1].value)
+                    return BinOpNode(op, args[0], args[2],
+                                     **{'token': args[1], 'line': args[1].column, 'column': args[1].column})
+
+                return get_bin_op_node
+            elif item in ('pragma_loop',):
+                def attach_pragma(pragma, stmt):
+                    if not isinstance(stmt, (ForNode, WhileNode)):
+                        raise SemanticException('#pragma {} применима только к циклам for и while'.format(pragma.kind),
+                                                pragma.kind.line, pragma.kind.column)
+                    stmt.pragma = pragma
+                    return stmt
+
+                return attach_pragma
+            else:
+                def get_node(*args):
+                    props = {}
+                    if len(args) == 1 and isinstance(args[0], Token):
+                        props['token'] = args[0]
+                        props['line'] = args[0].line
+                        props['column'] = args[0].column
+                        args = [args[0].value]
+                    cls = getattr(ast_node, ''.join(x.capitalize() for x in item.split('_')) + 'Node')
+                    return cls(*args, **props)
+
+                return get_node
+
+    return ASTBuilder
+
+
+_parser = None
+_builder = None
+
+
+def _build_parser():
+    from lark import Lark
+
+    return Lark.open(os.path.join(snapshot.BASE_DIR, GRAMMAR), start='start', lexer='standard',
+                     propagate_positions=True)
+
+
+def get_parser():
+    """Грамматика строится один раз на процесс (или загружается из снимка); :return: lark.Lark
+    """
+    global _parser, _builder
+    if _parser is None:
+        import lark
+
+        _parser = snapshot.load('parser', snapshot.source_key(lark.__version__, files=[GRAMMAR]), _build_parser)
+        _builder = _ast_builder_class()
+    return _parser
 
 
 def parse(prog: str, debug=False) -> StmtListNode:
-    parser = Lark.open("./syntax.lark", start='start', lexer='standard', propagate_positions=True)  # , lexer="standard")
+    parser = get_parser()
     prog = parser.parse(prog)
     if debug:
         print(prog.pretty())
         print(prog)
-    prog = ASTBuilder().transform(prog)
+    prog = _builder().transform(prog)
     return prog
@@ -0,0 +1,203 @@
+"""Менеджер проходов по AST.
+
+Проход задает обработчики enter_<Класс узла> / exit_<Класс узла> (вызываются для узлов класса и его
+подклассов, выбирается ближайший по MRO) и, при необходимости, start/finish. Проходы, объявленные
+в одном менеджере, объединяются в общий обход дерева по AstNode.children; проход, который зависит
+(requires) от прохода текущей группы, начинает следующий обход. Проход с методом run (например,
+семантический анализ, который сам передает области видимости вниз по дереву) выполняется отдельно.
+Группа проходов без обработчиков (вся работа в start/finish) обходится без обхода дерева.
+
+    manager = PassManager(ConstantDataPass(), FunctionSummaryPass(), profile=True)
+    results = manager.run(tree)
+    manager.report()
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import parallel
+import semantic
+from nodes.ast_node import AstNode
+
+Handler = Callable[[AstNode], None]
+
+
+class Pass:
+    name = ''
+    # имена проходов, результаты которых нужны этому проходу (передаются в start)
+    requires: Tuple[str, ...] = ()
+
+    def start(self, tree: AstNode, results: Dict[str, Any]) -> None:
+        pass
+
+    def finish(self, tree: AstNode) -> Any:
+        """:return: результат прохода, доступный зависящим проходам
+        """
+        return None
+
+    # run(self, tree, results) -> результат: проход выполняет обход сам и не объединяется с другими
+    run: Optional[Callable[[AstNode, Dict[str, Any]], Any]] = None
+
+    @property
+    def has_handlers(self) -> bool:
+        return any(name.startswith(('enter_', 'exit_')) for name in dir(self))
+
+    def handler(self, kind: str, cls: type) -> Optional[Handler]:
+        for base in cls.__mro__:
+            method = getattr(self, f'{kind}_{base.__name__}', None)
+            if method is not None:
+                return method
+        return None
+
+
+class SemanticCheckPass(Pass):
+    """Семантический анализ (AstNode.semantic_check) с областью видимости по умолчанию
+    и функциями других модулей (externals: имя -> сигнатура из интерфейса);
+    при jobs > 1 тела функций проверяются параллельно (parallel.py)
+    """
+    name = 'semantic'
+
+    def __init__(self, externals: Optional[dict] = None, jobs: int = 1):
+        self.externals = externals
+        self.jobs = jobs
+
+    def run(self, tree: AstNode, results: Dict[str, Any]) -> semantic.IdentScope:
+        scope = semantic.get_default_scope()
+        if self.externals:
+            semantic.add_external_functions(scope, self.externals)
+        parallel.check_program(tree, scope, self.jobs)
+        return scope
+
+
+class TreePass(Pass):
+    """Проход-функция над всем деревом (например, преобразования из optimizer.py)
+    """
+    def __init__(self, name: str, func: Callable[[AstNode], Any], requires: Tuple[str, ...] = ()):
+        self.name = name
+        self.func = func
+        self.requires = requires
+
+    def run(self, tree: AstNode, results: Dict[str, Any]) -> Any:
+        return self.func(tree)
+
+
+class PassManager:
+    def __init__(self, *passes: Pass, profile: bool = False):
+        self.passes: List[Pass] = list(passes)
+        self.profile = profile
+        # время (сек) по проходам: обработчики + start/finish; для обходов - время самого обхода
+        self.timings: Dict[str, float] = {}
+        self.traversals = 0
+
+    def add(self, pass_: Pass) -> 'PassManager':
+        self.passes.append(pass_)
+        return self
+
+    def ordered(self) -> List[Pass]:
+        """Проходы в порядке зависимостей (при прочих равных - в порядке добавления)
+        """
+        by_name = {pass_.name: pass_ for pass_ in self.passes}
+        result, done, visiting = [], set(), set()
+
+        def visit(pass_: Pass):
+            if pass_.name in done:
+                return
+            if pass_.name in visiting:
+                raise ValueError(f'Циклическая зависимость проходов: {pass_.name}')
+            visiting.add(pass_.name)
+            for name in pass_.requires:
+                if name not in by_name:
+                    raise ValueError(f'Проход {pass_.name} требует отсутствующий проход {name}')
+                visit(by_name[name])
+            visiting.discard(pass_.name)
+            done.add(pass_.name)
+            result.append(pass_)
+
+        for pass_ in self.passes:
+            visit(pass_)
+        return result
+
+    def schedule(self) -> List[List[Pass]]:
+        """Группы проходов, каждая выполняется одним обходом (или методом run, если проход один такой)
+        """
+        groups: List[List[Pass]] = []
+        current: List[Pass] = []
+        for pass_ in self.ordered():
+            if pass_.run is not None:
+                if current:
+                    groups.append(current)
+                groups.append([pass_])
+                current = []
+            elif any(required in {p.name for p in current} for required in pass_.requires):
+                groups.append(current)
+                current = [pass_]
+            else:
+                current.append(pass_)
+        if current:
+            groups.append(current)
+        return groups
+
+    def run(self, tree: AstNode) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        for group in self.schedule():
+            if group[0].run is not None:
+                start = time.perf_counter()
+                results[group[0].name] = group[0].run(tree, results)
+                self.measure(group[0].name, start)
+                continue
+            for pass_ in group:
+                start = time.perf_counter()
+                pass_.start(tree, results)
+                self.measure(pass_.name, start)
+            if any(pass_.has_handlers for pass_ in group):
+                self.traverse(tree, group)
+            for pass_ in group:
+                start = time.perf_counter()
+                results[pass_.name] = pass_.finish(tree)
+                self.measure(pass_.name, start)
+        return results
+
+    def measure(self, name: str, start: float):
+        self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def timed(self, name: str, handler: Handler) -> Handler:
+        def wrapper(node: AstNode):
+            start = time.perf_counter()
+            handler(node)
+            self.measure(name, start)
+        return wrapper
+
+    def traverse(self, tree: AstNode, group: List[Pass]):
+        table: Dict[type, Tuple[List[Handler], List[Handler]]] = {}
+
+        def handlers(cls: type) -> Tuple[List[Handler], List[Handler]]:
+            result = [], []
+            for pass_ in group:
+                for kind, found in zip(('enter', 'exit'), result):
+                    handler = pass_.handler(kind, cls)
+                    if handler is not None:
+                        found.append(self.timed(pass_.name, handler) if self.profile else handler)
+            table[cls] = result
+            return result
+
+        def visit(node: AstNode):
+            enter, exit_ = table.get(type(node)) or handlers(type(node))
+            for handler in enter:
+                handler(node)
+            for child in node.children:
+                if child is not None:
+                    visit(child)
+            for handler in exit_:
+                handler(node)
+
+        start = time.perf_counter()
+        visit(tree)
+        self.traversals += 1
+        self.measure(f'traversal {self.traversals} ({", ".join(p.name for p in group)})', start)
+
+    def report(self):
+        for name, elapsed in self.timings.items():
+            print(f'    {name:<60} {elapsed * 1000:10.2f} ms')
+
+
+def run_passes(tree: AstNode, *passes: Pass) -> Dict[str, Any]:
+    return PassManager(*passes).run(tree)
@@ -1,8 +1,9 @@
 from enum import Enum
-from typing import Optional, Tuple, Any, Dict
+from typing import Optional, Tuple, Any, Dict, List
 
 import parser_base
-from utils import BinOp, BaseType, ArrayType
+import snapshot
+from utils import BinOp, BaseType, ArrayType, isArrayBuiltinFunc
 
 VOID, INT, FLOAT, BOOL, CHAR = BaseType.VOID, BaseType.INT, BaseType.FLOAT, BaseType.BOOL, BaseType.CHAR
 INT_ARRAY, FLOAT_ARRAY, BOOL_ARRAY, CHAR_ARRAY = \
@@ -14,6 +15,24 @@ TYPE_CONVERTIBILITY = {
     BOOL: (INT, CHAR, FLOAT),
     CHAR: (INT, BOOL, FLOAT)
 }
+# преобразования без потерь: обратное преобразование возвращает исходное значение (char -> int - это zext)
+TYPE_PROMOTIONS = {(BOOL, CHAR), (BOOL, INT), (BOOL, FLOAT), (CHAR, INT), (CHAR, FLOAT), (INT, FLOAT)}
+
+
+# встроенные функции над массивами: имя -> (возвращаемый тип, типы параметров, допустимые типы элементов);
+# 'elem' - тип элементов массива из первого аргумента, 'arr' - массив того же типа.
+# В области видимости они объявлены для int[], тип уточняется при вызове (array_built_in_type)
+ARRAY_BUILT_INS = {
+    'fill': ('void', ('arr', 'elem', 'int'), ('int', 'float', 'char', 'bool')),
+    'copy': ('void', ('arr', 'arr', 'int'), ('int', 'float', 'char', 'bool')),
+    'sum': ('elem', ('arr', 'int'), ('int', 'float')),
+    'min': ('elem', ('arr', 'int'), ('int', 'float', 'char')),
+    'max': ('elem', ('arr', 'int'), ('int', 'float', 'char')),
+    'sort': ('void', ('arr', 'int'), ('int', 'float', 'char')),
+    'print_array': ('void', ('arr', 'int'), ('int', 'float', 'char')),
+}
+# номера параметров-массивов, элементы которых изменяет встроенная функция
+ARRAY_BUILT_IN_WRITES = {'fill': (0,), 'copy': (0,), 'sort': (0,)}
 
 
 class ScopeType(Enum):
@@ -201,6 +220,8 @@ class IdentDesc:
         self.scope = scope
         self.index = index
         self.built_in = False
+        # функция определена в другом модуле и известна по интерфейсу
+        self.external = False
 
     def __str__(self) -> str:
         return '{}, {}, {}'.format(self.type, self.scope, 'built-in' if self.built_in else self.index)
@@ -267,7 +288,9 @@ class IdentScope:
             elif ident.scope == ScopeType.LOCAL:
                 if old_ident.scope not in (ScopeType.GLOBAL, ScopeType.GLOBAL_LOCAL):
                     error = True
-            else:
+            elif not (old_ident.built_in and isArrayBuiltinFunc(ident.name)):
+                # функции и глобальные переменные программы могут называться как встроенные функции
+                # над массивами (и заменяют их)
                 error = True
             if error:
                 raise SemanticException('Идентификатор {} уже объявлен'.format(ident.name))
@@ -316,8 +339,58 @@ def can_type_convert_to(from_type: TypeDesc, to_type: TypeDesc) -> bool:
     return from_type.base_type in TYPE_CONVERTIBILITY and to_type.base_type in TYPE_CONVERTIBILITY[to_type.base_type]
 
 
+_built_in_idents: Optional[Dict[str, IdentDesc]] = None
+
+
 def get_default_scope() -> IdentScope:
-    BUILT_IN_FUNCTIONS = '''void print_int(int var){}
+    """Глобальная область видимости со встроенными функциями;
+    встроенные функции разбираются один раз на процесс (или загружаются из снимка, см. snapshot.py)
+    """
+    global _built_in_idents
+    if _built_in_idents is None:
+        key = snapshot.source_key(BUILT_IN_FUNCTIONS, files=['semantic.py', 'nodes/ast_node.py', 'utils.py'])
+        _built_in_idents = snapshot.load('built_ins', key, _parse_built_in_functions, type_singletons())
+    scope = IdentScope()
+    scope.idents = dict(_built_in_idents)
+    return scope
+
+
+def type_from_signature(type_str: str) -> TypeDesc:
+    if type_str.endswith('[]'):
+        return TypeDesc.arr_from_str(type_str[:-2])
+    return TypeDesc.from_str(type_str)
+
+
+def add_external_functions(scope: IdentScope, functions: Dict[str, Tuple[str, List[str]]]) -> None:
+    """Добавляет в глобальную область функции других модулей по сигнатурам из их интерфейсов:
+    имя -> (возвращаемый тип, типы параметров), массивы записываются как 'int[]'
+    """
+    for name, (return_type, params) in functions.items():
+        params = tuple(type_from_signature(param) for param in params)
+        if return_type.endswith('[]'):
+            ident = ArrayDesc(name, TypeDesc(None, type_from_signature(return_type), params, True), 1)
+        else:
+            ident = IdentDesc(name, TypeDesc(None, type_from_signature(return_type), params))
+        ident.external = True
+        try:
+            scope.add_ident(ident)
+        except SemanticException:
+            raise SemanticException(f'Функция {name} объявлена в нескольких модулях')
+
+
+def array_built_in_type(name: str, array: TypeDesc) -> Optional[TypeDesc]:
+    """Тип встроенной функции над массивами для первого аргумента типа array
+    (None, если функция не поддерживает такой тип)
+    """
+    return_type, params, elem_types = ARRAY_BUILT_INS[name]
+    if not array.is_arr or array.base_type.value not in elem_types:
+        return None
+    types = {'arr': array, 'elem': TypeDesc.from_str(array.base_type.value), 'int': TypeDesc.INT,
+             'void': TypeDesc.VOID}
+    return TypeDesc(None, types[return_type], tuple(types[param] for param in params))
+
+
+BUILT_IN_FUNCTIONS = '''void print_int(int var){}
     void print_float(float var){}
     void print_char(char var){}
     void print_str(char var[0]){}
@@ -325,8 +398,24 @@ def get_default_scope() -> IdentScope:
     float read_float(){}
     char read_char(){}
     char[] read_str(){}
+    void fill(int arr[0], int value, int n){}
+    void copy(int dst[0], int src[0], int n){}
+    int sum(int arr[0], int n){}
+    int min(int arr[0], int n){}
+    int max(int arr[0], int n){}
+    void sort(int arr[0], int n){}
+    void print_array(int arr[0], int n){}
     '''
 
+
+def type_singletons() -> Dict[str, 'TypeDesc']:
+    """Единственные экземпляры простых типов и типов массивов по имени (сравниваются через is)
+    """
+    return {f'type.{name}': getattr(TypeDesc, name)
+            for name in [t.name for t in BaseType] + [f'{t.name}_ARRAY' for t in ArrayType]}
+
+
+def _parse_built_in_functions() -> Dict[str, IdentDesc]:
     prog = parser_base.parse(BUILT_IN_FUNCTIONS)
     scope = IdentScope()
     prog.semantic_check(scope)
@@ -334,5 +423,4 @@ def get_default_scope() -> IdentScope:
     for name, ident in scope.idents.items():
         ident.built_in = True
 
-    scope.var_index = 0
-    return scope
\ No newline at end of file
+    return scope.idents
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""Резидентный сервер компиляции.
+
+Протокол: по одному JSON-объекту на строку в обе стороны.
+    {"id": 1, "op": "compile", "source": "...", "options": {"cse": true}}
+        -> {"id": 1, "ok": true, "llvm": "..."} | {"id": 1, "ok": false, "error": "..."}
+    {"id": 2, "op": "stats"} -> {"id": 2, "ok": true, "stats": {...}}
+    {"id": 3, "op": "ping"}  -> {"id": 3, "ok": true}
+
+Компиляция выполняется в пуле процессов, каждый рабочий процесс заранее строит грамматику
+и область видимости со встроенными функциями. Одинаковые одновременные запросы компилируются один раз.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 64
+DEFAULT_TIMEOUT = 10.0
+LATENCY_WINDOW = 10000
+
+
+def _warm_worker():
+    import parser_base
+    import semantic
+
+    parser_base.get_parser()
+    semantic.get_default_scope()
+
+
+def _compile(source: str, options: dict) -> Tuple[bool, str]:
+    import compiler
+    import semantic
+
+    try:
+        return True, compiler.compile_program(source, **options)
+    except semantic.SemanticException as e:
+        return False, e.message
+    except Exception as e:
+        return False, f'{type(e).__name__}: {e}'
+
+
+def _percentile(values, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class CompileServer:
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.started = time.time()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.counters = {'requests': 0, 'compiled': 0, 'coalesced': 0, 'rejected': 0, 'timeouts': 0,
+                         'errors': 0}
+
+    def stats(self) -> dict:
+        latencies = list(self.latencies)
+        return dict(self.counters, in_flight=len(self.in_flight), uptime=time.time() - self.started,
+                    p50_ms=_percentile(latencies, 0.5), p99_ms=_percentile(latencies, 0.99))
+
+    async def compile(self, source: str, options: dict) -> dict:
+        key = hashlib.sha256(json.dumps([source, options], sort_keys=True).encode()).hexdigest()
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+        elif len(self.in_flight) >= self.max_pending:
+            self.counters['rejected'] += 1
+            return {'ok': False, 'error': 'overloaded'}
+        else:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, _compile, source, options)
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+
+        try:
+            # shield: таймаут одного клиента не отменяет результат для остальных ожидающих
+            ok, result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.counters['timeouts'] += 1
+            return {'ok': False, 'error': 'timeout'}
+
+        if not ok:
+            self.counters['errors'] += 1
+            return {'ok': False, 'error': result}
+        self.counters['compiled'] += 1
+        return {'ok': True, 'llvm': result}
+
+    async def handle_request(self, request: dict) -> dict:
+        op = request.get('op', 'compile')
+        if op == 'ping':
+            return {'ok': True}
+        if op == 'stats':
+            return {'ok': True, 'stats': self.stats()}
+        if op == 'compile':
+            self.counters['requests'] += 1
+            start = time.perf_counter()
+            response = await self.compile(request.get('source', ''), request.get('options', {}))
+            self.latencies.append((time.perf_counter() - start) * 1000)
+            return response
+        return {'ok': False, 'error': f'unknown op {op}'}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        lock = asyncio.Lock()
+
+        async def respond(line: bytes):
+            try:
+                request = json.loads(line)
+                response = await self.handle_request(request)
+                response['id'] = request.get('id')
+            except (ValueError, AttributeError) as e:
+                response = {'ok': False, 'error': f'bad request: {e}'}
+            async with lock:
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, unix: Optional[str] = None, host: str = '127.0.0.1', port: int = 8765):
+        if unix:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix, limit=2 ** 26)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=2 ** 26)
+        # рабочие процессы прогреваются до первого запроса
+        await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(self.pool, _warm_worker)
+                               for _ in range(self.pool._max_workers)))
+        print(f'listening on {unix or f"{host}:{port}"}', flush=True)
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        async with server:
+            await stop.wait()
+
+
+def main():
+    args = argparse.ArgumentParser(description='Compile server')
+    args.add_argument('--unix', help='path of the unix socket (default: tcp)')
+    args.add_argument('--host', default='127.0.0.1')
+    args.add_argument('--port', type=int, default=8765)
+    args.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    args.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING)
+    args.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    args = args.parse_args()
+
+    server = CompileServer(args.workers, args.max_pending, args.timeout)
+    try:
+        asyncio.run(server.serve(args.unix, args.host, args.port))
+    finally:
+        server.pool.shutdown(cancel_futures=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Снимки состояния запуска: грамматика (парсер lark) и встроенные функции сохраняются через pickle,
+чтобы не строить их заново при каждом запуске компилятора.
+
+Снимок хранится в __pycache__ рядом с модулями (или в каталоге из переменной OURPARSER_CACHE)
+под именем, включающим хэш всего, от чего он зависит: при изменении грамматики, кода узлов
+или версии lark снимок строится заново. Если каталог недоступен для записи, состояние
+просто строится каждый раз.
+"""
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+import types
+from typing import Any, Callable, Dict, Iterable, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FORMAT = 1
+
+
+def directory() -> str:
+    return os.environ.get('OURPARSER_CACHE') or os.path.join(BASE_DIR, '__pycache__')
+
+
+def source_key(*parts: str, files: Iterable[str] = ()) -> str:
+    """Хэш частей и содержимого файлов (пути относительно каталога компилятора)
+    """
+    digest = hashlib.sha256(f'{FORMAT} {sys.version_info[:2]}'.encode())
+    for part in parts:
+        digest.update(part.encode())
+    for name in files:
+        with open(os.path.join(BASE_DIR, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _reduce_module(module: types.ModuleType):
+    return importlib.import_module, (module.__name__,)
+
+
+class _Pickler(pickle.Pickler):
+    # объекты, которые есть в каждом процессе (синглтоны типов), сохраняются по имени
+    def __init__(self, file, shared: Dict[str, Any]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.shared = {id(obj): name for name, obj in shared.items()}
+        # в объектах lark есть ссылки на модули (re)
+        self.dispatch_table = {types.ModuleType: _reduce_module}
+
+    def persistent_id(self, obj):
+        return self.shared.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, shared: Dict[str, Any]):
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, name: str):
+        return self.shared[name]
+
+
+def load(name: str, key: str, build: Callable[[], Any], shared: Optional[Dict[str, Any]] = None) -> Any:
+    """Состояние из снимка name-key; если снимка нет (или он поврежден) - build() с сохранением снимка
+    """
+    shared = shared or {}
+    path = os.path.join(directory(), f'{name}-{key}.pickle')
+    try:
+        with open(path, 'rb') as f:
+            return _Unpickler(f, shared).load()
+    except Exception:
+        # снимка нет, он поврежден или не загружается с текущими версиями библиотек
+        pass
+
+    value = build()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f'{path}.{os.getpid()}'
+        try:
+            with open(temp, 'wb') as f:
+                _Pickler(f, shared).dump(value)
+            os.replace(temp, path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+    except (OSError, pickle.PicklingError):
+        pass
+    return value
@@ -4,7 +4,14 @@ import sys
 
 
 def run_all(debug=False)->bool:
-    return  working_test(debug) and working_test(debug)
+    return working_test(debug) and corpus_test(debug)
+
+
+def corpus_test(debug=False) -> bool:
+    """IR и ошибки всех файлов tests/ совпадают с эталоном (corpus.py, без проверки времени)
+    """
+    import corpus
+    return corpus.run(repeat=1, timings=False, verbose=debug)
 
 
 def working_test(debug=False) -> bool:
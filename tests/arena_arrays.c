@@ -0,0 +1,30 @@
+// run
+int[] squares(int n) {
+    int r[n];
+    for (int i = 0; i < n; i = i + 1) {
+        r[i] = i * i;
+    }
+    return r;
+}
+
+int partial(int depth) {
+    int scratch[depth + 1];
+    fill(scratch, depth, depth + 1);
+    if (depth == 0)
+        return 0;
+    return sum(scratch, depth + 1) + partial(depth - 1);
+}
+
+int main() {
+    int total = 0;
+    for (int k = 1; k < 200; k = k + 1) {
+        int s[k] = squares(k);
+        total = total + s[k - 1];
+    }
+    print_int(total);
+    print_int(partial(30));
+    int big[20000];
+    fill(big, 3, 20000);
+    print_int(sum(big, 20000));
+    return 0;
+}
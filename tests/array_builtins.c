@@ -0,0 +1,25 @@
+// run
+int main() {
+    int a[6] = {5, -3, 9, 0, 7, 2};
+    int b[6];
+    float f[4] = {1.5, -2.25, 4.0, 0.5};
+    char s[5] = {"d", "a", "c", "b", "e"};
+
+    print_int(sum(a, 6));
+    print_int(min(a, 6));
+    print_int(max(a, 4));
+    copy(b, a, 6);
+    sort(b, 6);
+    print_array(b, 6);
+    print_array(a, 6);
+    fill(b, 1, 3);
+    print_array(b, 6);
+    print_float(sum(f, 4));
+    print_float(min(f, 4));
+    sort(f, 4);
+    print_array(f, 4);
+    sort(s, 5);
+    print_array(s, 5);
+    print_int(sum(a, 0));
+    return 0;
+}
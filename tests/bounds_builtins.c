@@ -0,0 +1,17 @@
+// run: checked
+int total(int a[8], int n) {
+    return sum(a, n);
+}
+
+int main() {
+    int a[8];
+    int b[3] = {1, 2, 3};
+    fill(a, 2, 8);
+    print_int(total(a, 8));
+    copy(a, b, 3);
+    print_array(a, 8);
+    int n = 5;
+    copy(a, b, n);
+    print_int(a[4]);
+    return 0;
+}
@@ -0,0 +1,14 @@
+// run: checked
+int main() {
+    int a[6];
+    int n = 8;
+    for (int i = 0; i < 6; i = i + 1) {
+        a[i] = i * i;
+    }
+    int s = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        s = s + a[i];
+        print_int(s);
+    }
+    return 0;
+}
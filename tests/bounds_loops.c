@@ -0,0 +1,31 @@
+// run
+int dot(int a[16], int b[16], int n) {
+    int s = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        s = s + a[i] * b[n - 1 - i];
+    }
+    return s;
+}
+
+int main() {
+    int a[16];
+    int b[16];
+    for (int i = 0; i < 16; i = i + 1) {
+        a[i] = i;
+        b[i] = 16 - i;
+    }
+    print_int(dot(a, b, 16));
+    print_int(dot(a, b, 10));
+    int hist[5];
+    fill(hist, 0, 5);
+    for (int i = 0; i < 16; i = i + 1) {
+        hist[a[i] - a[i] / 5 * 5] = hist[a[i] - a[i] / 5 * 5] + 1;
+    }
+    print_array(hist, 5);
+    int k = 2;
+    for (int i = 1; i < 14; i = i + 2) {
+        a[i + k] = a[i - 1] + a[i + 1];
+    }
+    print_array(a, 16);
+    return 0;
+}
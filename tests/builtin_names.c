@@ -0,0 +1,27 @@
+// run
+int sum = 0;
+int max = 1;
+float min = 2.5;
+int copy[3] = {4, 5, 6};
+char sort = "s";
+
+void add(int x) {
+    sum = sum + x;
+    if (x > max)
+        max = x;
+}
+
+int main() {
+    for (int i = 0; i < 3; i = i + 1) {
+        add(copy[i]);
+    }
+    int fill = sum * 2;
+    print_int(sum);
+    print_int(max);
+    print_float(min);
+    print_int(fill);
+    print_char(sort);
+    int a[3] = {3, 1, 2};
+    print_array(a, 3);
+    return 0;
+}
@@ -0,0 +1,60 @@
+// run
+int ga[4] = {1, 2, 3, 4};
+
+void set() {
+    ga[0] = 50;
+    ga[1] = 60;
+}
+
+int f(int a[4]) {
+    set();
+    print_int(a[0]);
+    print_int(a[1]);
+    return a[0] + a[1];
+}
+
+int g(int a[4]) {
+    ga[0] = 70;
+    return a[0];
+}
+
+int sum(int a[4]) {
+    return a[0] + a[1] + a[2] + a[3];
+}
+
+void replace() {
+    int c[4] = {9, 8, 7, 6};
+    ga = c;
+}
+
+int peek(int a[4]) {
+    replace();
+    return a[0];
+}
+
+int snapshot() {
+    int b[4];
+    int c[4] = {5, 5, 5, 5};
+    b = ga;
+    ga = c;
+    return b[0];
+}
+
+int main() {
+    int b[4];
+    b = ga;
+    set();
+    print_int(b[0]);
+    ga[0] = 1;
+    ga[1] = 2;
+    print_int(f(ga));
+    ga[0] = 1;
+    print_int(g(ga));
+    print_int(sum(ga));
+    ga[0] = 1;
+    print_int(peek(ga));
+    ga[0] = 1;
+    print_int(snapshot());
+    print_int(ga[0]);
+    return 0;
+}
@@ -0,0 +1,27 @@
+// run
+int counter = 10;
+float ratio = 0.5;
+int primes[6] = {2, 3, 5, 7, 11, 13};
+int squares[5] = {0, 1, 4, 9, 16};
+char letters[3] = {"x", "y", "z"};
+int table[4];
+
+void tick(int n) {
+    counter = counter + n;
+}
+
+int main() {
+    for (int i = 0; i < 4; i = i + 1) {
+        table[i] = primes[i] * squares[i + 1];
+        tick(i);
+    }
+    print_int(counter);
+    print_float(ratio * counter);
+    print_array(table, 4);
+    print_char(letters[1]);
+    int local[3] = {7, 8, 9};
+    print_int(local[2] + primes[5]);
+    int partial[4] = {1, -2, 3};
+    print_array(partial, 4);
+    return counter;
+}
@@ -0,0 +1,279 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main(i32 %ca, i8 %cb, i1 %cc, i32* %cd) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca i32
+%7 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%8 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%9 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%10 = alloca i32
+store i32 %ca, i32* %10
+%11 = alloca i8
+store i8 %cb, i8* %11
+%12 = alloca i1
+store i1 %cc, i1* %12
+%13 = alloca i32*
+%14 = zext i32 8 to i64
+%15 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %14)
+%16 = bitcast i8* %15 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %16, i32* %cd, i32 8, i1 0)
+store i32* %16,i32** %13
+%17 = add i32 0, 0
+store i32 %17, i32* %10
+%18 = add i32 0, 1
+store i32 %18, i32* %1
+store i32 0, i32* %2
+store i32 0, i32* %3
+%19 = add i32 0, 10
+store i32 %19, i32* %4
+%20 = load i8, i8* %11
+%21 = trunc i32 1 to i8
+%22 = add i8 %20, %21
+%23 = zext i8 %22 to i32
+store i32 %23, i32* %10
+%24 = load i32, i32* %10
+%25 = icmp eq i32 %24, 0
+br i1 %25, label %26, label %30
+
+26:
+%27 = load i32*, i32** %13
+%28 = getelementptr inbounds i32, i32* %27, i32 1
+%29 = add i32 0, 20
+store i32 %29, i32* %28
+br label %30
+30:
+br label %31
+
+31:
+%32 = add i32 0, 0
+store i32 %32, i32* %5
+br label %33
+33:
+%34 = load i32, i32* %5
+%35 = icmp slt i32 %34, 10
+br i1 %35, label %36, label %41
+
+36:
+%37 = add i32 0, 0
+store i32 %37, i32* %6
+br label %38
+38:
+%39 = load i32, i32* %5
+%40 = add i32 %39, 1
+store i32 %40, i32* %5
+br label %33
+
+41:
+br label %42
+
+42:
+%43 = load i8, i8* %11
+%44 = trunc i32 0 to i8
+%45 = icmp slt i8 %43, %44
+br i1 %45, label %46, label %47
+
+46:
+br label %42
+47:
+%48 = load i32, i32* %10
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %7, i8* %8, i8* %9)
+ret i32 %48
+}
+
+define internal double* @func() nounwind norecurse {
+%1 = alloca i32
+%2 = alloca double*
+%3 = add i32 0, 0
+store i32 %3, i32* %1
+%4 = zext i32 16 to i64
+%5 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.heap, i64 %4)
+%6 = bitcast i8* %5 to double*
+store double* %6, double** %2
+%7 = load double*, double** %2
+ret double* %7
+}
+
+define internal i32* @function(i32* %carr) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32*
+%3 = zext i32 40 to i64
+%4 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.heap, i64 %3)
+%5 = bitcast i8* %4 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %5, i32* %carr, i32 40, i1 0)
+store i32* %5,i32** %2
+%6 = add i32 0, 10
+store i32 %6, i32* %1
+%7 = load i32*, i32** %2
+ret i32* %7
+}
+
+define internal void @global.init() {
+%temp.0.0 = icmp ne i32 0, 2
+%aa.0 = load i32*, i32** @aa
+%call.main.0 = call i32 @main(i32 1, i8 65, i1 %temp.0.0, i32* %aa.0)
+store i32 %call.main.0, i32* @k
+%f.0 = load double*, double** @f
+%f.1 = getelementptr inbounds double, double* %f.0, i32 1
+%r.0 = load double*, double** @r
+%r.1 = getelementptr inbounds double, double* %r.0, i32 0
+%r.2 = load double, double* %r.1
+store double %r.2, double* %f.1
+%d.0 = load i32*, i32** @d
+%d.1 = getelementptr inbounds i32, i32* %d.0, i32 1
+%c.0 = load i32*, i32** @c
+%c.1 = getelementptr inbounds i32, i32* %c.0, i32 1
+%c.2 = load i32, i32* %c.1
+%temp.0.1 = sub i32 %c.2, 2
+store i32 %temp.0.1, i32* %d.1
+%call.func.0 = call double* @func()
+store double* %call.func.0, double** @f 
+%c.3 = load i32*, i32** @c
+%d.2 = load i32*, i32** @d
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %d.2, i32* %c.3, i32 8, i1 0)
+%awd.0 = load i32*, i32** @awd
+%call.function.0 = call i32* @function(i32* %awd.0)
+store i32* %call.function.0, i32** @a 
+%aawdaw.0 = load double*, double** @aawdaw
+%aawdaw.1 = getelementptr inbounds double, double* %aawdaw.0, i32 1
+%aawdaw.2 = fadd double 0.0, 3.0
+store double %aawdaw.2, double* %aawdaw.1
+%aaaa.0 = load i32, i32* @aaaa
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %aaaa.0)
+ret void
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+@const.0 = private unnamed_addr constant [2 x i32] zeroinitializer
+@aa = internal unnamed_addr constant i32* getelementptr inbounds ([2 x i32], [2 x i32]* @const.0, i32 0, i32 0)
+@k = internal global i32 0
+@d.data = internal global [2 x i32] zeroinitializer
+@d = internal global i32* getelementptr inbounds ([2 x i32], [2 x i32]* @d.data, i32 0, i32 0)
+@c = internal unnamed_addr constant i32* getelementptr inbounds ([2 x i32], [2 x i32]* @const.0, i32 0, i32 0)
+@f.data = internal global [2 x double] zeroinitializer
+@f = internal global double* getelementptr inbounds ([2 x double], [2 x double]* @f.data, i32 0, i32 0)
+@const.1 = private unnamed_addr constant [2 x double] zeroinitializer
+@r = internal unnamed_addr constant double* getelementptr inbounds ([2 x double], [2 x double]* @const.1, i32 0, i32 0)
+@const.2 = private unnamed_addr constant [10 x i32] zeroinitializer
+@awd = internal unnamed_addr constant i32* getelementptr inbounds ([10 x i32], [10 x i32]* @const.2, i32 0, i32 0)
+@a.data = internal global [10 x i32] zeroinitializer
+@a = internal global i32* getelementptr inbounds ([10 x i32], [10 x i32]* @a.data, i32 0, i32 0)
+@aawdaw.data = internal global [10 x double] zeroinitializer
+@aawdaw = internal unnamed_addr constant double* getelementptr inbounds ([10 x double], [10 x double]* @aawdaw.data, i32 0, i32 0)
+@b = internal unnamed_addr constant double 0x4024000000000000
+@aaaa = internal unnamed_addr constant i32 137
+@llvm.global_ctors = appending global [1 x { i32, void ()*, i8* }] [{ i32, void ()*, i8* } { i32 65535, void ()* @global.init, i8* null }]
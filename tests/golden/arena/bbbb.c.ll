@@ -0,0 +1,355 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @print_arr(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%5 = alloca i8*
+%6 = zext i32 10 to i64
+%7 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %6)
+%8 = bitcast i8* %7 to i8*
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %8, i8* %carr, i32 10, i1 0)
+store i8* %8,i8** %5
+%9 = alloca i32
+store i32 %cn, i32* %9
+br label %10
+
+10:
+%11 = add i32 0, 0
+store i32 %11, i32* %1
+br label %12
+12:
+%13 = load i32, i32* %1
+%14 = load i32, i32* %9
+%15 = icmp slt i32 %13, %14
+br i1 %15, label %16, label %25
+
+16:
+%17 = load i8*, i8** %5
+%18 = load i32, i32* %1
+%19 = getelementptr inbounds i8, i8* %17, i32 %18
+%20 = load i8, i8* %19
+%21 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %20)
+br label %22
+22:
+%23 = load i32, i32* %1
+%24 = add i32 %23, 1
+store i32 %24, i32* %1
+br label %12
+
+25:
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %2, i8* %3, i8* %4)
+ret void
+}
+
+define internal void @sortAndPrint(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%6 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%7 = alloca i8*
+%8 = zext i32 10 to i64
+%9 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %8)
+%10 = bitcast i8* %9 to i8*
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %10, i8* %carr, i32 10, i1 0)
+store i8* %10,i8** %7
+%11 = alloca i32
+store i32 %cn, i32* %11
+br label %12
+
+12:
+%13 = add i32 0, 0
+store i32 %13, i32* %1
+br label %14
+14:
+%15 = load i32, i32* %1
+%16 = load i32, i32* %11
+%17 = sub i32 %16, 1
+%18 = icmp slt i32 %15, %17
+br i1 %18, label %19, label %68
+
+19:
+br label %20
+
+20:
+%21 = add i32 0, 0
+store i32 %21, i32* %2
+br label %22
+22:
+%23 = load i32, i32* %2
+%24 = load i32, i32* %11
+%25 = load i32, i32* %1
+%26 = sub i32 %24, %25
+%27 = sub i32 %26, 1
+%28 = icmp slt i32 %23, %27
+br i1 %28, label %29, label %64
+
+29:
+%30 = load i8*, i8** %7
+%31 = load i32, i32* %2
+%32 = getelementptr inbounds i8, i8* %30, i32 %31
+%33 = load i8, i8* %32
+%34 = load i8*, i8** %7
+%35 = load i32, i32* %2
+%36 = add i32 %35, 1
+%37 = getelementptr inbounds i8, i8* %34, i32 %36
+%38 = load i8, i8* %37
+%39 = icmp slt i8 %33, %38
+br i1 %39, label %40, label %60
+
+40:
+%41 = load i8*, i8** %7
+%42 = load i32, i32* %2
+%43 = add i32 %42, 1
+%44 = getelementptr inbounds i8, i8* %41, i32 %43
+%45 = load i8, i8* %44
+%46 = zext i8 %45 to i32
+store i32 %46, i32* %3
+%47 = load i8*, i8** %7
+%48 = load i32, i32* %2
+%49 = add i32 %48, 1
+%50 = getelementptr inbounds i8, i8* %47, i32 %49
+%51 = load i8*, i8** %7
+%52 = load i32, i32* %2
+%53 = getelementptr inbounds i8, i8* %51, i32 %52
+%54 = load i8, i8* %53
+store i8 %54, i8* %50
+%55 = load i8*, i8** %7
+%56 = load i32, i32* %2
+%57 = getelementptr inbounds i8, i8* %55, i32 %56
+%58 = load i32, i32* %3
+%59 = trunc i32 %58 to i8
+store i8 %59, i8* %57
+br label %60
+60:
+br label %61
+61:
+%62 = load i32, i32* %2
+%63 = add i32 %62, 1
+store i32 %63, i32* %2
+br label %22
+
+64:
+br label %65
+65:
+%66 = load i32, i32* %1
+%67 = add i32 %66, 1
+store i32 %67, i32* %1
+br label %14
+
+68:
+%69 = load i8*, i8** %7
+%70 = load i32, i32* %11
+call void @print_arr(i8* %69, i32 %70)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %4, i8* %5, i8* %6)
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i8*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca double
+%7 = alloca i1
+%8 = alloca double
+%9 = alloca i8
+%10 = alloca double
+%11 = alloca i32
+%12 = alloca i8*
+%13 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%14 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%15 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%16 = zext i32 10 to i64
+%17 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %16)
+%18 = bitcast i8* %17 to i8*
+store i8* %18, i8** %1
+%19 = zext i32 80 to i64
+%20 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %19)
+%21 = bitcast i8* %20 to i32*
+store i32* %21, i32** %2
+%22 = add i32 0, 10
+store i32 %22, i32* %3
+%23 = add i32 0, 0
+store i32 %23, i32* %4
+%24 = add i32 0, 0
+store i32 %24, i32* %5
+%25 = load i32, i32* %5
+%26 = sitofp i32 %25 to double
+store double %26, double* %6
+%27 = icmp ne i32 0, 0
+store i1 %27, i1* %7
+%28 = load i1, i1* %7
+%29 = sitofp i1 %28 to double
+store double %29, double* %8
+%30 = add i8 0, 97
+store i8 %30, i8* %9
+%31 = load i8, i8* %9
+%32 = sitofp i8 %31 to double
+store double %32, double* %10
+%33 = load double, double* %6
+%34 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %33)
+%35 = load double, double* %8
+%36 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %35)
+%37 = load double, double* %10
+%38 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %37)
+%39 = zext i32 100 to i64
+%40 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %39)
+%41 = bitcast i8* %40 to i8*
+call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* %41)
+store i8* %41, i8** %1 
+%43 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 98)
+br label %44
+
+44:
+%45 = add i32 0, 0
+store i32 %45, i32* %11
+br label %46
+46:
+%47 = load i32, i32* %11
+%48 = icmp slt i32 %47, 10
+br i1 %48, label %49, label %55
+
+49:
+%50 = load i32, i32* %11
+%51 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %50)
+br label %52
+52:
+%53 = load i32, i32* %11
+%54 = add i32 %53, 1
+store i32 %54, i32* %11
+br label %46
+
+55:
+%56 = zext i32 10 to i64
+%57 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %56)
+%58 = bitcast i8* %57 to i8*
+store i8* %58, i8** %12
+%59 = load i8*, i8** %1
+%60 = zext i32 10 to i64
+%61 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %60)
+%62 = bitcast i8* %61 to i8*
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %62, i8* %59, i32 10, i1 0)
+store i8* %62, i8** %12
+%63 = load i8*, i8** %12
+call void @sortAndPrint(i8* %63, i32 10)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %13, i8* %14, i8* %15)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
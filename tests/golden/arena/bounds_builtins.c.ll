@@ -0,0 +1,295 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @total(i32* %ca, i32 %cn) nounwind norecurse {
+%1 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%4 = alloca i32*
+%5 = zext i32 32 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %ca, i32 32, i1 0)
+store i32* %7,i32** %4
+%8 = alloca i32
+store i32 %cn, i32* %8
+%9 = load i32*, i32** %4
+%10 = load i32, i32* %8
+%11 = call i32 @array.sum.i32(i32* %9, i32 %10)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %1, i8* %2, i8* %3)
+ret i32 %11
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%6 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%7 = zext i32 32 to i64
+%8 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %7)
+%9 = bitcast i8* %8 to i32*
+store i32* %9, i32** %1
+store i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32** %2
+%10 = load i32*, i32** %1
+call void @array.fill.i32(i32* %10, i32 2, i32 8)
+%11 = load i32*, i32** %1
+%12 = call i32 @total(i32* %11, i32 8)
+%13 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %12)
+%14 = load i32*, i32** %1
+%15 = load i32*, i32** %2
+%16 = icmp sgt i32 3, 0
+%17 = select i1 %16, i32 3, i32 0
+%18 = mul i32 %17, 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %14, i32* %15, i32 %18, i1 false)
+%19 = load i32*, i32** %1
+call void @array.print.i32(i32* %19, i32 8)
+%20 = add i32 0, 5
+store i32 %20, i32* %3
+%21 = load i32*, i32** %1
+%22 = load i32*, i32** %2
+%23 = load i32, i32* %3
+%24 = icmp sgt i32 %23, 0
+%25 = select i1 %24, i32 %23, i32 0
+%26 = mul i32 %25, 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %21, i32* %22, i32 %26, i1 false)
+%27 = load i32*, i32** %1
+%28 = getelementptr inbounds i32, i32* %27, i32 4
+%29 = load i32, i32* %28
+%30 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %29)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %4, i8* %5, i8* %6)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+@const.0 = private unnamed_addr constant [3 x i32] [i32 1, i32 2, i32 3]
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  ret void
+}
+
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.vectorize.enable", i1 true}
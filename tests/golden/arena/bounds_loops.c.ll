@@ -0,0 +1,418 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @dot(i32* %ca, i32* %cb, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%6 = alloca i32*
+%7 = zext i32 64 to i64
+%8 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %7)
+%9 = bitcast i8* %8 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %9, i32* %ca, i32 64, i1 0)
+store i32* %9,i32** %6
+%10 = alloca i32*
+%11 = zext i32 64 to i64
+%12 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %11)
+%13 = bitcast i8* %12 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %13, i32* %cb, i32 64, i1 0)
+store i32* %13,i32** %10
+%14 = alloca i32
+store i32 %cn, i32* %14
+%15 = add i32 0, 0
+store i32 %15, i32* %1
+br label %16
+
+16:
+%17 = add i32 0, 0
+store i32 %17, i32* %2
+br label %18
+18:
+%19 = load i32, i32* %2
+%20 = load i32, i32* %14
+%21 = icmp slt i32 %19, %20
+br i1 %21, label %22, label %40
+
+22:
+%23 = load i32, i32* %1
+%24 = load i32*, i32** %6
+%25 = load i32, i32* %2
+%26 = getelementptr inbounds i32, i32* %24, i32 %25
+%27 = load i32, i32* %26
+%28 = load i32*, i32** %10
+%29 = load i32, i32* %14
+%30 = sub i32 %29, 1
+%31 = load i32, i32* %2
+%32 = sub i32 %30, %31
+%33 = getelementptr inbounds i32, i32* %28, i32 %32
+%34 = load i32, i32* %33
+%35 = mul i32 %27, %34
+%36 = add i32 %23, %35
+store i32 %36, i32* %1
+br label %37
+37:
+%38 = load i32, i32* %2
+%39 = add i32 %38, 1
+store i32 %39, i32* %2
+br label %18
+
+40:
+%41 = load i32, i32* %1
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret i32 %41
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32*
+%5 = alloca i32
+%6 = alloca i32
+%7 = alloca i32
+%8 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%9 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%10 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%11 = zext i32 64 to i64
+%12 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %11)
+%13 = bitcast i8* %12 to i32*
+store i32* %13, i32** %1
+%14 = zext i32 64 to i64
+%15 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %14)
+%16 = bitcast i8* %15 to i32*
+store i32* %16, i32** %2
+br label %17
+
+17:
+%18 = add i32 0, 0
+store i32 %18, i32* %3
+br label %19
+19:
+%20 = load i32, i32* %3
+%21 = icmp slt i32 %20, 16
+br i1 %21, label %22, label %35
+
+22:
+%23 = load i32*, i32** %1
+%24 = load i32, i32* %3
+%25 = getelementptr inbounds i32, i32* %23, i32 %24
+%26 = load i32, i32* %3
+store i32 %26, i32* %25
+%27 = load i32*, i32** %2
+%28 = load i32, i32* %3
+%29 = getelementptr inbounds i32, i32* %27, i32 %28
+%30 = load i32, i32* %3
+%31 = sub i32 16, %30
+store i32 %31, i32* %29
+br label %32
+32:
+%33 = load i32, i32* %3
+%34 = add i32 %33, 1
+store i32 %34, i32* %3
+br label %19
+
+35:
+%36 = load i32*, i32** %1
+%37 = load i32*, i32** %2
+%38 = call i32 @dot(i32* %36, i32* %37, i32 16)
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %38)
+%40 = load i32*, i32** %1
+%41 = load i32*, i32** %2
+%42 = call i32 @dot(i32* %40, i32* %41, i32 10)
+%43 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %42)
+%44 = zext i32 20 to i64
+%45 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %44)
+%46 = bitcast i8* %45 to i32*
+store i32* %46, i32** %4
+%47 = load i32*, i32** %4
+%48 = icmp sgt i32 5, 0
+%49 = select i1 %48, i32 5, i32 0
+%50 = mul i32 %49, 4
+%51 = bitcast i32* %47 to i8*
+call void @llvm.memset.p0i8.i32(i8* %51, i8 0, i32 %50, i1 false)
+br label %52
+
+52:
+%53 = add i32 0, 0
+store i32 %53, i32* %5
+br label %54
+54:
+%55 = load i32, i32* %5
+%56 = icmp slt i32 %55, 16
+br i1 %56, label %57, label %89
+
+57:
+%58 = load i32*, i32** %4
+%59 = load i32*, i32** %1
+%60 = load i32, i32* %5
+%61 = getelementptr inbounds i32, i32* %59, i32 %60
+%62 = load i32, i32* %61
+%63 = load i32*, i32** %1
+%64 = load i32, i32* %5
+%65 = getelementptr inbounds i32, i32* %63, i32 %64
+%66 = load i32, i32* %65
+%67 = sdiv i32 %66, 5
+%68 = mul i32 %67, 5
+%69 = sub i32 %62, %68
+%70 = getelementptr inbounds i32, i32* %58, i32 %69
+%71 = load i32*, i32** %4
+%72 = load i32*, i32** %1
+%73 = load i32, i32* %5
+%74 = getelementptr inbounds i32, i32* %72, i32 %73
+%75 = load i32, i32* %74
+%76 = load i32*, i32** %1
+%77 = load i32, i32* %5
+%78 = getelementptr inbounds i32, i32* %76, i32 %77
+%79 = load i32, i32* %78
+%80 = sdiv i32 %79, 5
+%81 = mul i32 %80, 5
+%82 = sub i32 %75, %81
+%83 = getelementptr inbounds i32, i32* %71, i32 %82
+%84 = load i32, i32* %83
+%85 = add i32 %84, 1
+store i32 %85, i32* %70
+br label %86
+86:
+%87 = load i32, i32* %5
+%88 = add i32 %87, 1
+store i32 %88, i32* %5
+br label %54
+
+89:
+%90 = load i32*, i32** %4
+call void @array.print.i32(i32* %90, i32 5)
+%91 = add i32 0, 2
+store i32 %91, i32* %6
+br label %92
+
+92:
+%93 = add i32 0, 1
+store i32 %93, i32* %7
+br label %94
+94:
+%95 = load i32, i32* %7
+%96 = icmp slt i32 %95, 14
+br i1 %96, label %97, label %117
+
+97:
+%98 = load i32*, i32** %1
+%99 = load i32, i32* %7
+%100 = load i32, i32* %6
+%101 = add i32 %99, %100
+%102 = getelementptr inbounds i32, i32* %98, i32 %101
+%103 = load i32*, i32** %1
+%104 = load i32, i32* %7
+%105 = sub i32 %104, 1
+%106 = getelementptr inbounds i32, i32* %103, i32 %105
+%107 = load i32, i32* %106
+%108 = load i32*, i32** %1
+%109 = load i32, i32* %7
+%110 = add i32 %109, 1
+%111 = getelementptr inbounds i32, i32* %108, i32 %110
+%112 = load i32, i32* %111
+%113 = add i32 %107, %112
+store i32 %113, i32* %102
+br label %114
+114:
+%115 = load i32, i32* %7
+%116 = add i32 %115, 2
+store i32 %116, i32* %7
+br label %94
+
+117:
+%118 = load i32*, i32** %1
+call void @array.print.i32(i32* %118, i32 16)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %8, i8* %9, i8* %10)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,326 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @set() nounwind norecurse {
+%1 = load i32*, i32** @ga
+%2 = getelementptr inbounds i32, i32* %1, i32 0
+%3 = add i32 0, 50
+store i32 %3, i32* %2
+%4 = load i32*, i32** @ga
+%5 = getelementptr inbounds i32, i32* %4, i32 1
+%6 = add i32 0, 60
+store i32 %6, i32* %5
+ret void
+}
+
+define internal i32 @f(i32* %ca) nounwind norecurse {
+%1 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%4 = alloca i32*
+%5 = zext i32 16 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %ca, i32 16, i1 0)
+store i32* %7,i32** %4
+call void @set()
+%8 = load i32*, i32** %4
+%9 = getelementptr inbounds i32, i32* %8, i32 0
+%10 = load i32, i32* %9
+%11 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %10)
+%12 = load i32*, i32** %4
+%13 = getelementptr inbounds i32, i32* %12, i32 1
+%14 = load i32, i32* %13
+%15 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %14)
+%16 = load i32*, i32** %4
+%17 = getelementptr inbounds i32, i32* %16, i32 0
+%18 = load i32, i32* %17
+%19 = load i32*, i32** %4
+%20 = getelementptr inbounds i32, i32* %19, i32 1
+%21 = load i32, i32* %20
+%22 = add i32 %18, %21
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %1, i8* %2, i8* %3)
+ret i32 %22
+}
+
+define internal i32 @g(i32* %ca) nounwind norecurse {
+%1 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%4 = alloca i32*
+%5 = zext i32 16 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %ca, i32 16, i1 0)
+store i32* %7,i32** %4
+%8 = load i32*, i32** @ga
+%9 = getelementptr inbounds i32, i32* %8, i32 0
+%10 = add i32 0, 70
+store i32 %10, i32* %9
+%11 = load i32*, i32** %4
+%12 = getelementptr inbounds i32, i32* %11, i32 0
+%13 = load i32, i32* %12
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %1, i8* %2, i8* %3)
+ret i32 %13
+}
+
+define internal i32 @sum(i32* %ca) nounwind norecurse {
+%1 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%4 = alloca i32*
+%5 = zext i32 16 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %ca, i32 16, i1 0)
+store i32* %7,i32** %4
+%8 = load i32*, i32** %4
+%9 = getelementptr inbounds i32, i32* %8, i32 0
+%10 = load i32, i32* %9
+%11 = load i32*, i32** %4
+%12 = getelementptr inbounds i32, i32* %11, i32 1
+%13 = load i32, i32* %12
+%14 = add i32 %10, %13
+%15 = load i32*, i32** %4
+%16 = getelementptr inbounds i32, i32* %15, i32 2
+%17 = load i32, i32* %16
+%18 = add i32 %14, %17
+%19 = load i32*, i32** %4
+%20 = getelementptr inbounds i32, i32* %19, i32 3
+%21 = load i32, i32* %20
+%22 = add i32 %18, %21
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %1, i8* %2, i8* %3)
+ret i32 %22
+}
+
+define internal void @replace() nounwind norecurse {
+%1 = alloca i32*
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32** %1
+%2 = load i32*, i32** %1
+%3 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %3, i32* %2, i32 16, i1 0)
+ret void
+}
+
+define internal i32 @peek(i32* %ca) nounwind norecurse {
+%1 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%4 = alloca i32*
+%5 = zext i32 16 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %ca, i32 16, i1 0)
+store i32* %7,i32** %4
+call void @replace()
+%8 = load i32*, i32** %4
+%9 = getelementptr inbounds i32, i32* %8, i32 0
+%10 = load i32, i32* %9
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %1, i8* %2, i8* %3)
+ret i32 %10
+}
+
+define internal i32 @snapshot() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%6 = zext i32 16 to i64
+%7 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %6)
+%8 = bitcast i8* %7 to i32*
+store i32* %8, i32** %1
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %2
+%9 = load i32*, i32** @ga
+%10 = zext i32 16 to i64
+%11 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %10)
+%12 = bitcast i8* %11 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %12, i32* %9, i32 16, i1 0)
+store i32* %12, i32** %1
+%13 = load i32*, i32** %2
+%14 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %14, i32* %13, i32 16, i1 0)
+%15 = load i32*, i32** %1
+%16 = getelementptr inbounds i32, i32* %15, i32 0
+%17 = load i32, i32* %16
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret i32 %17
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%5 = zext i32 16 to i64
+%6 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %5)
+%7 = bitcast i8* %6 to i32*
+store i32* %7, i32** %1
+%8 = load i32*, i32** @ga
+%9 = zext i32 16 to i64
+%10 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %9)
+%11 = bitcast i8* %10 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %11, i32* %8, i32 16, i1 0)
+store i32* %11, i32** %1
+call void @set()
+%12 = load i32*, i32** %1
+%13 = getelementptr inbounds i32, i32* %12, i32 0
+%14 = load i32, i32* %13
+%15 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %14)
+%16 = load i32*, i32** @ga
+%17 = getelementptr inbounds i32, i32* %16, i32 0
+%18 = add i32 0, 1
+store i32 %18, i32* %17
+%19 = load i32*, i32** @ga
+%20 = getelementptr inbounds i32, i32* %19, i32 1
+%21 = add i32 0, 2
+store i32 %21, i32* %20
+%22 = load i32*, i32** @ga
+%23 = call i32 @f(i32* %22)
+%24 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %23)
+%25 = load i32*, i32** @ga
+%26 = getelementptr inbounds i32, i32* %25, i32 0
+%27 = add i32 0, 1
+store i32 %27, i32* %26
+%28 = load i32*, i32** @ga
+%29 = call i32 @g(i32* %28)
+%30 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %29)
+%31 = load i32*, i32** @ga
+%32 = call i32 @sum(i32* %31)
+%33 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %32)
+%34 = load i32*, i32** @ga
+%35 = getelementptr inbounds i32, i32* %34, i32 0
+%36 = add i32 0, 1
+store i32 %36, i32* %35
+%37 = load i32*, i32** @ga
+%38 = call i32 @peek(i32* %37)
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %38)
+%40 = load i32*, i32** @ga
+%41 = getelementptr inbounds i32, i32* %40, i32 0
+%42 = add i32 0, 1
+store i32 %42, i32* %41
+%43 = call i32 @snapshot()
+%44 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %43)
+%45 = load i32*, i32** @ga
+%46 = getelementptr inbounds i32, i32* %45, i32 0
+%47 = load i32, i32* %46
+%48 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %47)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %2, i8* %3, i8* %4)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+@const.0 = private unnamed_addr constant [4 x i32] [i32 9, i32 8, i32 7, i32 6]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 5, i32 5, i32 5, i32 5]
+@ga.data = internal global [4 x i32] [i32 1, i32 2, i32 3, i32 4]
+@ga = internal global i32* getelementptr inbounds ([4 x i32], [4 x i32]* @ga.data, i32 0, i32 0)
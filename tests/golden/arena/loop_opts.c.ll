@@ -0,0 +1,381 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @square(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = load i32, i32* %1
+%3 = load i32, i32* %1
+%4 = mul i32 %2, %3
+ret i32 %4
+}
+
+define internal i32 @fib(i32 %cn) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = load i32, i32* %1
+%3 = icmp slt i32 %2, 2
+br i1 %3, label %4, label %6
+
+4:
+%5 = load i32, i32* %1
+ret i32 %5
+6:
+%7 = load i32, i32* %1
+%8 = sub i32 %7, 1
+%9 = call i32 @fib(i32 %8)
+%10 = load i32, i32* %1
+%11 = sub i32 %10, 2
+%12 = call i32 @fib(i32 %11)
+%13 = add i32 %9, %12
+ret i32 %13
+}
+
+define internal i32 @unused(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = load i32, i32* %1
+%3 = add i32 %2, 1
+ret i32 %3
+}
+
+define internal i32 @weighted(i32* %ca, i32 %cn, i32 %cscale) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%6 = alloca i32*
+%7 = zext i32 32 to i64
+%8 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %7)
+%9 = bitcast i8* %8 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %9, i32* %ca, i32 32, i1 0)
+store i32* %9,i32** %6
+%10 = alloca i32
+store i32 %cn, i32* %10
+%11 = alloca i32
+store i32 %cscale, i32* %11
+%12 = add i32 0, 0
+store i32 %12, i32* %1
+br label %13
+
+13:
+%14 = add i32 0, 0
+store i32 %14, i32* %2
+br label %15
+15:
+%16 = load i32, i32* %2
+%17 = load i32, i32* %10
+%18 = icmp slt i32 %16, %17
+br i1 %18, label %19, label %34
+
+19:
+%20 = load i32, i32* %1
+%21 = load i32*, i32** %6
+%22 = load i32, i32* %2
+%23 = getelementptr inbounds i32, i32* %21, i32 %22
+%24 = load i32, i32* %23
+%25 = load i32, i32* %11
+%26 = load i32, i32* %11
+%27 = mul i32 %25, %26
+%28 = add i32 %27, 1
+%29 = mul i32 %24, %28
+%30 = add i32 %20, %29
+store i32 %30, i32* %1
+br label %31
+31:
+%32 = load i32, i32* %2
+%33 = add i32 %32, 1
+store i32 %33, i32* %2
+br label %15
+
+34:
+%35 = load i32, i32* %1
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret i32 %35
+}
+
+define internal double @average(i32* %ca, i32 %cn) nounwind norecurse {
+%1 = alloca double
+%2 = alloca i32
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%6 = alloca i32*
+%7 = zext i32 32 to i64
+%8 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %7)
+%9 = bitcast i8* %8 to i32*
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %9, i32* %ca, i32 32, i1 0)
+store i32* %9,i32** %6
+%10 = alloca i32
+store i32 %cn, i32* %10
+%11 = sitofp i32 0 to double
+store double %11, double* %1
+br label %12
+
+12:
+%13 = add i32 0, 0
+store i32 %13, i32* %2
+br label %14
+14:
+%15 = load i32, i32* %2
+%16 = load i32, i32* %10
+%17 = icmp slt i32 %15, %16
+br i1 %17, label %18, label %29
+
+18:
+%19 = load double, double* %1
+%20 = load i32*, i32** %6
+%21 = load i32, i32* %2
+%22 = getelementptr inbounds i32, i32* %20, i32 %21
+%23 = load i32, i32* %22
+%24 = sitofp i32 %23 to double
+%25 = fadd double %19, %24
+store double %25, double* %1
+br label %26
+26:
+%27 = load i32, i32* %2
+%28 = add i32 %27, 1
+store i32 %28, i32* %2
+br label %14, !llvm.loop !0
+
+29:
+%30 = load double, double* %1
+%31 = load i32, i32* %10
+%32 = sitofp i32 %31 to double
+%33 = fdiv double %30, %32
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret double %33
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i8
+%6 = alloca i32
+%7 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%8 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%9 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%10 = zext i32 32 to i64
+%11 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %10)
+%12 = bitcast i8* %11 to i32*
+store i32* %12, i32** %1
+br label %13
+
+13:
+%14 = add i32 0, 0
+store i32 %14, i32* %2
+br label %15
+15:
+%16 = load i32, i32* %2
+%17 = icmp slt i32 %16, 8
+br i1 %17, label %18, label %29
+
+18:
+%19 = load i32*, i32** %1
+%20 = load i32, i32* %2
+%21 = getelementptr inbounds i32, i32* %19, i32 %20
+%22 = load i32, i32* %2
+%23 = call i32 @square(i32 %22)
+%24 = load i32, i32* %2
+%25 = sub i32 %23, %24
+store i32 %25, i32* %21
+br label %26
+26:
+%27 = load i32, i32* %2
+%28 = add i32 %27, 1
+store i32 %28, i32* %2
+br label %15, !llvm.loop !4
+
+29:
+%30 = add i32 0, 3
+store i32 %30, i32* %3
+%31 = add i32 0, 0
+store i32 %31, i32* %4
+br label %32
+
+32:
+%33 = load i32, i32* %4
+%34 = icmp slt i32 %33, 8
+br i1 %34, label %35, label %58
+
+35:
+%36 = load i32*, i32** %1
+%37 = load i32, i32* %4
+%38 = getelementptr inbounds i32, i32* %36, i32 %37
+%39 = load i32*, i32** %1
+%40 = load i32, i32* %4
+%41 = getelementptr inbounds i32, i32* %39, i32 %40
+%42 = load i32, i32* %41
+%43 = load i32, i32* %3
+%44 = mul i32 %43, 2
+%45 = add i32 %44, 1
+%46 = add i32 %42, %45
+%47 = load i32*, i32** %1
+%48 = load i32, i32* %4
+%49 = getelementptr inbounds i32, i32* %47, i32 %48
+%50 = load i32, i32* %49
+%51 = load i32, i32* %3
+%52 = mul i32 %51, 2
+%53 = add i32 %52, 1
+%54 = mul i32 %50, %53
+%55 = add i32 %46, %54
+store i32 %55, i32* %38
+%56 = load i32, i32* %4
+%57 = add i32 %56, 1
+store i32 %57, i32* %4
+br label %32
+58:
+%59 = load i32*, i32** %1
+%60 = call i32 @weighted(i32* %59, i32 8, i32 2)
+%61 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %60)
+%62 = load i32*, i32** %1
+%63 = call double @average(i32* %62, i32 8)
+%64 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %63)
+%65 = call i32 @fib(i32 15)
+%66 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %65)
+%67 = call i32 @square(i32 12)
+%68 = call i32 @square(i32 5)
+%69 = add i32 %67, %68
+%70 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %69)
+%71 = trunc i32 200 to i8
+store i8 %71, i8* %5
+%72 = load i8, i8* %5
+%73 = zext i8 %72 to i32
+store i32 %73, i32* %6
+%74 = load i32, i32* %6
+%75 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %74)
+%76 = icmp ne i32 0, 0
+br i1 %76, label %77, label %80
+
+77:
+%78 = call i32 @unused(i32 1)
+%79 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %78)
+br label %80
+80:
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %7, i8* %8, i8* %9)
+ret i32 0
+%82 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 7)
+unreachable
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+
+!0 = distinct !{!0, !1, !2, !3}
+!1 = !{!"llvm.loop.vectorize.width", i32 4}
+!2 = !{!"llvm.loop.vectorize.enable", i1 true}
+!3 = !{!"llvm.loop.interleave.count", i32 2}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.unroll.count", i32 2}
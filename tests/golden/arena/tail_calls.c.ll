@@ -0,0 +1,130 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @sum_to(i32 %cn, i32 %cacc) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = alloca i32
+store i32 %cacc, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %1
+%5 = icmp eq i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %2
+ret i32 %7
+8:
+%9 = load i32, i32* %1
+%10 = sub i32 %9, 1
+%11 = load i32, i32* %2
+%12 = load i32, i32* %1
+%13 = add i32 %11, %12
+store i32 %10, i32* %1
+store i32 %13, i32* %2
+br label %3
+}
+
+define internal i32 @gcd(i32 %ca, i32 %cb) nounwind readnone {
+%1 = alloca i32
+store i32 %ca, i32* %1
+%2 = alloca i32
+store i32 %cb, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %2
+%5 = icmp eq i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %1
+ret i32 %7
+8:
+%9 = load i32, i32* %2
+%10 = load i32, i32* %1
+%11 = load i32, i32* %1
+%12 = load i32, i32* %2
+%13 = sdiv i32 %11, %12
+%14 = load i32, i32* %2
+%15 = mul i32 %13, %14
+%16 = sub i32 %10, %15
+store i32 %9, i32* %1
+store i32 %16, i32* %2
+br label %3
+}
+
+define internal i32 @count_down(i32 %cn, i32 %csteps) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = alloca i32
+store i32 %csteps, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %1
+%5 = icmp sle i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %2
+ret i32 %7
+8:
+%9 = load i32, i32* %1
+%10 = load i32, i32* %1
+%11 = sdiv i32 %10, 2
+%12 = mul i32 %11, 2
+%13 = sub i32 %9, %12
+%14 = icmp eq i32 %13, 0
+br i1 %14, label %15, label %20
+
+15:
+%16 = load i32, i32* %1
+%17 = sdiv i32 %16, 2
+%18 = load i32, i32* %2
+%19 = add i32 %18, 1
+store i32 %17, i32* %1
+store i32 %19, i32* %2
+br label %3
+20:
+%21 = load i32, i32* %1
+%22 = sub i32 %21, 1
+%23 = load i32, i32* %2
+%24 = add i32 %23, 1
+store i32 %22, i32* %1
+store i32 %24, i32* %2
+br label %3
+}
+
+define i32 @main() nounwind norecurse {
+%1 = call i32 @sum_to(i32 50000, i32 0)
+%2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %1)
+%3 = call i32 @gcd(i32 1071, i32 462)
+%4 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %3)
+%5 = call i32 @count_down(i32 1000000, i32 0)
+%6 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %5)
+ret i32 0
+}
+
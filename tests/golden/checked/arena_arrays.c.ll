@@ -0,0 +1,360 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32* @squares(i32 %cn) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+store i32 %cn, i32* %4
+%5 = mul i32 %cn, 4
+%6 = zext i32 %5 to i64
+%7 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.heap, i64 %6)
+%8 = bitcast i8* %7 to i32*
+store i32* %8, i32** %1
+store i32 %cn, i32* %2
+br label %9
+
+9:
+%10 = add i32 0, 0
+store i32 %10, i32* %3
+%11 = load i32, i32* %4
+%12 = load i32*, i32** %1
+%13 = sext i32 %10 to i64
+%14 = sext i32 %11 to i64
+%15 = sub i64 %14, 1
+%16 = add i64 %15, 1
+%17 = icmp sle i64 %16, 2147483647
+%18 = add i64 %13, 0
+%19 = add i64 %15, 0
+%20 = icmp sge i64 %18, 0
+%21 = load i32, i32* %2
+%22 = sext i32 %21 to i64
+%23 = icmp slt i64 %19, %22
+%24 = and i1 %17, %20
+%25 = and i1 %24, %23
+br i1 %25, label %26, label %37
+26:
+%27 = load i32, i32* %3
+%28 = icmp slt i32 %27, %11
+br i1 %28, label %29, label %52
+
+29:
+%30 = load i32, i32* %3
+%31 = sext i32 %30 to i64
+%32 = getelementptr inbounds i32, i32* %12, i64 %31
+%33 = mul nsw i32 %30, %30
+store i32 %33, i32* %32
+br label %34
+34:
+%35 = load i32, i32* %3
+%36 = add nsw i32 %35, 1
+store i32 %36, i32* %3
+br label %26
+
+37:
+%38 = load i32, i32* %3
+%39 = icmp slt i32 %38, %11
+br i1 %39, label %40, label %52
+
+40:
+%41 = load i32, i32* %3
+%42 = load i32, i32* %2
+%43 = icmp ult i32 %41, %42
+br i1 %43, label %45, label %44
+44:
+call void @array.bounds_error(i32 %41)
+unreachable
+45:
+%46 = sext i32 %41 to i64
+%47 = getelementptr inbounds i32, i32* %12, i64 %46
+%48 = mul nsw i32 %41, %41
+store i32 %48, i32* %47
+br label %49
+49:
+%50 = load i32, i32* %3
+%51 = add nsw i32 %50, 1
+store i32 %51, i32* %3
+br label %37
+
+52:
+%53 = load i32*, i32** %1
+ret i32* %53
+}
+
+define internal i32 @partial(i32 %cdepth) nounwind {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%6 = alloca i32
+store i32 %cdepth, i32* %6
+%7 = add nsw i32 %cdepth, 1
+%8 = mul i32 %7, 4
+%9 = zext i32 %8 to i64
+%10 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %9)
+%11 = bitcast i8* %10 to i32*
+store i32* %11, i32** %1
+store i32 %7, i32* %2
+%12 = icmp sle i32 %7, %7
+br i1 %12, label %14, label %13
+13:
+call void @array.bounds_error(i32 %7)
+unreachable
+14:
+call void @array.fill.i32(i32* %11, i32 %cdepth, i32 %7)
+%15 = icmp eq i32 %cdepth, 0
+br i1 %15, label %16, label %17
+
+16:
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret i32 0
+17:
+%18 = load i32*, i32** %1
+%19 = load i32, i32* %6
+%20 = add nsw i32 %19, 1
+%21 = load i32, i32* %2
+%22 = icmp sle i32 %20, %21
+br i1 %22, label %24, label %23
+23:
+call void @array.bounds_error(i32 %20)
+unreachable
+24:
+%25 = call i32 @array.sum.i32(i32* %18, i32 %20)
+%26 = sub nsw i32 %19, 1
+%27 = call i32 @partial(i32 %26)
+%28 = add nsw i32 %25, %27
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %3, i8* %4, i8* %5)
+ret i32 %28
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32
+%5 = alloca i32*
+%6 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%7 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%8 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%9 = add i32 0, 0
+store i32 %9, i32* %1
+br label %10
+
+10:
+%11 = add i32 0, 1
+store i32 %11, i32* %2
+br label %12
+12:
+%13 = load i32, i32* %2
+%14 = icmp slt i32 %13, 200
+br i1 %14, label %15, label %30
+
+15:
+%16 = load i32, i32* %2
+%17 = call i32* @squares(i32 %16)
+store i32* %17, i32** %3 
+store i32 2147483647, i32* %4
+%18 = load i32, i32* %1
+%19 = sub nsw i32 %16, 1
+%20 = icmp ult i32 %19, 2147483647
+br i1 %20, label %22, label %21
+21:
+call void @array.bounds_error(i32 %19)
+unreachable
+22:
+%23 = sext i32 %19 to i64
+%24 = getelementptr inbounds i32, i32* %17, i64 %23
+%25 = load i32, i32* %24
+%26 = add nsw i32 %18, %25
+store i32 %26, i32* %1
+br label %27
+27:
+%28 = load i32, i32* %2
+%29 = add nsw i32 %28, 1
+store i32 %29, i32* %2
+br label %12
+
+30:
+%31 = load i32, i32* %1
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = call i32 @partial(i32 30)
+%34 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %33)
+%35 = zext i32 80000 to i64
+%36 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %35)
+%37 = bitcast i8* %36 to i32*
+store i32* %37, i32** %5
+call void @array.fill.i32(i32* %37, i32 3, i32 20000)
+%38 = call i32 @array.sum.i32(i32* %37, i32 20000)
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %38)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %6, i8* %7, i8* %8)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  ret void
+}
+
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add nsw i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,380 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @print_arr(i8* noalias readonly %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i8*
+store i8* %carr, i8** %2
+%3 = alloca i32
+store i32 %cn, i32* %3
+br label %4
+
+4:
+%5 = add i32 0, 0
+store i32 %5, i32* %1
+%6 = load i32, i32* %3
+%7 = load i8*, i8** %2
+%8 = sext i32 %5 to i64
+%9 = sext i32 %6 to i64
+%10 = sub i64 %9, 1
+%11 = add i64 %10, 1
+%12 = icmp sle i64 %11, 2147483647
+%13 = add i64 %8, 0
+%14 = add i64 %10, 0
+%15 = icmp sge i64 %13, 0
+%16 = icmp slt i64 %14, 10
+%17 = and i1 %12, %15
+%18 = and i1 %17, %16
+br i1 %18, label %19, label %31
+19:
+%20 = load i32, i32* %1
+%21 = icmp slt i32 %20, %6
+br i1 %21, label %22, label %46
+
+22:
+%23 = load i32, i32* %1
+%24 = sext i32 %23 to i64
+%25 = getelementptr inbounds i8, i8* %7, i64 %24
+%26 = load i8, i8* %25
+%27 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %26)
+br label %28
+28:
+%29 = load i32, i32* %1
+%30 = add nsw i32 %29, 1
+store i32 %30, i32* %1
+br label %19
+
+31:
+%32 = load i32, i32* %1
+%33 = icmp slt i32 %32, %6
+br i1 %33, label %34, label %46
+
+34:
+%35 = load i32, i32* %1
+%36 = icmp ult i32 %35, 10
+br i1 %36, label %38, label %37
+37:
+call void @array.bounds_error(i32 %35)
+unreachable
+38:
+%39 = sext i32 %35 to i64
+%40 = getelementptr inbounds i8, i8* %7, i64 %39
+%41 = load i8, i8* %40
+%42 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %41)
+br label %43
+43:
+%44 = load i32, i32* %1
+%45 = add nsw i32 %44, 1
+store i32 %45, i32* %1
+br label %31
+
+46:
+ret void
+}
+
+define internal void @sortAndPrint(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i8*
+%5 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %5, i8* %carr, i32 10, i1 0)
+store i8* %5,i8** %4
+%6 = alloca i32
+store i32 %cn, i32* %6
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %1
+%9 = load i32, i32* %6
+%10 = sub nsw i32 %9, 1
+%11 = load i8*, i8** %4
+br label %12
+12:
+%13 = load i32, i32* %1
+%14 = icmp slt i32 %13, %10
+br i1 %14, label %15, label %134
+
+15:
+br label %16
+
+16:
+%17 = add i32 0, 0
+store i32 %17, i32* %2
+%18 = load i32, i32* %1
+%19 = sub nsw i32 %9, %18
+%20 = sub nsw i32 %19, 1
+%21 = sext i32 %17 to i64
+%22 = sext i32 %20 to i64
+%23 = sub i64 %22, 1
+%24 = add i64 %23, 1
+%25 = icmp sle i64 %24, 2147483647
+%26 = add i64 %21, 0
+%27 = add i64 %23, 0
+%28 = icmp sge i64 %26, 0
+%29 = icmp slt i64 %27, 10
+%30 = add i64 %21, 1
+%31 = add i64 %23, 1
+%32 = icmp sge i64 %30, 0
+%33 = icmp slt i64 %31, 10
+%34 = add i64 %21, 1
+%35 = add i64 %23, 1
+%36 = icmp sge i64 %34, 0
+%37 = icmp slt i64 %35, 10
+%38 = add i64 %21, 1
+%39 = add i64 %23, 1
+%40 = icmp sge i64 %38, 0
+%41 = icmp slt i64 %39, 10
+%42 = add i64 %21, 0
+%43 = add i64 %23, 0
+%44 = icmp sge i64 %42, 0
+%45 = icmp slt i64 %43, 10
+%46 = add i64 %21, 0
+%47 = add i64 %23, 0
+%48 = icmp sge i64 %46, 0
+%49 = icmp slt i64 %47, 10
+%50 = and i1 %25, %28
+%51 = and i1 %50, %29
+%52 = and i1 %51, %32
+%53 = and i1 %52, %33
+%54 = and i1 %53, %36
+%55 = and i1 %54, %37
+%56 = and i1 %55, %40
+%57 = and i1 %56, %41
+%58 = and i1 %57, %44
+%59 = and i1 %58, %45
+%60 = and i1 %59, %48
+%61 = and i1 %60, %49
+br i1 %61, label %62, label %90
+62:
+%63 = load i32, i32* %2
+%64 = icmp slt i32 %63, %20
+br i1 %64, label %65, label %130
+
+65:
+%66 = load i32, i32* %2
+%67 = sext i32 %66 to i64
+%68 = getelementptr inbounds i8, i8* %11, i64 %67
+%69 = load i8, i8* %68
+%70 = add nsw i32 %66, 1
+%71 = sext i32 %70 to i64
+%72 = getelementptr inbounds i8, i8* %11, i64 %71
+%73 = load i8, i8* %72
+%74 = icmp slt i8 %69, %73
+br i1 %74, label %75, label %86
+
+75:
+%76 = load i32, i32* %2
+%77 = add nsw i32 %76, 1
+%78 = sext i32 %77 to i64
+%79 = getelementptr inbounds i8, i8* %11, i64 %78
+%80 = load i8, i8* %79
+%81 = zext i8 %80 to i32
+store i32 %81, i32* %3
+%82 = sext i32 %76 to i64
+%83 = getelementptr inbounds i8, i8* %11, i64 %82
+%84 = load i8, i8* %83
+store i8 %84, i8* %79
+%85 = trunc i32 %81 to i8
+store i8 %85, i8* %83
+br label %86
+86:
+br label %87
+87:
+%88 = load i32, i32* %2
+%89 = add nsw i32 %88, 1
+store i32 %89, i32* %2
+br label %62
+
+90:
+%91 = load i32, i32* %2
+%92 = icmp slt i32 %91, %20
+br i1 %92, label %93, label %130
+
+93:
+%94 = load i32, i32* %2
+%95 = icmp ult i32 %94, 10
+br i1 %95, label %97, label %96
+96:
+call void @array.bounds_error(i32 %94)
+unreachable
+97:
+%98 = sext i32 %94 to i64
+%99 = getelementptr inbounds i8, i8* %11, i64 %98
+%100 = load i8, i8* %99
+%101 = add nsw i32 %94, 1
+%102 = icmp ult i32 %101, 10
+br i1 %102, label %104, label %103
+103:
+call void @array.bounds_error(i32 %101)
+unreachable
+104:
+%105 = sext i32 %101 to i64
+%106 = getelementptr inbounds i8, i8* %11, i64 %105
+%107 = load i8, i8* %106
+%108 = icmp slt i8 %100, %107
+br i1 %108, label %109, label %126
+
+109:
+%110 = load i32, i32* %2
+%111 = add nsw i32 %110, 1
+%112 = icmp ult i32 %111, 10
+br i1 %112, label %114, label %113
+113:
+call void @array.bounds_error(i32 %111)
+unreachable
+114:
+%115 = sext i32 %111 to i64
+%116 = getelementptr inbounds i8, i8* %11, i64 %115
+%117 = load i8, i8* %116
+%118 = zext i8 %117 to i32
+store i32 %118, i32* %3
+%119 = icmp ult i32 %110, 10
+br i1 %119, label %121, label %120
+120:
+call void @array.bounds_error(i32 %110)
+unreachable
+121:
+%122 = sext i32 %110 to i64
+%123 = getelementptr inbounds i8, i8* %11, i64 %122
+%124 = load i8, i8* %123
+store i8 %124, i8* %116
+%125 = trunc i32 %118 to i8
+store i8 %125, i8* %123
+br label %126
+126:
+br label %127
+127:
+%128 = load i32, i32* %2
+%129 = add nsw i32 %128, 1
+store i32 %129, i32* %2
+br label %90
+
+130:
+br label %131
+131:
+%132 = load i32, i32* %1
+%133 = add nsw i32 %132, 1
+store i32 %133, i32* %1
+br label %12
+
+134:
+%135 = load i8*, i8** %4
+%136 = load i32, i32* %6
+call void @print_arr(i8* %135, i32 %136)
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i8*
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca i32
+%7 = alloca double
+%8 = alloca i1
+%9 = alloca double
+%10 = alloca i8
+%11 = alloca double
+%12 = alloca i32
+%13 = alloca i8*
+%14 = alloca i32
+%15 = alloca i8, i32 10
+store i8* %15, i8** %1
+store i32 10, i32* %2
+%16 = alloca i32, i32 20
+store i32* %16, i32** %3
+%17 = add i32 0, 10
+store i32 %17, i32* %4
+%18 = add i32 0, 0
+store i32 %18, i32* %5
+%19 = add i32 0, 0
+store i32 %19, i32* %6
+%20 = sitofp i32 %19 to double
+store double %20, double* %7
+%21 = icmp ne i32 0, 0
+store i1 %21, i1* %8
+%22 = sitofp i1 %21 to double
+store double %22, double* %9
+%23 = add i8 0, 97
+store i8 %23, i8* %10
+%24 = sitofp i8 %23 to double
+store double %24, double* %11
+%25 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %20)
+%26 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %22)
+%27 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %24)
+%28 = alloca i8, i32 100
+call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* %28)
+store i8* %28, i8** %1 
+store i32 2147483647, i32* %2
+%30 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 98)
+br label %31
+
+31:
+%32 = add i32 0, 0
+store i32 %32, i32* %12
+br label %33
+33:
+%34 = load i32, i32* %12
+%35 = icmp slt i32 %34, 10
+br i1 %35, label %36, label %42
+
+36:
+%37 = load i32, i32* %12
+%38 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %37)
+br label %39
+39:
+%40 = load i32, i32* %12
+%41 = add nsw i32 %40, 1
+store i32 %41, i32* %12
+br label %33
+
+42:
+%43 = alloca i8, i32 10
+store i8* %43, i8** %13
+store i32 10, i32* %14
+store i32 10, i32* %14
+%44 = load i8*, i8** %1
+%45 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %45, i8* %44, i32 10, i1 0)
+store i8* %45, i8** %13
+call void @sortAndPrint(i8* %45, i32 10)
+ret i32 0
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
@@ -0,0 +1,211 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @total(i32* noalias readonly %ca, i32 %cn) nounwind norecurse {
+%1 = alloca i32*
+store i32* %ca, i32** %1
+%2 = alloca i32
+store i32 %cn, i32* %2
+%3 = icmp sle i32 %cn, 8
+br i1 %3, label %5, label %4
+4:
+call void @array.bounds_error(i32 %cn)
+unreachable
+5:
+%6 = call i32 @array.sum.i32(i32* %ca, i32 %cn)
+ret i32 %6
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32, i32 8
+store i32* %4, i32** %1
+store i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32** %2
+call void @array.fill.i32(i32* %4, i32 2, i32 8)
+%5 = call i32 @total(i32* %4, i32 8)
+%6 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %5)
+%7 = icmp sgt i32 3, 0
+%8 = select i1 %7, i32 3, i32 0
+%9 = mul i32 %8, 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32 %9, i1 false)
+call void @array.print.i32(i32* %4, i32 8)
+%10 = add i32 0, 5
+store i32 %10, i32* %3
+%11 = icmp sle i32 %10, 8
+br i1 %11, label %13, label %12
+12:
+call void @array.bounds_error(i32 %10)
+unreachable
+13:
+%14 = icmp sle i32 %10, 3
+br i1 %14, label %16, label %15
+15:
+call void @array.bounds_error(i32 %10)
+unreachable
+16:
+%17 = icmp sgt i32 %10, 0
+%18 = select i1 %17, i32 %10, i32 0
+%19 = mul i32 %18, 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32 %19, i1 false)
+%20 = getelementptr inbounds i32, i32* %4, i64 4
+%21 = load i32, i32* %20
+%22 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %21)
+ret i32 0
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add nsw i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+@const.0 = private unnamed_addr constant [3 x i32] [i32 1, i32 2, i32 3]
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  ret void
+}
+
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,146 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca i32, i32 6
+store i32* %6, i32** %1
+%7 = add i32 0, 8
+store i32 %7, i32* %2
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %3
+%10 = load i32*, i32** %1
+br label %11
+11:
+%12 = load i32, i32* %3
+%13 = icmp slt i32 %12, 6
+br i1 %13, label %14, label %22
+
+14:
+%15 = load i32, i32* %3
+%16 = sext i32 %15 to i64
+%17 = getelementptr inbounds i32, i32* %10, i64 %16
+%18 = mul nsw i32 %15, %15
+store i32 %18, i32* %17
+br label %19
+19:
+%20 = load i32, i32* %3
+%21 = add nsw i32 %20, 1
+store i32 %21, i32* %3
+br label %11
+
+22:
+%23 = add i32 0, 0
+store i32 %23, i32* %4
+br label %24
+
+24:
+%25 = add i32 0, 0
+store i32 %25, i32* %5
+%26 = load i32, i32* %2
+%27 = load i32*, i32** %1
+%28 = sext i32 %25 to i64
+%29 = sext i32 %26 to i64
+%30 = sub i64 %29, 1
+%31 = add i64 %30, 1
+%32 = icmp sle i64 %31, 2147483647
+%33 = add i64 %28, 0
+%34 = add i64 %30, 0
+%35 = icmp sge i64 %33, 0
+%36 = icmp slt i64 %34, 6
+%37 = and i1 %32, %35
+%38 = and i1 %37, %36
+br i1 %38, label %39, label %53
+39:
+%40 = load i32, i32* %5
+%41 = icmp slt i32 %40, %26
+br i1 %41, label %42, label %70
+
+42:
+%43 = load i32, i32* %4
+%44 = load i32, i32* %5
+%45 = sext i32 %44 to i64
+%46 = getelementptr inbounds i32, i32* %27, i64 %45
+%47 = load i32, i32* %46
+%48 = add nsw i32 %43, %47
+store i32 %48, i32* %4
+%49 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %48)
+br label %50
+50:
+%51 = load i32, i32* %5
+%52 = add nsw i32 %51, 1
+store i32 %52, i32* %5
+br label %39
+
+53:
+%54 = load i32, i32* %5
+%55 = icmp slt i32 %54, %26
+br i1 %55, label %56, label %70
+
+56:
+%57 = load i32, i32* %4
+%58 = load i32, i32* %5
+%59 = icmp ult i32 %58, 6
+br i1 %59, label %61, label %60
+60:
+call void @array.bounds_error(i32 %58)
+unreachable
+61:
+%62 = sext i32 %58 to i64
+%63 = getelementptr inbounds i32, i32* %27, i64 %62
+%64 = load i32, i32* %63
+%65 = add nsw i32 %57, %64
+store i32 %65, i32* %4
+%66 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %65)
+br label %67
+67:
+%68 = load i32, i32* %5
+%69 = add nsw i32 %68, 1
+store i32 %69, i32* %5
+br label %53
+
+70:
+ret i32 0
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
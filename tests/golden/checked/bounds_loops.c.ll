@@ -0,0 +1,402 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @dot(i32* noalias readonly %ca, i32* noalias readonly %cb, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32*
+store i32* %cb, i32** %4
+%5 = alloca i32
+store i32 %cn, i32* %5
+%6 = add i32 0, 0
+store i32 %6, i32* %1
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %2
+%9 = load i32, i32* %5
+%10 = load i32*, i32** %3
+%11 = load i32*, i32** %4
+%12 = sub nsw i32 %9, 1
+%13 = sext i32 %8 to i64
+%14 = sext i32 %9 to i64
+%15 = sub i64 %14, 1
+%16 = add i64 %15, 1
+%17 = icmp sle i64 %16, 2147483647
+%18 = add i64 %13, 0
+%19 = add i64 %15, 0
+%20 = icmp sge i64 %18, 0
+%21 = icmp slt i64 %19, 16
+%22 = and i1 %17, %20
+%23 = and i1 %22, %21
+br i1 %23, label %24, label %45
+24:
+%25 = load i32, i32* %2
+%26 = icmp slt i32 %25, %9
+br i1 %26, label %27, label %69
+
+27:
+%28 = load i32, i32* %1
+%29 = load i32, i32* %2
+%30 = sext i32 %29 to i64
+%31 = getelementptr inbounds i32, i32* %10, i64 %30
+%32 = load i32, i32* %31
+%33 = sub nsw i32 %12, %29
+%34 = icmp ult i32 %33, 16
+br i1 %34, label %36, label %35
+35:
+call void @array.bounds_error(i32 %33)
+unreachable
+36:
+%37 = sext i32 %33 to i64
+%38 = getelementptr inbounds i32, i32* %11, i64 %37
+%39 = load i32, i32* %38
+%40 = mul nsw i32 %32, %39
+%41 = add nsw i32 %28, %40
+store i32 %41, i32* %1
+br label %42
+42:
+%43 = load i32, i32* %2
+%44 = add nsw i32 %43, 1
+store i32 %44, i32* %2
+br label %24
+
+45:
+%46 = load i32, i32* %2
+%47 = icmp slt i32 %46, %9
+br i1 %47, label %48, label %69
+
+48:
+%49 = load i32, i32* %1
+%50 = load i32, i32* %2
+%51 = icmp ult i32 %50, 16
+br i1 %51, label %53, label %52
+52:
+call void @array.bounds_error(i32 %50)
+unreachable
+53:
+%54 = sext i32 %50 to i64
+%55 = getelementptr inbounds i32, i32* %10, i64 %54
+%56 = load i32, i32* %55
+%57 = sub nsw i32 %12, %50
+%58 = icmp ult i32 %57, 16
+br i1 %58, label %60, label %59
+59:
+call void @array.bounds_error(i32 %57)
+unreachable
+60:
+%61 = sext i32 %57 to i64
+%62 = getelementptr inbounds i32, i32* %11, i64 %61
+%63 = load i32, i32* %62
+%64 = mul nsw i32 %56, %63
+%65 = add nsw i32 %49, %64
+store i32 %65, i32* %1
+br label %66
+66:
+%67 = load i32, i32* %2
+%68 = add nsw i32 %67, 1
+store i32 %68, i32* %2
+br label %45
+
+69:
+%70 = load i32, i32* %1
+ret i32 %70
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32*
+%5 = alloca i32
+%6 = alloca i32
+%7 = alloca i32
+%8 = alloca i32, i32 16
+store i32* %8, i32** %1
+%9 = alloca i32, i32 16
+store i32* %9, i32** %2
+br label %10
+
+10:
+%11 = add i32 0, 0
+store i32 %11, i32* %3
+%12 = load i32*, i32** %1
+%13 = load i32*, i32** %2
+br label %14
+14:
+%15 = load i32, i32* %3
+%16 = icmp slt i32 %15, 16
+br i1 %16, label %17, label %26
+
+17:
+%18 = load i32, i32* %3
+%19 = sext i32 %18 to i64
+%20 = getelementptr inbounds i32, i32* %12, i64 %19
+store i32 %18, i32* %20
+%21 = getelementptr inbounds i32, i32* %13, i64 %19
+%22 = sub nsw i32 16, %18
+store i32 %22, i32* %21
+br label %23
+23:
+%24 = load i32, i32* %3
+%25 = add nsw i32 %24, 1
+store i32 %25, i32* %3
+br label %14
+
+26:
+%27 = load i32*, i32** %1
+%28 = load i32*, i32** %2
+%29 = call i32 @dot(i32* %27, i32* %28, i32 16)
+%30 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %29)
+%31 = call i32 @dot(i32* %27, i32* %28, i32 10)
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = alloca i32, i32 5
+store i32* %33, i32** %4
+%34 = icmp sgt i32 5, 0
+%35 = select i1 %34, i32 5, i32 0
+%36 = mul i32 %35, 4
+%37 = bitcast i32* %33 to i8*
+call void @llvm.memset.p0i8.i32(i8* %37, i8 0, i32 %36, i1 false)
+br label %38
+
+38:
+%39 = add i32 0, 0
+store i32 %39, i32* %5
+%40 = load i32*, i32** %4
+%41 = load i32*, i32** %1
+br label %42
+42:
+%43 = load i32, i32* %5
+%44 = icmp slt i32 %43, 16
+br i1 %44, label %45, label %63
+
+45:
+%46 = load i32, i32* %5
+%47 = sext i32 %46 to i64
+%48 = getelementptr inbounds i32, i32* %41, i64 %47
+%49 = load i32, i32* %48
+%50 = sdiv i32 %49, 5
+%51 = mul nsw i32 %50, 5
+%52 = sub nsw i32 %49, %51
+%53 = icmp ult i32 %52, 5
+br i1 %53, label %55, label %54
+54:
+call void @array.bounds_error(i32 %52)
+unreachable
+55:
+%56 = sext i32 %52 to i64
+%57 = getelementptr inbounds i32, i32* %40, i64 %56
+%58 = load i32, i32* %57
+%59 = add nsw i32 %58, 1
+store i32 %59, i32* %57
+br label %60
+60:
+%61 = load i32, i32* %5
+%62 = add nsw i32 %61, 1
+store i32 %62, i32* %5
+br label %42
+
+63:
+%64 = load i32*, i32** %4
+call void @array.print.i32(i32* %64, i32 5)
+%65 = add i32 0, 2
+store i32 %65, i32* %6
+br label %66
+
+66:
+%67 = add i32 0, 1
+store i32 %67, i32* %7
+%68 = load i32*, i32** %1
+%69 = load i32, i32* %6
+%70 = sext i32 %67 to i64
+%71 = sub i64 14, 1
+%72 = add i64 %71, 2
+%73 = icmp sle i64 %72, 2147483647
+%74 = sext i32 %69 to i64
+%75 = add i64 %70, %74
+%76 = add i64 %71, %74
+%77 = icmp sge i64 %75, 0
+%78 = icmp slt i64 %76, 16
+%79 = and i1 %73, %77
+%80 = and i1 %79, %78
+br i1 %80, label %81, label %101
+81:
+%82 = load i32, i32* %7
+%83 = icmp slt i32 %82, 14
+br i1 %83, label %84, label %124
+
+84:
+%85 = load i32, i32* %7
+%86 = add nsw i32 %85, %69
+%87 = sext i32 %86 to i64
+%88 = getelementptr inbounds i32, i32* %68, i64 %87
+%89 = sub nsw i32 %85, 1
+%90 = sext i32 %89 to i64
+%91 = getelementptr inbounds i32, i32* %68, i64 %90
+%92 = load i32, i32* %91
+%93 = add nsw i32 %85, 1
+%94 = sext i32 %93 to i64
+%95 = getelementptr inbounds i32, i32* %68, i64 %94
+%96 = load i32, i32* %95
+%97 = add nsw i32 %92, %96
+store i32 %97, i32* %88
+br label %98
+98:
+%99 = load i32, i32* %7
+%100 = add nsw i32 %99, 2
+store i32 %100, i32* %7
+br label %81
+
+101:
+%102 = load i32, i32* %7
+%103 = icmp slt i32 %102, 14
+br i1 %103, label %104, label %124
+
+104:
+%105 = load i32, i32* %7
+%106 = add nsw i32 %105, %69
+%107 = icmp ult i32 %106, 16
+br i1 %107, label %109, label %108
+108:
+call void @array.bounds_error(i32 %106)
+unreachable
+109:
+%110 = sext i32 %106 to i64
+%111 = getelementptr inbounds i32, i32* %68, i64 %110
+%112 = sub nsw i32 %105, 1
+%113 = sext i32 %112 to i64
+%114 = getelementptr inbounds i32, i32* %68, i64 %113
+%115 = load i32, i32* %114
+%116 = add nsw i32 %105, 1
+%117 = sext i32 %116 to i64
+%118 = getelementptr inbounds i32, i32* %68, i64 %117
+%119 = load i32, i32* %118
+%120 = add nsw i32 %115, %119
+store i32 %120, i32* %111
+br label %121
+121:
+%122 = load i32, i32* %7
+%123 = add nsw i32 %122, 2
+store i32 %123, i32* %7
+br label %101
+
+124:
+%125 = load i32*, i32** %1
+call void @array.print.i32(i32* %125, i32 16)
+ret i32 0
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
+declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,265 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @set() nounwind norecurse {
+%1 = load i32*, i32** @ga
+%2 = load i32, i32* @ga.len
+%3 = icmp ult i32 0, %2
+br i1 %3, label %5, label %4
+4:
+call void @array.bounds_error(i32 0)
+unreachable
+5:
+%6 = getelementptr inbounds i32, i32* %1, i64 0
+%7 = add i32 0, 50
+store i32 %7, i32* %6
+%8 = icmp ult i32 1, %2
+br i1 %8, label %10, label %9
+9:
+call void @array.bounds_error(i32 1)
+unreachable
+10:
+%11 = getelementptr inbounds i32, i32* %1, i64 1
+%12 = add i32 0, 60
+store i32 %12, i32* %11
+ret void
+}
+
+define internal i32 @f(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @set()
+%3 = getelementptr inbounds i32, i32* %2, i64 0
+%4 = load i32, i32* %3
+%5 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %4)
+%6 = getelementptr inbounds i32, i32* %2, i64 1
+%7 = load i32, i32* %6
+%8 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %7)
+%9 = add nsw i32 %4, %7
+ret i32 %9
+}
+
+define internal i32 @g(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+%3 = load i32*, i32** @ga
+%4 = load i32, i32* @ga.len
+%5 = icmp ult i32 0, %4
+br i1 %5, label %7, label %6
+6:
+call void @array.bounds_error(i32 0)
+unreachable
+7:
+%8 = getelementptr inbounds i32, i32* %3, i64 0
+%9 = add i32 0, 70
+store i32 %9, i32* %8
+%10 = getelementptr inbounds i32, i32* %2, i64 0
+%11 = load i32, i32* %10
+ret i32 %11
+}
+
+define internal i32 @sum(i32* noalias readonly %ca) nounwind readonly norecurse {
+%1 = alloca i32*
+store i32* %ca, i32** %1
+%2 = getelementptr inbounds i32, i32* %ca, i64 0
+%3 = load i32, i32* %2
+%4 = getelementptr inbounds i32, i32* %ca, i64 1
+%5 = load i32, i32* %4
+%6 = add nsw i32 %3, %5
+%7 = getelementptr inbounds i32, i32* %ca, i64 2
+%8 = load i32, i32* %7
+%9 = add nsw i32 %6, %8
+%10 = getelementptr inbounds i32, i32* %ca, i64 3
+%11 = load i32, i32* %10
+%12 = add nsw i32 %9, %11
+ret i32 %12
+}
+
+define internal void @replace() nounwind norecurse {
+%1 = alloca i32*
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32** %1
+store i32 4, i32* @ga.len
+%2 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32 16, i1 0)
+ret void
+}
+
+define internal i32 @peek(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @replace()
+%3 = getelementptr inbounds i32, i32* %2, i64 0
+%4 = load i32, i32* %3
+ret i32 %4
+}
+
+define internal i32 @snapshot() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32, i32 4
+store i32* %4, i32** %1
+store i32 4, i32* %2
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %3
+store i32 4, i32* %2
+%5 = load i32*, i32** @ga
+%6 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %6, i32* %5, i32 16, i1 0)
+store i32* %6, i32** %1
+store i32 4, i32* @ga.len
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %5, i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32 16, i1 0)
+%7 = icmp ult i32 0, 4
+br i1 %7, label %9, label %8
+8:
+call void @array.bounds_error(i32 0)
+unreachable
+9:
+%10 = getelementptr inbounds i32, i32* %6, i64 0
+%11 = load i32, i32* %10
+ret i32 %11
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32, i32 4
+store i32* %3, i32** %1
+store i32 4, i32* %2
+store i32 4, i32* %2
+%4 = load i32*, i32** @ga
+%5 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %5, i32* %4, i32 16, i1 0)
+store i32* %5, i32** %1
+call void @set()
+%6 = icmp ult i32 0, 4
+br i1 %6, label %8, label %7
+7:
+call void @array.bounds_error(i32 0)
+unreachable
+8:
+%9 = getelementptr inbounds i32, i32* %5, i64 0
+%10 = load i32, i32* %9
+%11 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %10)
+%12 = load i32*, i32** @ga
+%13 = load i32, i32* @ga.len
+%14 = icmp ult i32 0, %13
+br i1 %14, label %16, label %15
+15:
+call void @array.bounds_error(i32 0)
+unreachable
+16:
+%17 = getelementptr inbounds i32, i32* %12, i64 0
+%18 = add i32 0, 1
+store i32 %18, i32* %17
+%19 = icmp ult i32 1, %13
+br i1 %19, label %21, label %20
+20:
+call void @array.bounds_error(i32 1)
+unreachable
+21:
+%22 = getelementptr inbounds i32, i32* %12, i64 1
+%23 = add i32 0, 2
+store i32 %23, i32* %22
+%24 = call i32 @f(i32* %12)
+%25 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %24)
+%26 = load i32*, i32** @ga
+%27 = load i32, i32* @ga.len
+%28 = icmp ult i32 0, %27
+br i1 %28, label %30, label %29
+29:
+call void @array.bounds_error(i32 0)
+unreachable
+30:
+%31 = getelementptr inbounds i32, i32* %26, i64 0
+%32 = add i32 0, 1
+store i32 %32, i32* %31
+%33 = call i32 @g(i32* %26)
+%34 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %33)
+%35 = load i32*, i32** @ga
+%36 = call i32 @sum(i32* %35)
+%37 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %36)
+%38 = load i32*, i32** @ga
+%39 = load i32, i32* @ga.len
+%40 = icmp ult i32 0, %39
+br i1 %40, label %42, label %41
+41:
+call void @array.bounds_error(i32 0)
+unreachable
+42:
+%43 = getelementptr inbounds i32, i32* %38, i64 0
+%44 = add i32 0, 1
+store i32 %44, i32* %43
+%45 = call i32 @peek(i32* %38)
+%46 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %45)
+%47 = load i32*, i32** @ga
+%48 = load i32, i32* @ga.len
+%49 = icmp ult i32 0, %48
+br i1 %49, label %51, label %50
+50:
+call void @array.bounds_error(i32 0)
+unreachable
+51:
+%52 = getelementptr inbounds i32, i32* %47, i64 0
+%53 = add i32 0, 1
+store i32 %53, i32* %52
+%54 = call i32 @snapshot()
+%55 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %54)
+%56 = load i32*, i32** @ga
+%57 = load i32, i32* @ga.len
+%58 = icmp ult i32 0, %57
+br i1 %58, label %60, label %59
+59:
+call void @array.bounds_error(i32 0)
+unreachable
+60:
+%61 = getelementptr inbounds i32, i32* %56, i64 0
+%62 = load i32, i32* %61
+%63 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %62)
+ret i32 0
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
+@const.0 = private unnamed_addr constant [4 x i32] [i32 9, i32 8, i32 7, i32 6]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 5, i32 5, i32 5, i32 5]
+@ga.len = internal global i32 4
+@ga.data = internal global [4 x i32] [i32 1, i32 2, i32 3, i32 4]
+@ga = internal global i32* getelementptr inbounds ([4 x i32], [4 x i32]* @ga.data, i32 0, i32 0)
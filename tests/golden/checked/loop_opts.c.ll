@@ -0,0 +1,345 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @square(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = mul nsw i32 %cx, %cx
+ret i32 %2
+}
+
+define internal i32 @fib(i32 %cn) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = icmp slt i32 %cn, 2
+br i1 %2, label %3, label %5
+
+3:
+%4 = load i32, i32* %1
+ret i32 %4
+5:
+%6 = load i32, i32* %1
+%7 = sub nsw i32 %6, 1
+%8 = call i32 @fib(i32 %7)
+%9 = sub nsw i32 %6, 2
+%10 = call i32 @fib(i32 %9)
+%11 = add nsw i32 %8, %10
+ret i32 %11
+}
+
+define internal i32 @unused(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = add nsw i32 %cx, 1
+ret i32 %2
+}
+
+define internal i32 @weighted(i32* noalias readonly %ca, i32 %cn, i32 %cscale) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32
+store i32 %cn, i32* %4
+%5 = alloca i32
+store i32 %cscale, i32* %5
+%6 = add i32 0, 0
+store i32 %6, i32* %1
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %2
+%9 = load i32, i32* %4
+%10 = load i32*, i32** %3
+%11 = load i32, i32* %5
+%12 = mul nsw i32 %11, %11
+%13 = add nsw i32 %12, 1
+%14 = sext i32 %8 to i64
+%15 = sext i32 %9 to i64
+%16 = sub i64 %15, 1
+%17 = add i64 %16, 1
+%18 = icmp sle i64 %17, 2147483647
+%19 = add i64 %14, 0
+%20 = add i64 %16, 0
+%21 = icmp sge i64 %19, 0
+%22 = icmp slt i64 %20, 8
+%23 = and i1 %18, %21
+%24 = and i1 %23, %22
+br i1 %24, label %25, label %39
+25:
+%26 = load i32, i32* %2
+%27 = icmp slt i32 %26, %9
+br i1 %27, label %28, label %56
+
+28:
+%29 = load i32, i32* %1
+%30 = load i32, i32* %2
+%31 = sext i32 %30 to i64
+%32 = getelementptr inbounds i32, i32* %10, i64 %31
+%33 = load i32, i32* %32
+%34 = mul nsw i32 %33, %13
+%35 = add nsw i32 %29, %34
+store i32 %35, i32* %1
+br label %36
+36:
+%37 = load i32, i32* %2
+%38 = add nsw i32 %37, 1
+store i32 %38, i32* %2
+br label %25
+
+39:
+%40 = load i32, i32* %2
+%41 = icmp slt i32 %40, %9
+br i1 %41, label %42, label %56
+
+42:
+%43 = load i32, i32* %1
+%44 = load i32, i32* %2
+%45 = icmp ult i32 %44, 8
+br i1 %45, label %47, label %46
+46:
+call void @array.bounds_error(i32 %44)
+unreachable
+47:
+%48 = sext i32 %44 to i64
+%49 = getelementptr inbounds i32, i32* %10, i64 %48
+%50 = load i32, i32* %49
+%51 = mul nsw i32 %50, %13
+%52 = add nsw i32 %43, %51
+store i32 %52, i32* %1
+br label %53
+53:
+%54 = load i32, i32* %2
+%55 = add nsw i32 %54, 1
+store i32 %55, i32* %2
+br label %39
+
+56:
+%57 = load i32, i32* %1
+ret i32 %57
+}
+
+define internal double @average(i32* noalias readonly %ca, i32 %cn) nounwind norecurse {
+%1 = alloca double
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32
+store i32 %cn, i32* %4
+%5 = sitofp i32 0 to double
+store double %5, double* %1
+br label %6
+
+6:
+%7 = add i32 0, 0
+store i32 %7, i32* %2
+%8 = load i32, i32* %4
+%9 = load i32*, i32** %3
+%10 = sext i32 %7 to i64
+%11 = sext i32 %8 to i64
+%12 = sub i64 %11, 1
+%13 = add i64 %12, 1
+%14 = icmp sle i64 %13, 2147483647
+%15 = add i64 %10, 0
+%16 = add i64 %12, 0
+%17 = icmp sge i64 %15, 0
+%18 = icmp slt i64 %16, 8
+%19 = and i1 %14, %17
+%20 = and i1 %19, %18
+br i1 %20, label %21, label %35
+21:
+%22 = load i32, i32* %2
+%23 = icmp slt i32 %22, %8
+br i1 %23, label %24, label %52
+
+24:
+%25 = load double, double* %1
+%26 = load i32, i32* %2
+%27 = sext i32 %26 to i64
+%28 = getelementptr inbounds i32, i32* %9, i64 %27
+%29 = load i32, i32* %28
+%30 = sitofp i32 %29 to double
+%31 = fadd double %25, %30
+store double %31, double* %1
+br label %32
+32:
+%33 = load i32, i32* %2
+%34 = add nsw i32 %33, 1
+store i32 %34, i32* %2
+br label %21, !llvm.loop !0
+
+35:
+%36 = load i32, i32* %2
+%37 = icmp slt i32 %36, %8
+br i1 %37, label %38, label %52
+
+38:
+%39 = load double, double* %1
+%40 = load i32, i32* %2
+%41 = icmp ult i32 %40, 8
+br i1 %41, label %43, label %42
+42:
+call void @array.bounds_error(i32 %40)
+unreachable
+43:
+%44 = sext i32 %40 to i64
+%45 = getelementptr inbounds i32, i32* %9, i64 %44
+%46 = load i32, i32* %45
+%47 = sitofp i32 %46 to double
+%48 = fadd double %39, %47
+store double %48, double* %1
+br label %49
+49:
+%50 = load i32, i32* %2
+%51 = add nsw i32 %50, 1
+store i32 %51, i32* %2
+br label %35
+
+52:
+%53 = load double, double* %1
+%54 = load i32, i32* %4
+%55 = sitofp i32 %54 to double
+%56 = fdiv double %53, %55
+ret double %56
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i8
+%6 = alloca i32
+%7 = alloca i32, i32 8
+store i32* %7, i32** %1
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %2
+%10 = load i32*, i32** %1
+br label %11
+11:
+%12 = load i32, i32* %2
+%13 = icmp slt i32 %12, 8
+br i1 %13, label %14, label %23
+
+14:
+%15 = load i32, i32* %2
+%16 = sext i32 %15 to i64
+%17 = getelementptr inbounds i32, i32* %10, i64 %16
+%18 = call i32 @square(i32 %15)
+%19 = sub nsw i32 %18, %15
+store i32 %19, i32* %17
+br label %20
+20:
+%21 = load i32, i32* %2
+%22 = add nsw i32 %21, 1
+store i32 %22, i32* %2
+br label %11, !llvm.loop !4
+
+23:
+%24 = add i32 0, 3
+store i32 %24, i32* %3
+%25 = add i32 0, 0
+store i32 %25, i32* %4
+%26 = load i32*, i32** %1
+%27 = mul nsw i32 %24, 2
+%28 = add nsw i32 %27, 1
+br label %29
+
+29:
+%30 = load i32, i32* %4
+%31 = icmp slt i32 %30, 8
+br i1 %31, label %32, label %44
+
+32:
+%33 = load i32, i32* %4
+%34 = icmp ult i32 %33, 8
+br i1 %34, label %36, label %35
+35:
+call void @array.bounds_error(i32 %33)
+unreachable
+36:
+%37 = sext i32 %33 to i64
+%38 = getelementptr inbounds i32, i32* %26, i64 %37
+%39 = load i32, i32* %38
+%40 = add nsw i32 %39, %28
+%41 = mul nsw i32 %39, %28
+%42 = add nsw i32 %40, %41
+store i32 %42, i32* %38
+%43 = add nsw i32 %33, 1
+store i32 %43, i32* %4
+br label %29
+44:
+%45 = load i32*, i32** %1
+%46 = call i32 @weighted(i32* %45, i32 8, i32 2)
+%47 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %46)
+%48 = call double @average(i32* %45, i32 8)
+%49 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %48)
+%50 = call i32 @fib(i32 15)
+%51 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %50)
+%52 = call i32 @square(i32 12)
+%53 = call i32 @square(i32 5)
+%54 = add nsw i32 %52, %53
+%55 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %54)
+%56 = trunc i32 200 to i8
+store i8 %56, i8* %5
+%57 = zext i8 %56 to i32
+store i32 %57, i32* %6
+%58 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %57)
+%59 = icmp ne i32 0, 0
+br i1 %59, label %60, label %63
+
+60:
+%61 = call i32 @unused(i32 1)
+%62 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %61)
+br label %63
+63:
+ret i32 0
+%65 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 7)
+unreachable
+}
+
+@bounds.message = private unnamed_addr constant [86 x i8] c"\D0\9E\D1\88\D0\B8\D0\B1\D0\BA\D0\B0 \D0\B2\D1\8B\D0\BF\D0\BE\D0\BB\D0\BD\D0\B5\D0\BD\D0\B8\D1\8F: \D0\92\D1\8B\D1\85\D0\BE\D0\B4 \D0\B7\D0\B0 \D0\B3\D1\80\D0\B0\D0\BD\D0\B8\D1\86\D1\8B \D0\BC\D0\B0\D1\81\D1\81\D0\B8\D0\B2\D0\B0: %d\0A\00"
+declare i32 @dprintf(i32, i8*, ...) nounwind
+declare void @exit(i32) noreturn nounwind
+
+define internal void @array.bounds_error(i32 %index) cold noinline noreturn nounwind {
+entry:
+  call i32 (i32, i8*, ...) @dprintf(i32 2, i8* getelementptr inbounds ([86 x i8], [86 x i8]* @bounds.message, i32 0, i32 0), i32 %index)
+  call void @exit(i32 1)
+  unreachable
+}
+
+
+!0 = distinct !{!0, !1, !2, !3}
+!1 = !{!"llvm.loop.vectorize.width", i32 4}
+!2 = !{!"llvm.loop.vectorize.enable", i1 true}
+!3 = !{!"llvm.loop.interleave.count", i32 2}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.unroll.count", i32 2}
@@ -0,0 +1,134 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @classify(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+%2 = alloca i32
+store i32 %cx, i32* %2
+%3 = add i32 0, 0
+store i32 %3, i32* %1
+%4 = icmp eq i32 %cx, 1
+br i1 %4, label %5, label %7
+
+5:
+%6 = add i32 0, 10
+store i32 %6, i32* %1
+br label %21
+7:
+%8 = load i32, i32* %2
+%9 = icmp eq i32 %8, 2
+br i1 %9, label %10, label %12
+
+10:
+%11 = add i32 0, 20
+store i32 %11, i32* %1
+br label %20
+12:
+%13 = load i32, i32* %2
+%14 = icmp eq i32 %13, 3
+br i1 %14, label %15, label %17
+
+15:
+%16 = add i32 0, 30
+store i32 %16, i32* %1
+br label %19
+17:
+%18 = add i32 0, 40
+store i32 %18, i32* %1
+br label %19
+19:
+br label %20
+20:
+br label %21
+21:
+%22 = load i32, i32* %1
+ret i32 %22
+}
+
+define internal void @name(i8 %cc) nounwind norecurse {
+%1 = alloca i8
+store i8 %cc, i8* %1
+%2 = icmp eq i8 %cc, 97
+br i1 %2, label %3, label %5
+
+3:
+%4 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 1)
+br label %17
+5:
+%6 = load i8, i8* %1
+%7 = icmp eq i8 %6, 98
+br i1 %7, label %8, label %10
+
+8:
+%9 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 2)
+br label %16
+10:
+%11 = load i8, i8* %1
+%12 = icmp eq i8 %11, 99
+br i1 %12, label %13, label %15
+
+13:
+%14 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 3)
+br label %15
+15:
+br label %16
+16:
+br label %17
+17:
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32
+br label %2
+
+2:
+%3 = add i32 0, 0
+store i32 %3, i32* %1
+br label %4
+4:
+%5 = load i32, i32* %1
+%6 = icmp slt i32 %5, 5
+br i1 %6, label %7, label %14
+
+7:
+%8 = load i32, i32* %1
+%9 = call i32 @classify(i32 %8)
+%10 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %9)
+br label %11
+11:
+%12 = load i32, i32* %1
+%13 = add nsw i32 %12, 1
+store i32 %13, i32* %1
+br label %4
+
+14:
+call void @name(i8 97)
+call void @name(i8 99)
+call void @name(i8 122)
+ret i32 0
+}
+
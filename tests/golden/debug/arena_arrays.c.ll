@@ -0,0 +1,298 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32* @squares(i32 %cn) nounwind norecurse {
+%r.addr.1 = alloca i32*
+%i.addr.2 = alloca i32
+%n.addr.0 = alloca i32
+store i32 %cn, i32* %n.addr.0
+%n.0 = load i32, i32* %n.addr.0
+%temp.0.0 = mul i32 %n.0, 4
+%temp.0.1 = zext i32 %temp.0.0 to i64
+%temp.0.2 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.heap, i64 %temp.0.1)
+%r.0 = bitcast i8* %temp.0.2 to i32*
+store i32* %r.0, i32** %r.addr.1
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.2
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.2
+%n.1 = load i32, i32* %n.addr.0
+%temp.0.3 = icmp slt i32 %i.1, %n.1
+br i1 %temp.0.3, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%r.1 = load i32*, i32** %r.addr.1
+%i.2 = load i32, i32* %i.addr.2
+%r.2 = getelementptr inbounds i32, i32* %r.1, i32 %i.2
+%i.3 = load i32, i32* %i.addr.2
+%i.4 = load i32, i32* %i.addr.2
+%temp.0.4 = mul i32 %i.3, %i.4
+store i32 %temp.0.4, i32* %r.2
+br label %for.hatch.0
+for.hatch.0:
+%i.5 = load i32, i32* %i.addr.2
+%temp.0.5 = add i32 %i.5, 1
+store i32 %temp.0.5, i32* %i.addr.2
+br label %for.cond.0
+
+for.exit.0:
+%temp.0.6 = load i32*, i32** %r.addr.1
+ret i32* %temp.0.6
+}
+
+define internal i32 @partial(i32 %cdepth) nounwind {
+%scratch.addr.1 = alloca i32*
+%arena.head = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%arena.top = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%arena.end = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%depth.addr.0 = alloca i32
+store i32 %cdepth, i32* %depth.addr.0
+%depth.0 = load i32, i32* %depth.addr.0
+%temp.0.0 = add i32 %depth.0, 1
+%temp.0.1 = mul i32 %temp.0.0, 4
+%temp.0.2 = zext i32 %temp.0.1 to i64
+%temp.0.3 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %temp.0.2)
+%scratch.0 = bitcast i8* %temp.0.3 to i32*
+store i32* %scratch.0, i32** %scratch.addr.1
+%scratch.1 = load i32*, i32** %scratch.addr.1
+%depth.1 = load i32, i32* %depth.addr.0
+%depth.2 = load i32, i32* %depth.addr.0
+%temp.0.4 = add i32 %depth.2, 1
+call void @array.fill.i32(i32* %scratch.1, i32 %depth.1, i32 %temp.0.4)
+%depth.3 = load i32, i32* %depth.addr.0
+%temp.0.5 = icmp eq i32 %depth.3, 0
+br i1 %temp.0.5, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %arena.head, i8* %arena.top, i8* %arena.end)
+ret i32 0
+IfEnd.0.0:
+%scratch.2 = load i32*, i32** %scratch.addr.1
+%depth.4 = load i32, i32* %depth.addr.0
+%temp.0.6 = add i32 %depth.4, 1
+%call.sum.0 = call i32 @array.sum.i32(i32* %scratch.2, i32 %temp.0.6)
+%depth.5 = load i32, i32* %depth.addr.0
+%temp.0.7 = sub i32 %depth.5, 1
+%call.partial.0 = call i32 @partial(i32 %temp.0.7)
+%temp.0.8 = add i32 %call.sum.0, %call.partial.0
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %arena.head, i8* %arena.top, i8* %arena.end)
+ret i32 %temp.0.8
+}
+
+define i32 @main() nounwind norecurse {
+%total.addr.0 = alloca i32
+%k.addr.1 = alloca i32
+%s.addr.2 = alloca i32*
+%big.addr.3 = alloca i32*
+%arena.head = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%arena.top = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%arena.end = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%total.0 = add i32 0, 0
+store i32 %total.0, i32* %total.addr.0
+br label %for.head.0
+
+for.head.0:
+%k.0 = add i32 0, 1
+store i32 %k.0, i32* %k.addr.1
+br label %for.cond.0
+for.cond.0:
+%k.1 = load i32, i32* %k.addr.1
+%temp.0.0 = icmp slt i32 %k.1, 200
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%k.2 = load i32, i32* %k.addr.1
+%call.squares.0 = call i32* @squares(i32 %k.2)
+store i32* %call.squares.0, i32** %s.addr.2 
+%total.1 = load i32, i32* %total.addr.0
+%s.0 = load i32*, i32** %s.addr.2
+%k.3 = load i32, i32* %k.addr.1
+%temp.0.1 = sub i32 %k.3, 1
+%s.1 = getelementptr inbounds i32, i32* %s.0, i32 %temp.0.1
+%s.2 = load i32, i32* %s.1
+%temp.0.2 = add i32 %total.1, %s.2
+store i32 %temp.0.2, i32* %total.addr.0
+br label %for.hatch.0
+for.hatch.0:
+%k.4 = load i32, i32* %k.addr.1
+%temp.0.3 = add i32 %k.4, 1
+store i32 %temp.0.3, i32* %k.addr.1
+br label %for.cond.0
+
+for.exit.0:
+%total.2 = load i32, i32* %total.addr.0
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %total.2)
+%call.partial.0 = call i32 @partial(i32 30)
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.partial.0)
+%temp.0.4 = zext i32 80000 to i64
+%temp.0.5 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %temp.0.4)
+%big.0 = bitcast i8* %temp.0.5 to i32*
+store i32* %big.0, i32** %big.addr.3
+%big.1 = load i32*, i32** %big.addr.3
+call void @array.fill.i32(i32* %big.1, i32 3, i32 20000)
+%big.2 = load i32*, i32** %big.addr.3
+%call.sum.0 = call i32 @array.sum.i32(i32* %big.2, i32 20000)
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.sum.0)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %arena.head, i8* %arena.top, i8* %arena.end)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  ret void
+}
+
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
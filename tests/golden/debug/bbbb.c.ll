@@ -0,0 +1,241 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @print_arr(i8* %carr, i32 %cn) nounwind norecurse {
+%i.addr.2 = alloca i32
+%arr.addr.0 = alloca i8*
+%arr.0 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %arr.0, i8* %carr, i32 10, i1 0)
+store i8* %arr.0,i8** %arr.addr.0
+%n.addr.1 = alloca i32
+store i32 %cn, i32* %n.addr.1
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.2
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.2
+%n.0 = load i32, i32* %n.addr.1
+%temp.0.0 = icmp slt i32 %i.1, %n.0
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%arr.1 = load i8*, i8** %arr.addr.0
+%i.2 = load i32, i32* %i.addr.2
+%arr.2 = getelementptr inbounds i8, i8* %arr.1, i32 %i.2
+%arr.3 = load i8, i8* %arr.2
+%call.print_char.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %arr.3)
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.2
+%temp.0.2 = add i32 %i.3, 1
+store i32 %temp.0.2, i32* %i.addr.2
+br label %for.cond.0
+
+for.exit.0:
+ret void
+}
+
+define internal void @sortAndPrint(i8* %carr, i32 %cn) nounwind norecurse {
+%i.addr.2 = alloca i32
+%j.addr.3 = alloca i32
+%temp.addr.4 = alloca i32
+%arr.addr.0 = alloca i8*
+%arr.0 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %arr.0, i8* %carr, i32 10, i1 0)
+store i8* %arr.0,i8** %arr.addr.0
+%n.addr.1 = alloca i32
+store i32 %cn, i32* %n.addr.1
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.2
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.2
+%n.0 = load i32, i32* %n.addr.1
+%temp.0.0 = sub i32 %n.0, 1
+%temp.0.1 = icmp slt i32 %i.1, %temp.0.0
+br i1 %temp.0.1, label %for.body.0, label %for.exit.0
+
+for.body.0:
+br label %for.head.1
+
+for.head.1:
+%j.0 = add i32 0, 0
+store i32 %j.0, i32* %j.addr.3
+br label %for.cond.1
+for.cond.1:
+%j.1 = load i32, i32* %j.addr.3
+%n.1 = load i32, i32* %n.addr.1
+%i.2 = load i32, i32* %i.addr.2
+%temp.0.2 = sub i32 %n.1, %i.2
+%temp.0.3 = sub i32 %temp.0.2, 1
+%temp.0.4 = icmp slt i32 %j.1, %temp.0.3
+br i1 %temp.0.4, label %for.body.1, label %for.exit.1
+
+for.body.1:
+%arr.1 = load i8*, i8** %arr.addr.0
+%j.2 = load i32, i32* %j.addr.3
+%arr.2 = getelementptr inbounds i8, i8* %arr.1, i32 %j.2
+%arr.3 = load i8, i8* %arr.2
+%arr.4 = load i8*, i8** %arr.addr.0
+%j.3 = load i32, i32* %j.addr.3
+%temp.0.5 = add i32 %j.3, 1
+%arr.5 = getelementptr inbounds i8, i8* %arr.4, i32 %temp.0.5
+%arr.6 = load i8, i8* %arr.5
+%temp.0.6 = icmp slt i8 %arr.3, %arr.6
+br i1 %temp.0.6, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%arr.7 = load i8*, i8** %arr.addr.0
+%j.4 = load i32, i32* %j.addr.3
+%temp.0.7 = add i32 %j.4, 1
+%arr.8 = getelementptr inbounds i8, i8* %arr.7, i32 %temp.0.7
+%arr.9 = load i8, i8* %arr.8
+%temp.0.8 = zext i8 %arr.9 to i32
+store i32 %temp.0.8, i32* %temp.addr.4
+%arr.10 = load i8*, i8** %arr.addr.0
+%j.5 = load i32, i32* %j.addr.3
+%temp.0.9 = add i32 %j.5, 1
+%arr.11 = getelementptr inbounds i8, i8* %arr.10, i32 %temp.0.9
+%arr.12 = load i8*, i8** %arr.addr.0
+%j.6 = load i32, i32* %j.addr.3
+%arr.13 = getelementptr inbounds i8, i8* %arr.12, i32 %j.6
+%arr.14 = load i8, i8* %arr.13
+store i8 %arr.14, i8* %arr.11
+%arr.15 = load i8*, i8** %arr.addr.0
+%j.7 = load i32, i32* %j.addr.3
+%arr.16 = getelementptr inbounds i8, i8* %arr.15, i32 %j.7
+%temp.10 = load i32, i32* %temp.addr.4
+%temp.0.11 = trunc i32 %temp.10 to i8
+store i8 %temp.0.11, i8* %arr.16
+br label %IfEnd.0.0
+IfEnd.0.0:
+br label %for.hatch.1
+for.hatch.1:
+%j.8 = load i32, i32* %j.addr.3
+%temp.0.12 = add i32 %j.8, 1
+store i32 %temp.0.12, i32* %j.addr.3
+br label %for.cond.1
+
+for.exit.1:
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.2
+%temp.0.13 = add i32 %i.3, 1
+store i32 %temp.0.13, i32* %i.addr.2
+br label %for.cond.0
+
+for.exit.0:
+%arr.17 = load i8*, i8** %arr.addr.0
+%n.2 = load i32, i32* %n.addr.1
+call void @print_arr(i8* %arr.17, i32 %n.2)
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%a.addr.0 = alloca i8*
+%b.addr.1 = alloca i32*
+%n.addr.2 = alloca i32
+%k.addr.3 = alloca i32
+%c.addr.4 = alloca i32
+%g.addr.5 = alloca double
+%cc.addr.6 = alloca i1
+%gg.addr.7 = alloca double
+%ccc.addr.8 = alloca i8
+%ggg.addr.9 = alloca double
+%i.addr.10 = alloca i32
+%arr.addr.11 = alloca i8*
+%a.0 = alloca i8, i32 10
+store i8* %a.0, i8** %a.addr.0
+%b.0 = alloca i32, i32 20
+store i32* %b.0, i32** %b.addr.1
+%n.0 = add i32 0, 10
+store i32 %n.0, i32* %n.addr.2
+%k.0 = add i32 0, 0
+store i32 %k.0, i32* %k.addr.3
+%c.0 = add i32 0, 0
+store i32 %c.0, i32* %c.addr.4
+%c.1 = load i32, i32* %c.addr.4
+%temp.0.0 = sitofp i32 %c.1 to double
+store double %temp.0.0, double* %g.addr.5
+%temp.0.1 = icmp ne i32 0, 0
+store i1 %temp.0.1, i1* %cc.addr.6
+%cc.0 = load i1, i1* %cc.addr.6
+%temp.0.2 = sitofp i1 %cc.0 to double
+store double %temp.0.2, double* %gg.addr.7
+%ccc.0 = add i8 0, 97
+store i8 %ccc.0, i8* %ccc.addr.8
+%ccc.1 = load i8, i8* %ccc.addr.8
+%temp.0.3 = sitofp i8 %ccc.1 to double
+store double %temp.0.3, double* %ggg.addr.9
+%g.0 = load double, double* %g.addr.5
+%call.print_float.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %g.0)
+%gg.0 = load double, double* %gg.addr.7
+%call.print_float.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %gg.0)
+%ggg.0 = load double, double* %ggg.addr.9
+%call.print_float.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %ggg.0)
+%call.read_str.0 = alloca i8, i32 100
+call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* %call.read_str.0)
+store i8* %call.read_str.0, i8** %a.addr.0 
+%call.print_char.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 98)
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.10
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.10
+%temp.0.5 = icmp slt i32 %i.1, 10
+br i1 %temp.0.5, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%i.2 = load i32, i32* %i.addr.10
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %i.2)
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.10
+%temp.0.6 = add i32 %i.3, 1
+store i32 %temp.0.6, i32* %i.addr.10
+br label %for.cond.0
+
+for.exit.0:
+%arr.0 = alloca i8, i32 10
+store i8* %arr.0, i8** %arr.addr.11
+%a.1 = load i8*, i8** %a.addr.0
+%temp.0.7 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %temp.0.7, i8* %a.1, i32 10, i1 0)
+store i8* %temp.0.7, i8** %arr.addr.11
+%arr.1 = load i8*, i8** %arr.addr.11
+call void @sortAndPrint(i8* %arr.1, i32 10)
+ret i32 0
+}
+
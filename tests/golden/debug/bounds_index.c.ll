@@ -0,0 +1,98 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main() nounwind norecurse {
+%a.addr.0 = alloca i32*
+%n.addr.1 = alloca i32
+%i.addr.2 = alloca i32
+%s.addr.3 = alloca i32
+%i.addr.4 = alloca i32
+%a.0 = alloca i32, i32 6
+store i32* %a.0, i32** %a.addr.0
+%n.0 = add i32 0, 8
+store i32 %n.0, i32* %n.addr.1
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.2
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.2
+%temp.0.0 = icmp slt i32 %i.1, 6
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.2
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%i.3 = load i32, i32* %i.addr.2
+%i.4 = load i32, i32* %i.addr.2
+%temp.0.1 = mul i32 %i.3, %i.4
+store i32 %temp.0.1, i32* %a.2
+br label %for.hatch.0
+for.hatch.0:
+%i.5 = load i32, i32* %i.addr.2
+%temp.0.2 = add i32 %i.5, 1
+store i32 %temp.0.2, i32* %i.addr.2
+br label %for.cond.0
+
+for.exit.0:
+%s.0 = add i32 0, 0
+store i32 %s.0, i32* %s.addr.3
+br label %for.head.1
+
+for.head.1:
+%i.6 = add i32 0, 0
+store i32 %i.6, i32* %i.addr.4
+br label %for.cond.1
+for.cond.1:
+%i.7 = load i32, i32* %i.addr.4
+%n.1 = load i32, i32* %n.addr.1
+%temp.0.3 = icmp slt i32 %i.7, %n.1
+br i1 %temp.0.3, label %for.body.1, label %for.exit.1
+
+for.body.1:
+%s.1 = load i32, i32* %s.addr.3
+%a.3 = load i32*, i32** %a.addr.0
+%i.8 = load i32, i32* %i.addr.4
+%a.4 = getelementptr inbounds i32, i32* %a.3, i32 %i.8
+%a.5 = load i32, i32* %a.4
+%temp.0.4 = add i32 %s.1, %a.5
+store i32 %temp.0.4, i32* %s.addr.3
+%s.2 = load i32, i32* %s.addr.3
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %s.2)
+br label %for.hatch.1
+for.hatch.1:
+%i.9 = load i32, i32* %i.addr.4
+%temp.0.5 = add i32 %i.9, 1
+store i32 %temp.0.5, i32* %i.addr.4
+br label %for.cond.1
+
+for.exit.1:
+ret i32 0
+}
+
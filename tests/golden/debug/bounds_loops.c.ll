@@ -0,0 +1,312 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @dot(i32* %ca, i32* %cb, i32 %cn) nounwind readonly norecurse {
+%s.addr.3 = alloca i32
+%i.addr.4 = alloca i32
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 16
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 64, i1 0)
+store i32* %a.0,i32** %a.addr.0
+%b.addr.1 = alloca i32*
+%b.0 = alloca i32, i32 16
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %b.0, i32* %cb, i32 64, i1 0)
+store i32* %b.0,i32** %b.addr.1
+%n.addr.2 = alloca i32
+store i32 %cn, i32* %n.addr.2
+%s.0 = add i32 0, 0
+store i32 %s.0, i32* %s.addr.3
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.4
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.4
+%n.0 = load i32, i32* %n.addr.2
+%temp.0.0 = icmp slt i32 %i.1, %n.0
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%s.1 = load i32, i32* %s.addr.3
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.4
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%a.3 = load i32, i32* %a.2
+%b.1 = load i32*, i32** %b.addr.1
+%n.1 = load i32, i32* %n.addr.2
+%temp.0.1 = sub i32 %n.1, 1
+%i.3 = load i32, i32* %i.addr.4
+%temp.0.2 = sub i32 %temp.0.1, %i.3
+%b.2 = getelementptr inbounds i32, i32* %b.1, i32 %temp.0.2
+%b.3 = load i32, i32* %b.2
+%temp.0.3 = mul i32 %a.3, %b.3
+%temp.0.4 = add i32 %s.1, %temp.0.3
+store i32 %temp.0.4, i32* %s.addr.3
+br label %for.hatch.0
+for.hatch.0:
+%i.4 = load i32, i32* %i.addr.4
+%temp.0.5 = add i32 %i.4, 1
+store i32 %temp.0.5, i32* %i.addr.4
+br label %for.cond.0
+
+for.exit.0:
+%s.2 = load i32, i32* %s.addr.3
+ret i32 %s.2
+}
+
+define i32 @main() nounwind norecurse {
+%a.addr.0 = alloca i32*
+%b.addr.1 = alloca i32*
+%i.addr.2 = alloca i32
+%hist.addr.3 = alloca i32*
+%i.addr.4 = alloca i32
+%k.addr.5 = alloca i32
+%i.addr.6 = alloca i32
+%a.0 = alloca i32, i32 16
+store i32* %a.0, i32** %a.addr.0
+%b.0 = alloca i32, i32 16
+store i32* %b.0, i32** %b.addr.1
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.2
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.2
+%temp.0.0 = icmp slt i32 %i.1, 16
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.2
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%i.3 = load i32, i32* %i.addr.2
+store i32 %i.3, i32* %a.2
+%b.1 = load i32*, i32** %b.addr.1
+%i.4 = load i32, i32* %i.addr.2
+%b.2 = getelementptr inbounds i32, i32* %b.1, i32 %i.4
+%i.5 = load i32, i32* %i.addr.2
+%temp.0.1 = sub i32 16, %i.5
+store i32 %temp.0.1, i32* %b.2
+br label %for.hatch.0
+for.hatch.0:
+%i.6 = load i32, i32* %i.addr.2
+%temp.0.2 = add i32 %i.6, 1
+store i32 %temp.0.2, i32* %i.addr.2
+br label %for.cond.0
+
+for.exit.0:
+%a.3 = load i32*, i32** %a.addr.0
+%b.3 = load i32*, i32** %b.addr.1
+%call.dot.0 = call i32 @dot(i32* %a.3, i32* %b.3, i32 16)
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.dot.0)
+%a.4 = load i32*, i32** %a.addr.0
+%b.4 = load i32*, i32** %b.addr.1
+%call.dot.1 = call i32 @dot(i32* %a.4, i32* %b.4, i32 10)
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.dot.1)
+%hist.0 = alloca i32, i32 5
+store i32* %hist.0, i32** %hist.addr.3
+%hist.1 = load i32*, i32** %hist.addr.3
+%temp.0.3 = icmp sgt i32 5, 0
+%temp.0.4 = select i1 %temp.0.3, i32 5, i32 0
+%temp.0.5 = mul i32 %temp.0.4, 4
+%temp.0.6 = bitcast i32* %hist.1 to i8*
+call void @llvm.memset.p0i8.i32(i8* %temp.0.6, i8 0, i32 %temp.0.5, i1 false)
+br label %for.head.1
+
+for.head.1:
+%i.7 = add i32 0, 0
+store i32 %i.7, i32* %i.addr.4
+br label %for.cond.1
+for.cond.1:
+%i.8 = load i32, i32* %i.addr.4
+%temp.0.7 = icmp slt i32 %i.8, 16
+br i1 %temp.0.7, label %for.body.1, label %for.exit.1
+
+for.body.1:
+%hist.2 = load i32*, i32** %hist.addr.3
+%a.5 = load i32*, i32** %a.addr.0
+%i.9 = load i32, i32* %i.addr.4
+%a.6 = getelementptr inbounds i32, i32* %a.5, i32 %i.9
+%a.7 = load i32, i32* %a.6
+%a.8 = load i32*, i32** %a.addr.0
+%i.10 = load i32, i32* %i.addr.4
+%a.9 = getelementptr inbounds i32, i32* %a.8, i32 %i.10
+%a.10 = load i32, i32* %a.9
+%temp.0.8 = sdiv i32 %a.10, 5
+%temp.0.9 = mul i32 %temp.0.8, 5
+%temp.0.10 = sub i32 %a.7, %temp.0.9
+%hist.3 = getelementptr inbounds i32, i32* %hist.2, i32 %temp.0.10
+%hist.4 = load i32*, i32** %hist.addr.3
+%a.11 = load i32*, i32** %a.addr.0
+%i.11 = load i32, i32* %i.addr.4
+%a.12 = getelementptr inbounds i32, i32* %a.11, i32 %i.11
+%a.13 = load i32, i32* %a.12
+%a.14 = load i32*, i32** %a.addr.0
+%i.12 = load i32, i32* %i.addr.4
+%a.15 = getelementptr inbounds i32, i32* %a.14, i32 %i.12
+%a.16 = load i32, i32* %a.15
+%temp.0.11 = sdiv i32 %a.16, 5
+%temp.0.12 = mul i32 %temp.0.11, 5
+%temp.0.13 = sub i32 %a.13, %temp.0.12
+%hist.5 = getelementptr inbounds i32, i32* %hist.4, i32 %temp.0.13
+%hist.6 = load i32, i32* %hist.5
+%temp.0.14 = add i32 %hist.6, 1
+store i32 %temp.0.14, i32* %hist.3
+br label %for.hatch.1
+for.hatch.1:
+%i.13 = load i32, i32* %i.addr.4
+%temp.0.15 = add i32 %i.13, 1
+store i32 %temp.0.15, i32* %i.addr.4
+br label %for.cond.1
+
+for.exit.1:
+%hist.7 = load i32*, i32** %hist.addr.3
+call void @array.print.i32(i32* %hist.7, i32 5)
+%k.0 = add i32 0, 2
+store i32 %k.0, i32* %k.addr.5
+br label %for.head.2
+
+for.head.2:
+%i.14 = add i32 0, 1
+store i32 %i.14, i32* %i.addr.6
+br label %for.cond.2
+for.cond.2:
+%i.15 = load i32, i32* %i.addr.6
+%temp.0.16 = icmp slt i32 %i.15, 14
+br i1 %temp.0.16, label %for.body.2, label %for.exit.2
+
+for.body.2:
+%a.17 = load i32*, i32** %a.addr.0
+%i.16 = load i32, i32* %i.addr.6
+%k.1 = load i32, i32* %k.addr.5
+%temp.0.17 = add i32 %i.16, %k.1
+%a.18 = getelementptr inbounds i32, i32* %a.17, i32 %temp.0.17
+%a.19 = load i32*, i32** %a.addr.0
+%i.17 = load i32, i32* %i.addr.6
+%temp.0.18 = sub i32 %i.17, 1
+%a.20 = getelementptr inbounds i32, i32* %a.19, i32 %temp.0.18
+%a.21 = load i32, i32* %a.20
+%a.22 = load i32*, i32** %a.addr.0
+%i.18 = load i32, i32* %i.addr.6
+%temp.0.19 = add i32 %i.18, 1
+%a.23 = getelementptr inbounds i32, i32* %a.22, i32 %temp.0.19
+%a.24 = load i32, i32* %a.23
+%temp.0.20 = add i32 %a.21, %a.24
+store i32 %temp.0.20, i32* %a.18
+br label %for.hatch.2
+for.hatch.2:
+%i.19 = load i32, i32* %i.addr.6
+%temp.0.21 = add i32 %i.19, 2
+store i32 %temp.0.21, i32* %i.addr.6
+br label %for.cond.2
+
+for.exit.2:
+%a.25 = load i32*, i32** %a.addr.0
+call void @array.print.i32(i32* %a.25, i32 16)
+ret i32 0
+}
+
+declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,177 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @add(i32 %cx) nounwind norecurse {
+%x.addr.0 = alloca i32
+store i32 %cx, i32* %x.addr.0
+%sum.0 = load i32, i32* @sum
+%x.0 = load i32, i32* %x.addr.0
+%temp.0.0 = add i32 %sum.0, %x.0
+store i32 %temp.0.0, i32* @sum
+%x.1 = load i32, i32* %x.addr.0
+%max.0 = load i32, i32* @max
+%temp.0.1 = icmp sgt i32 %x.1, %max.0
+br i1 %temp.0.1, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%x.2 = load i32, i32* %x.addr.0
+store i32 %x.2, i32* @max
+br label %IfEnd.0.0
+IfEnd.0.0:
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%i.addr.0 = alloca i32
+%fill.addr.1 = alloca i32
+%a.addr.2 = alloca i32*
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.0
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.0
+%temp.0.0 = icmp slt i32 %i.1, 3
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%copy.0 = load i32*, i32** @copy
+%i.2 = load i32, i32* %i.addr.0
+%copy.1 = getelementptr inbounds i32, i32* %copy.0, i32 %i.2
+%copy.2 = load i32, i32* %copy.1
+call void @add(i32 %copy.2)
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.0
+%temp.0.1 = add i32 %i.3, 1
+store i32 %temp.0.1, i32* %i.addr.0
+br label %for.cond.0
+
+for.exit.0:
+%sum.0 = load i32, i32* @sum
+%temp.0.2 = mul i32 %sum.0, 2
+store i32 %temp.0.2, i32* %fill.addr.1
+%sum.1 = load i32, i32* @sum
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %sum.1)
+%max.0 = load i32, i32* @max
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %max.0)
+%min.0 = load double, double* @min
+%call.print_float.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %min.0)
+%fill.0 = load i32, i32* %fill.addr.1
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %fill.0)
+%sort.0 = load i8, i8* @sort
+%call.print_char.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %sort.0)
+store i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32** %a.addr.2
+%a.0 = load i32*, i32** %a.addr.2
+call void @array.print.i32(i32* %a.0, i32 3)
+ret i32 0
+}
+
+@const.0 = private unnamed_addr constant [3 x i32] [i32 3, i32 1, i32 2]
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+@sum = internal global i32 0
+@max = internal global i32 1
+@min = internal unnamed_addr constant double 0x4004000000000000
+@const.1 = private unnamed_addr constant [3 x i32] [i32 4, i32 5, i32 6]
+@copy = internal unnamed_addr constant i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.1, i32 0, i32 0)
+@sort = internal unnamed_addr constant i8 115
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,198 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @set() nounwind norecurse {
+%ga.0 = load i32*, i32** @ga
+%ga.1 = getelementptr inbounds i32, i32* %ga.0, i32 0
+%ga.2 = add i32 0, 50
+store i32 %ga.2, i32* %ga.1
+%ga.3 = load i32*, i32** @ga
+%ga.4 = getelementptr inbounds i32, i32* %ga.3, i32 1
+%ga.5 = add i32 0, 60
+store i32 %ga.5, i32* %ga.4
+ret void
+}
+
+define internal i32 @f(i32* %ca) nounwind norecurse {
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 16, i1 0)
+store i32* %a.0,i32** %a.addr.0
+call void @set()
+%a.1 = load i32*, i32** %a.addr.0
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 0
+%a.3 = load i32, i32* %a.2
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %a.3)
+%a.4 = load i32*, i32** %a.addr.0
+%a.5 = getelementptr inbounds i32, i32* %a.4, i32 1
+%a.6 = load i32, i32* %a.5
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %a.6)
+%a.7 = load i32*, i32** %a.addr.0
+%a.8 = getelementptr inbounds i32, i32* %a.7, i32 0
+%a.9 = load i32, i32* %a.8
+%a.10 = load i32*, i32** %a.addr.0
+%a.11 = getelementptr inbounds i32, i32* %a.10, i32 1
+%a.12 = load i32, i32* %a.11
+%temp.0.0 = add i32 %a.9, %a.12
+ret i32 %temp.0.0
+}
+
+define internal i32 @g(i32* %ca) nounwind norecurse {
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 16, i1 0)
+store i32* %a.0,i32** %a.addr.0
+%ga.0 = load i32*, i32** @ga
+%ga.1 = getelementptr inbounds i32, i32* %ga.0, i32 0
+%ga.2 = add i32 0, 70
+store i32 %ga.2, i32* %ga.1
+%a.1 = load i32*, i32** %a.addr.0
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 0
+%a.3 = load i32, i32* %a.2
+ret i32 %a.3
+}
+
+define internal i32 @sum(i32* %ca) nounwind readonly norecurse {
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 16, i1 0)
+store i32* %a.0,i32** %a.addr.0
+%a.1 = load i32*, i32** %a.addr.0
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 0
+%a.3 = load i32, i32* %a.2
+%a.4 = load i32*, i32** %a.addr.0
+%a.5 = getelementptr inbounds i32, i32* %a.4, i32 1
+%a.6 = load i32, i32* %a.5
+%temp.0.0 = add i32 %a.3, %a.6
+%a.7 = load i32*, i32** %a.addr.0
+%a.8 = getelementptr inbounds i32, i32* %a.7, i32 2
+%a.9 = load i32, i32* %a.8
+%temp.0.1 = add i32 %temp.0.0, %a.9
+%a.10 = load i32*, i32** %a.addr.0
+%a.11 = getelementptr inbounds i32, i32* %a.10, i32 3
+%a.12 = load i32, i32* %a.11
+%temp.0.2 = add i32 %temp.0.1, %a.12
+ret i32 %temp.0.2
+}
+
+define internal void @replace() nounwind norecurse {
+%c.addr.0 = alloca i32*
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32** %c.addr.0
+%c.0 = load i32*, i32** %c.addr.0
+%ga.0 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %ga.0, i32* %c.0, i32 16, i1 0)
+ret void
+}
+
+define internal i32 @peek(i32* %ca) nounwind norecurse {
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 16, i1 0)
+store i32* %a.0,i32** %a.addr.0
+call void @replace()
+%a.1 = load i32*, i32** %a.addr.0
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 0
+%a.3 = load i32, i32* %a.2
+ret i32 %a.3
+}
+
+define internal i32 @snapshot() nounwind norecurse {
+%b.addr.0 = alloca i32*
+%c.addr.1 = alloca i32*
+%b.0 = alloca i32, i32 4
+store i32* %b.0, i32** %b.addr.0
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %c.addr.1
+%ga.0 = load i32*, i32** @ga
+%temp.0.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %temp.0.0, i32* %ga.0, i32 16, i1 0)
+store i32* %temp.0.0, i32** %b.addr.0
+%c.0 = load i32*, i32** %c.addr.1
+%ga.1 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %ga.1, i32* %c.0, i32 16, i1 0)
+%b.1 = load i32*, i32** %b.addr.0
+%b.2 = getelementptr inbounds i32, i32* %b.1, i32 0
+%b.3 = load i32, i32* %b.2
+ret i32 %b.3
+}
+
+define i32 @main() nounwind norecurse {
+%b.addr.0 = alloca i32*
+%b.0 = alloca i32, i32 4
+store i32* %b.0, i32** %b.addr.0
+%ga.0 = load i32*, i32** @ga
+%temp.0.0 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %temp.0.0, i32* %ga.0, i32 16, i1 0)
+store i32* %temp.0.0, i32** %b.addr.0
+call void @set()
+%b.1 = load i32*, i32** %b.addr.0
+%b.2 = getelementptr inbounds i32, i32* %b.1, i32 0
+%b.3 = load i32, i32* %b.2
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %b.3)
+%ga.1 = load i32*, i32** @ga
+%ga.2 = getelementptr inbounds i32, i32* %ga.1, i32 0
+%ga.3 = add i32 0, 1
+store i32 %ga.3, i32* %ga.2
+%ga.4 = load i32*, i32** @ga
+%ga.5 = getelementptr inbounds i32, i32* %ga.4, i32 1
+%ga.6 = add i32 0, 2
+store i32 %ga.6, i32* %ga.5
+%ga.7 = load i32*, i32** @ga
+%call.f.0 = call i32 @f(i32* %ga.7)
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.f.0)
+%ga.8 = load i32*, i32** @ga
+%ga.9 = getelementptr inbounds i32, i32* %ga.8, i32 0
+%ga.10 = add i32 0, 1
+store i32 %ga.10, i32* %ga.9
+%ga.11 = load i32*, i32** @ga
+%call.g.0 = call i32 @g(i32* %ga.11)
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.g.0)
+%ga.12 = load i32*, i32** @ga
+%call.sum.0 = call i32 @sum(i32* %ga.12)
+%call.print_int.3 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.sum.0)
+%ga.13 = load i32*, i32** @ga
+%ga.14 = getelementptr inbounds i32, i32* %ga.13, i32 0
+%ga.15 = add i32 0, 1
+store i32 %ga.15, i32* %ga.14
+%ga.16 = load i32*, i32** @ga
+%call.peek.0 = call i32 @peek(i32* %ga.16)
+%call.print_int.4 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.peek.0)
+%ga.17 = load i32*, i32** @ga
+%ga.18 = getelementptr inbounds i32, i32* %ga.17, i32 0
+%ga.19 = add i32 0, 1
+store i32 %ga.19, i32* %ga.18
+%call.snapshot.0 = call i32 @snapshot()
+%call.print_int.5 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.snapshot.0)
+%ga.20 = load i32*, i32** @ga
+%ga.21 = getelementptr inbounds i32, i32* %ga.20, i32 0
+%ga.22 = load i32, i32* %ga.21
+%call.print_int.6 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %ga.22)
+ret i32 0
+}
+
+@const.0 = private unnamed_addr constant [4 x i32] [i32 9, i32 8, i32 7, i32 6]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 5, i32 5, i32 5, i32 5]
+@ga.data = internal global [4 x i32] [i32 1, i32 2, i32 3, i32 4]
+@ga = internal global i32* getelementptr inbounds ([4 x i32], [4 x i32]* @ga.data, i32 0, i32 0)
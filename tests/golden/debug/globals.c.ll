@@ -0,0 +1,193 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @tick(i32 %cn) nounwind norecurse {
+%n.addr.0 = alloca i32
+store i32 %cn, i32* %n.addr.0
+%counter.0 = load i32, i32* @counter
+%n.0 = load i32, i32* %n.addr.0
+%temp.0.0 = add i32 %counter.0, %n.0
+store i32 %temp.0.0, i32* @counter
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%i.addr.0 = alloca i32
+%local.addr.1 = alloca i32*
+%partial.addr.2 = alloca i32*
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.0
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.0
+%temp.0.0 = icmp slt i32 %i.1, 4
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%table.0 = load i32*, i32** @table
+%i.2 = load i32, i32* %i.addr.0
+%table.1 = getelementptr inbounds i32, i32* %table.0, i32 %i.2
+%primes.0 = load i32*, i32** @primes
+%i.3 = load i32, i32* %i.addr.0
+%primes.1 = getelementptr inbounds i32, i32* %primes.0, i32 %i.3
+%primes.2 = load i32, i32* %primes.1
+%squares.0 = load i32*, i32** @squares
+%i.4 = load i32, i32* %i.addr.0
+%temp.0.1 = add i32 %i.4, 1
+%squares.1 = getelementptr inbounds i32, i32* %squares.0, i32 %temp.0.1
+%squares.2 = load i32, i32* %squares.1
+%temp.0.2 = mul i32 %primes.2, %squares.2
+store i32 %temp.0.2, i32* %table.1
+%i.5 = load i32, i32* %i.addr.0
+call void @tick(i32 %i.5)
+br label %for.hatch.0
+for.hatch.0:
+%i.6 = load i32, i32* %i.addr.0
+%temp.0.3 = add i32 %i.6, 1
+store i32 %temp.0.3, i32* %i.addr.0
+br label %for.cond.0
+
+for.exit.0:
+%counter.0 = load i32, i32* @counter
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %counter.0)
+%ratio.0 = load double, double* @ratio
+%counter.1 = load i32, i32* @counter
+%temp.0.4 = sitofp i32 %counter.1 to double
+%temp.0.5 = fmul fast double %ratio.0, %temp.0.4
+%call.print_float.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %temp.0.5)
+%table.2 = load i32*, i32** @table
+call void @array.print.i32(i32* %table.2, i32 4)
+%letters.0 = load i8*, i8** @letters
+%letters.1 = getelementptr inbounds i8, i8* %letters.0, i32 1
+%letters.2 = load i8, i8* %letters.1
+%call.print_char.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %letters.2)
+store i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32** %local.addr.1
+%local.0 = load i32*, i32** %local.addr.1
+%local.1 = getelementptr inbounds i32, i32* %local.0, i32 2
+%local.2 = load i32, i32* %local.1
+%primes.3 = load i32*, i32** @primes
+%primes.4 = getelementptr inbounds i32, i32* %primes.3, i32 5
+%primes.5 = load i32, i32* %primes.4
+%temp.0.7 = add i32 %local.2, %primes.5
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %temp.0.7)
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %partial.addr.2
+%partial.0 = load i32*, i32** %partial.addr.2
+call void @array.print.i32(i32* %partial.0, i32 4)
+%counter.2 = load i32, i32* @counter
+ret i32 %counter.2
+}
+
+@const.0 = private unnamed_addr constant [3 x i32] [i32 7, i32 8, i32 9]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 1, i32 -2, i32 3, i32 0]
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+@counter = internal global i32 10
+@ratio = internal unnamed_addr constant double 0x3FE0000000000000
+@const.2 = private unnamed_addr constant [6 x i32] [i32 2, i32 3, i32 5, i32 7, i32 11, i32 13]
+@primes = internal unnamed_addr constant i32* getelementptr inbounds ([6 x i32], [6 x i32]* @const.2, i32 0, i32 0)
+@const.3 = private unnamed_addr constant [5 x i32] [i32 0, i32 1, i32 4, i32 9, i32 16]
+@squares = internal unnamed_addr constant i32* getelementptr inbounds ([5 x i32], [5 x i32]* @const.3, i32 0, i32 0)
+@const.4 = private unnamed_addr constant [3 x i8] [i8 120, i8 121, i8 122]
+@letters = internal unnamed_addr constant i8* getelementptr inbounds ([3 x i8], [3 x i8]* @const.4, i32 0, i32 0)
+@table.data = internal global [4 x i32] zeroinitializer
+@table = internal unnamed_addr constant i32* getelementptr inbounds ([4 x i32], [4 x i32]* @table.data, i32 0, i32 0)
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
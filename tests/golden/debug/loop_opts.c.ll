@@ -0,0 +1,275 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @square(i32 %cx) nounwind readnone norecurse {
+%x.addr.0 = alloca i32
+store i32 %cx, i32* %x.addr.0
+%x.0 = load i32, i32* %x.addr.0
+%x.1 = load i32, i32* %x.addr.0
+%temp.0.0 = mul i32 %x.0, %x.1
+ret i32 %temp.0.0
+}
+
+define internal i32 @fib(i32 %cn) nounwind readnone {
+%n.addr.0 = alloca i32
+store i32 %cn, i32* %n.addr.0
+%n.0 = load i32, i32* %n.addr.0
+%temp.0.0 = icmp slt i32 %n.0, 2
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%n.1 = load i32, i32* %n.addr.0
+ret i32 %n.1
+IfEnd.0.0:
+%n.2 = load i32, i32* %n.addr.0
+%temp.0.1 = sub i32 %n.2, 1
+%call.fib.0 = call i32 @fib(i32 %temp.0.1)
+%n.3 = load i32, i32* %n.addr.0
+%temp.0.2 = sub i32 %n.3, 2
+%call.fib.1 = call i32 @fib(i32 %temp.0.2)
+%temp.0.3 = add i32 %call.fib.0, %call.fib.1
+ret i32 %temp.0.3
+}
+
+define internal i32 @unused(i32 %cx) nounwind readnone norecurse {
+%x.addr.0 = alloca i32
+store i32 %cx, i32* %x.addr.0
+%x.0 = load i32, i32* %x.addr.0
+%temp.0.0 = add i32 %x.0, 1
+ret i32 %temp.0.0
+}
+
+define internal i32 @weighted(i32* %ca, i32 %cn, i32 %cscale) nounwind readonly norecurse {
+%total.addr.3 = alloca i32
+%i.addr.4 = alloca i32
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 8
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 32, i1 0)
+store i32* %a.0,i32** %a.addr.0
+%n.addr.1 = alloca i32
+store i32 %cn, i32* %n.addr.1
+%scale.addr.2 = alloca i32
+store i32 %cscale, i32* %scale.addr.2
+%total.0 = add i32 0, 0
+store i32 %total.0, i32* %total.addr.3
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.4
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.4
+%n.0 = load i32, i32* %n.addr.1
+%temp.0.0 = icmp slt i32 %i.1, %n.0
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%total.1 = load i32, i32* %total.addr.3
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.4
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%a.3 = load i32, i32* %a.2
+%scale.0 = load i32, i32* %scale.addr.2
+%scale.1 = load i32, i32* %scale.addr.2
+%temp.0.1 = mul i32 %scale.0, %scale.1
+%temp.0.2 = add i32 %temp.0.1, 1
+%temp.0.3 = mul i32 %a.3, %temp.0.2
+%temp.0.4 = add i32 %total.1, %temp.0.3
+store i32 %temp.0.4, i32* %total.addr.3
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.4
+%temp.0.5 = add i32 %i.3, 1
+store i32 %temp.0.5, i32* %i.addr.4
+br label %for.cond.0
+
+for.exit.0:
+%total.2 = load i32, i32* %total.addr.3
+ret i32 %total.2
+}
+
+define internal double @average(i32* %ca, i32 %cn) nounwind readonly norecurse {
+%s.addr.2 = alloca double
+%i.addr.3 = alloca i32
+%a.addr.0 = alloca i32*
+%a.0 = alloca i32, i32 8
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %a.0, i32* %ca, i32 32, i1 0)
+store i32* %a.0,i32** %a.addr.0
+%n.addr.1 = alloca i32
+store i32 %cn, i32* %n.addr.1
+%temp.0.0 = sitofp i32 0 to double
+store double %temp.0.0, double* %s.addr.2
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.3
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.3
+%n.0 = load i32, i32* %n.addr.1
+%temp.0.1 = icmp slt i32 %i.1, %n.0
+br i1 %temp.0.1, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%s.0 = load double, double* %s.addr.2
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.3
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%a.3 = load i32, i32* %a.2
+%temp.0.2 = sitofp i32 %a.3 to double
+%temp.0.3 = fadd fast double %s.0, %temp.0.2
+store double %temp.0.3, double* %s.addr.2
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.3
+%temp.0.4 = add i32 %i.3, 1
+store i32 %temp.0.4, i32* %i.addr.3
+br label %for.cond.0, !llvm.loop !0
+
+for.exit.0:
+%s.1 = load double, double* %s.addr.2
+%n.1 = load i32, i32* %n.addr.1
+%temp.0.5 = sitofp i32 %n.1 to double
+%temp.0.6 = fdiv fast double %s.1, %temp.0.5
+ret double %temp.0.6
+}
+
+define i32 @main() nounwind norecurse {
+%a.addr.0 = alloca i32*
+%i.addr.1 = alloca i32
+%k.addr.2 = alloca i32
+%j.addr.3 = alloca i32
+%c.addr.4 = alloca i8
+%wide.addr.5 = alloca i32
+%a.0 = alloca i32, i32 8
+store i32* %a.0, i32** %a.addr.0
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.1
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.1
+%temp.0.0 = icmp slt i32 %i.1, 8
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%a.1 = load i32*, i32** %a.addr.0
+%i.2 = load i32, i32* %i.addr.1
+%a.2 = getelementptr inbounds i32, i32* %a.1, i32 %i.2
+%i.3 = load i32, i32* %i.addr.1
+%call.square.0 = call i32 @square(i32 %i.3)
+%i.4 = load i32, i32* %i.addr.1
+%temp.0.1 = sub i32 %call.square.0, %i.4
+store i32 %temp.0.1, i32* %a.2
+br label %for.hatch.0
+for.hatch.0:
+%i.5 = load i32, i32* %i.addr.1
+%temp.0.2 = add i32 %i.5, 1
+store i32 %temp.0.2, i32* %i.addr.1
+br label %for.cond.0, !llvm.loop !4
+
+for.exit.0:
+%k.0 = add i32 0, 3
+store i32 %k.0, i32* %k.addr.2
+%j.0 = add i32 0, 0
+store i32 %j.0, i32* %j.addr.3
+br label %whihe.cond.0
+
+whihe.cond.0:
+%j.1 = load i32, i32* %j.addr.3
+%temp.0.3 = icmp slt i32 %j.1, 8
+br i1 %temp.0.3, label %whihe.body.0, label %while.exit.0
+
+whihe.body.0:
+%a.3 = load i32*, i32** %a.addr.0
+%j.2 = load i32, i32* %j.addr.3
+%a.4 = getelementptr inbounds i32, i32* %a.3, i32 %j.2
+%a.5 = load i32*, i32** %a.addr.0
+%j.3 = load i32, i32* %j.addr.3
+%a.6 = getelementptr inbounds i32, i32* %a.5, i32 %j.3
+%a.7 = load i32, i32* %a.6
+%k.1 = load i32, i32* %k.addr.2
+%temp.0.4 = mul i32 %k.1, 2
+%temp.0.5 = add i32 %temp.0.4, 1
+%temp.0.6 = add i32 %a.7, %temp.0.5
+%a.8 = load i32*, i32** %a.addr.0
+%j.4 = load i32, i32* %j.addr.3
+%a.9 = getelementptr inbounds i32, i32* %a.8, i32 %j.4
+%a.10 = load i32, i32* %a.9
+%k.2 = load i32, i32* %k.addr.2
+%temp.0.7 = mul i32 %k.2, 2
+%temp.0.8 = add i32 %temp.0.7, 1
+%temp.0.9 = mul i32 %a.10, %temp.0.8
+%temp.0.10 = add i32 %temp.0.6, %temp.0.9
+store i32 %temp.0.10, i32* %a.4
+%j.5 = load i32, i32* %j.addr.3
+%temp.0.11 = add i32 %j.5, 1
+store i32 %temp.0.11, i32* %j.addr.3
+br label %whihe.cond.0
+while.exit.0:
+%a.11 = load i32*, i32** %a.addr.0
+%call.weighted.0 = call i32 @weighted(i32* %a.11, i32 8, i32 2)
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.weighted.0)
+%a.12 = load i32*, i32** %a.addr.0
+%call.average.0 = call double @average(i32* %a.12, i32 8)
+%call.print_float.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %call.average.0)
+%call.fib.0 = call i32 @fib(i32 15)
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.fib.0)
+%call.square.1 = call i32 @square(i32 12)
+%call.square.2 = call i32 @square(i32 5)
+%temp.0.12 = add i32 %call.square.1, %call.square.2
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %temp.0.12)
+%temp.0.13 = trunc i32 200 to i8
+store i8 %temp.0.13, i8* %c.addr.4
+%c.0 = load i8, i8* %c.addr.4
+%temp.0.14 = zext i8 %c.0 to i32
+store i32 %temp.0.14, i32* %wide.addr.5
+%wide.0 = load i32, i32* %wide.addr.5
+%call.print_int.3 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %wide.0)
+%temp.0.15 = icmp ne i32 0, 0
+br i1 %temp.0.15, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%call.unused.0 = call i32 @unused(i32 1)
+%call.print_int.4 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.unused.0)
+br label %IfEnd.0.0
+IfEnd.0.0:
+ret i32 0
+%call.print_int.5 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 7)
+unreachable
+}
+
+
+!0 = distinct !{!0, !1, !2, !3}
+!1 = !{!"llvm.loop.vectorize.width", i32 4}
+!2 = !{!"llvm.loop.vectorize.enable", i1 true}
+!3 = !{!"llvm.loop.interleave.count", i32 2}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.unroll.count", i32 2}
@@ -0,0 +1,136 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @classify(i32 %cx) nounwind readnone norecurse {
+%r.addr.1 = alloca i32
+%x.addr.0 = alloca i32
+store i32 %cx, i32* %x.addr.0
+%r.0 = add i32 0, 0
+store i32 %r.0, i32* %r.addr.1
+%x.0 = load i32, i32* %x.addr.0
+%temp.0.0 = icmp eq i32 %x.0, 1
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfFalse.0.0
+
+IfTrue.0.0:
+%r.1 = add i32 0, 10
+store i32 %r.1, i32* %r.addr.1
+br label %IfEnd.0.0
+IfFalse.0.0:
+%x.1 = load i32, i32* %x.addr.0
+%temp.0.1 = icmp eq i32 %x.1, 2
+br i1 %temp.0.1, label %IfTrue.0.1, label %IfFalse.0.1
+
+IfTrue.0.1:
+%r.2 = add i32 0, 20
+store i32 %r.2, i32* %r.addr.1
+br label %IfEnd.0.1
+IfFalse.0.1:
+%x.2 = load i32, i32* %x.addr.0
+%temp.0.2 = icmp eq i32 %x.2, 3
+br i1 %temp.0.2, label %IfTrue.0.2, label %IfFalse.0.2
+
+IfTrue.0.2:
+%r.3 = add i32 0, 30
+store i32 %r.3, i32* %r.addr.1
+br label %IfEnd.0.2
+IfFalse.0.2:
+%r.4 = add i32 0, 40
+store i32 %r.4, i32* %r.addr.1
+br label %IfEnd.0.2
+IfEnd.0.2:
+br label %IfEnd.0.1
+IfEnd.0.1:
+br label %IfEnd.0.0
+IfEnd.0.0:
+%r.5 = load i32, i32* %r.addr.1
+ret i32 %r.5
+}
+
+define internal void @name(i8 %cc) nounwind norecurse {
+%c.addr.0 = alloca i8
+store i8 %cc, i8* %c.addr.0
+%c.0 = load i8, i8* %c.addr.0
+%temp.0.0 = icmp eq i8 %c.0, 97
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfFalse.0.0
+
+IfTrue.0.0:
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 1)
+br label %IfEnd.0.0
+IfFalse.0.0:
+%c.1 = load i8, i8* %c.addr.0
+%temp.0.1 = icmp eq i8 %c.1, 98
+br i1 %temp.0.1, label %IfTrue.0.1, label %IfFalse.0.1
+
+IfTrue.0.1:
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 2)
+br label %IfEnd.0.1
+IfFalse.0.1:
+%c.2 = load i8, i8* %c.addr.0
+%temp.0.2 = icmp eq i8 %c.2, 99
+br i1 %temp.0.2, label %IfTrue.0.2, label %IfEnd.0.2
+
+IfTrue.0.2:
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 3)
+br label %IfEnd.0.2
+IfEnd.0.2:
+br label %IfEnd.0.1
+IfEnd.0.1:
+br label %IfEnd.0.0
+IfEnd.0.0:
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%i.addr.0 = alloca i32
+br label %for.head.0
+
+for.head.0:
+%i.0 = add i32 0, 0
+store i32 %i.0, i32* %i.addr.0
+br label %for.cond.0
+for.cond.0:
+%i.1 = load i32, i32* %i.addr.0
+%temp.0.0 = icmp slt i32 %i.1, 5
+br i1 %temp.0.0, label %for.body.0, label %for.exit.0
+
+for.body.0:
+%i.2 = load i32, i32* %i.addr.0
+%call.classify.0 = call i32 @classify(i32 %i.2)
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.classify.0)
+br label %for.hatch.0
+for.hatch.0:
+%i.3 = load i32, i32* %i.addr.0
+%temp.0.1 = add i32 %i.3, 1
+store i32 %temp.0.1, i32* %i.addr.0
+br label %for.cond.0
+
+for.exit.0:
+call void @name(i8 97)
+call void @name(i8 99)
+call void @name(i8 122)
+ret i32 0
+}
+
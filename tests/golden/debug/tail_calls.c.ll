@@ -0,0 +1,120 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @sum_to(i32 %cn, i32 %cacc) nounwind readnone {
+%n.addr.0 = alloca i32
+store i32 %cn, i32* %n.addr.0
+%acc.addr.1 = alloca i32
+store i32 %cacc, i32* %acc.addr.1
+%n.0 = load i32, i32* %n.addr.0
+%temp.0.0 = icmp eq i32 %n.0, 0
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%acc.0 = load i32, i32* %acc.addr.1
+ret i32 %acc.0
+IfEnd.0.0:
+%n.1 = load i32, i32* %n.addr.0
+%temp.0.1 = sub i32 %n.1, 1
+%acc.1 = load i32, i32* %acc.addr.1
+%n.2 = load i32, i32* %n.addr.0
+%temp.0.2 = add i32 %acc.1, %n.2
+%call.sum_to.0 = call i32 @sum_to(i32 %temp.0.1, i32 %temp.0.2)
+ret i32 %call.sum_to.0
+}
+
+define internal i32 @gcd(i32 %ca, i32 %cb) nounwind readnone {
+%a.addr.0 = alloca i32
+store i32 %ca, i32* %a.addr.0
+%b.addr.1 = alloca i32
+store i32 %cb, i32* %b.addr.1
+%b.0 = load i32, i32* %b.addr.1
+%temp.0.0 = icmp eq i32 %b.0, 0
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%a.0 = load i32, i32* %a.addr.0
+ret i32 %a.0
+IfEnd.0.0:
+%b.1 = load i32, i32* %b.addr.1
+%a.1 = load i32, i32* %a.addr.0
+%a.2 = load i32, i32* %a.addr.0
+%b.2 = load i32, i32* %b.addr.1
+%temp.0.1 = sdiv i32 %a.2, %b.2
+%b.3 = load i32, i32* %b.addr.1
+%temp.0.2 = mul i32 %temp.0.1, %b.3
+%temp.0.3 = sub i32 %a.1, %temp.0.2
+%call.gcd.0 = call i32 @gcd(i32 %b.1, i32 %temp.0.3)
+ret i32 %call.gcd.0
+}
+
+define internal i32 @count_down(i32 %cn, i32 %csteps) nounwind readnone {
+%n.addr.0 = alloca i32
+store i32 %cn, i32* %n.addr.0
+%steps.addr.1 = alloca i32
+store i32 %csteps, i32* %steps.addr.1
+%n.0 = load i32, i32* %n.addr.0
+%temp.0.0 = icmp sle i32 %n.0, 0
+br i1 %temp.0.0, label %IfTrue.0.0, label %IfEnd.0.0
+
+IfTrue.0.0:
+%steps.0 = load i32, i32* %steps.addr.1
+ret i32 %steps.0
+IfEnd.0.0:
+%n.1 = load i32, i32* %n.addr.0
+%n.2 = load i32, i32* %n.addr.0
+%temp.0.1 = sdiv i32 %n.2, 2
+%temp.0.2 = mul i32 %temp.0.1, 2
+%temp.0.3 = sub i32 %n.1, %temp.0.2
+%temp.0.4 = icmp eq i32 %temp.0.3, 0
+br i1 %temp.0.4, label %IfTrue.0.1, label %IfEnd.0.1
+
+IfTrue.0.1:
+%n.3 = load i32, i32* %n.addr.0
+%temp.0.5 = sdiv i32 %n.3, 2
+%steps.1 = load i32, i32* %steps.addr.1
+%temp.0.6 = add i32 %steps.1, 1
+%call.count_down.0 = call i32 @count_down(i32 %temp.0.5, i32 %temp.0.6)
+ret i32 %call.count_down.0
+IfEnd.0.1:
+%n.4 = load i32, i32* %n.addr.0
+%temp.0.7 = sub i32 %n.4, 1
+%steps.2 = load i32, i32* %steps.addr.1
+%temp.0.8 = add i32 %steps.2, 1
+%call.count_down.1 = call i32 @count_down(i32 %temp.0.7, i32 %temp.0.8)
+ret i32 %call.count_down.1
+}
+
+define i32 @main() nounwind norecurse {
+%call.sum_to.0 = call i32 @sum_to(i32 50000, i32 0)
+%call.print_int.0 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.sum_to.0)
+%call.gcd.0 = call i32 @gcd(i32 1071, i32 462)
+%call.print_int.1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.gcd.0)
+%call.count_down.0 = call i32 @count_down(i32 1000000, i32 0)
+%call.print_int.2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %call.count_down.0)
+ret i32 0
+}
+
@@ -0,0 +1,469 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca double*
+%4 = alloca i8*
+store i32* getelementptr inbounds ([6 x i32], [6 x i32]* @const.0, i32 0, i32 0), i32** %1
+%5 = alloca i32, i32 6
+store i32* %5, i32** %2
+%6 = alloca double, i32 4
+store double* %6, double** %3
+call void @llvm.memcpy.p0f64.p0f64.i32(double* %6, double* getelementptr inbounds ([4 x double], [4 x double]* @const.1, i32 0, i32 0), i32 32, i1 0)
+%7 = alloca i8, i32 5
+store i8* %7, i8** %4
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %7, i8* getelementptr inbounds ([5 x i8], [5 x i8]* @const.2, i32 0, i32 0), i32 5, i1 0)
+%8 = load i32*, i32** %1
+%9 = call i32 @array.sum.i32(i32* %8, i32 6)
+%10 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %9)
+%11 = load i32*, i32** %1
+%12 = call i32 @array.min.i32(i32* %11, i32 6)
+%13 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %12)
+%14 = load i32*, i32** %1
+%15 = call i32 @array.max.i32(i32* %14, i32 4)
+%16 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %15)
+%17 = load i32*, i32** %2
+%18 = load i32*, i32** %1
+%19 = icmp sgt i32 6, 0
+%20 = select i1 %19, i32 6, i32 0
+%21 = mul i32 %20, 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %17, i32* %18, i32 %21, i1 false)
+%22 = load i32*, i32** %2
+call void @array.sort.i32(i32* %22, i32 6)
+%23 = load i32*, i32** %2
+call void @array.print.i32(i32* %23, i32 6)
+%24 = load i32*, i32** %1
+call void @array.print.i32(i32* %24, i32 6)
+%25 = load i32*, i32** %2
+call void @array.fill.i32(i32* %25, i32 1, i32 3)
+%26 = load i32*, i32** %2
+call void @array.print.i32(i32* %26, i32 6)
+%27 = load double*, double** %3
+%28 = call double @array.sum.f64(double* %27, i32 4)
+%29 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %28)
+%30 = load double*, double** %3
+%31 = call double @array.min.f64(double* %30, i32 4)
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %31)
+%33 = load double*, double** %3
+call void @array.sort.f64(double* %33, i32 4)
+%34 = load double*, double** %3
+call void @array.print.f64(double* %34, i32 4)
+%35 = load i8*, i8** %4
+call void @array.sort.i8(i8* %35, i32 5)
+%36 = load i8*, i8** %4
+call void @array.print.i8(i8* %36, i32 5)
+%37 = load i32*, i32** %1
+%38 = call i32 @array.sum.i32(i32* %37, i32 0)
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %38)
+ret i32 0
+}
+
+@const.0 = private unnamed_addr constant [6 x i32] [i32 5, i32 -3, i32 9, i32 0, i32 7, i32 2]
+@const.1 = private unnamed_addr constant [4 x double] [double 0x3FF8000000000000, double 0xC002000000000000, double 0x4010000000000000, double 0x3FE0000000000000]
+@const.2 = private unnamed_addr constant [5 x i8] [i8 100, i8 97, i8 99, i8 98, i8 101]
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+define internal i32 @array.min.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %better = icmp slt i32 %v, %acc
+  %acc.next = select i1 %better, i32 %v, i32 %acc
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+define internal i32 @array.max.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %better = icmp sgt i32 %v, %acc
+  %acc.next = select i1 %better, i32 %v, i32 %acc
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !4
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+declare void @qsort(i8*, i64, i64, i32 (i8*, i8*)*)
+define internal i32 @array.compare.i32(i8* %x, i8* %y) nounwind readonly {
+entry:
+  %px = bitcast i8* %x to i32*
+  %py = bitcast i8* %y to i32*
+  %vx = load i32, i32* %px
+  %vy = load i32, i32* %py
+  %less = icmp slt i32 %vx, %vy
+  %greater = icmp sgt i32 %vx, %vy
+  %less.32 = zext i1 %less to i32
+  %greater.32 = zext i1 %greater to i32
+  %order = sub i32 %greater.32, %less.32
+  ret i32 %order
+}
+
+define internal void @array.sort.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %many = icmp sgt i32 %n, 1
+  br i1 %many, label %sort, label %done
+sort:
+  %data = bitcast i32* %a to i8*
+  %count = sext i32 %n to i64
+  call void @qsort(i8* %data, i64 %count, i64 4, i32 (i8*, i8*)* @array.compare.i32)
+  br label %done
+done:
+  ret void
+}
+
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !10
+done:
+  ret void
+}
+
+define internal double @array.sum.f64(double* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load double, double* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi double [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds double, double* %a, i64 %i
+  %v = load double, double* %p
+  %acc.next = fadd double %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %result = phi double [ 0.0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret double %result
+}
+
+define internal double @array.min.f64(double* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load double, double* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi double [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds double, double* %a, i64 %i
+  %v = load double, double* %p
+  %better = fcmp olt double %v, %acc
+  %acc.next = select i1 %better, double %v, double %acc
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %result = phi double [ 0.0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret double %result
+}
+
+define internal i32 @array.compare.f64(i8* %x, i8* %y) nounwind readonly {
+entry:
+  %px = bitcast i8* %x to double*
+  %py = bitcast i8* %y to double*
+  %vx = load double, double* %px
+  %vy = load double, double* %py
+  %less = fcmp olt double %vx, %vy
+  %greater = fcmp ogt double %vx, %vy
+  %less.32 = zext i1 %less to i32
+  %greater.32 = zext i1 %greater to i32
+  %order = sub i32 %greater.32, %less.32
+  ret i32 %order
+}
+
+define internal void @array.sort.f64(double* %a, i32 %n) nounwind {
+entry:
+  %many = icmp sgt i32 %n, 1
+  br i1 %many, label %sort, label %done
+sort:
+  %data = bitcast double* %a to i8*
+  %count = sext i32 %n to i64
+  call void @qsort(i8* %data, i64 %count, i64 8, i32 (i8*, i8*)* @array.compare.f64)
+  br label %done
+done:
+  ret void
+}
+
+declare i32 @snprintf(i8*, i64, i8*, ...) nounwind
+define internal void @array.print.f64(double* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds double, double* %a, i64 %i
+  %v = load double, double* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %room = sub i64 16384, %start
+  %written = call i32 (i8*, i64, i8*, ...) @snprintf(i8* %out, i64 %room, i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %v)
+  %written.64 = sext i32 %written to i64
+  %pos.next = add i64 %start, %written.64
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+define internal i32 @array.compare.i8(i8* %x, i8* %y) nounwind readonly {
+entry:
+  %px = bitcast i8* %x to i8*
+  %py = bitcast i8* %y to i8*
+  %vx = load i8, i8* %px
+  %vy = load i8, i8* %py
+  %less = icmp slt i8 %vx, %vy
+  %greater = icmp sgt i8 %vx, %vy
+  %less.32 = zext i1 %less to i32
+  %greater.32 = zext i1 %greater to i32
+  %order = sub i32 %greater.32, %less.32
+  ret i32 %order
+}
+
+define internal void @array.sort.i8(i8* %a, i32 %n) nounwind {
+entry:
+  %many = icmp sgt i32 %n, 1
+  br i1 %many, label %sort, label %done
+sort:
+  %data = bitcast i8* %a to i8*
+  %count = sext i32 %n to i64
+  call void @qsort(i8* %data, i64 %count, i64 1, i32 (i8*, i8*)* @array.compare.i8)
+  br label %done
+done:
+  ret void
+}
+
+define internal void @array.print.i8(i8* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i8, i8* %a, i64 %i
+  %v = load i8, i8* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  store i8 %v, i8* %out
+  %newline.out = getelementptr inbounds i8, i8* %out, i64 1
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %start, 2
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.vectorize.enable", i1 true}
+!6 = distinct !{!6, !7}
+!7 = !{!"llvm.loop.vectorize.enable", i1 true}
+!8 = distinct !{!8, !9}
+!9 = !{!"llvm.loop.vectorize.enable", i1 true}
+!10 = distinct !{!10, !11}
+!11 = !{!"llvm.loop.vectorize.enable", i1 true}
+!12 = distinct !{!12, !13}
+!13 = !{!"llvm.loop.vectorize.enable", i1 true}
+!14 = distinct !{!14, !15}
+!15 = !{!"llvm.loop.vectorize.enable", i1 true}
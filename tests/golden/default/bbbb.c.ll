@@ -0,0 +1,241 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @print_arr(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i8*
+%3 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %3, i8* %carr, i32 10, i1 0)
+store i8* %3,i8** %2
+%4 = alloca i32
+store i32 %cn, i32* %4
+br label %5
+
+5:
+%6 = add i32 0, 0
+store i32 %6, i32* %1
+br label %7
+7:
+%8 = load i32, i32* %1
+%9 = load i32, i32* %4
+%10 = icmp slt i32 %8, %9
+br i1 %10, label %11, label %20
+
+11:
+%12 = load i8*, i8** %2
+%13 = load i32, i32* %1
+%14 = getelementptr inbounds i8, i8* %12, i32 %13
+%15 = load i8, i8* %14
+%16 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %15)
+br label %17
+17:
+%18 = load i32, i32* %1
+%19 = add i32 %18, 1
+store i32 %19, i32* %1
+br label %7
+
+20:
+ret void
+}
+
+define internal void @sortAndPrint(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i8*
+%5 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %5, i8* %carr, i32 10, i1 0)
+store i8* %5,i8** %4
+%6 = alloca i32
+store i32 %cn, i32* %6
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %1
+br label %9
+9:
+%10 = load i32, i32* %1
+%11 = load i32, i32* %6
+%12 = sub i32 %11, 1
+%13 = icmp slt i32 %10, %12
+br i1 %13, label %14, label %63
+
+14:
+br label %15
+
+15:
+%16 = add i32 0, 0
+store i32 %16, i32* %2
+br label %17
+17:
+%18 = load i32, i32* %2
+%19 = load i32, i32* %6
+%20 = load i32, i32* %1
+%21 = sub i32 %19, %20
+%22 = sub i32 %21, 1
+%23 = icmp slt i32 %18, %22
+br i1 %23, label %24, label %59
+
+24:
+%25 = load i8*, i8** %4
+%26 = load i32, i32* %2
+%27 = getelementptr inbounds i8, i8* %25, i32 %26
+%28 = load i8, i8* %27
+%29 = load i8*, i8** %4
+%30 = load i32, i32* %2
+%31 = add i32 %30, 1
+%32 = getelementptr inbounds i8, i8* %29, i32 %31
+%33 = load i8, i8* %32
+%34 = icmp slt i8 %28, %33
+br i1 %34, label %35, label %55
+
+35:
+%36 = load i8*, i8** %4
+%37 = load i32, i32* %2
+%38 = add i32 %37, 1
+%39 = getelementptr inbounds i8, i8* %36, i32 %38
+%40 = load i8, i8* %39
+%41 = zext i8 %40 to i32
+store i32 %41, i32* %3
+%42 = load i8*, i8** %4
+%43 = load i32, i32* %2
+%44 = add i32 %43, 1
+%45 = getelementptr inbounds i8, i8* %42, i32 %44
+%46 = load i8*, i8** %4
+%47 = load i32, i32* %2
+%48 = getelementptr inbounds i8, i8* %46, i32 %47
+%49 = load i8, i8* %48
+store i8 %49, i8* %45
+%50 = load i8*, i8** %4
+%51 = load i32, i32* %2
+%52 = getelementptr inbounds i8, i8* %50, i32 %51
+%53 = load i32, i32* %3
+%54 = trunc i32 %53 to i8
+store i8 %54, i8* %52
+br label %55
+55:
+br label %56
+56:
+%57 = load i32, i32* %2
+%58 = add i32 %57, 1
+store i32 %58, i32* %2
+br label %17
+
+59:
+br label %60
+60:
+%61 = load i32, i32* %1
+%62 = add i32 %61, 1
+store i32 %62, i32* %1
+br label %9
+
+63:
+%64 = load i8*, i8** %4
+%65 = load i32, i32* %6
+call void @print_arr(i8* %64, i32 %65)
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i8*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca double
+%7 = alloca i1
+%8 = alloca double
+%9 = alloca i8
+%10 = alloca double
+%11 = alloca i32
+%12 = alloca i8*
+%13 = alloca i8, i32 10
+store i8* %13, i8** %1
+%14 = alloca i32, i32 20
+store i32* %14, i32** %2
+%15 = add i32 0, 10
+store i32 %15, i32* %3
+%16 = add i32 0, 0
+store i32 %16, i32* %4
+%17 = add i32 0, 0
+store i32 %17, i32* %5
+%18 = load i32, i32* %5
+%19 = sitofp i32 %18 to double
+store double %19, double* %6
+%20 = icmp ne i32 0, 0
+store i1 %20, i1* %7
+%21 = load i1, i1* %7
+%22 = sitofp i1 %21 to double
+store double %22, double* %8
+%23 = add i8 0, 97
+store i8 %23, i8* %9
+%24 = load i8, i8* %9
+%25 = sitofp i8 %24 to double
+store double %25, double* %10
+%26 = load double, double* %6
+%27 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %26)
+%28 = load double, double* %8
+%29 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %28)
+%30 = load double, double* %10
+%31 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %30)
+%32 = alloca i8, i32 100
+call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* %32)
+store i8* %32, i8** %1 
+%34 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 98)
+br label %35
+
+35:
+%36 = add i32 0, 0
+store i32 %36, i32* %11
+br label %37
+37:
+%38 = load i32, i32* %11
+%39 = icmp slt i32 %38, 10
+br i1 %39, label %40, label %46
+
+40:
+%41 = load i32, i32* %11
+%42 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %41)
+br label %43
+43:
+%44 = load i32, i32* %11
+%45 = add i32 %44, 1
+store i32 %45, i32* %11
+br label %37
+
+46:
+%47 = alloca i8, i32 10
+store i8* %47, i8** %12
+%48 = load i8*, i8** %1
+%49 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %49, i8* %48, i32 10, i1 0)
+store i8* %49, i8** %12
+%50 = load i8*, i8** %12
+call void @sortAndPrint(i8* %50, i32 10)
+ret i32 0
+}
+
@@ -0,0 +1,193 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @tick(i32 %cn) nounwind norecurse {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = load i32, i32* @counter
+%3 = load i32, i32* %1
+%4 = add i32 %2, %3
+store i32 %4, i32* @counter
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32*
+%3 = alloca i32*
+br label %4
+
+4:
+%5 = add i32 0, 0
+store i32 %5, i32* %1
+br label %6
+6:
+%7 = load i32, i32* %1
+%8 = icmp slt i32 %7, 4
+br i1 %8, label %9, label %27
+
+9:
+%10 = load i32*, i32** @table
+%11 = load i32, i32* %1
+%12 = getelementptr inbounds i32, i32* %10, i32 %11
+%13 = load i32*, i32** @primes
+%14 = load i32, i32* %1
+%15 = getelementptr inbounds i32, i32* %13, i32 %14
+%16 = load i32, i32* %15
+%17 = load i32*, i32** @squares
+%18 = load i32, i32* %1
+%19 = add i32 %18, 1
+%20 = getelementptr inbounds i32, i32* %17, i32 %19
+%21 = load i32, i32* %20
+%22 = mul i32 %16, %21
+store i32 %22, i32* %12
+%23 = load i32, i32* %1
+call void @tick(i32 %23)
+br label %24
+24:
+%25 = load i32, i32* %1
+%26 = add i32 %25, 1
+store i32 %26, i32* %1
+br label %6
+
+27:
+%28 = load i32, i32* @counter
+%29 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %28)
+%30 = load double, double* @ratio
+%31 = load i32, i32* @counter
+%32 = sitofp i32 %31 to double
+%33 = fmul double %30, %32
+%34 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %33)
+%35 = load i32*, i32** @table
+call void @array.print.i32(i32* %35, i32 4)
+%36 = load i8*, i8** @letters
+%37 = getelementptr inbounds i8, i8* %36, i32 1
+%38 = load i8, i8* %37
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %38)
+store i32* getelementptr inbounds ([3 x i32], [3 x i32]* @const.0, i32 0, i32 0), i32** %2
+%40 = load i32*, i32** %2
+%41 = getelementptr inbounds i32, i32* %40, i32 2
+%42 = load i32, i32* %41
+%43 = load i32*, i32** @primes
+%44 = getelementptr inbounds i32, i32* %43, i32 5
+%45 = load i32, i32* %44
+%46 = add i32 %42, %45
+%47 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %46)
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %3
+%48 = load i32*, i32** %3
+call void @array.print.i32(i32* %48, i32 4)
+%49 = load i32, i32* @counter
+ret i32 %49
+}
+
+@const.0 = private unnamed_addr constant [3 x i32] [i32 7, i32 8, i32 9]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 1, i32 -2, i32 3, i32 0]
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+@counter = internal global i32 10
+@ratio = internal unnamed_addr constant double 0x3FE0000000000000
+@const.2 = private unnamed_addr constant [6 x i32] [i32 2, i32 3, i32 5, i32 7, i32 11, i32 13]
+@primes = internal unnamed_addr constant i32* getelementptr inbounds ([6 x i32], [6 x i32]* @const.2, i32 0, i32 0)
+@const.3 = private unnamed_addr constant [5 x i32] [i32 0, i32 1, i32 4, i32 9, i32 16]
+@squares = internal unnamed_addr constant i32* getelementptr inbounds ([5 x i32], [5 x i32]* @const.3, i32 0, i32 0)
+@const.4 = private unnamed_addr constant [3 x i8] [i8 120, i8 121, i8 122]
+@letters = internal unnamed_addr constant i8* getelementptr inbounds ([3 x i8], [3 x i8]* @const.4, i32 0, i32 0)
+@table.data = internal global [4 x i32] zeroinitializer
+@table = internal unnamed_addr constant i32* getelementptr inbounds ([4 x i32], [4 x i32]* @table.data, i32 0, i32 0)
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
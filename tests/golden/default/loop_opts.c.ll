@@ -0,0 +1,275 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @square(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = load i32, i32* %1
+%3 = load i32, i32* %1
+%4 = mul i32 %2, %3
+ret i32 %4
+}
+
+define internal i32 @fib(i32 %cn) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = load i32, i32* %1
+%3 = icmp slt i32 %2, 2
+br i1 %3, label %4, label %6
+
+4:
+%5 = load i32, i32* %1
+ret i32 %5
+6:
+%7 = load i32, i32* %1
+%8 = sub i32 %7, 1
+%9 = call i32 @fib(i32 %8)
+%10 = load i32, i32* %1
+%11 = sub i32 %10, 2
+%12 = call i32 @fib(i32 %11)
+%13 = add i32 %9, %12
+ret i32 %13
+}
+
+define internal i32 @unused(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = load i32, i32* %1
+%3 = add i32 %2, 1
+ret i32 %3
+}
+
+define internal i32 @weighted(i32* %ca, i32 %cn, i32 %cscale) nounwind readonly norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32, i32 8
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* %ca, i32 32, i1 0)
+store i32* %4,i32** %3
+%5 = alloca i32
+store i32 %cn, i32* %5
+%6 = alloca i32
+store i32 %cscale, i32* %6
+%7 = add i32 0, 0
+store i32 %7, i32* %1
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %2
+br label %10
+10:
+%11 = load i32, i32* %2
+%12 = load i32, i32* %5
+%13 = icmp slt i32 %11, %12
+br i1 %13, label %14, label %29
+
+14:
+%15 = load i32, i32* %1
+%16 = load i32*, i32** %3
+%17 = load i32, i32* %2
+%18 = getelementptr inbounds i32, i32* %16, i32 %17
+%19 = load i32, i32* %18
+%20 = load i32, i32* %6
+%21 = load i32, i32* %6
+%22 = mul i32 %20, %21
+%23 = add i32 %22, 1
+%24 = mul i32 %19, %23
+%25 = add i32 %15, %24
+store i32 %25, i32* %1
+br label %26
+26:
+%27 = load i32, i32* %2
+%28 = add i32 %27, 1
+store i32 %28, i32* %2
+br label %10
+
+29:
+%30 = load i32, i32* %1
+ret i32 %30
+}
+
+define internal double @average(i32* %ca, i32 %cn) nounwind readonly norecurse {
+%1 = alloca double
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32, i32 8
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* %ca, i32 32, i1 0)
+store i32* %4,i32** %3
+%5 = alloca i32
+store i32 %cn, i32* %5
+%6 = sitofp i32 0 to double
+store double %6, double* %1
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %2
+br label %9
+9:
+%10 = load i32, i32* %2
+%11 = load i32, i32* %5
+%12 = icmp slt i32 %10, %11
+br i1 %12, label %13, label %24
+
+13:
+%14 = load double, double* %1
+%15 = load i32*, i32** %3
+%16 = load i32, i32* %2
+%17 = getelementptr inbounds i32, i32* %15, i32 %16
+%18 = load i32, i32* %17
+%19 = sitofp i32 %18 to double
+%20 = fadd double %14, %19
+store double %20, double* %1
+br label %21
+21:
+%22 = load i32, i32* %2
+%23 = add i32 %22, 1
+store i32 %23, i32* %2
+br label %9, !llvm.loop !0
+
+24:
+%25 = load double, double* %1
+%26 = load i32, i32* %5
+%27 = sitofp i32 %26 to double
+%28 = fdiv double %25, %27
+ret double %28
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i8
+%6 = alloca i32
+%7 = alloca i32, i32 8
+store i32* %7, i32** %1
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %2
+br label %10
+10:
+%11 = load i32, i32* %2
+%12 = icmp slt i32 %11, 8
+br i1 %12, label %13, label %24
+
+13:
+%14 = load i32*, i32** %1
+%15 = load i32, i32* %2
+%16 = getelementptr inbounds i32, i32* %14, i32 %15
+%17 = load i32, i32* %2
+%18 = call i32 @square(i32 %17)
+%19 = load i32, i32* %2
+%20 = sub i32 %18, %19
+store i32 %20, i32* %16
+br label %21
+21:
+%22 = load i32, i32* %2
+%23 = add i32 %22, 1
+store i32 %23, i32* %2
+br label %10, !llvm.loop !4
+
+24:
+%25 = add i32 0, 3
+store i32 %25, i32* %3
+%26 = add i32 0, 0
+store i32 %26, i32* %4
+br label %27
+
+27:
+%28 = load i32, i32* %4
+%29 = icmp slt i32 %28, 8
+br i1 %29, label %30, label %53
+
+30:
+%31 = load i32*, i32** %1
+%32 = load i32, i32* %4
+%33 = getelementptr inbounds i32, i32* %31, i32 %32
+%34 = load i32*, i32** %1
+%35 = load i32, i32* %4
+%36 = getelementptr inbounds i32, i32* %34, i32 %35
+%37 = load i32, i32* %36
+%38 = load i32, i32* %3
+%39 = mul i32 %38, 2
+%40 = add i32 %39, 1
+%41 = add i32 %37, %40
+%42 = load i32*, i32** %1
+%43 = load i32, i32* %4
+%44 = getelementptr inbounds i32, i32* %42, i32 %43
+%45 = load i32, i32* %44
+%46 = load i32, i32* %3
+%47 = mul i32 %46, 2
+%48 = add i32 %47, 1
+%49 = mul i32 %45, %48
+%50 = add i32 %41, %49
+store i32 %50, i32* %33
+%51 = load i32, i32* %4
+%52 = add i32 %51, 1
+store i32 %52, i32* %4
+br label %27
+53:
+%54 = load i32*, i32** %1
+%55 = call i32 @weighted(i32* %54, i32 8, i32 2)
+%56 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %55)
+%57 = load i32*, i32** %1
+%58 = call double @average(i32* %57, i32 8)
+%59 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %58)
+%60 = call i32 @fib(i32 15)
+%61 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %60)
+%62 = call i32 @square(i32 12)
+%63 = call i32 @square(i32 5)
+%64 = add i32 %62, %63
+%65 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %64)
+%66 = trunc i32 200 to i8
+store i8 %66, i8* %5
+%67 = load i8, i8* %5
+%68 = zext i8 %67 to i32
+store i32 %68, i32* %6
+%69 = load i32, i32* %6
+%70 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %69)
+%71 = icmp ne i32 0, 0
+br i1 %71, label %72, label %75
+
+72:
+%73 = call i32 @unused(i32 1)
+%74 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %73)
+br label %75
+75:
+ret i32 0
+%77 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 7)
+unreachable
+}
+
+
+!0 = distinct !{!0, !1, !2, !3}
+!1 = !{!"llvm.loop.vectorize.width", i32 4}
+!2 = !{!"llvm.loop.vectorize.enable", i1 true}
+!3 = !{!"llvm.loop.interleave.count", i32 2}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.unroll.count", i32 2}
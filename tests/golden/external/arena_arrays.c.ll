@@ -0,0 +1,298 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32* @squares(i32 %cn) {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+store i32 %cn, i32* %3
+%4 = load i32, i32* %3
+%5 = mul i32 %4, 4
+%6 = zext i32 %5 to i64
+%7 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.heap, i64 %6)
+%8 = bitcast i8* %7 to i32*
+store i32* %8, i32** %1
+br label %9
+
+9:
+%10 = add i32 0, 0
+store i32 %10, i32* %2
+br label %11
+11:
+%12 = load i32, i32* %2
+%13 = load i32, i32* %3
+%14 = icmp slt i32 %12, %13
+br i1 %14, label %15, label %25
+
+15:
+%16 = load i32*, i32** %1
+%17 = load i32, i32* %2
+%18 = getelementptr inbounds i32, i32* %16, i32 %17
+%19 = load i32, i32* %2
+%20 = load i32, i32* %2
+%21 = mul i32 %19, %20
+store i32 %21, i32* %18
+br label %22
+22:
+%23 = load i32, i32* %2
+%24 = add i32 %23, 1
+store i32 %24, i32* %2
+br label %11
+
+25:
+%26 = load i32*, i32** %1
+ret i32* %26
+}
+
+define i32 @partial(i32 %cdepth) {
+%1 = alloca i32*
+%2 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%3 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%4 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%5 = alloca i32
+store i32 %cdepth, i32* %5
+%6 = load i32, i32* %5
+%7 = add i32 %6, 1
+%8 = mul i32 %7, 4
+%9 = zext i32 %8 to i64
+%10 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %9)
+%11 = bitcast i8* %10 to i32*
+store i32* %11, i32** %1
+%12 = load i32*, i32** %1
+%13 = load i32, i32* %5
+%14 = load i32, i32* %5
+%15 = add i32 %14, 1
+call void @array.fill.i32(i32* %12, i32 %13, i32 %15)
+%16 = load i32, i32* %5
+%17 = icmp eq i32 %16, 0
+br i1 %17, label %18, label %19
+
+18:
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %2, i8* %3, i8* %4)
+ret i32 0
+19:
+%20 = load i32*, i32** %1
+%21 = load i32, i32* %5
+%22 = add i32 %21, 1
+%23 = call i32 @array.sum.i32(i32* %20, i32 %22)
+%24 = load i32, i32* %5
+%25 = sub i32 %24, 1
+%26 = call i32 @partial(i32 %25)
+%27 = add i32 %23, %26
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %2, i8* %3, i8* %4)
+ret i32 %27
+}
+
+define i32 @main() {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32*
+%5 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 0)
+%6 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 1)
+%7 = load i8*, i8** getelementptr inbounds ({ i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* @arena.frame, i32 0, i32 2)
+%8 = add i32 0, 0
+store i32 %8, i32* %1
+br label %9
+
+9:
+%10 = add i32 0, 1
+store i32 %10, i32* %2
+br label %11
+11:
+%12 = load i32, i32* %2
+%13 = icmp slt i32 %12, 200
+br i1 %13, label %14, label %27
+
+14:
+%15 = load i32, i32* %2
+%16 = call i32* @squares(i32 %15)
+store i32* %16, i32** %3 
+%17 = load i32, i32* %1
+%18 = load i32*, i32** %3
+%19 = load i32, i32* %2
+%20 = sub i32 %19, 1
+%21 = getelementptr inbounds i32, i32* %18, i32 %20
+%22 = load i32, i32* %21
+%23 = add i32 %17, %22
+store i32 %23, i32* %1
+br label %24
+24:
+%25 = load i32, i32* %2
+%26 = add i32 %25, 1
+store i32 %26, i32* %2
+br label %11
+
+27:
+%28 = load i32, i32* %1
+%29 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %28)
+%30 = call i32 @partial(i32 30)
+%31 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %30)
+%32 = zext i32 80000 to i64
+%33 = call i8* @arena.alloc({ i8*, i8*, i8*, i8* }* @arena.frame, i64 %32)
+%34 = bitcast i8* %33 to i32*
+store i32* %34, i32** %4
+%35 = load i32*, i32** %4
+call void @array.fill.i32(i32* %35, i32 3, i32 20000)
+%36 = load i32*, i32** %4
+%37 = call i32 @array.sum.i32(i32* %36, i32 20000)
+%38 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %37)
+call void @arena.release({ i8*, i8*, i8*, i8* }* @arena.frame, i8* %5, i8* %6, i8* %7)
+ret i32 0
+}
+
+declare noalias i8* @malloc(i64) nounwind
+@arena.frame = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+@arena.heap = internal global { i8*, i8*, i8*, i8* } zeroinitializer
+declare void @free(i8*) nounwind
+
+define internal i8* @arena.alloc({ i8*, i8*, i8*, i8* }* %a, i64 %n) nounwind {
+entry:
+  %padded = add i64 %n, 15
+  %size = and i64 %padded, -16
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  %top = load i8*, i8** %topp
+  %end = load i8*, i8** %endp
+  %room = ptrtoint i8* %end to i64
+  %used = ptrtoint i8* %top to i64
+  %left = sub i64 %room, %used
+  %fits = icmp ule i64 %size, %left
+  br i1 %fits, label %bump, label %grow
+bump:
+  %next = getelementptr inbounds i8, i8* %top, i64 %size
+  store i8* %next, i8** %topp
+  ret i8* %top
+grow:
+  %want = add i64 %size, 16
+  %large = icmp ugt i64 %want, 1048576
+  %want.size = select i1 %large, i64 %want, i64 1048576
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  %spare = load i8*, i8** %sparep
+  %has.spare = icmp ne i8* %spare, null
+  br i1 %has.spare, label %check.spare, label %fresh
+check.spare:
+  %spare.sizep.raw = getelementptr inbounds i8, i8* %spare, i64 8
+  %spare.sizep = bitcast i8* %spare.sizep.raw to i64*
+  %spare.size = load i64, i64* %spare.sizep
+  %enough = icmp uge i64 %spare.size, %want.size
+  br i1 %enough, label %reuse, label %fresh
+reuse:
+  %spare.link = bitcast i8* %spare to i8**
+  %spare.next = load i8*, i8** %spare.link
+  store i8* %spare.next, i8** %sparep
+  br label %link
+fresh:
+  %new = call i8* @malloc(i64 %want.size)
+  %new.sizep.raw = getelementptr inbounds i8, i8* %new, i64 8
+  %new.sizep = bitcast i8* %new.sizep.raw to i64*
+  store i64 %want.size, i64* %new.sizep
+  br label %link
+link:
+  %chunk = phi i8* [ %spare, %reuse ], [ %new, %fresh ]
+  %chunk.size = phi i64 [ %spare.size, %reuse ], [ %want.size, %fresh ]
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %head = load i8*, i8** %headp
+  %chunk.link = bitcast i8* %chunk to i8**
+  store i8* %head, i8** %chunk.link
+  store i8* %chunk, i8** %headp
+  %data = getelementptr inbounds i8, i8* %chunk, i64 16
+  %data.end = getelementptr inbounds i8, i8* %data, i64 %size
+  store i8* %data.end, i8** %topp
+  %chunk.end = getelementptr inbounds i8, i8* %chunk, i64 %chunk.size
+  store i8* %chunk.end, i8** %endp
+  ret i8* %data
+}
+
+define internal void @arena.release({ i8*, i8*, i8*, i8* }* %a, i8* %head, i8* %top, i8* %end) nounwind {
+entry:
+  %headp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 0
+  %sparep = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 3
+  br label %check
+check:
+  %chunk = load i8*, i8** %headp
+  %done = icmp eq i8* %chunk, %head
+  br i1 %done, label %exit, label %discard
+discard:
+  %link = bitcast i8* %chunk to i8**
+  %prev = load i8*, i8** %link
+  store i8* %prev, i8** %headp
+  %spare = load i8*, i8** %sparep
+  store i8* %spare, i8** %link
+  store i8* %chunk, i8** %sparep
+  br label %check
+exit:
+  %topp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 1
+  store i8* %top, i8** %topp
+  %endp = getelementptr inbounds { i8*, i8*, i8*, i8* }, { i8*, i8*, i8*, i8* }* %a, i32 0, i32 2
+  store i8* %end, i8** %endp
+  ret void
+}
+
+define internal void @array.fill.i32(i32* %a, i32 %value, i32 %n) nounwind {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  store i32 %value, i32* %p
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !0
+done:
+  ret void
+}
+
+define internal i32 @array.sum.i32(i32* %a, i32 %n) nounwind readonly {
+entry:
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %first
+first:
+  %first.value = load i32, i32* %a
+  %single = icmp eq i64 %count, 1
+  br i1 %single, label %done, label %loop
+loop:
+  %i = phi i64 [ 1, %first ], [ %i.next, %loop ]
+  %acc = phi i32 [ %first.value, %first ], [ %acc.next, %loop ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %acc.next = add i32 %acc, %v
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done, !llvm.loop !2
+done:
+  %result = phi i32 [ 0, %entry ], [ %first.value, %first ], [ %acc.next, %loop ]
+  ret i32 %result
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
+!2 = distinct !{!2, !3}
+!3 = !{!"llvm.loop.vectorize.enable", i1 true}
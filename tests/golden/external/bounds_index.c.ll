@@ -0,0 +1,98 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main() {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca i32, i32 6
+store i32* %6, i32** %1
+%7 = add i32 0, 8
+store i32 %7, i32* %2
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %3
+br label %10
+10:
+%11 = load i32, i32* %3
+%12 = icmp slt i32 %11, 6
+br i1 %12, label %13, label %23
+
+13:
+%14 = load i32*, i32** %1
+%15 = load i32, i32* %3
+%16 = getelementptr inbounds i32, i32* %14, i32 %15
+%17 = load i32, i32* %3
+%18 = load i32, i32* %3
+%19 = mul i32 %17, %18
+store i32 %19, i32* %16
+br label %20
+20:
+%21 = load i32, i32* %3
+%22 = add i32 %21, 1
+store i32 %22, i32* %3
+br label %10
+
+23:
+%24 = add i32 0, 0
+store i32 %24, i32* %4
+br label %25
+
+25:
+%26 = add i32 0, 0
+store i32 %26, i32* %5
+br label %27
+27:
+%28 = load i32, i32* %5
+%29 = load i32, i32* %2
+%30 = icmp slt i32 %28, %29
+br i1 %30, label %31, label %43
+
+31:
+%32 = load i32, i32* %4
+%33 = load i32*, i32** %1
+%34 = load i32, i32* %5
+%35 = getelementptr inbounds i32, i32* %33, i32 %34
+%36 = load i32, i32* %35
+%37 = add i32 %32, %36
+store i32 %37, i32* %4
+%38 = load i32, i32* %4
+%39 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %38)
+br label %40
+40:
+%41 = load i32, i32* %5
+%42 = add i32 %41, 1
+store i32 %42, i32* %5
+br label %27
+
+43:
+ret i32 0
+}
+
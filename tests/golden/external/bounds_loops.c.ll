@@ -0,0 +1,312 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @dot(i32* %ca, i32* %cb, i32 %cn) {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+%4 = alloca i32, i32 16
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* %ca, i32 64, i1 0)
+store i32* %4,i32** %3
+%5 = alloca i32*
+%6 = alloca i32, i32 16
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %6, i32* %cb, i32 64, i1 0)
+store i32* %6,i32** %5
+%7 = alloca i32
+store i32 %cn, i32* %7
+%8 = add i32 0, 0
+store i32 %8, i32* %1
+br label %9
+
+9:
+%10 = add i32 0, 0
+store i32 %10, i32* %2
+br label %11
+11:
+%12 = load i32, i32* %2
+%13 = load i32, i32* %7
+%14 = icmp slt i32 %12, %13
+br i1 %14, label %15, label %33
+
+15:
+%16 = load i32, i32* %1
+%17 = load i32*, i32** %3
+%18 = load i32, i32* %2
+%19 = getelementptr inbounds i32, i32* %17, i32 %18
+%20 = load i32, i32* %19
+%21 = load i32*, i32** %5
+%22 = load i32, i32* %7
+%23 = sub i32 %22, 1
+%24 = load i32, i32* %2
+%25 = sub i32 %23, %24
+%26 = getelementptr inbounds i32, i32* %21, i32 %25
+%27 = load i32, i32* %26
+%28 = mul i32 %20, %27
+%29 = add i32 %16, %28
+store i32 %29, i32* %1
+br label %30
+30:
+%31 = load i32, i32* %2
+%32 = add i32 %31, 1
+store i32 %32, i32* %2
+br label %11
+
+33:
+%34 = load i32, i32* %1
+ret i32 %34
+}
+
+define i32 @main() {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32*
+%5 = alloca i32
+%6 = alloca i32
+%7 = alloca i32
+%8 = alloca i32, i32 16
+store i32* %8, i32** %1
+%9 = alloca i32, i32 16
+store i32* %9, i32** %2
+br label %10
+
+10:
+%11 = add i32 0, 0
+store i32 %11, i32* %3
+br label %12
+12:
+%13 = load i32, i32* %3
+%14 = icmp slt i32 %13, 16
+br i1 %14, label %15, label %28
+
+15:
+%16 = load i32*, i32** %1
+%17 = load i32, i32* %3
+%18 = getelementptr inbounds i32, i32* %16, i32 %17
+%19 = load i32, i32* %3
+store i32 %19, i32* %18
+%20 = load i32*, i32** %2
+%21 = load i32, i32* %3
+%22 = getelementptr inbounds i32, i32* %20, i32 %21
+%23 = load i32, i32* %3
+%24 = sub i32 16, %23
+store i32 %24, i32* %22
+br label %25
+25:
+%26 = load i32, i32* %3
+%27 = add i32 %26, 1
+store i32 %27, i32* %3
+br label %12
+
+28:
+%29 = load i32*, i32** %1
+%30 = load i32*, i32** %2
+%31 = call i32 @dot(i32* %29, i32* %30, i32 16)
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = load i32*, i32** %1
+%34 = load i32*, i32** %2
+%35 = call i32 @dot(i32* %33, i32* %34, i32 10)
+%36 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %35)
+%37 = alloca i32, i32 5
+store i32* %37, i32** %4
+%38 = load i32*, i32** %4
+%39 = icmp sgt i32 5, 0
+%40 = select i1 %39, i32 5, i32 0
+%41 = mul i32 %40, 4
+%42 = bitcast i32* %38 to i8*
+call void @llvm.memset.p0i8.i32(i8* %42, i8 0, i32 %41, i1 false)
+br label %43
+
+43:
+%44 = add i32 0, 0
+store i32 %44, i32* %5
+br label %45
+45:
+%46 = load i32, i32* %5
+%47 = icmp slt i32 %46, 16
+br i1 %47, label %48, label %80
+
+48:
+%49 = load i32*, i32** %4
+%50 = load i32*, i32** %1
+%51 = load i32, i32* %5
+%52 = getelementptr inbounds i32, i32* %50, i32 %51
+%53 = load i32, i32* %52
+%54 = load i32*, i32** %1
+%55 = load i32, i32* %5
+%56 = getelementptr inbounds i32, i32* %54, i32 %55
+%57 = load i32, i32* %56
+%58 = sdiv i32 %57, 5
+%59 = mul i32 %58, 5
+%60 = sub i32 %53, %59
+%61 = getelementptr inbounds i32, i32* %49, i32 %60
+%62 = load i32*, i32** %4
+%63 = load i32*, i32** %1
+%64 = load i32, i32* %5
+%65 = getelementptr inbounds i32, i32* %63, i32 %64
+%66 = load i32, i32* %65
+%67 = load i32*, i32** %1
+%68 = load i32, i32* %5
+%69 = getelementptr inbounds i32, i32* %67, i32 %68
+%70 = load i32, i32* %69
+%71 = sdiv i32 %70, 5
+%72 = mul i32 %71, 5
+%73 = sub i32 %66, %72
+%74 = getelementptr inbounds i32, i32* %62, i32 %73
+%75 = load i32, i32* %74
+%76 = add i32 %75, 1
+store i32 %76, i32* %61
+br label %77
+77:
+%78 = load i32, i32* %5
+%79 = add i32 %78, 1
+store i32 %79, i32* %5
+br label %45
+
+80:
+%81 = load i32*, i32** %4
+call void @array.print.i32(i32* %81, i32 5)
+%82 = add i32 0, 2
+store i32 %82, i32* %6
+br label %83
+
+83:
+%84 = add i32 0, 1
+store i32 %84, i32* %7
+br label %85
+85:
+%86 = load i32, i32* %7
+%87 = icmp slt i32 %86, 14
+br i1 %87, label %88, label %108
+
+88:
+%89 = load i32*, i32** %1
+%90 = load i32, i32* %7
+%91 = load i32, i32* %6
+%92 = add i32 %90, %91
+%93 = getelementptr inbounds i32, i32* %89, i32 %92
+%94 = load i32*, i32** %1
+%95 = load i32, i32* %7
+%96 = sub i32 %95, 1
+%97 = getelementptr inbounds i32, i32* %94, i32 %96
+%98 = load i32, i32* %97
+%99 = load i32*, i32** %1
+%100 = load i32, i32* %7
+%101 = add i32 %100, 1
+%102 = getelementptr inbounds i32, i32* %99, i32 %101
+%103 = load i32, i32* %102
+%104 = add i32 %98, %103
+store i32 %104, i32* %93
+br label %105
+105:
+%106 = load i32, i32* %7
+%107 = add i32 %106, 2
+store i32 %107, i32* %7
+br label %85
+
+108:
+%109 = load i32*, i32** %1
+call void @array.print.i32(i32* %109, i32 16)
+ret i32 0
+}
+
+declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,198 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define void @set() {
+%1 = load i32*, i32** @ga
+%2 = getelementptr inbounds i32, i32* %1, i32 0
+%3 = add i32 0, 50
+store i32 %3, i32* %2
+%4 = load i32*, i32** @ga
+%5 = getelementptr inbounds i32, i32* %4, i32 1
+%6 = add i32 0, 60
+store i32 %6, i32* %5
+ret void
+}
+
+define i32 @f(i32* %ca) {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @set()
+%3 = load i32*, i32** %1
+%4 = getelementptr inbounds i32, i32* %3, i32 0
+%5 = load i32, i32* %4
+%6 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %5)
+%7 = load i32*, i32** %1
+%8 = getelementptr inbounds i32, i32* %7, i32 1
+%9 = load i32, i32* %8
+%10 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %9)
+%11 = load i32*, i32** %1
+%12 = getelementptr inbounds i32, i32* %11, i32 0
+%13 = load i32, i32* %12
+%14 = load i32*, i32** %1
+%15 = getelementptr inbounds i32, i32* %14, i32 1
+%16 = load i32, i32* %15
+%17 = add i32 %13, %16
+ret i32 %17
+}
+
+define i32 @g(i32* %ca) {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+%3 = load i32*, i32** @ga
+%4 = getelementptr inbounds i32, i32* %3, i32 0
+%5 = add i32 0, 70
+store i32 %5, i32* %4
+%6 = load i32*, i32** %1
+%7 = getelementptr inbounds i32, i32* %6, i32 0
+%8 = load i32, i32* %7
+ret i32 %8
+}
+
+define i32 @sum(i32* %ca) {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+%3 = load i32*, i32** %1
+%4 = getelementptr inbounds i32, i32* %3, i32 0
+%5 = load i32, i32* %4
+%6 = load i32*, i32** %1
+%7 = getelementptr inbounds i32, i32* %6, i32 1
+%8 = load i32, i32* %7
+%9 = add i32 %5, %8
+%10 = load i32*, i32** %1
+%11 = getelementptr inbounds i32, i32* %10, i32 2
+%12 = load i32, i32* %11
+%13 = add i32 %9, %12
+%14 = load i32*, i32** %1
+%15 = getelementptr inbounds i32, i32* %14, i32 3
+%16 = load i32, i32* %15
+%17 = add i32 %13, %16
+ret i32 %17
+}
+
+define void @replace() {
+%1 = alloca i32*
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32** %1
+%2 = load i32*, i32** %1
+%3 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %3, i32* %2, i32 16, i1 0)
+ret void
+}
+
+define i32 @peek(i32* %ca) {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @replace()
+%3 = load i32*, i32** %1
+%4 = getelementptr inbounds i32, i32* %3, i32 0
+%5 = load i32, i32* %4
+ret i32 %5
+}
+
+define i32 @snapshot() {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32, i32 4
+store i32* %3, i32** %1
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %2
+%4 = load i32*, i32** @ga
+%5 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %5, i32* %4, i32 16, i1 0)
+store i32* %5, i32** %1
+%6 = load i32*, i32** %2
+%7 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %7, i32* %6, i32 16, i1 0)
+%8 = load i32*, i32** %1
+%9 = getelementptr inbounds i32, i32* %8, i32 0
+%10 = load i32, i32* %9
+ret i32 %10
+}
+
+define i32 @main() {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+store i32* %2, i32** %1
+%3 = load i32*, i32** @ga
+%4 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* %3, i32 16, i1 0)
+store i32* %4, i32** %1
+call void @set()
+%5 = load i32*, i32** %1
+%6 = getelementptr inbounds i32, i32* %5, i32 0
+%7 = load i32, i32* %6
+%8 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %7)
+%9 = load i32*, i32** @ga
+%10 = getelementptr inbounds i32, i32* %9, i32 0
+%11 = add i32 0, 1
+store i32 %11, i32* %10
+%12 = load i32*, i32** @ga
+%13 = getelementptr inbounds i32, i32* %12, i32 1
+%14 = add i32 0, 2
+store i32 %14, i32* %13
+%15 = load i32*, i32** @ga
+%16 = call i32 @f(i32* %15)
+%17 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %16)
+%18 = load i32*, i32** @ga
+%19 = getelementptr inbounds i32, i32* %18, i32 0
+%20 = add i32 0, 1
+store i32 %20, i32* %19
+%21 = load i32*, i32** @ga
+%22 = call i32 @g(i32* %21)
+%23 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %22)
+%24 = load i32*, i32** @ga
+%25 = call i32 @sum(i32* %24)
+%26 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %25)
+%27 = load i32*, i32** @ga
+%28 = getelementptr inbounds i32, i32* %27, i32 0
+%29 = add i32 0, 1
+store i32 %29, i32* %28
+%30 = load i32*, i32** @ga
+%31 = call i32 @peek(i32* %30)
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = load i32*, i32** @ga
+%34 = getelementptr inbounds i32, i32* %33, i32 0
+%35 = add i32 0, 1
+store i32 %35, i32* %34
+%36 = call i32 @snapshot()
+%37 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %36)
+%38 = load i32*, i32** @ga
+%39 = getelementptr inbounds i32, i32* %38, i32 0
+%40 = load i32, i32* %39
+%41 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %40)
+ret i32 0
+}
+
+@const.0 = private unnamed_addr constant [4 x i32] [i32 9, i32 8, i32 7, i32 6]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 5, i32 5, i32 5, i32 5]
+@ga.data = internal global [4 x i32] [i32 1, i32 2, i32 3, i32 4]
+@ga = global i32* getelementptr inbounds ([4 x i32], [4 x i32]* @ga.data, i32 0, i32 0)
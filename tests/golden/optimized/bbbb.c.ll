@@ -0,0 +1,223 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @print_arr(i8* noalias readonly %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i8*
+store i8* %carr, i8** %2
+%3 = alloca i32
+store i32 %cn, i32* %3
+br label %4
+
+4:
+%5 = add i32 0, 0
+store i32 %5, i32* %1
+%6 = load i32, i32* %3
+%7 = load i8*, i8** %2
+br label %8
+8:
+%9 = load i32, i32* %1
+%10 = icmp slt i32 %9, %6
+br i1 %10, label %11, label %20
+
+11:
+%12 = load i32, i32* %1
+%13 = sext i32 %12 to i64
+%14 = getelementptr inbounds i8, i8* %7, i64 %13
+%15 = load i8, i8* %14
+%16 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 %15)
+br label %17
+17:
+%18 = load i32, i32* %1
+%19 = add nsw i32 %18, 1
+store i32 %19, i32* %1
+br label %8
+
+20:
+ret void
+}
+
+define internal void @sortAndPrint(i8* %carr, i32 %cn) nounwind norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i8*
+%5 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %5, i8* %carr, i32 10, i1 0)
+store i8* %5,i8** %4
+%6 = alloca i32
+store i32 %cn, i32* %6
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %1
+%9 = load i32, i32* %6
+%10 = sub nsw i32 %9, 1
+%11 = load i8*, i8** %4
+br label %12
+12:
+%13 = load i32, i32* %1
+%14 = icmp slt i32 %13, %10
+br i1 %14, label %15, label %53
+
+15:
+br label %16
+
+16:
+%17 = add i32 0, 0
+store i32 %17, i32* %2
+%18 = load i32, i32* %1
+%19 = sub nsw i32 %9, %18
+%20 = sub nsw i32 %19, 1
+br label %21
+21:
+%22 = load i32, i32* %2
+%23 = icmp slt i32 %22, %20
+br i1 %23, label %24, label %49
+
+24:
+%25 = load i32, i32* %2
+%26 = sext i32 %25 to i64
+%27 = getelementptr inbounds i8, i8* %11, i64 %26
+%28 = load i8, i8* %27
+%29 = add nsw i32 %25, 1
+%30 = sext i32 %29 to i64
+%31 = getelementptr inbounds i8, i8* %11, i64 %30
+%32 = load i8, i8* %31
+%33 = icmp slt i8 %28, %32
+br i1 %33, label %34, label %45
+
+34:
+%35 = load i32, i32* %2
+%36 = add nsw i32 %35, 1
+%37 = sext i32 %36 to i64
+%38 = getelementptr inbounds i8, i8* %11, i64 %37
+%39 = load i8, i8* %38
+%40 = zext i8 %39 to i32
+store i32 %40, i32* %3
+%41 = sext i32 %35 to i64
+%42 = getelementptr inbounds i8, i8* %11, i64 %41
+%43 = load i8, i8* %42
+store i8 %43, i8* %38
+%44 = trunc i32 %40 to i8
+store i8 %44, i8* %42
+br label %45
+45:
+br label %46
+46:
+%47 = load i32, i32* %2
+%48 = add nsw i32 %47, 1
+store i32 %48, i32* %2
+br label %21
+
+49:
+br label %50
+50:
+%51 = load i32, i32* %1
+%52 = add nsw i32 %51, 1
+store i32 %52, i32* %1
+br label %12
+
+53:
+%54 = load i8*, i8** %4
+%55 = load i32, i32* %6
+call void @print_arr(i8* %54, i32 %55)
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i8*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca double
+%7 = alloca i1
+%8 = alloca double
+%9 = alloca i8
+%10 = alloca double
+%11 = alloca i32
+%12 = alloca i8*
+%13 = alloca i8, i32 10
+store i8* %13, i8** %1
+%14 = alloca i32, i32 20
+store i32* %14, i32** %2
+%15 = add i32 0, 10
+store i32 %15, i32* %3
+%16 = add i32 0, 0
+store i32 %16, i32* %4
+%17 = add i32 0, 0
+store i32 %17, i32* %5
+%18 = sitofp i32 %17 to double
+store double %18, double* %6
+%19 = add i1 0, 0
+store i1 %19, i1* %7
+%20 = sitofp i1 %19 to double
+store double %20, double* %8
+%21 = add i8 0, 97
+store i8 %21, i8* %9
+%22 = sitofp i8 %21 to double
+store double %22, double* %10
+%23 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %18)
+%24 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %20)
+%25 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %22)
+%26 = alloca i8, i32 100
+call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([3 x i8], [3 x i8]* @inputStr, i32 0, i32 0), i8* %26)
+store i8* %26, i8** %1 
+%28 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatChar, i32 0, i32 0), i8 98)
+br label %29
+
+29:
+%30 = add i32 0, 0
+store i32 %30, i32* %11
+br label %31
+31:
+%32 = load i32, i32* %11
+%33 = icmp slt i32 %32, 10
+br i1 %33, label %34, label %40
+
+34:
+%35 = load i32, i32* %11
+%36 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %35)
+br label %37
+37:
+%38 = load i32, i32* %11
+%39 = add nsw i32 %38, 1
+store i32 %39, i32* %11
+br label %31
+
+40:
+%41 = alloca i8, i32 10
+store i8* %41, i8** %12
+%42 = load i8*, i8** %1
+%43 = alloca i8, i32 10
+call void @llvm.memcpy.p0i8.p0i8.i32(i8* %43, i8* %42, i32 10, i1 0)
+store i8* %43, i8** %12
+call void @sortAndPrint(i8* %43, i32 10)
+ret i32 0
+}
+
@@ -0,0 +1,97 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i32
+%6 = alloca i32, i32 6
+store i32* %6, i32** %1
+%7 = add i32 0, 8
+store i32 %7, i32* %2
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %3
+%10 = load i32*, i32** %1
+br label %11
+11:
+%12 = load i32, i32* %3
+%13 = icmp slt i32 %12, 6
+br i1 %13, label %14, label %22
+
+14:
+%15 = load i32, i32* %3
+%16 = sext i32 %15 to i64
+%17 = getelementptr inbounds i32, i32* %10, i64 %16
+%18 = mul nsw i32 %15, %15
+store i32 %18, i32* %17
+br label %19
+19:
+%20 = load i32, i32* %3
+%21 = add nsw i32 %20, 1
+store i32 %21, i32* %3
+br label %11
+
+22:
+%23 = add i32 0, 0
+store i32 %23, i32* %4
+br label %24
+
+24:
+%25 = add i32 0, 0
+store i32 %25, i32* %5
+%26 = load i32, i32* %2
+%27 = load i32*, i32** %1
+br label %28
+28:
+%29 = load i32, i32* %5
+%30 = icmp slt i32 %29, %26
+br i1 %30, label %31, label %42
+
+31:
+%32 = load i32, i32* %4
+%33 = load i32, i32* %5
+%34 = sext i32 %33 to i64
+%35 = getelementptr inbounds i32, i32* %27, i64 %34
+%36 = load i32, i32* %35
+%37 = add nsw i32 %32, %36
+store i32 %37, i32* %4
+%38 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %37)
+br label %39
+39:
+%40 = load i32, i32* %5
+%41 = add nsw i32 %40, 1
+store i32 %41, i32* %5
+br label %28
+
+42:
+ret i32 0
+}
+
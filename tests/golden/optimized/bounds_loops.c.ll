@@ -0,0 +1,287 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @dot(i32* noalias readonly %ca, i32* noalias readonly %cb, i32 %cn) nounwind readonly norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32*
+store i32* %cb, i32** %4
+%5 = alloca i32
+store i32 %cn, i32* %5
+%6 = add i32 0, 0
+store i32 %6, i32* %1
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %2
+%9 = load i32, i32* %5
+%10 = load i32*, i32** %3
+%11 = load i32*, i32** %4
+%12 = sub nsw i32 %9, 1
+br label %13
+13:
+%14 = load i32, i32* %2
+%15 = icmp slt i32 %14, %9
+br i1 %15, label %16, label %31
+
+16:
+%17 = load i32, i32* %1
+%18 = load i32, i32* %2
+%19 = sext i32 %18 to i64
+%20 = getelementptr inbounds i32, i32* %10, i64 %19
+%21 = load i32, i32* %20
+%22 = sub nsw i32 %12, %18
+%23 = sext i32 %22 to i64
+%24 = getelementptr inbounds i32, i32* %11, i64 %23
+%25 = load i32, i32* %24
+%26 = mul nsw i32 %21, %25
+%27 = add nsw i32 %17, %26
+store i32 %27, i32* %1
+br label %28
+28:
+%29 = load i32, i32* %2
+%30 = add nsw i32 %29, 1
+store i32 %30, i32* %2
+br label %13
+
+31:
+%32 = load i32, i32* %1
+ret i32 %32
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32
+%4 = alloca i32*
+%5 = alloca i32
+%6 = alloca i32
+%7 = alloca i32
+%8 = alloca i32, i32 16
+store i32* %8, i32** %1
+%9 = alloca i32, i32 16
+store i32* %9, i32** %2
+br label %10
+
+10:
+%11 = add i32 0, 0
+store i32 %11, i32* %3
+%12 = load i32*, i32** %1
+%13 = load i32*, i32** %2
+br label %14
+14:
+%15 = load i32, i32* %3
+%16 = icmp slt i32 %15, 16
+br i1 %16, label %17, label %26
+
+17:
+%18 = load i32, i32* %3
+%19 = sext i32 %18 to i64
+%20 = getelementptr inbounds i32, i32* %12, i64 %19
+store i32 %18, i32* %20
+%21 = getelementptr inbounds i32, i32* %13, i64 %19
+%22 = sub nsw i32 16, %18
+store i32 %22, i32* %21
+br label %23
+23:
+%24 = load i32, i32* %3
+%25 = add nsw i32 %24, 1
+store i32 %25, i32* %3
+br label %14
+
+26:
+%27 = load i32*, i32** %1
+%28 = load i32*, i32** %2
+%29 = call i32 @dot(i32* %27, i32* %28, i32 16)
+%30 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %29)
+%31 = call i32 @dot(i32* %27, i32* %28, i32 10)
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = alloca i32, i32 5
+store i32* %33, i32** %4
+%34 = icmp sgt i32 5, 0
+%35 = select i1 %34, i32 5, i32 0
+%36 = mul i32 %35, 4
+%37 = bitcast i32* %33 to i8*
+call void @llvm.memset.p0i8.i32(i8* %37, i8 0, i32 %36, i1 false)
+br label %38
+
+38:
+%39 = add i32 0, 0
+store i32 %39, i32* %5
+%40 = load i32*, i32** %4
+%41 = load i32*, i32** %1
+br label %42
+42:
+%43 = load i32, i32* %5
+%44 = icmp slt i32 %43, 16
+br i1 %44, label %45, label %60
+
+45:
+%46 = load i32, i32* %5
+%47 = sext i32 %46 to i64
+%48 = getelementptr inbounds i32, i32* %41, i64 %47
+%49 = load i32, i32* %48
+%50 = sdiv i32 %49, 5
+%51 = mul nsw i32 %50, 5
+%52 = sub nsw i32 %49, %51
+%53 = sext i32 %52 to i64
+%54 = getelementptr inbounds i32, i32* %40, i64 %53
+%55 = load i32, i32* %54
+%56 = add nsw i32 %55, 1
+store i32 %56, i32* %54
+br label %57
+57:
+%58 = load i32, i32* %5
+%59 = add nsw i32 %58, 1
+store i32 %59, i32* %5
+br label %42
+
+60:
+%61 = load i32*, i32** %4
+call void @array.print.i32(i32* %61, i32 5)
+%62 = add i32 0, 2
+store i32 %62, i32* %6
+br label %63
+
+63:
+%64 = add i32 0, 1
+store i32 %64, i32* %7
+%65 = load i32*, i32** %1
+%66 = load i32, i32* %6
+br label %67
+67:
+%68 = load i32, i32* %7
+%69 = icmp slt i32 %68, 14
+br i1 %69, label %70, label %87
+
+70:
+%71 = load i32, i32* %7
+%72 = add nsw i32 %71, %66
+%73 = sext i32 %72 to i64
+%74 = getelementptr inbounds i32, i32* %65, i64 %73
+%75 = sub nsw i32 %71, 1
+%76 = sext i32 %75 to i64
+%77 = getelementptr inbounds i32, i32* %65, i64 %76
+%78 = load i32, i32* %77
+%79 = add nsw i32 %71, 1
+%80 = sext i32 %79 to i64
+%81 = getelementptr inbounds i32, i32* %65, i64 %80
+%82 = load i32, i32* %81
+%83 = add nsw i32 %78, %82
+store i32 %83, i32* %74
+br label %84
+84:
+%85 = load i32, i32* %7
+%86 = add nsw i32 %85, 2
+store i32 %86, i32* %7
+br label %67
+
+87:
+%88 = load i32*, i32** %1
+call void @array.print.i32(i32* %88, i32 16)
+ret i32 0
+}
+
+declare void @llvm.memset.p0i8.i32(i8*, i8, i32, i1)
+@stdout = external global i8*
+declare i64 @fwrite(i8*, i64, i64, i8*) nounwind
+
+define internal void @array.write(i8* %data, i64 %size) nounwind {
+entry:
+  %stream = load i8*, i8** @stdout
+  call i64 @fwrite(i8* %data, i64 1, i64 %size, i8* %stream)
+  ret void
+}
+
+define internal void @array.print.i32(i32* %a, i32 %n) nounwind {
+entry:
+  %buffer = alloca [16384 x i8]
+  %base = getelementptr inbounds [16384 x i8], [16384 x i8]* %buffer, i64 0, i64 0
+  %digits = alloca [12 x i8]
+  %digits.base = getelementptr inbounds [12 x i8], [12 x i8]* %digits, i64 0, i64 0
+  %count = sext i32 %n to i64
+  %empty = icmp slt i64 %count, 1
+  br i1 %empty, label %done, label %loop
+loop:
+  %i = phi i64 [ 0, %entry ], [ %i.next, %next ]
+  %pos = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  %full = icmp ugt i64 %pos, 15872
+  br i1 %full, label %flush, label %format
+flush:
+  call void @array.write(i8* %base, i64 %pos)
+  br label %format
+format:
+  %start = phi i64 [ %pos, %loop ], [ 0, %flush ]
+  %p = getelementptr inbounds i32, i32* %a, i64 %i
+  %v = load i32, i32* %p
+  %out = getelementptr inbounds i8, i8* %base, i64 %start
+  %negative = icmp slt i32 %v, 0
+  %wide = sext i32 %v to i64
+  %minus = sub i64 0, %wide
+  %magnitude = select i1 %negative, i64 %minus, i64 %wide
+  br label %digit
+digit:
+  %m = phi i64 [ %magnitude, %format ], [ %quotient, %digit ]
+  %k = phi i64 [ 12, %format ], [ %k.next, %digit ]
+  %quotient = udiv i64 %m, 10
+  %tens = mul i64 %quotient, 10
+  %remainder = sub i64 %m, %tens
+  %remainder.8 = trunc i64 %remainder to i8
+  %char = add i8 %remainder.8, 48
+  %k.next = sub i64 %k, 1
+  %slot = getelementptr inbounds i8, i8* %digits.base, i64 %k.next
+  store i8 %char, i8* %slot
+  %more.digits = icmp ne i64 %quotient, 0
+  br i1 %more.digits, label %digit, label %sign
+sign:
+  store i8 45, i8* %out
+  %sign.size = zext i1 %negative to i64
+  %digits.start = add i64 %start, %sign.size
+  %length = sub i64 12, %k.next
+  %length.32 = trunc i64 %length to i32
+  %target = getelementptr inbounds i8, i8* %base, i64 %digits.start
+  call void @llvm.memcpy.p0i8.p0i8.i32(i8* %target, i8* %slot, i32 %length.32, i1 false)
+  %line.end = add i64 %digits.start, %length
+  %newline.out = getelementptr inbounds i8, i8* %base, i64 %line.end
+  store i8 10, i8* %newline.out
+  %pos.next = add i64 %line.end, 1
+  br label %next
+next:
+  %i.next = add nuw nsw i64 %i, 1
+  %more = icmp slt i64 %i.next, %count
+  br i1 %more, label %loop, label %done
+done:
+  %last = phi i64 [ 0, %entry ], [ %pos.next, %next ]
+  call void @array.write(i8* %base, i64 %last)
+  ret void
+}
+
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.vectorize.enable", i1 true}
@@ -0,0 +1,172 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal void @set() nounwind norecurse {
+%1 = load i32*, i32** @ga
+%2 = getelementptr inbounds i32, i32* %1, i64 0
+%3 = add i32 0, 50
+store i32 %3, i32* %2
+%4 = getelementptr inbounds i32, i32* %1, i64 1
+%5 = add i32 0, 60
+store i32 %5, i32* %4
+ret void
+}
+
+define internal i32 @f(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @set()
+%3 = getelementptr inbounds i32, i32* %2, i64 0
+%4 = load i32, i32* %3
+%5 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %4)
+%6 = getelementptr inbounds i32, i32* %2, i64 1
+%7 = load i32, i32* %6
+%8 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %7)
+%9 = add nsw i32 %4, %7
+ret i32 %9
+}
+
+define internal i32 @g(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+%3 = load i32*, i32** @ga
+%4 = getelementptr inbounds i32, i32* %3, i64 0
+%5 = add i32 0, 70
+store i32 %5, i32* %4
+%6 = getelementptr inbounds i32, i32* %2, i64 0
+%7 = load i32, i32* %6
+ret i32 %7
+}
+
+define internal i32 @sum(i32* noalias readonly %ca) nounwind readonly norecurse {
+%1 = alloca i32*
+store i32* %ca, i32** %1
+%2 = getelementptr inbounds i32, i32* %ca, i64 0
+%3 = load i32, i32* %2
+%4 = getelementptr inbounds i32, i32* %ca, i64 1
+%5 = load i32, i32* %4
+%6 = add nsw i32 %3, %5
+%7 = getelementptr inbounds i32, i32* %ca, i64 2
+%8 = load i32, i32* %7
+%9 = add nsw i32 %6, %8
+%10 = getelementptr inbounds i32, i32* %ca, i64 3
+%11 = load i32, i32* %10
+%12 = add nsw i32 %9, %11
+ret i32 %12
+}
+
+define internal void @replace() nounwind norecurse {
+%1 = alloca i32*
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32** %1
+%2 = load i32*, i32** @ga
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.0, i32 0, i32 0), i32 16, i1 0)
+ret void
+}
+
+define internal i32 @peek(i32* %ca) nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %2, i32* %ca, i32 16, i1 0)
+store i32* %2,i32** %1
+call void @replace()
+%3 = getelementptr inbounds i32, i32* %2, i64 0
+%4 = load i32, i32* %3
+ret i32 %4
+}
+
+define internal i32 @snapshot() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32*
+%3 = alloca i32, i32 4
+store i32* %3, i32** %1
+store i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32** %2
+%4 = load i32*, i32** @ga
+%5 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %5, i32* %4, i32 16, i1 0)
+store i32* %5, i32** %1
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* getelementptr inbounds ([4 x i32], [4 x i32]* @const.1, i32 0, i32 0), i32 16, i1 0)
+%6 = getelementptr inbounds i32, i32* %5, i64 0
+%7 = load i32, i32* %6
+ret i32 %7
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32, i32 4
+store i32* %2, i32** %1
+%3 = load i32*, i32** @ga
+%4 = alloca i32, i32 4
+call void @llvm.memcpy.p0i32.p0i32.i32(i32* %4, i32* %3, i32 16, i1 0)
+store i32* %4, i32** %1
+call void @set()
+%5 = getelementptr inbounds i32, i32* %4, i64 0
+%6 = load i32, i32* %5
+%7 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %6)
+%8 = load i32*, i32** @ga
+%9 = getelementptr inbounds i32, i32* %8, i64 0
+%10 = add i32 0, 1
+store i32 %10, i32* %9
+%11 = getelementptr inbounds i32, i32* %8, i64 1
+%12 = add i32 0, 2
+store i32 %12, i32* %11
+%13 = call i32 @f(i32* %8)
+%14 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %13)
+%15 = load i32*, i32** @ga
+%16 = getelementptr inbounds i32, i32* %15, i64 0
+%17 = add i32 0, 1
+store i32 %17, i32* %16
+%18 = call i32 @g(i32* %15)
+%19 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %18)
+%20 = load i32*, i32** @ga
+%21 = call i32 @sum(i32* %20)
+%22 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %21)
+%23 = load i32*, i32** @ga
+%24 = getelementptr inbounds i32, i32* %23, i64 0
+%25 = add i32 0, 1
+store i32 %25, i32* %24
+%26 = call i32 @peek(i32* %23)
+%27 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %26)
+%28 = load i32*, i32** @ga
+%29 = getelementptr inbounds i32, i32* %28, i64 0
+%30 = add i32 0, 1
+store i32 %30, i32* %29
+%31 = call i32 @snapshot()
+%32 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %31)
+%33 = load i32*, i32** @ga
+%34 = getelementptr inbounds i32, i32* %33, i64 0
+%35 = load i32, i32* %34
+%36 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %35)
+ret i32 0
+}
+
+@const.0 = private unnamed_addr constant [4 x i32] [i32 9, i32 8, i32 7, i32 6]
+@const.1 = private unnamed_addr constant [4 x i32] [i32 5, i32 5, i32 5, i32 5]
+@ga.data = internal global [4 x i32] [i32 1, i32 2, i32 3, i32 4]
+@ga = internal global i32* getelementptr inbounds ([4 x i32], [4 x i32]* @ga.data, i32 0, i32 0)
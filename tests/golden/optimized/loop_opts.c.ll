@@ -0,0 +1,245 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @square(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = mul nsw i32 %cx, %cx
+ret i32 %2
+}
+
+define internal i32 @fib(i32 %cn) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = icmp slt i32 %cn, 2
+br i1 %2, label %3, label %5
+
+3:
+%4 = load i32, i32* %1
+ret i32 %4
+5:
+%6 = load i32, i32* %1
+%7 = sub nsw i32 %6, 1
+%8 = call i32 @fib(i32 %7)
+%9 = sub nsw i32 %6, 2
+%10 = call i32 @fib(i32 %9)
+%11 = add nsw i32 %8, %10
+ret i32 %11
+}
+
+define internal i32 @unused(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+store i32 %cx, i32* %1
+%2 = add nsw i32 %cx, 1
+ret i32 %2
+}
+
+define internal i32 @weighted(i32* noalias readonly %ca, i32 %cn, i32 %cscale) nounwind readonly norecurse {
+%1 = alloca i32
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32
+store i32 %cn, i32* %4
+%5 = alloca i32
+store i32 %cscale, i32* %5
+%6 = add i32 0, 0
+store i32 %6, i32* %1
+br label %7
+
+7:
+%8 = add i32 0, 0
+store i32 %8, i32* %2
+%9 = load i32, i32* %4
+%10 = load i32*, i32** %3
+%11 = load i32, i32* %5
+%12 = mul nsw i32 %11, %11
+%13 = add nsw i32 %12, 1
+br label %14
+14:
+%15 = load i32, i32* %2
+%16 = icmp slt i32 %15, %9
+br i1 %16, label %17, label %28
+
+17:
+%18 = load i32, i32* %1
+%19 = load i32, i32* %2
+%20 = sext i32 %19 to i64
+%21 = getelementptr inbounds i32, i32* %10, i64 %20
+%22 = load i32, i32* %21
+%23 = mul nsw i32 %22, %13
+%24 = add nsw i32 %18, %23
+store i32 %24, i32* %1
+br label %25
+25:
+%26 = load i32, i32* %2
+%27 = add nsw i32 %26, 1
+store i32 %27, i32* %2
+br label %14
+
+28:
+%29 = load i32, i32* %1
+ret i32 %29
+}
+
+define internal double @average(i32* noalias readonly %ca, i32 %cn) nounwind readonly norecurse {
+%1 = alloca double
+%2 = alloca i32
+%3 = alloca i32*
+store i32* %ca, i32** %3
+%4 = alloca i32
+store i32 %cn, i32* %4
+%5 = fadd double 0.0, 0.0
+store double %5, double* %1
+br label %6
+
+6:
+%7 = add i32 0, 0
+store i32 %7, i32* %2
+%8 = load i32, i32* %4
+%9 = load i32*, i32** %3
+br label %10
+10:
+%11 = load i32, i32* %2
+%12 = icmp slt i32 %11, %8
+br i1 %12, label %13, label %24
+
+13:
+%14 = load double, double* %1
+%15 = load i32, i32* %2
+%16 = sext i32 %15 to i64
+%17 = getelementptr inbounds i32, i32* %9, i64 %16
+%18 = load i32, i32* %17
+%19 = sitofp i32 %18 to double
+%20 = fadd double %14, %19
+store double %20, double* %1
+br label %21
+21:
+%22 = load i32, i32* %2
+%23 = add nsw i32 %22, 1
+store i32 %23, i32* %2
+br label %10, !llvm.loop !0
+
+24:
+%25 = load double, double* %1
+%26 = load i32, i32* %4
+%27 = sitofp i32 %26 to double
+%28 = fdiv double %25, %27
+ret double %28
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32*
+%2 = alloca i32
+%3 = alloca i32
+%4 = alloca i32
+%5 = alloca i8
+%6 = alloca i32
+%7 = alloca i32, i32 8
+store i32* %7, i32** %1
+br label %8
+
+8:
+%9 = add i32 0, 0
+store i32 %9, i32* %2
+%10 = load i32*, i32** %1
+br label %11
+11:
+%12 = load i32, i32* %2
+%13 = icmp slt i32 %12, 8
+br i1 %13, label %14, label %23
+
+14:
+%15 = load i32, i32* %2
+%16 = sext i32 %15 to i64
+%17 = getelementptr inbounds i32, i32* %10, i64 %16
+%18 = call i32 @square(i32 %15)
+%19 = sub nsw i32 %18, %15
+store i32 %19, i32* %17
+br label %20
+20:
+%21 = load i32, i32* %2
+%22 = add nsw i32 %21, 1
+store i32 %22, i32* %2
+br label %11, !llvm.loop !4
+
+23:
+%24 = add i32 0, 3
+store i32 %24, i32* %3
+%25 = add i32 0, 0
+store i32 %25, i32* %4
+%26 = load i32*, i32** %1
+%27 = mul nsw i32 %24, 2
+%28 = add nsw i32 %27, 1
+br label %29
+
+29:
+%30 = load i32, i32* %4
+%31 = icmp slt i32 %30, 8
+br i1 %31, label %32, label %41
+
+32:
+%33 = load i32, i32* %4
+%34 = sext i32 %33 to i64
+%35 = getelementptr inbounds i32, i32* %26, i64 %34
+%36 = load i32, i32* %35
+%37 = add nsw i32 %36, %28
+%38 = mul nsw i32 %36, %28
+%39 = add nsw i32 %37, %38
+store i32 %39, i32* %35
+%40 = add nsw i32 %33, 1
+store i32 %40, i32* %4
+br label %29
+41:
+%42 = load i32*, i32** %1
+%43 = call i32 @weighted(i32* %42, i32 8, i32 2)
+%44 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %43)
+%45 = call double @average(i32* %42, i32 8)
+%46 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatFloat, i32 0, i32 0), double %45)
+%47 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 610)
+%48 = add nsw i32 144, 25
+%49 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %48)
+%50 = add i8 0, 200
+store i8 %50, i8* %5
+%51 = zext i8 %50 to i32
+store i32 %51, i32* %6
+%52 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %51)
+br i1 0, label %53, label %55
+
+53:
+%54 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 2)
+br label %55
+55:
+ret i32 0
+}
+
+
+!0 = distinct !{!0, !1, !2, !3}
+!1 = !{!"llvm.loop.vectorize.width", i32 4}
+!2 = !{!"llvm.loop.vectorize.enable", i1 true}
+!3 = !{!"llvm.loop.interleave.count", i32 2}
+!4 = distinct !{!4, !5}
+!5 = !{!"llvm.loop.unroll.count", i32 2}
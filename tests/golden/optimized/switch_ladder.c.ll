@@ -0,0 +1,112 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @classify(i32 %cx) nounwind readnone norecurse {
+%1 = alloca i32
+%2 = alloca i32
+store i32 %cx, i32* %2
+%3 = add i32 0, 0
+store i32 %3, i32* %1
+switch i32 %cx, label %10 [
+    i32 1, label %4
+    i32 2, label %6
+    i32 3, label %8
+  ]
+
+4:
+%5 = add i32 0, 10
+store i32 %5, i32* %1
+br label %12
+6:
+%7 = add i32 0, 20
+store i32 %7, i32* %1
+br label %12
+8:
+%9 = add i32 0, 30
+store i32 %9, i32* %1
+br label %12
+10:
+%11 = add i32 0, 40
+store i32 %11, i32* %1
+br label %12
+12:
+%13 = load i32, i32* %1
+ret i32 %13
+}
+
+define internal void @name(i8 %cc) nounwind norecurse {
+%1 = alloca i8
+store i8 %cc, i8* %1
+switch i8 %cc, label %8 [
+    i8 97, label %2
+    i8 98, label %4
+    i8 99, label %6
+  ]
+
+2:
+%3 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 1)
+br label %8
+4:
+%5 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 2)
+br label %8
+6:
+%7 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 3)
+br label %8
+8:
+ret void
+}
+
+define i32 @main() nounwind norecurse {
+%1 = alloca i32
+br label %2
+
+2:
+%3 = add i32 0, 0
+store i32 %3, i32* %1
+br label %4
+4:
+%5 = load i32, i32* %1
+%6 = icmp slt i32 %5, 5
+br i1 %6, label %7, label %14
+
+7:
+%8 = load i32, i32* %1
+%9 = call i32 @classify(i32 %8)
+%10 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 %9)
+br label %11
+11:
+%12 = load i32, i32* %1
+%13 = add nsw i32 %12, 1
+store i32 %13, i32* %1
+br label %4
+
+14:
+call void @name(i8 97)
+call void @name(i8 99)
+call void @name(i8 122)
+ret i32 0
+}
+
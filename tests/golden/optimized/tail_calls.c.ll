@@ -0,0 +1,122 @@
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-pc-linux-gnu"
+
+declare i32 @printf(i8*, ...) nounwind
+declare i32 @scanf(i8*, ...) nounwind
+
+declare void @llvm.memcpy.p0i32.p0i32.i32(i32*, i32*, i32, i1)
+declare void @llvm.memcpy.p0i1.p0i1.i32(i1*, i1*, i32, i1)
+declare void @llvm.memcpy.p0i8.p0i8.i32(i8*, i8*, i32, i1)
+declare void @llvm.memcpy.p0f64.p0f64.i32(double*, double*, i32, i1)
+
+@int.0.0 = internal global i32 0
+@char.0.0 = internal global i8 0
+@float.0.0 = internal global double 0.0
+
+@formatInt = private unnamed_addr constant [4 x i8] c"%d\0A\00"
+@formatFloat = private unnamed_addr constant [4 x i8] c"%f\0A\00"
+@formatChar = private unnamed_addr constant [4 x i8] c"%c\0A\00"
+
+@formatStr = private unnamed_addr constant [4 x i8] c"%s\0A\00"
+
+@inputStr = private unnamed_addr constant [3 x i8] c"%s\00"
+@inputFloat = private unnamed_addr constant [4 x i8] c"%lf\00"
+@inputChar = private unnamed_addr constant [3 x i8] c"%c\00"
+@inputInt = private unnamed_addr constant [3 x i8] c"%d\00"
+
+define internal i32 @sum_to(i32 %cn, i32 %cacc) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = alloca i32
+store i32 %cacc, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %1
+%5 = icmp eq i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %2
+ret i32 %7
+8:
+%9 = load i32, i32* %1
+%10 = sub nsw i32 %9, 1
+%11 = load i32, i32* %2
+%12 = add nsw i32 %11, %9
+store i32 %10, i32* %1
+store i32 %12, i32* %2
+br label %3
+}
+
+define internal i32 @gcd(i32 %ca, i32 %cb) nounwind readnone {
+%1 = alloca i32
+store i32 %ca, i32* %1
+%2 = alloca i32
+store i32 %cb, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %2
+%5 = icmp eq i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %1
+ret i32 %7
+8:
+%9 = load i32, i32* %2
+%10 = load i32, i32* %1
+%11 = sdiv i32 %10, %9
+%12 = mul nsw i32 %11, %9
+%13 = sub nsw i32 %10, %12
+store i32 %9, i32* %1
+store i32 %13, i32* %2
+br label %3
+}
+
+define internal i32 @count_down(i32 %cn, i32 %csteps) nounwind readnone {
+%1 = alloca i32
+store i32 %cn, i32* %1
+%2 = alloca i32
+store i32 %csteps, i32* %2
+br label %3
+3:
+%4 = load i32, i32* %1
+%5 = icmp sle i32 %4, 0
+br i1 %5, label %6, label %8
+
+6:
+%7 = load i32, i32* %2
+ret i32 %7
+8:
+%9 = load i32, i32* %1
+%10 = sdiv i32 %9, 2
+%11 = mul nsw i32 %10, 2
+%12 = sub nsw i32 %9, %11
+%13 = icmp eq i32 %12, 0
+br i1 %13, label %14, label %19
+
+14:
+%15 = load i32, i32* %1
+%16 = sdiv i32 %15, 2
+%17 = load i32, i32* %2
+%18 = add nsw i32 %17, 1
+store i32 %16, i32* %1
+store i32 %18, i32* %2
+br label %3
+19:
+%20 = load i32, i32* %1
+%21 = sub nsw i32 %20, 1
+%22 = load i32, i32* %2
+%23 = add nsw i32 %22, 1
+store i32 %21, i32* %1
+store i32 %23, i32* %2
+br label %3
+}
+
+define i32 @main() nounwind norecurse {
+%1 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 1250025000)
+%2 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 21)
+%3 = call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @formatInt, i32 0, i32 0), i32 26)
+ret i32 0
+}
+
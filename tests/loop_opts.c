@@ -0,0 +1,57 @@
+// run
+int square(int x) {
+    return x * x;
+}
+
+int fib(int n) {
+    if (n < 2)
+        return n;
+    return fib(n - 1) + fib(n - 2);
+}
+
+int unused(int x) {
+    return x + 1;
+}
+
+int weighted(int a[8], int n, int scale) {
+    int total = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        total = total + a[i] * (scale * scale + 1);
+    }
+    return total;
+}
+
+float average(int a[8], int n) {
+    float s = 0;
+    #pragma loop vectorize_width(4) interleave_count(2)
+    for (int i = 0; i < n; i = i + 1) {
+        s = s + a[i];
+    }
+    return s / n;
+}
+
+int main() {
+    int a[8];
+    #pragma loop unroll_count(2)
+    for (int i = 0; i < 8; i = i + 1) {
+        a[i] = square(i) - i;
+    }
+    int k = 3;
+    int j = 0;
+    while (j < 8) {
+        a[j] = a[j] + (k * 2 + 1) + a[j] * (k * 2 + 1);
+        j = j + 1;
+    }
+    print_int(weighted(a, 8, 2));
+    print_float(average(a, 8));
+    print_int(fib(15));
+    print_int(square(12) + square(5));
+    char c = 200;
+    int wide = c;
+    print_int(wide);
+    if (0) {
+        print_int(unused(1));
+    }
+    return 0;
+    print_int(7);
+}
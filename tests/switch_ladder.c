@@ -0,0 +1,33 @@
+// run
+int classify(int x) {
+    int r = 0;
+    if (x == 1) {
+        r = 10;
+    } else if (x == 2) {
+        r = 20;
+    } else if (x == 3) {
+        r = 30;
+    } else {
+        r = 40;
+    }
+    return r;
+}
+
+void name(char c) {
+    if (c == "a")
+        print_int(1);
+    else if (c == "b")
+        print_int(2);
+    else if (c == "c")
+        print_int(3);
+}
+
+int main() {
+    for (int i = 0; i < 5; i = i + 1) {
+        print_int(classify(i));
+    }
+    name("a");
+    name("c");
+    name("z");
+    return 0;
+}
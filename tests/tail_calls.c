@@ -0,0 +1,27 @@
+// run
+int sum_to(int n, int acc) {
+    if (n == 0)
+        return acc;
+    return sum_to(n - 1, acc + n);
+}
+
+int gcd(int a, int b) {
+    if (b == 0)
+        return a;
+    return gcd(b, a - a / b * b);
+}
+
+int count_down(int n, int steps) {
+    if (n <= 0)
+        return steps;
+    if (n - n / 2 * 2 == 0)
+        return count_down(n / 2, steps + 1);
+    return count_down(n - 1, steps + 1);
+}
+
+int main() {
+    print_int(sum_to(50000, 0));
+    print_int(gcd(1071, 462));
+    print_int(count_down(1000000, 0));
+    return 0;
+}
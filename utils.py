@@ -1,3 +1,4 @@
+import math
 from enum import Enum
 
 
@@ -54,6 +55,15 @@ def getLLVMtype(type):
     return result
 
 
+def getLLVMTypeSize(type) -> int:
+    return {"i32": 4, "double": 8, "i1": 1, "i8": 1}[getLLVMtype(type)]
+
+
+def getMemcpy(type) -> str:
+    suffix = getLLVMtype(type).replace("double", "f64")
+    return f"llvm.memcpy.p0{suffix}.p0{suffix}.i32"
+
+
 def getBinOp(binOp, type: BaseType):
     result = str(binOp).replace("+", "add") \
         .replace("-", "sub") \
@@ -96,6 +106,30 @@ def getConvOp(opFrom: BaseType, opTo: BaseType) -> str:
         return "sitofp"
 
 
+def convertValue(value, opFrom: BaseType, opTo: BaseType):
+    """Значение после преобразования типа так, как его выполняет сгенерированный код (getConvOp, icmp/fcmp для bool);
+    значения в представлении интерпретатора: char - число от -128 до 127, bool - 0 или 1.
+    :return: None, если результат не определен (fptosi вне диапазона типа)
+    """
+    if opTo == BaseType.BOOL:
+        # fcmp one: NaN не истинен
+        return int(value != 0 and value == value)
+    if opFrom == BaseType.BOOL:
+        # sitofp i1: истина - это -1
+        return (-1.0 if value else 0.0) if opTo == BaseType.FLOAT else int(bool(value))
+    if opFrom == BaseType.CHAR and opTo == BaseType.INT:
+        return value & 0xFF
+    if opFrom == BaseType.INT and opTo == BaseType.CHAR:
+        return (value + 0x80 & 0xFF) - 0x80
+    if opFrom == BaseType.FLOAT:
+        if not math.isfinite(value):
+            return None
+        bits = 32 if opTo == BaseType.INT else 8
+        value = int(value)
+        return value if -(1 << bits - 1) <= value < 1 << bits - 1 else None
+    return float(value)
+
+
 def isBuiltinFunc(name: str) -> bool:
     if name == "print_float"        \
             or name == "print_int"  \
@@ -107,4 +141,16 @@ def isBuiltinFunc(name: str) -> bool:
             or name == "read_str":
         return True
 
-    return False
\ No newline at end of file
+    return False
+
+
+# границы int (i32)
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+# встроенные функции над массивами (тип элементов определяется по первому аргументу, см. semantic.ARRAY_BUILT_INS)
+ARRAY_BUILT_IN_FUNCS = ("fill", "copy", "sum", "min", "max", "sort", "print_array")
+
+
+def isArrayBuiltinFunc(name: str) -> bool:
+    return name in ARRAY_BUILT_IN_FUNCS
\ No newline at end of file